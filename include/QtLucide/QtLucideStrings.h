@@ -17,1657 +17,3420 @@
 
 namespace lucide {
 
+/**
+ * @brief Mappings between icon enums and string names, filled together
+ */
+struct IconNameMaps {
+    QHash<Icons, QString> iconToString;
+    QHash<QString, Icons> stringToIcon;
+};
+
+static IconNameMaps createIconNameMaps() {
+    IconNameMaps maps;
+    maps.iconToString.reserve(ICON_COUNT);
+    maps.stringToIcon.reserve(ICON_COUNT);
+    maps.iconToString.insert(Icons::a_arrow_down, QStringLiteral("a-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("a-arrow-down"), Icons::a_arrow_down);
+    maps.iconToString.insert(Icons::a_arrow_up, QStringLiteral("a-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("a-arrow-up"), Icons::a_arrow_up);
+    maps.iconToString.insert(Icons::a_large_small, QStringLiteral("a-large-small"));
+    maps.stringToIcon.insert(QStringLiteral("a-large-small"), Icons::a_large_small);
+    maps.iconToString.insert(Icons::accessibility, QStringLiteral("accessibility"));
+    maps.stringToIcon.insert(QStringLiteral("accessibility"), Icons::accessibility);
+    maps.iconToString.insert(Icons::activity, QStringLiteral("activity"));
+    maps.stringToIcon.insert(QStringLiteral("activity"), Icons::activity);
+    maps.iconToString.insert(Icons::air_vent, QStringLiteral("air-vent"));
+    maps.stringToIcon.insert(QStringLiteral("air-vent"), Icons::air_vent);
+    maps.iconToString.insert(Icons::airplay, QStringLiteral("airplay"));
+    maps.stringToIcon.insert(QStringLiteral("airplay"), Icons::airplay);
+    maps.iconToString.insert(Icons::alarm_clock, QStringLiteral("alarm-clock"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-clock"), Icons::alarm_clock);
+    maps.iconToString.insert(Icons::alarm_clock_check, QStringLiteral("alarm-clock-check"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-clock-check"), Icons::alarm_clock_check);
+    maps.iconToString.insert(Icons::alarm_clock_minus, QStringLiteral("alarm-clock-minus"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-clock-minus"), Icons::alarm_clock_minus);
+    maps.iconToString.insert(Icons::alarm_clock_off, QStringLiteral("alarm-clock-off"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-clock-off"), Icons::alarm_clock_off);
+    maps.iconToString.insert(Icons::alarm_clock_plus, QStringLiteral("alarm-clock-plus"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-clock-plus"), Icons::alarm_clock_plus);
+    maps.iconToString.insert(Icons::alarm_smoke, QStringLiteral("alarm-smoke"));
+    maps.stringToIcon.insert(QStringLiteral("alarm-smoke"), Icons::alarm_smoke);
+    maps.iconToString.insert(Icons::album, QStringLiteral("album"));
+    maps.stringToIcon.insert(QStringLiteral("album"), Icons::album);
+    maps.iconToString.insert(Icons::align_center_horizontal,
+                             QStringLiteral("align-center-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("align-center-horizontal"),
+                             Icons::align_center_horizontal);
+    maps.iconToString.insert(Icons::align_center_vertical, QStringLiteral("align-center-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("align-center-vertical"), Icons::align_center_vertical);
+    maps.iconToString.insert(Icons::align_end_horizontal, QStringLiteral("align-end-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("align-end-horizontal"), Icons::align_end_horizontal);
+    maps.iconToString.insert(Icons::align_end_vertical, QStringLiteral("align-end-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("align-end-vertical"), Icons::align_end_vertical);
+    maps.iconToString.insert(Icons::align_horizontal_distribute_center,
+                             QStringLiteral("align-horizontal-distribute-center"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-distribute-center"),
+                             Icons::align_horizontal_distribute_center);
+    maps.iconToString.insert(Icons::align_horizontal_distribute_end,
+                             QStringLiteral("align-horizontal-distribute-end"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-distribute-end"),
+                             Icons::align_horizontal_distribute_end);
+    maps.iconToString.insert(Icons::align_horizontal_distribute_start,
+                             QStringLiteral("align-horizontal-distribute-start"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-distribute-start"),
+                             Icons::align_horizontal_distribute_start);
+    maps.iconToString.insert(Icons::align_horizontal_justify_center,
+                             QStringLiteral("align-horizontal-justify-center"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-justify-center"),
+                             Icons::align_horizontal_justify_center);
+    maps.iconToString.insert(Icons::align_horizontal_justify_end,
+                             QStringLiteral("align-horizontal-justify-end"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-justify-end"),
+                             Icons::align_horizontal_justify_end);
+    maps.iconToString.insert(Icons::align_horizontal_justify_start,
+                             QStringLiteral("align-horizontal-justify-start"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-justify-start"),
+                             Icons::align_horizontal_justify_start);
+    maps.iconToString.insert(Icons::align_horizontal_space_around,
+                             QStringLiteral("align-horizontal-space-around"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-space-around"),
+                             Icons::align_horizontal_space_around);
+    maps.iconToString.insert(Icons::align_horizontal_space_between,
+                             QStringLiteral("align-horizontal-space-between"));
+    maps.stringToIcon.insert(QStringLiteral("align-horizontal-space-between"),
+                             Icons::align_horizontal_space_between);
+    maps.iconToString.insert(Icons::align_start_horizontal,
+                             QStringLiteral("align-start-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("align-start-horizontal"),
+                             Icons::align_start_horizontal);
+    maps.iconToString.insert(Icons::align_start_vertical, QStringLiteral("align-start-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("align-start-vertical"), Icons::align_start_vertical);
+    maps.iconToString.insert(Icons::align_vertical_distribute_center,
+                             QStringLiteral("align-vertical-distribute-center"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-distribute-center"),
+                             Icons::align_vertical_distribute_center);
+    maps.iconToString.insert(Icons::align_vertical_distribute_end,
+                             QStringLiteral("align-vertical-distribute-end"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-distribute-end"),
+                             Icons::align_vertical_distribute_end);
+    maps.iconToString.insert(Icons::align_vertical_distribute_start,
+                             QStringLiteral("align-vertical-distribute-start"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-distribute-start"),
+                             Icons::align_vertical_distribute_start);
+    maps.iconToString.insert(Icons::align_vertical_justify_center,
+                             QStringLiteral("align-vertical-justify-center"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-justify-center"),
+                             Icons::align_vertical_justify_center);
+    maps.iconToString.insert(Icons::align_vertical_justify_end,
+                             QStringLiteral("align-vertical-justify-end"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-justify-end"),
+                             Icons::align_vertical_justify_end);
+    maps.iconToString.insert(Icons::align_vertical_justify_start,
+                             QStringLiteral("align-vertical-justify-start"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-justify-start"),
+                             Icons::align_vertical_justify_start);
+    maps.iconToString.insert(Icons::align_vertical_space_around,
+                             QStringLiteral("align-vertical-space-around"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-space-around"),
+                             Icons::align_vertical_space_around);
+    maps.iconToString.insert(Icons::align_vertical_space_between,
+                             QStringLiteral("align-vertical-space-between"));
+    maps.stringToIcon.insert(QStringLiteral("align-vertical-space-between"),
+                             Icons::align_vertical_space_between);
+    maps.iconToString.insert(Icons::ambulance, QStringLiteral("ambulance"));
+    maps.stringToIcon.insert(QStringLiteral("ambulance"), Icons::ambulance);
+    maps.iconToString.insert(Icons::ampersand, QStringLiteral("ampersand"));
+    maps.stringToIcon.insert(QStringLiteral("ampersand"), Icons::ampersand);
+    maps.iconToString.insert(Icons::ampersands, QStringLiteral("ampersands"));
+    maps.stringToIcon.insert(QStringLiteral("ampersands"), Icons::ampersands);
+    maps.iconToString.insert(Icons::amphora, QStringLiteral("amphora"));
+    maps.stringToIcon.insert(QStringLiteral("amphora"), Icons::amphora);
+    maps.iconToString.insert(Icons::anchor, QStringLiteral("anchor"));
+    maps.stringToIcon.insert(QStringLiteral("anchor"), Icons::anchor);
+    maps.iconToString.insert(Icons::angry, QStringLiteral("angry"));
+    maps.stringToIcon.insert(QStringLiteral("angry"), Icons::angry);
+    maps.iconToString.insert(Icons::annoyed, QStringLiteral("annoyed"));
+    maps.stringToIcon.insert(QStringLiteral("annoyed"), Icons::annoyed);
+    maps.iconToString.insert(Icons::antenna, QStringLiteral("antenna"));
+    maps.stringToIcon.insert(QStringLiteral("antenna"), Icons::antenna);
+    maps.iconToString.insert(Icons::anvil, QStringLiteral("anvil"));
+    maps.stringToIcon.insert(QStringLiteral("anvil"), Icons::anvil);
+    maps.iconToString.insert(Icons::aperture, QStringLiteral("aperture"));
+    maps.stringToIcon.insert(QStringLiteral("aperture"), Icons::aperture);
+    maps.iconToString.insert(Icons::app_window, QStringLiteral("app-window"));
+    maps.stringToIcon.insert(QStringLiteral("app-window"), Icons::app_window);
+    maps.iconToString.insert(Icons::app_window_mac, QStringLiteral("app-window-mac"));
+    maps.stringToIcon.insert(QStringLiteral("app-window-mac"), Icons::app_window_mac);
+    maps.iconToString.insert(Icons::apple, QStringLiteral("apple"));
+    maps.stringToIcon.insert(QStringLiteral("apple"), Icons::apple);
+    maps.iconToString.insert(Icons::archive, QStringLiteral("archive"));
+    maps.stringToIcon.insert(QStringLiteral("archive"), Icons::archive);
+    maps.iconToString.insert(Icons::archive_restore, QStringLiteral("archive-restore"));
+    maps.stringToIcon.insert(QStringLiteral("archive-restore"), Icons::archive_restore);
+    maps.iconToString.insert(Icons::archive_x, QStringLiteral("archive-x"));
+    maps.stringToIcon.insert(QStringLiteral("archive-x"), Icons::archive_x);
+    maps.iconToString.insert(Icons::armchair, QStringLiteral("armchair"));
+    maps.stringToIcon.insert(QStringLiteral("armchair"), Icons::armchair);
+    maps.iconToString.insert(Icons::arrow_big_down, QStringLiteral("arrow-big-down"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-down"), Icons::arrow_big_down);
+    maps.iconToString.insert(Icons::arrow_big_down_dash, QStringLiteral("arrow-big-down-dash"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-down-dash"), Icons::arrow_big_down_dash);
+    maps.iconToString.insert(Icons::arrow_big_left, QStringLiteral("arrow-big-left"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-left"), Icons::arrow_big_left);
+    maps.iconToString.insert(Icons::arrow_big_left_dash, QStringLiteral("arrow-big-left-dash"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-left-dash"), Icons::arrow_big_left_dash);
+    maps.iconToString.insert(Icons::arrow_big_right, QStringLiteral("arrow-big-right"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-right"), Icons::arrow_big_right);
+    maps.iconToString.insert(Icons::arrow_big_right_dash, QStringLiteral("arrow-big-right-dash"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-right-dash"), Icons::arrow_big_right_dash);
+    maps.iconToString.insert(Icons::arrow_big_up, QStringLiteral("arrow-big-up"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-up"), Icons::arrow_big_up);
+    maps.iconToString.insert(Icons::arrow_big_up_dash, QStringLiteral("arrow-big-up-dash"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-big-up-dash"), Icons::arrow_big_up_dash);
+    maps.iconToString.insert(Icons::arrow_down, QStringLiteral("arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down"), Icons::arrow_down);
+    maps.iconToString.insert(Icons::arrow_down_0_1, QStringLiteral("arrow-down-0-1"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-0-1"), Icons::arrow_down_0_1);
+    maps.iconToString.insert(Icons::arrow_down_1_0, QStringLiteral("arrow-down-1-0"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-1-0"), Icons::arrow_down_1_0);
+    maps.iconToString.insert(Icons::arrow_down_a_z, QStringLiteral("arrow-down-a-z"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-a-z"), Icons::arrow_down_a_z);
+    maps.iconToString.insert(Icons::arrow_down_from_line, QStringLiteral("arrow-down-from-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-from-line"), Icons::arrow_down_from_line);
+    maps.iconToString.insert(Icons::arrow_down_left, QStringLiteral("arrow-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-left"), Icons::arrow_down_left);
+    maps.iconToString.insert(Icons::arrow_down_narrow_wide,
+                             QStringLiteral("arrow-down-narrow-wide"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-narrow-wide"),
+                             Icons::arrow_down_narrow_wide);
+    maps.iconToString.insert(Icons::arrow_down_right, QStringLiteral("arrow-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-right"), Icons::arrow_down_right);
+    maps.iconToString.insert(Icons::arrow_down_to_dot, QStringLiteral("arrow-down-to-dot"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-to-dot"), Icons::arrow_down_to_dot);
+    maps.iconToString.insert(Icons::arrow_down_to_line, QStringLiteral("arrow-down-to-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-to-line"), Icons::arrow_down_to_line);
+    maps.iconToString.insert(Icons::arrow_down_up, QStringLiteral("arrow-down-up"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-up"), Icons::arrow_down_up);
+    maps.iconToString.insert(Icons::arrow_down_wide_narrow,
+                             QStringLiteral("arrow-down-wide-narrow"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-wide-narrow"),
+                             Icons::arrow_down_wide_narrow);
+    maps.iconToString.insert(Icons::arrow_down_z_a, QStringLiteral("arrow-down-z-a"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-down-z-a"), Icons::arrow_down_z_a);
+    maps.iconToString.insert(Icons::arrow_left, QStringLiteral("arrow-left"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-left"), Icons::arrow_left);
+    maps.iconToString.insert(Icons::arrow_left_from_line, QStringLiteral("arrow-left-from-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-left-from-line"), Icons::arrow_left_from_line);
+    maps.iconToString.insert(Icons::arrow_left_right, QStringLiteral("arrow-left-right"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-left-right"), Icons::arrow_left_right);
+    maps.iconToString.insert(Icons::arrow_left_to_line, QStringLiteral("arrow-left-to-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-left-to-line"), Icons::arrow_left_to_line);
+    maps.iconToString.insert(Icons::arrow_right, QStringLiteral("arrow-right"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-right"), Icons::arrow_right);
+    maps.iconToString.insert(Icons::arrow_right_from_line, QStringLiteral("arrow-right-from-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-right-from-line"), Icons::arrow_right_from_line);
+    maps.iconToString.insert(Icons::arrow_right_left, QStringLiteral("arrow-right-left"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-right-left"), Icons::arrow_right_left);
+    maps.iconToString.insert(Icons::arrow_right_to_line, QStringLiteral("arrow-right-to-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-right-to-line"), Icons::arrow_right_to_line);
+    maps.iconToString.insert(Icons::arrow_up, QStringLiteral("arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up"), Icons::arrow_up);
+    maps.iconToString.insert(Icons::arrow_up_0_1, QStringLiteral("arrow-up-0-1"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-0-1"), Icons::arrow_up_0_1);
+    maps.iconToString.insert(Icons::arrow_up_1_0, QStringLiteral("arrow-up-1-0"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-1-0"), Icons::arrow_up_1_0);
+    maps.iconToString.insert(Icons::arrow_up_a_z, QStringLiteral("arrow-up-a-z"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-a-z"), Icons::arrow_up_a_z);
+    maps.iconToString.insert(Icons::arrow_up_down, QStringLiteral("arrow-up-down"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-down"), Icons::arrow_up_down);
+    maps.iconToString.insert(Icons::arrow_up_from_dot, QStringLiteral("arrow-up-from-dot"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-from-dot"), Icons::arrow_up_from_dot);
+    maps.iconToString.insert(Icons::arrow_up_from_line, QStringLiteral("arrow-up-from-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-from-line"), Icons::arrow_up_from_line);
+    maps.iconToString.insert(Icons::arrow_up_left, QStringLiteral("arrow-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-left"), Icons::arrow_up_left);
+    maps.iconToString.insert(Icons::arrow_up_narrow_wide, QStringLiteral("arrow-up-narrow-wide"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-narrow-wide"), Icons::arrow_up_narrow_wide);
+    maps.iconToString.insert(Icons::arrow_up_right, QStringLiteral("arrow-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-right"), Icons::arrow_up_right);
+    maps.iconToString.insert(Icons::arrow_up_to_line, QStringLiteral("arrow-up-to-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-to-line"), Icons::arrow_up_to_line);
+    maps.iconToString.insert(Icons::arrow_up_wide_narrow, QStringLiteral("arrow-up-wide-narrow"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-wide-narrow"), Icons::arrow_up_wide_narrow);
+    maps.iconToString.insert(Icons::arrow_up_z_a, QStringLiteral("arrow-up-z-a"));
+    maps.stringToIcon.insert(QStringLiteral("arrow-up-z-a"), Icons::arrow_up_z_a);
+    maps.iconToString.insert(Icons::arrows_up_from_line, QStringLiteral("arrows-up-from-line"));
+    maps.stringToIcon.insert(QStringLiteral("arrows-up-from-line"), Icons::arrows_up_from_line);
+    maps.iconToString.insert(Icons::asterisk, QStringLiteral("asterisk"));
+    maps.stringToIcon.insert(QStringLiteral("asterisk"), Icons::asterisk);
+    maps.iconToString.insert(Icons::at_sign, QStringLiteral("at-sign"));
+    maps.stringToIcon.insert(QStringLiteral("at-sign"), Icons::at_sign);
+    maps.iconToString.insert(Icons::atom, QStringLiteral("atom"));
+    maps.stringToIcon.insert(QStringLiteral("atom"), Icons::atom);
+    maps.iconToString.insert(Icons::audio_lines, QStringLiteral("audio-lines"));
+    maps.stringToIcon.insert(QStringLiteral("audio-lines"), Icons::audio_lines);
+    maps.iconToString.insert(Icons::audio_waveform, QStringLiteral("audio-waveform"));
+    maps.stringToIcon.insert(QStringLiteral("audio-waveform"), Icons::audio_waveform);
+    maps.iconToString.insert(Icons::award, QStringLiteral("award"));
+    maps.stringToIcon.insert(QStringLiteral("award"), Icons::award);
+    maps.iconToString.insert(Icons::axe, QStringLiteral("axe"));
+    maps.stringToIcon.insert(QStringLiteral("axe"), Icons::axe);
+    maps.iconToString.insert(Icons::axis_3d, QStringLiteral("axis-3d"));
+    maps.stringToIcon.insert(QStringLiteral("axis-3d"), Icons::axis_3d);
+    maps.iconToString.insert(Icons::baby, QStringLiteral("baby"));
+    maps.stringToIcon.insert(QStringLiteral("baby"), Icons::baby);
+    maps.iconToString.insert(Icons::backpack, QStringLiteral("backpack"));
+    maps.stringToIcon.insert(QStringLiteral("backpack"), Icons::backpack);
+    maps.iconToString.insert(Icons::badge, QStringLiteral("badge"));
+    maps.stringToIcon.insert(QStringLiteral("badge"), Icons::badge);
+    maps.iconToString.insert(Icons::badge_alert, QStringLiteral("badge-alert"));
+    maps.stringToIcon.insert(QStringLiteral("badge-alert"), Icons::badge_alert);
+    maps.iconToString.insert(Icons::badge_cent, QStringLiteral("badge-cent"));
+    maps.stringToIcon.insert(QStringLiteral("badge-cent"), Icons::badge_cent);
+    maps.iconToString.insert(Icons::badge_check, QStringLiteral("badge-check"));
+    maps.stringToIcon.insert(QStringLiteral("badge-check"), Icons::badge_check);
+    maps.iconToString.insert(Icons::badge_dollar_sign, QStringLiteral("badge-dollar-sign"));
+    maps.stringToIcon.insert(QStringLiteral("badge-dollar-sign"), Icons::badge_dollar_sign);
+    maps.iconToString.insert(Icons::badge_euro, QStringLiteral("badge-euro"));
+    maps.stringToIcon.insert(QStringLiteral("badge-euro"), Icons::badge_euro);
+    maps.iconToString.insert(Icons::badge_indian_rupee, QStringLiteral("badge-indian-rupee"));
+    maps.stringToIcon.insert(QStringLiteral("badge-indian-rupee"), Icons::badge_indian_rupee);
+    maps.iconToString.insert(Icons::badge_info, QStringLiteral("badge-info"));
+    maps.stringToIcon.insert(QStringLiteral("badge-info"), Icons::badge_info);
+    maps.iconToString.insert(Icons::badge_japanese_yen, QStringLiteral("badge-japanese-yen"));
+    maps.stringToIcon.insert(QStringLiteral("badge-japanese-yen"), Icons::badge_japanese_yen);
+    maps.iconToString.insert(Icons::badge_minus, QStringLiteral("badge-minus"));
+    maps.stringToIcon.insert(QStringLiteral("badge-minus"), Icons::badge_minus);
+    maps.iconToString.insert(Icons::badge_percent, QStringLiteral("badge-percent"));
+    maps.stringToIcon.insert(QStringLiteral("badge-percent"), Icons::badge_percent);
+    maps.iconToString.insert(Icons::badge_plus, QStringLiteral("badge-plus"));
+    maps.stringToIcon.insert(QStringLiteral("badge-plus"), Icons::badge_plus);
+    maps.iconToString.insert(Icons::badge_pound_sterling, QStringLiteral("badge-pound-sterling"));
+    maps.stringToIcon.insert(QStringLiteral("badge-pound-sterling"), Icons::badge_pound_sterling);
+    maps.iconToString.insert(Icons::badge_question_mark, QStringLiteral("badge-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("badge-question-mark"), Icons::badge_question_mark);
+    maps.iconToString.insert(Icons::badge_russian_ruble, QStringLiteral("badge-russian-ruble"));
+    maps.stringToIcon.insert(QStringLiteral("badge-russian-ruble"), Icons::badge_russian_ruble);
+    maps.iconToString.insert(Icons::badge_swiss_franc, QStringLiteral("badge-swiss-franc"));
+    maps.stringToIcon.insert(QStringLiteral("badge-swiss-franc"), Icons::badge_swiss_franc);
+    maps.iconToString.insert(Icons::badge_turkish_lira, QStringLiteral("badge-turkish-lira"));
+    maps.stringToIcon.insert(QStringLiteral("badge-turkish-lira"), Icons::badge_turkish_lira);
+    maps.iconToString.insert(Icons::badge_x, QStringLiteral("badge-x"));
+    maps.stringToIcon.insert(QStringLiteral("badge-x"), Icons::badge_x);
+    maps.iconToString.insert(Icons::baggage_claim, QStringLiteral("baggage-claim"));
+    maps.stringToIcon.insert(QStringLiteral("baggage-claim"), Icons::baggage_claim);
+    maps.iconToString.insert(Icons::ban, QStringLiteral("ban"));
+    maps.stringToIcon.insert(QStringLiteral("ban"), Icons::ban);
+    maps.iconToString.insert(Icons::banana, QStringLiteral("banana"));
+    maps.stringToIcon.insert(QStringLiteral("banana"), Icons::banana);
+    maps.iconToString.insert(Icons::bandage, QStringLiteral("bandage"));
+    maps.stringToIcon.insert(QStringLiteral("bandage"), Icons::bandage);
+    maps.iconToString.insert(Icons::banknote, QStringLiteral("banknote"));
+    maps.stringToIcon.insert(QStringLiteral("banknote"), Icons::banknote);
+    maps.iconToString.insert(Icons::banknote_arrow_down, QStringLiteral("banknote-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("banknote-arrow-down"), Icons::banknote_arrow_down);
+    maps.iconToString.insert(Icons::banknote_arrow_up, QStringLiteral("banknote-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("banknote-arrow-up"), Icons::banknote_arrow_up);
+    maps.iconToString.insert(Icons::banknote_x, QStringLiteral("banknote-x"));
+    maps.stringToIcon.insert(QStringLiteral("banknote-x"), Icons::banknote_x);
+    maps.iconToString.insert(Icons::barcode, QStringLiteral("barcode"));
+    maps.stringToIcon.insert(QStringLiteral("barcode"), Icons::barcode);
+    maps.iconToString.insert(Icons::barrel, QStringLiteral("barrel"));
+    maps.stringToIcon.insert(QStringLiteral("barrel"), Icons::barrel);
+    maps.iconToString.insert(Icons::baseline, QStringLiteral("baseline"));
+    maps.stringToIcon.insert(QStringLiteral("baseline"), Icons::baseline);
+    maps.iconToString.insert(Icons::bath, QStringLiteral("bath"));
+    maps.stringToIcon.insert(QStringLiteral("bath"), Icons::bath);
+    maps.iconToString.insert(Icons::battery, QStringLiteral("battery"));
+    maps.stringToIcon.insert(QStringLiteral("battery"), Icons::battery);
+    maps.iconToString.insert(Icons::battery_charging, QStringLiteral("battery-charging"));
+    maps.stringToIcon.insert(QStringLiteral("battery-charging"), Icons::battery_charging);
+    maps.iconToString.insert(Icons::battery_full, QStringLiteral("battery-full"));
+    maps.stringToIcon.insert(QStringLiteral("battery-full"), Icons::battery_full);
+    maps.iconToString.insert(Icons::battery_low, QStringLiteral("battery-low"));
+    maps.stringToIcon.insert(QStringLiteral("battery-low"), Icons::battery_low);
+    maps.iconToString.insert(Icons::battery_medium, QStringLiteral("battery-medium"));
+    maps.stringToIcon.insert(QStringLiteral("battery-medium"), Icons::battery_medium);
+    maps.iconToString.insert(Icons::battery_plus, QStringLiteral("battery-plus"));
+    maps.stringToIcon.insert(QStringLiteral("battery-plus"), Icons::battery_plus);
+    maps.iconToString.insert(Icons::battery_warning, QStringLiteral("battery-warning"));
+    maps.stringToIcon.insert(QStringLiteral("battery-warning"), Icons::battery_warning);
+    maps.iconToString.insert(Icons::beaker, QStringLiteral("beaker"));
+    maps.stringToIcon.insert(QStringLiteral("beaker"), Icons::beaker);
+    maps.iconToString.insert(Icons::bean, QStringLiteral("bean"));
+    maps.stringToIcon.insert(QStringLiteral("bean"), Icons::bean);
+    maps.iconToString.insert(Icons::bean_off, QStringLiteral("bean-off"));
+    maps.stringToIcon.insert(QStringLiteral("bean-off"), Icons::bean_off);
+    maps.iconToString.insert(Icons::bed, QStringLiteral("bed"));
+    maps.stringToIcon.insert(QStringLiteral("bed"), Icons::bed);
+    maps.iconToString.insert(Icons::bed_double, QStringLiteral("bed-double"));
+    maps.stringToIcon.insert(QStringLiteral("bed-double"), Icons::bed_double);
+    maps.iconToString.insert(Icons::bed_single, QStringLiteral("bed-single"));
+    maps.stringToIcon.insert(QStringLiteral("bed-single"), Icons::bed_single);
+    maps.iconToString.insert(Icons::beef, QStringLiteral("beef"));
+    maps.stringToIcon.insert(QStringLiteral("beef"), Icons::beef);
+    maps.iconToString.insert(Icons::beer, QStringLiteral("beer"));
+    maps.stringToIcon.insert(QStringLiteral("beer"), Icons::beer);
+    maps.iconToString.insert(Icons::beer_off, QStringLiteral("beer-off"));
+    maps.stringToIcon.insert(QStringLiteral("beer-off"), Icons::beer_off);
+    maps.iconToString.insert(Icons::bell, QStringLiteral("bell"));
+    maps.stringToIcon.insert(QStringLiteral("bell"), Icons::bell);
+    maps.iconToString.insert(Icons::bell_dot, QStringLiteral("bell-dot"));
+    maps.stringToIcon.insert(QStringLiteral("bell-dot"), Icons::bell_dot);
+    maps.iconToString.insert(Icons::bell_electric, QStringLiteral("bell-electric"));
+    maps.stringToIcon.insert(QStringLiteral("bell-electric"), Icons::bell_electric);
+    maps.iconToString.insert(Icons::bell_minus, QStringLiteral("bell-minus"));
+    maps.stringToIcon.insert(QStringLiteral("bell-minus"), Icons::bell_minus);
+    maps.iconToString.insert(Icons::bell_off, QStringLiteral("bell-off"));
+    maps.stringToIcon.insert(QStringLiteral("bell-off"), Icons::bell_off);
+    maps.iconToString.insert(Icons::bell_plus, QStringLiteral("bell-plus"));
+    maps.stringToIcon.insert(QStringLiteral("bell-plus"), Icons::bell_plus);
+    maps.iconToString.insert(Icons::bell_ring, QStringLiteral("bell-ring"));
+    maps.stringToIcon.insert(QStringLiteral("bell-ring"), Icons::bell_ring);
+    maps.iconToString.insert(Icons::between_horizontal_end,
+                             QStringLiteral("between-horizontal-end"));
+    maps.stringToIcon.insert(QStringLiteral("between-horizontal-end"),
+                             Icons::between_horizontal_end);
+    maps.iconToString.insert(Icons::between_horizontal_start,
+                             QStringLiteral("between-horizontal-start"));
+    maps.stringToIcon.insert(QStringLiteral("between-horizontal-start"),
+                             Icons::between_horizontal_start);
+    maps.iconToString.insert(Icons::between_vertical_end, QStringLiteral("between-vertical-end"));
+    maps.stringToIcon.insert(QStringLiteral("between-vertical-end"), Icons::between_vertical_end);
+    maps.iconToString.insert(Icons::between_vertical_start,
+                             QStringLiteral("between-vertical-start"));
+    maps.stringToIcon.insert(QStringLiteral("between-vertical-start"),
+                             Icons::between_vertical_start);
+    maps.iconToString.insert(Icons::biceps_flexed, QStringLiteral("biceps-flexed"));
+    maps.stringToIcon.insert(QStringLiteral("biceps-flexed"), Icons::biceps_flexed);
+    maps.iconToString.insert(Icons::bike, QStringLiteral("bike"));
+    maps.stringToIcon.insert(QStringLiteral("bike"), Icons::bike);
+    maps.iconToString.insert(Icons::binary, QStringLiteral("binary"));
+    maps.stringToIcon.insert(QStringLiteral("binary"), Icons::binary);
+    maps.iconToString.insert(Icons::binoculars, QStringLiteral("binoculars"));
+    maps.stringToIcon.insert(QStringLiteral("binoculars"), Icons::binoculars);
+    maps.iconToString.insert(Icons::biohazard, QStringLiteral("biohazard"));
+    maps.stringToIcon.insert(QStringLiteral("biohazard"), Icons::biohazard);
+    maps.iconToString.insert(Icons::bird, QStringLiteral("bird"));
+    maps.stringToIcon.insert(QStringLiteral("bird"), Icons::bird);
+    maps.iconToString.insert(Icons::bitcoin, QStringLiteral("bitcoin"));
+    maps.stringToIcon.insert(QStringLiteral("bitcoin"), Icons::bitcoin);
+    maps.iconToString.insert(Icons::blend, QStringLiteral("blend"));
+    maps.stringToIcon.insert(QStringLiteral("blend"), Icons::blend);
+    maps.iconToString.insert(Icons::blinds, QStringLiteral("blinds"));
+    maps.stringToIcon.insert(QStringLiteral("blinds"), Icons::blinds);
+    maps.iconToString.insert(Icons::blocks, QStringLiteral("blocks"));
+    maps.stringToIcon.insert(QStringLiteral("blocks"), Icons::blocks);
+    maps.iconToString.insert(Icons::bluetooth, QStringLiteral("bluetooth"));
+    maps.stringToIcon.insert(QStringLiteral("bluetooth"), Icons::bluetooth);
+    maps.iconToString.insert(Icons::bluetooth_connected, QStringLiteral("bluetooth-connected"));
+    maps.stringToIcon.insert(QStringLiteral("bluetooth-connected"), Icons::bluetooth_connected);
+    maps.iconToString.insert(Icons::bluetooth_off, QStringLiteral("bluetooth-off"));
+    maps.stringToIcon.insert(QStringLiteral("bluetooth-off"), Icons::bluetooth_off);
+    maps.iconToString.insert(Icons::bluetooth_searching, QStringLiteral("bluetooth-searching"));
+    maps.stringToIcon.insert(QStringLiteral("bluetooth-searching"), Icons::bluetooth_searching);
+    maps.iconToString.insert(Icons::bold, QStringLiteral("bold"));
+    maps.stringToIcon.insert(QStringLiteral("bold"), Icons::bold);
+    maps.iconToString.insert(Icons::bolt, QStringLiteral("bolt"));
+    maps.stringToIcon.insert(QStringLiteral("bolt"), Icons::bolt);
+    maps.iconToString.insert(Icons::bomb, QStringLiteral("bomb"));
+    maps.stringToIcon.insert(QStringLiteral("bomb"), Icons::bomb);
+    maps.iconToString.insert(Icons::bone, QStringLiteral("bone"));
+    maps.stringToIcon.insert(QStringLiteral("bone"), Icons::bone);
+    maps.iconToString.insert(Icons::book, QStringLiteral("book"));
+    maps.stringToIcon.insert(QStringLiteral("book"), Icons::book);
+    maps.iconToString.insert(Icons::book_a, QStringLiteral("book-a"));
+    maps.stringToIcon.insert(QStringLiteral("book-a"), Icons::book_a);
+    maps.iconToString.insert(Icons::book_alert, QStringLiteral("book-alert"));
+    maps.stringToIcon.insert(QStringLiteral("book-alert"), Icons::book_alert);
+    maps.iconToString.insert(Icons::book_audio, QStringLiteral("book-audio"));
+    maps.stringToIcon.insert(QStringLiteral("book-audio"), Icons::book_audio);
+    maps.iconToString.insert(Icons::book_check, QStringLiteral("book-check"));
+    maps.stringToIcon.insert(QStringLiteral("book-check"), Icons::book_check);
+    maps.iconToString.insert(Icons::book_copy, QStringLiteral("book-copy"));
+    maps.stringToIcon.insert(QStringLiteral("book-copy"), Icons::book_copy);
+    maps.iconToString.insert(Icons::book_dashed, QStringLiteral("book-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("book-dashed"), Icons::book_dashed);
+    maps.iconToString.insert(Icons::book_down, QStringLiteral("book-down"));
+    maps.stringToIcon.insert(QStringLiteral("book-down"), Icons::book_down);
+    maps.iconToString.insert(Icons::book_headphones, QStringLiteral("book-headphones"));
+    maps.stringToIcon.insert(QStringLiteral("book-headphones"), Icons::book_headphones);
+    maps.iconToString.insert(Icons::book_heart, QStringLiteral("book-heart"));
+    maps.stringToIcon.insert(QStringLiteral("book-heart"), Icons::book_heart);
+    maps.iconToString.insert(Icons::book_image, QStringLiteral("book-image"));
+    maps.stringToIcon.insert(QStringLiteral("book-image"), Icons::book_image);
+    maps.iconToString.insert(Icons::book_key, QStringLiteral("book-key"));
+    maps.stringToIcon.insert(QStringLiteral("book-key"), Icons::book_key);
+    maps.iconToString.insert(Icons::book_lock, QStringLiteral("book-lock"));
+    maps.stringToIcon.insert(QStringLiteral("book-lock"), Icons::book_lock);
+    maps.iconToString.insert(Icons::book_marked, QStringLiteral("book-marked"));
+    maps.stringToIcon.insert(QStringLiteral("book-marked"), Icons::book_marked);
+    maps.iconToString.insert(Icons::book_minus, QStringLiteral("book-minus"));
+    maps.stringToIcon.insert(QStringLiteral("book-minus"), Icons::book_minus);
+    maps.iconToString.insert(Icons::book_open, QStringLiteral("book-open"));
+    maps.stringToIcon.insert(QStringLiteral("book-open"), Icons::book_open);
+    maps.iconToString.insert(Icons::book_open_check, QStringLiteral("book-open-check"));
+    maps.stringToIcon.insert(QStringLiteral("book-open-check"), Icons::book_open_check);
+    maps.iconToString.insert(Icons::book_open_text, QStringLiteral("book-open-text"));
+    maps.stringToIcon.insert(QStringLiteral("book-open-text"), Icons::book_open_text);
+    maps.iconToString.insert(Icons::book_plus, QStringLiteral("book-plus"));
+    maps.stringToIcon.insert(QStringLiteral("book-plus"), Icons::book_plus);
+    maps.iconToString.insert(Icons::book_text, QStringLiteral("book-text"));
+    maps.stringToIcon.insert(QStringLiteral("book-text"), Icons::book_text);
+    maps.iconToString.insert(Icons::book_type, QStringLiteral("book-type"));
+    maps.stringToIcon.insert(QStringLiteral("book-type"), Icons::book_type);
+    maps.iconToString.insert(Icons::book_up, QStringLiteral("book-up"));
+    maps.stringToIcon.insert(QStringLiteral("book-up"), Icons::book_up);
+    maps.iconToString.insert(Icons::book_up_2, QStringLiteral("book-up-2"));
+    maps.stringToIcon.insert(QStringLiteral("book-up-2"), Icons::book_up_2);
+    maps.iconToString.insert(Icons::book_user, QStringLiteral("book-user"));
+    maps.stringToIcon.insert(QStringLiteral("book-user"), Icons::book_user);
+    maps.iconToString.insert(Icons::book_x, QStringLiteral("book-x"));
+    maps.stringToIcon.insert(QStringLiteral("book-x"), Icons::book_x);
+    maps.iconToString.insert(Icons::bookmark, QStringLiteral("bookmark"));
+    maps.stringToIcon.insert(QStringLiteral("bookmark"), Icons::bookmark);
+    maps.iconToString.insert(Icons::bookmark_check, QStringLiteral("bookmark-check"));
+    maps.stringToIcon.insert(QStringLiteral("bookmark-check"), Icons::bookmark_check);
+    maps.iconToString.insert(Icons::bookmark_minus, QStringLiteral("bookmark-minus"));
+    maps.stringToIcon.insert(QStringLiteral("bookmark-minus"), Icons::bookmark_minus);
+    maps.iconToString.insert(Icons::bookmark_plus, QStringLiteral("bookmark-plus"));
+    maps.stringToIcon.insert(QStringLiteral("bookmark-plus"), Icons::bookmark_plus);
+    maps.iconToString.insert(Icons::bookmark_x, QStringLiteral("bookmark-x"));
+    maps.stringToIcon.insert(QStringLiteral("bookmark-x"), Icons::bookmark_x);
+    maps.iconToString.insert(Icons::boom_box, QStringLiteral("boom-box"));
+    maps.stringToIcon.insert(QStringLiteral("boom-box"), Icons::boom_box);
+    maps.iconToString.insert(Icons::bot, QStringLiteral("bot"));
+    maps.stringToIcon.insert(QStringLiteral("bot"), Icons::bot);
+    maps.iconToString.insert(Icons::bot_message_square, QStringLiteral("bot-message-square"));
+    maps.stringToIcon.insert(QStringLiteral("bot-message-square"), Icons::bot_message_square);
+    maps.iconToString.insert(Icons::bot_off, QStringLiteral("bot-off"));
+    maps.stringToIcon.insert(QStringLiteral("bot-off"), Icons::bot_off);
+    maps.iconToString.insert(Icons::bottle_wine, QStringLiteral("bottle-wine"));
+    maps.stringToIcon.insert(QStringLiteral("bottle-wine"), Icons::bottle_wine);
+    maps.iconToString.insert(Icons::bow_arrow, QStringLiteral("bow-arrow"));
+    maps.stringToIcon.insert(QStringLiteral("bow-arrow"), Icons::bow_arrow);
+    maps.iconToString.insert(Icons::box, QStringLiteral("box"));
+    maps.stringToIcon.insert(QStringLiteral("box"), Icons::box);
+    maps.iconToString.insert(Icons::boxes, QStringLiteral("boxes"));
+    maps.stringToIcon.insert(QStringLiteral("boxes"), Icons::boxes);
+    maps.iconToString.insert(Icons::braces, QStringLiteral("braces"));
+    maps.stringToIcon.insert(QStringLiteral("braces"), Icons::braces);
+    maps.iconToString.insert(Icons::brackets, QStringLiteral("brackets"));
+    maps.stringToIcon.insert(QStringLiteral("brackets"), Icons::brackets);
+    maps.iconToString.insert(Icons::brain, QStringLiteral("brain"));
+    maps.stringToIcon.insert(QStringLiteral("brain"), Icons::brain);
+    maps.iconToString.insert(Icons::brain_circuit, QStringLiteral("brain-circuit"));
+    maps.stringToIcon.insert(QStringLiteral("brain-circuit"), Icons::brain_circuit);
+    maps.iconToString.insert(Icons::brain_cog, QStringLiteral("brain-cog"));
+    maps.stringToIcon.insert(QStringLiteral("brain-cog"), Icons::brain_cog);
+    maps.iconToString.insert(Icons::brick_wall, QStringLiteral("brick-wall"));
+    maps.stringToIcon.insert(QStringLiteral("brick-wall"), Icons::brick_wall);
+    maps.iconToString.insert(Icons::brick_wall_fire, QStringLiteral("brick-wall-fire"));
+    maps.stringToIcon.insert(QStringLiteral("brick-wall-fire"), Icons::brick_wall_fire);
+    maps.iconToString.insert(Icons::brick_wall_shield, QStringLiteral("brick-wall-shield"));
+    maps.stringToIcon.insert(QStringLiteral("brick-wall-shield"), Icons::brick_wall_shield);
+    maps.iconToString.insert(Icons::briefcase, QStringLiteral("briefcase"));
+    maps.stringToIcon.insert(QStringLiteral("briefcase"), Icons::briefcase);
+    maps.iconToString.insert(Icons::briefcase_business, QStringLiteral("briefcase-business"));
+    maps.stringToIcon.insert(QStringLiteral("briefcase-business"), Icons::briefcase_business);
+    maps.iconToString.insert(Icons::briefcase_conveyor_belt,
+                             QStringLiteral("briefcase-conveyor-belt"));
+    maps.stringToIcon.insert(QStringLiteral("briefcase-conveyor-belt"),
+                             Icons::briefcase_conveyor_belt);
+    maps.iconToString.insert(Icons::briefcase_medical, QStringLiteral("briefcase-medical"));
+    maps.stringToIcon.insert(QStringLiteral("briefcase-medical"), Icons::briefcase_medical);
+    maps.iconToString.insert(Icons::bring_to_front, QStringLiteral("bring-to-front"));
+    maps.stringToIcon.insert(QStringLiteral("bring-to-front"), Icons::bring_to_front);
+    maps.iconToString.insert(Icons::brush, QStringLiteral("brush"));
+    maps.stringToIcon.insert(QStringLiteral("brush"), Icons::brush);
+    maps.iconToString.insert(Icons::brush_cleaning, QStringLiteral("brush-cleaning"));
+    maps.stringToIcon.insert(QStringLiteral("brush-cleaning"), Icons::brush_cleaning);
+    maps.iconToString.insert(Icons::bubbles, QStringLiteral("bubbles"));
+    maps.stringToIcon.insert(QStringLiteral("bubbles"), Icons::bubbles);
+    maps.iconToString.insert(Icons::bug, QStringLiteral("bug"));
+    maps.stringToIcon.insert(QStringLiteral("bug"), Icons::bug);
+    maps.iconToString.insert(Icons::bug_off, QStringLiteral("bug-off"));
+    maps.stringToIcon.insert(QStringLiteral("bug-off"), Icons::bug_off);
+    maps.iconToString.insert(Icons::bug_play, QStringLiteral("bug-play"));
+    maps.stringToIcon.insert(QStringLiteral("bug-play"), Icons::bug_play);
+    maps.iconToString.insert(Icons::building, QStringLiteral("building"));
+    maps.stringToIcon.insert(QStringLiteral("building"), Icons::building);
+    maps.iconToString.insert(Icons::building_2, QStringLiteral("building-2"));
+    maps.stringToIcon.insert(QStringLiteral("building-2"), Icons::building_2);
+    maps.iconToString.insert(Icons::bus, QStringLiteral("bus"));
+    maps.stringToIcon.insert(QStringLiteral("bus"), Icons::bus);
+    maps.iconToString.insert(Icons::bus_front, QStringLiteral("bus-front"));
+    maps.stringToIcon.insert(QStringLiteral("bus-front"), Icons::bus_front);
+    maps.iconToString.insert(Icons::cable, QStringLiteral("cable"));
+    maps.stringToIcon.insert(QStringLiteral("cable"), Icons::cable);
+    maps.iconToString.insert(Icons::cable_car, QStringLiteral("cable-car"));
+    maps.stringToIcon.insert(QStringLiteral("cable-car"), Icons::cable_car);
+    maps.iconToString.insert(Icons::cake, QStringLiteral("cake"));
+    maps.stringToIcon.insert(QStringLiteral("cake"), Icons::cake);
+    maps.iconToString.insert(Icons::cake_slice, QStringLiteral("cake-slice"));
+    maps.stringToIcon.insert(QStringLiteral("cake-slice"), Icons::cake_slice);
+    maps.iconToString.insert(Icons::calculator, QStringLiteral("calculator"));
+    maps.stringToIcon.insert(QStringLiteral("calculator"), Icons::calculator);
+    maps.iconToString.insert(Icons::calendar, QStringLiteral("calendar"));
+    maps.stringToIcon.insert(QStringLiteral("calendar"), Icons::calendar);
+    maps.iconToString.insert(Icons::calendar_1, QStringLiteral("calendar-1"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-1"), Icons::calendar_1);
+    maps.iconToString.insert(Icons::calendar_arrow_down, QStringLiteral("calendar-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-arrow-down"), Icons::calendar_arrow_down);
+    maps.iconToString.insert(Icons::calendar_arrow_up, QStringLiteral("calendar-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-arrow-up"), Icons::calendar_arrow_up);
+    maps.iconToString.insert(Icons::calendar_check, QStringLiteral("calendar-check"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-check"), Icons::calendar_check);
+    maps.iconToString.insert(Icons::calendar_check_2, QStringLiteral("calendar-check-2"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-check-2"), Icons::calendar_check_2);
+    maps.iconToString.insert(Icons::calendar_clock, QStringLiteral("calendar-clock"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-clock"), Icons::calendar_clock);
+    maps.iconToString.insert(Icons::calendar_cog, QStringLiteral("calendar-cog"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-cog"), Icons::calendar_cog);
+    maps.iconToString.insert(Icons::calendar_days, QStringLiteral("calendar-days"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-days"), Icons::calendar_days);
+    maps.iconToString.insert(Icons::calendar_fold, QStringLiteral("calendar-fold"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-fold"), Icons::calendar_fold);
+    maps.iconToString.insert(Icons::calendar_heart, QStringLiteral("calendar-heart"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-heart"), Icons::calendar_heart);
+    maps.iconToString.insert(Icons::calendar_minus, QStringLiteral("calendar-minus"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-minus"), Icons::calendar_minus);
+    maps.iconToString.insert(Icons::calendar_minus_2, QStringLiteral("calendar-minus-2"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-minus-2"), Icons::calendar_minus_2);
+    maps.iconToString.insert(Icons::calendar_off, QStringLiteral("calendar-off"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-off"), Icons::calendar_off);
+    maps.iconToString.insert(Icons::calendar_plus, QStringLiteral("calendar-plus"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-plus"), Icons::calendar_plus);
+    maps.iconToString.insert(Icons::calendar_plus_2, QStringLiteral("calendar-plus-2"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-plus-2"), Icons::calendar_plus_2);
+    maps.iconToString.insert(Icons::calendar_range, QStringLiteral("calendar-range"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-range"), Icons::calendar_range);
+    maps.iconToString.insert(Icons::calendar_search, QStringLiteral("calendar-search"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-search"), Icons::calendar_search);
+    maps.iconToString.insert(Icons::calendar_sync, QStringLiteral("calendar-sync"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-sync"), Icons::calendar_sync);
+    maps.iconToString.insert(Icons::calendar_x, QStringLiteral("calendar-x"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-x"), Icons::calendar_x);
+    maps.iconToString.insert(Icons::calendar_x_2, QStringLiteral("calendar-x-2"));
+    maps.stringToIcon.insert(QStringLiteral("calendar-x-2"), Icons::calendar_x_2);
+    maps.iconToString.insert(Icons::camera, QStringLiteral("camera"));
+    maps.stringToIcon.insert(QStringLiteral("camera"), Icons::camera);
+    maps.iconToString.insert(Icons::camera_off, QStringLiteral("camera-off"));
+    maps.stringToIcon.insert(QStringLiteral("camera-off"), Icons::camera_off);
+    maps.iconToString.insert(Icons::candy, QStringLiteral("candy"));
+    maps.stringToIcon.insert(QStringLiteral("candy"), Icons::candy);
+    maps.iconToString.insert(Icons::candy_cane, QStringLiteral("candy-cane"));
+    maps.stringToIcon.insert(QStringLiteral("candy-cane"), Icons::candy_cane);
+    maps.iconToString.insert(Icons::candy_off, QStringLiteral("candy-off"));
+    maps.stringToIcon.insert(QStringLiteral("candy-off"), Icons::candy_off);
+    maps.iconToString.insert(Icons::cannabis, QStringLiteral("cannabis"));
+    maps.stringToIcon.insert(QStringLiteral("cannabis"), Icons::cannabis);
+    maps.iconToString.insert(Icons::captions, QStringLiteral("captions"));
+    maps.stringToIcon.insert(QStringLiteral("captions"), Icons::captions);
+    maps.iconToString.insert(Icons::captions_off, QStringLiteral("captions-off"));
+    maps.stringToIcon.insert(QStringLiteral("captions-off"), Icons::captions_off);
+    maps.iconToString.insert(Icons::car, QStringLiteral("car"));
+    maps.stringToIcon.insert(QStringLiteral("car"), Icons::car);
+    maps.iconToString.insert(Icons::car_front, QStringLiteral("car-front"));
+    maps.stringToIcon.insert(QStringLiteral("car-front"), Icons::car_front);
+    maps.iconToString.insert(Icons::car_taxi_front, QStringLiteral("car-taxi-front"));
+    maps.stringToIcon.insert(QStringLiteral("car-taxi-front"), Icons::car_taxi_front);
+    maps.iconToString.insert(Icons::caravan, QStringLiteral("caravan"));
+    maps.stringToIcon.insert(QStringLiteral("caravan"), Icons::caravan);
+    maps.iconToString.insert(Icons::card_sim, QStringLiteral("card-sim"));
+    maps.stringToIcon.insert(QStringLiteral("card-sim"), Icons::card_sim);
+    maps.iconToString.insert(Icons::carrot, QStringLiteral("carrot"));
+    maps.stringToIcon.insert(QStringLiteral("carrot"), Icons::carrot);
+    maps.iconToString.insert(Icons::case_lower, QStringLiteral("case-lower"));
+    maps.stringToIcon.insert(QStringLiteral("case-lower"), Icons::case_lower);
+    maps.iconToString.insert(Icons::case_sensitive, QStringLiteral("case-sensitive"));
+    maps.stringToIcon.insert(QStringLiteral("case-sensitive"), Icons::case_sensitive);
+    maps.iconToString.insert(Icons::case_upper, QStringLiteral("case-upper"));
+    maps.stringToIcon.insert(QStringLiteral("case-upper"), Icons::case_upper);
+    maps.iconToString.insert(Icons::cassette_tape, QStringLiteral("cassette-tape"));
+    maps.stringToIcon.insert(QStringLiteral("cassette-tape"), Icons::cassette_tape);
+    maps.iconToString.insert(Icons::cast, QStringLiteral("cast"));
+    maps.stringToIcon.insert(QStringLiteral("cast"), Icons::cast);
+    maps.iconToString.insert(Icons::castle, QStringLiteral("castle"));
+    maps.stringToIcon.insert(QStringLiteral("castle"), Icons::castle);
+    maps.iconToString.insert(Icons::cat, QStringLiteral("cat"));
+    maps.stringToIcon.insert(QStringLiteral("cat"), Icons::cat);
+    maps.iconToString.insert(Icons::cctv, QStringLiteral("cctv"));
+    maps.stringToIcon.insert(QStringLiteral("cctv"), Icons::cctv);
+    maps.iconToString.insert(Icons::chart_area, QStringLiteral("chart-area"));
+    maps.stringToIcon.insert(QStringLiteral("chart-area"), Icons::chart_area);
+    maps.iconToString.insert(Icons::chart_bar, QStringLiteral("chart-bar"));
+    maps.stringToIcon.insert(QStringLiteral("chart-bar"), Icons::chart_bar);
+    maps.iconToString.insert(Icons::chart_bar_big, QStringLiteral("chart-bar-big"));
+    maps.stringToIcon.insert(QStringLiteral("chart-bar-big"), Icons::chart_bar_big);
+    maps.iconToString.insert(Icons::chart_bar_decreasing, QStringLiteral("chart-bar-decreasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-bar-decreasing"), Icons::chart_bar_decreasing);
+    maps.iconToString.insert(Icons::chart_bar_increasing, QStringLiteral("chart-bar-increasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-bar-increasing"), Icons::chart_bar_increasing);
+    maps.iconToString.insert(Icons::chart_bar_stacked, QStringLiteral("chart-bar-stacked"));
+    maps.stringToIcon.insert(QStringLiteral("chart-bar-stacked"), Icons::chart_bar_stacked);
+    maps.iconToString.insert(Icons::chart_candlestick, QStringLiteral("chart-candlestick"));
+    maps.stringToIcon.insert(QStringLiteral("chart-candlestick"), Icons::chart_candlestick);
+    maps.iconToString.insert(Icons::chart_column, QStringLiteral("chart-column"));
+    maps.stringToIcon.insert(QStringLiteral("chart-column"), Icons::chart_column);
+    maps.iconToString.insert(Icons::chart_column_big, QStringLiteral("chart-column-big"));
+    maps.stringToIcon.insert(QStringLiteral("chart-column-big"), Icons::chart_column_big);
+    maps.iconToString.insert(Icons::chart_column_decreasing,
+                             QStringLiteral("chart-column-decreasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-column-decreasing"),
+                             Icons::chart_column_decreasing);
+    maps.iconToString.insert(Icons::chart_column_increasing,
+                             QStringLiteral("chart-column-increasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-column-increasing"),
+                             Icons::chart_column_increasing);
+    maps.iconToString.insert(Icons::chart_column_stacked, QStringLiteral("chart-column-stacked"));
+    maps.stringToIcon.insert(QStringLiteral("chart-column-stacked"), Icons::chart_column_stacked);
+    maps.iconToString.insert(Icons::chart_gantt, QStringLiteral("chart-gantt"));
+    maps.stringToIcon.insert(QStringLiteral("chart-gantt"), Icons::chart_gantt);
+    maps.iconToString.insert(Icons::chart_line, QStringLiteral("chart-line"));
+    maps.stringToIcon.insert(QStringLiteral("chart-line"), Icons::chart_line);
+    maps.iconToString.insert(Icons::chart_network, QStringLiteral("chart-network"));
+    maps.stringToIcon.insert(QStringLiteral("chart-network"), Icons::chart_network);
+    maps.iconToString.insert(Icons::chart_no_axes_column, QStringLiteral("chart-no-axes-column"));
+    maps.stringToIcon.insert(QStringLiteral("chart-no-axes-column"), Icons::chart_no_axes_column);
+    maps.iconToString.insert(Icons::chart_no_axes_column_decreasing,
+                             QStringLiteral("chart-no-axes-column-decreasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-no-axes-column-decreasing"),
+                             Icons::chart_no_axes_column_decreasing);
+    maps.iconToString.insert(Icons::chart_no_axes_column_increasing,
+                             QStringLiteral("chart-no-axes-column-increasing"));
+    maps.stringToIcon.insert(QStringLiteral("chart-no-axes-column-increasing"),
+                             Icons::chart_no_axes_column_increasing);
+    maps.iconToString.insert(Icons::chart_no_axes_combined,
+                             QStringLiteral("chart-no-axes-combined"));
+    maps.stringToIcon.insert(QStringLiteral("chart-no-axes-combined"),
+                             Icons::chart_no_axes_combined);
+    maps.iconToString.insert(Icons::chart_no_axes_gantt, QStringLiteral("chart-no-axes-gantt"));
+    maps.stringToIcon.insert(QStringLiteral("chart-no-axes-gantt"), Icons::chart_no_axes_gantt);
+    maps.iconToString.insert(Icons::chart_pie, QStringLiteral("chart-pie"));
+    maps.stringToIcon.insert(QStringLiteral("chart-pie"), Icons::chart_pie);
+    maps.iconToString.insert(Icons::chart_scatter, QStringLiteral("chart-scatter"));
+    maps.stringToIcon.insert(QStringLiteral("chart-scatter"), Icons::chart_scatter);
+    maps.iconToString.insert(Icons::chart_spline, QStringLiteral("chart-spline"));
+    maps.stringToIcon.insert(QStringLiteral("chart-spline"), Icons::chart_spline);
+    maps.iconToString.insert(Icons::check, QStringLiteral("check"));
+    maps.stringToIcon.insert(QStringLiteral("check"), Icons::check);
+    maps.iconToString.insert(Icons::check_check, QStringLiteral("check-check"));
+    maps.stringToIcon.insert(QStringLiteral("check-check"), Icons::check_check);
+    maps.iconToString.insert(Icons::check_line, QStringLiteral("check-line"));
+    maps.stringToIcon.insert(QStringLiteral("check-line"), Icons::check_line);
+    maps.iconToString.insert(Icons::chef_hat, QStringLiteral("chef-hat"));
+    maps.stringToIcon.insert(QStringLiteral("chef-hat"), Icons::chef_hat);
+    maps.iconToString.insert(Icons::cherry, QStringLiteral("cherry"));
+    maps.stringToIcon.insert(QStringLiteral("cherry"), Icons::cherry);
+    maps.iconToString.insert(Icons::chevron_down, QStringLiteral("chevron-down"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-down"), Icons::chevron_down);
+    maps.iconToString.insert(Icons::chevron_first, QStringLiteral("chevron-first"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-first"), Icons::chevron_first);
+    maps.iconToString.insert(Icons::chevron_last, QStringLiteral("chevron-last"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-last"), Icons::chevron_last);
+    maps.iconToString.insert(Icons::chevron_left, QStringLiteral("chevron-left"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-left"), Icons::chevron_left);
+    maps.iconToString.insert(Icons::chevron_right, QStringLiteral("chevron-right"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-right"), Icons::chevron_right);
+    maps.iconToString.insert(Icons::chevron_up, QStringLiteral("chevron-up"));
+    maps.stringToIcon.insert(QStringLiteral("chevron-up"), Icons::chevron_up);
+    maps.iconToString.insert(Icons::chevrons_down, QStringLiteral("chevrons-down"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-down"), Icons::chevrons_down);
+    maps.iconToString.insert(Icons::chevrons_down_up, QStringLiteral("chevrons-down-up"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-down-up"), Icons::chevrons_down_up);
+    maps.iconToString.insert(Icons::chevrons_left, QStringLiteral("chevrons-left"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-left"), Icons::chevrons_left);
+    maps.iconToString.insert(Icons::chevrons_left_right, QStringLiteral("chevrons-left-right"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-left-right"), Icons::chevrons_left_right);
+    maps.iconToString.insert(Icons::chevrons_left_right_ellipsis,
+                             QStringLiteral("chevrons-left-right-ellipsis"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-left-right-ellipsis"),
+                             Icons::chevrons_left_right_ellipsis);
+    maps.iconToString.insert(Icons::chevrons_right, QStringLiteral("chevrons-right"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-right"), Icons::chevrons_right);
+    maps.iconToString.insert(Icons::chevrons_right_left, QStringLiteral("chevrons-right-left"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-right-left"), Icons::chevrons_right_left);
+    maps.iconToString.insert(Icons::chevrons_up, QStringLiteral("chevrons-up"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-up"), Icons::chevrons_up);
+    maps.iconToString.insert(Icons::chevrons_up_down, QStringLiteral("chevrons-up-down"));
+    maps.stringToIcon.insert(QStringLiteral("chevrons-up-down"), Icons::chevrons_up_down);
+    maps.iconToString.insert(Icons::chromium, QStringLiteral("chromium"));
+    maps.stringToIcon.insert(QStringLiteral("chromium"), Icons::chromium);
+    maps.iconToString.insert(Icons::church, QStringLiteral("church"));
+    maps.stringToIcon.insert(QStringLiteral("church"), Icons::church);
+    maps.iconToString.insert(Icons::cigarette, QStringLiteral("cigarette"));
+    maps.stringToIcon.insert(QStringLiteral("cigarette"), Icons::cigarette);
+    maps.iconToString.insert(Icons::cigarette_off, QStringLiteral("cigarette-off"));
+    maps.stringToIcon.insert(QStringLiteral("cigarette-off"), Icons::cigarette_off);
+    maps.iconToString.insert(Icons::circle, QStringLiteral("circle"));
+    maps.stringToIcon.insert(QStringLiteral("circle"), Icons::circle);
+    maps.iconToString.insert(Icons::circle_alert, QStringLiteral("circle-alert"));
+    maps.stringToIcon.insert(QStringLiteral("circle-alert"), Icons::circle_alert);
+    maps.iconToString.insert(Icons::circle_arrow_down, QStringLiteral("circle-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-down"), Icons::circle_arrow_down);
+    maps.iconToString.insert(Icons::circle_arrow_left, QStringLiteral("circle-arrow-left"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-left"), Icons::circle_arrow_left);
+    maps.iconToString.insert(Icons::circle_arrow_out_down_left,
+                             QStringLiteral("circle-arrow-out-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-out-down-left"),
+                             Icons::circle_arrow_out_down_left);
+    maps.iconToString.insert(Icons::circle_arrow_out_down_right,
+                             QStringLiteral("circle-arrow-out-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-out-down-right"),
+                             Icons::circle_arrow_out_down_right);
+    maps.iconToString.insert(Icons::circle_arrow_out_up_left,
+                             QStringLiteral("circle-arrow-out-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-out-up-left"),
+                             Icons::circle_arrow_out_up_left);
+    maps.iconToString.insert(Icons::circle_arrow_out_up_right,
+                             QStringLiteral("circle-arrow-out-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-out-up-right"),
+                             Icons::circle_arrow_out_up_right);
+    maps.iconToString.insert(Icons::circle_arrow_right, QStringLiteral("circle-arrow-right"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-right"), Icons::circle_arrow_right);
+    maps.iconToString.insert(Icons::circle_arrow_up, QStringLiteral("circle-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("circle-arrow-up"), Icons::circle_arrow_up);
+    maps.iconToString.insert(Icons::circle_check, QStringLiteral("circle-check"));
+    maps.stringToIcon.insert(QStringLiteral("circle-check"), Icons::circle_check);
+    maps.iconToString.insert(Icons::circle_check_big, QStringLiteral("circle-check-big"));
+    maps.stringToIcon.insert(QStringLiteral("circle-check-big"), Icons::circle_check_big);
+    maps.iconToString.insert(Icons::circle_chevron_down, QStringLiteral("circle-chevron-down"));
+    maps.stringToIcon.insert(QStringLiteral("circle-chevron-down"), Icons::circle_chevron_down);
+    maps.iconToString.insert(Icons::circle_chevron_left, QStringLiteral("circle-chevron-left"));
+    maps.stringToIcon.insert(QStringLiteral("circle-chevron-left"), Icons::circle_chevron_left);
+    maps.iconToString.insert(Icons::circle_chevron_right, QStringLiteral("circle-chevron-right"));
+    maps.stringToIcon.insert(QStringLiteral("circle-chevron-right"), Icons::circle_chevron_right);
+    maps.iconToString.insert(Icons::circle_chevron_up, QStringLiteral("circle-chevron-up"));
+    maps.stringToIcon.insert(QStringLiteral("circle-chevron-up"), Icons::circle_chevron_up);
+    maps.iconToString.insert(Icons::circle_dashed, QStringLiteral("circle-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("circle-dashed"), Icons::circle_dashed);
+    maps.iconToString.insert(Icons::circle_divide, QStringLiteral("circle-divide"));
+    maps.stringToIcon.insert(QStringLiteral("circle-divide"), Icons::circle_divide);
+    maps.iconToString.insert(Icons::circle_dollar_sign, QStringLiteral("circle-dollar-sign"));
+    maps.stringToIcon.insert(QStringLiteral("circle-dollar-sign"), Icons::circle_dollar_sign);
+    maps.iconToString.insert(Icons::circle_dot, QStringLiteral("circle-dot"));
+    maps.stringToIcon.insert(QStringLiteral("circle-dot"), Icons::circle_dot);
+    maps.iconToString.insert(Icons::circle_dot_dashed, QStringLiteral("circle-dot-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("circle-dot-dashed"), Icons::circle_dot_dashed);
+    maps.iconToString.insert(Icons::circle_ellipsis, QStringLiteral("circle-ellipsis"));
+    maps.stringToIcon.insert(QStringLiteral("circle-ellipsis"), Icons::circle_ellipsis);
+    maps.iconToString.insert(Icons::circle_equal, QStringLiteral("circle-equal"));
+    maps.stringToIcon.insert(QStringLiteral("circle-equal"), Icons::circle_equal);
+    maps.iconToString.insert(Icons::circle_fading_arrow_up,
+                             QStringLiteral("circle-fading-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("circle-fading-arrow-up"),
+                             Icons::circle_fading_arrow_up);
+    maps.iconToString.insert(Icons::circle_fading_plus, QStringLiteral("circle-fading-plus"));
+    maps.stringToIcon.insert(QStringLiteral("circle-fading-plus"), Icons::circle_fading_plus);
+    maps.iconToString.insert(Icons::circle_gauge, QStringLiteral("circle-gauge"));
+    maps.stringToIcon.insert(QStringLiteral("circle-gauge"), Icons::circle_gauge);
+    maps.iconToString.insert(Icons::circle_minus, QStringLiteral("circle-minus"));
+    maps.stringToIcon.insert(QStringLiteral("circle-minus"), Icons::circle_minus);
+    maps.iconToString.insert(Icons::circle_off, QStringLiteral("circle-off"));
+    maps.stringToIcon.insert(QStringLiteral("circle-off"), Icons::circle_off);
+    maps.iconToString.insert(Icons::circle_parking, QStringLiteral("circle-parking"));
+    maps.stringToIcon.insert(QStringLiteral("circle-parking"), Icons::circle_parking);
+    maps.iconToString.insert(Icons::circle_parking_off, QStringLiteral("circle-parking-off"));
+    maps.stringToIcon.insert(QStringLiteral("circle-parking-off"), Icons::circle_parking_off);
+    maps.iconToString.insert(Icons::circle_pause, QStringLiteral("circle-pause"));
+    maps.stringToIcon.insert(QStringLiteral("circle-pause"), Icons::circle_pause);
+    maps.iconToString.insert(Icons::circle_percent, QStringLiteral("circle-percent"));
+    maps.stringToIcon.insert(QStringLiteral("circle-percent"), Icons::circle_percent);
+    maps.iconToString.insert(Icons::circle_play, QStringLiteral("circle-play"));
+    maps.stringToIcon.insert(QStringLiteral("circle-play"), Icons::circle_play);
+    maps.iconToString.insert(Icons::circle_plus, QStringLiteral("circle-plus"));
+    maps.stringToIcon.insert(QStringLiteral("circle-plus"), Icons::circle_plus);
+    maps.iconToString.insert(Icons::circle_pound_sterling, QStringLiteral("circle-pound-sterling"));
+    maps.stringToIcon.insert(QStringLiteral("circle-pound-sterling"), Icons::circle_pound_sterling);
+    maps.iconToString.insert(Icons::circle_power, QStringLiteral("circle-power"));
+    maps.stringToIcon.insert(QStringLiteral("circle-power"), Icons::circle_power);
+    maps.iconToString.insert(Icons::circle_question_mark, QStringLiteral("circle-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("circle-question-mark"), Icons::circle_question_mark);
+    maps.iconToString.insert(Icons::circle_slash, QStringLiteral("circle-slash"));
+    maps.stringToIcon.insert(QStringLiteral("circle-slash"), Icons::circle_slash);
+    maps.iconToString.insert(Icons::circle_slash_2, QStringLiteral("circle-slash-2"));
+    maps.stringToIcon.insert(QStringLiteral("circle-slash-2"), Icons::circle_slash_2);
+    maps.iconToString.insert(Icons::circle_small, QStringLiteral("circle-small"));
+    maps.stringToIcon.insert(QStringLiteral("circle-small"), Icons::circle_small);
+    maps.iconToString.insert(Icons::circle_star, QStringLiteral("circle-star"));
+    maps.stringToIcon.insert(QStringLiteral("circle-star"), Icons::circle_star);
+    maps.iconToString.insert(Icons::circle_stop, QStringLiteral("circle-stop"));
+    maps.stringToIcon.insert(QStringLiteral("circle-stop"), Icons::circle_stop);
+    maps.iconToString.insert(Icons::circle_user, QStringLiteral("circle-user"));
+    maps.stringToIcon.insert(QStringLiteral("circle-user"), Icons::circle_user);
+    maps.iconToString.insert(Icons::circle_user_round, QStringLiteral("circle-user-round"));
+    maps.stringToIcon.insert(QStringLiteral("circle-user-round"), Icons::circle_user_round);
+    maps.iconToString.insert(Icons::circle_x, QStringLiteral("circle-x"));
+    maps.stringToIcon.insert(QStringLiteral("circle-x"), Icons::circle_x);
+    maps.iconToString.insert(Icons::circuit_board, QStringLiteral("circuit-board"));
+    maps.stringToIcon.insert(QStringLiteral("circuit-board"), Icons::circuit_board);
+    maps.iconToString.insert(Icons::citrus, QStringLiteral("citrus"));
+    maps.stringToIcon.insert(QStringLiteral("citrus"), Icons::citrus);
+    maps.iconToString.insert(Icons::clapperboard, QStringLiteral("clapperboard"));
+    maps.stringToIcon.insert(QStringLiteral("clapperboard"), Icons::clapperboard);
+    maps.iconToString.insert(Icons::clipboard, QStringLiteral("clipboard"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard"), Icons::clipboard);
+    maps.iconToString.insert(Icons::clipboard_check, QStringLiteral("clipboard-check"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-check"), Icons::clipboard_check);
+    maps.iconToString.insert(Icons::clipboard_clock, QStringLiteral("clipboard-clock"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-clock"), Icons::clipboard_clock);
+    maps.iconToString.insert(Icons::clipboard_copy, QStringLiteral("clipboard-copy"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-copy"), Icons::clipboard_copy);
+    maps.iconToString.insert(Icons::clipboard_list, QStringLiteral("clipboard-list"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-list"), Icons::clipboard_list);
+    maps.iconToString.insert(Icons::clipboard_minus, QStringLiteral("clipboard-minus"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-minus"), Icons::clipboard_minus);
+    maps.iconToString.insert(Icons::clipboard_paste, QStringLiteral("clipboard-paste"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-paste"), Icons::clipboard_paste);
+    maps.iconToString.insert(Icons::clipboard_pen, QStringLiteral("clipboard-pen"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-pen"), Icons::clipboard_pen);
+    maps.iconToString.insert(Icons::clipboard_pen_line, QStringLiteral("clipboard-pen-line"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-pen-line"), Icons::clipboard_pen_line);
+    maps.iconToString.insert(Icons::clipboard_plus, QStringLiteral("clipboard-plus"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-plus"), Icons::clipboard_plus);
+    maps.iconToString.insert(Icons::clipboard_type, QStringLiteral("clipboard-type"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-type"), Icons::clipboard_type);
+    maps.iconToString.insert(Icons::clipboard_x, QStringLiteral("clipboard-x"));
+    maps.stringToIcon.insert(QStringLiteral("clipboard-x"), Icons::clipboard_x);
+    maps.iconToString.insert(Icons::clock, QStringLiteral("clock"));
+    maps.stringToIcon.insert(QStringLiteral("clock"), Icons::clock);
+    maps.iconToString.insert(Icons::clock_1, QStringLiteral("clock-1"));
+    maps.stringToIcon.insert(QStringLiteral("clock-1"), Icons::clock_1);
+    maps.iconToString.insert(Icons::clock_10, QStringLiteral("clock-10"));
+    maps.stringToIcon.insert(QStringLiteral("clock-10"), Icons::clock_10);
+    maps.iconToString.insert(Icons::clock_11, QStringLiteral("clock-11"));
+    maps.stringToIcon.insert(QStringLiteral("clock-11"), Icons::clock_11);
+    maps.iconToString.insert(Icons::clock_12, QStringLiteral("clock-12"));
+    maps.stringToIcon.insert(QStringLiteral("clock-12"), Icons::clock_12);
+    maps.iconToString.insert(Icons::clock_2, QStringLiteral("clock-2"));
+    maps.stringToIcon.insert(QStringLiteral("clock-2"), Icons::clock_2);
+    maps.iconToString.insert(Icons::clock_3, QStringLiteral("clock-3"));
+    maps.stringToIcon.insert(QStringLiteral("clock-3"), Icons::clock_3);
+    maps.iconToString.insert(Icons::clock_4, QStringLiteral("clock-4"));
+    maps.stringToIcon.insert(QStringLiteral("clock-4"), Icons::clock_4);
+    maps.iconToString.insert(Icons::clock_5, QStringLiteral("clock-5"));
+    maps.stringToIcon.insert(QStringLiteral("clock-5"), Icons::clock_5);
+    maps.iconToString.insert(Icons::clock_6, QStringLiteral("clock-6"));
+    maps.stringToIcon.insert(QStringLiteral("clock-6"), Icons::clock_6);
+    maps.iconToString.insert(Icons::clock_7, QStringLiteral("clock-7"));
+    maps.stringToIcon.insert(QStringLiteral("clock-7"), Icons::clock_7);
+    maps.iconToString.insert(Icons::clock_8, QStringLiteral("clock-8"));
+    maps.stringToIcon.insert(QStringLiteral("clock-8"), Icons::clock_8);
+    maps.iconToString.insert(Icons::clock_9, QStringLiteral("clock-9"));
+    maps.stringToIcon.insert(QStringLiteral("clock-9"), Icons::clock_9);
+    maps.iconToString.insert(Icons::clock_alert, QStringLiteral("clock-alert"));
+    maps.stringToIcon.insert(QStringLiteral("clock-alert"), Icons::clock_alert);
+    maps.iconToString.insert(Icons::clock_arrow_down, QStringLiteral("clock-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("clock-arrow-down"), Icons::clock_arrow_down);
+    maps.iconToString.insert(Icons::clock_arrow_up, QStringLiteral("clock-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("clock-arrow-up"), Icons::clock_arrow_up);
+    maps.iconToString.insert(Icons::clock_fading, QStringLiteral("clock-fading"));
+    maps.stringToIcon.insert(QStringLiteral("clock-fading"), Icons::clock_fading);
+    maps.iconToString.insert(Icons::clock_plus, QStringLiteral("clock-plus"));
+    maps.stringToIcon.insert(QStringLiteral("clock-plus"), Icons::clock_plus);
+    maps.iconToString.insert(Icons::closed_caption, QStringLiteral("closed-caption"));
+    maps.stringToIcon.insert(QStringLiteral("closed-caption"), Icons::closed_caption);
+    maps.iconToString.insert(Icons::cloud, QStringLiteral("cloud"));
+    maps.stringToIcon.insert(QStringLiteral("cloud"), Icons::cloud);
+    maps.iconToString.insert(Icons::cloud_alert, QStringLiteral("cloud-alert"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-alert"), Icons::cloud_alert);
+    maps.iconToString.insert(Icons::cloud_check, QStringLiteral("cloud-check"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-check"), Icons::cloud_check);
+    maps.iconToString.insert(Icons::cloud_cog, QStringLiteral("cloud-cog"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-cog"), Icons::cloud_cog);
+    maps.iconToString.insert(Icons::cloud_download, QStringLiteral("cloud-download"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-download"), Icons::cloud_download);
+    maps.iconToString.insert(Icons::cloud_drizzle, QStringLiteral("cloud-drizzle"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-drizzle"), Icons::cloud_drizzle);
+    maps.iconToString.insert(Icons::cloud_fog, QStringLiteral("cloud-fog"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-fog"), Icons::cloud_fog);
+    maps.iconToString.insert(Icons::cloud_hail, QStringLiteral("cloud-hail"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-hail"), Icons::cloud_hail);
+    maps.iconToString.insert(Icons::cloud_lightning, QStringLiteral("cloud-lightning"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-lightning"), Icons::cloud_lightning);
+    maps.iconToString.insert(Icons::cloud_moon, QStringLiteral("cloud-moon"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-moon"), Icons::cloud_moon);
+    maps.iconToString.insert(Icons::cloud_moon_rain, QStringLiteral("cloud-moon-rain"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-moon-rain"), Icons::cloud_moon_rain);
+    maps.iconToString.insert(Icons::cloud_off, QStringLiteral("cloud-off"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-off"), Icons::cloud_off);
+    maps.iconToString.insert(Icons::cloud_rain, QStringLiteral("cloud-rain"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-rain"), Icons::cloud_rain);
+    maps.iconToString.insert(Icons::cloud_rain_wind, QStringLiteral("cloud-rain-wind"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-rain-wind"), Icons::cloud_rain_wind);
+    maps.iconToString.insert(Icons::cloud_snow, QStringLiteral("cloud-snow"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-snow"), Icons::cloud_snow);
+    maps.iconToString.insert(Icons::cloud_sun, QStringLiteral("cloud-sun"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-sun"), Icons::cloud_sun);
+    maps.iconToString.insert(Icons::cloud_sun_rain, QStringLiteral("cloud-sun-rain"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-sun-rain"), Icons::cloud_sun_rain);
+    maps.iconToString.insert(Icons::cloud_upload, QStringLiteral("cloud-upload"));
+    maps.stringToIcon.insert(QStringLiteral("cloud-upload"), Icons::cloud_upload);
+    maps.iconToString.insert(Icons::cloudy, QStringLiteral("cloudy"));
+    maps.stringToIcon.insert(QStringLiteral("cloudy"), Icons::cloudy);
+    maps.iconToString.insert(Icons::clover, QStringLiteral("clover"));
+    maps.stringToIcon.insert(QStringLiteral("clover"), Icons::clover);
+    maps.iconToString.insert(Icons::club, QStringLiteral("club"));
+    maps.stringToIcon.insert(QStringLiteral("club"), Icons::club);
+    maps.iconToString.insert(Icons::code, QStringLiteral("code"));
+    maps.stringToIcon.insert(QStringLiteral("code"), Icons::code);
+    maps.iconToString.insert(Icons::code_xml, QStringLiteral("code-xml"));
+    maps.stringToIcon.insert(QStringLiteral("code-xml"), Icons::code_xml);
+    maps.iconToString.insert(Icons::codepen, QStringLiteral("codepen"));
+    maps.stringToIcon.insert(QStringLiteral("codepen"), Icons::codepen);
+    maps.iconToString.insert(Icons::codesandbox, QStringLiteral("codesandbox"));
+    maps.stringToIcon.insert(QStringLiteral("codesandbox"), Icons::codesandbox);
+    maps.iconToString.insert(Icons::coffee, QStringLiteral("coffee"));
+    maps.stringToIcon.insert(QStringLiteral("coffee"), Icons::coffee);
+    maps.iconToString.insert(Icons::cog, QStringLiteral("cog"));
+    maps.stringToIcon.insert(QStringLiteral("cog"), Icons::cog);
+    maps.iconToString.insert(Icons::coins, QStringLiteral("coins"));
+    maps.stringToIcon.insert(QStringLiteral("coins"), Icons::coins);
+    maps.iconToString.insert(Icons::columns_2, QStringLiteral("columns-2"));
+    maps.stringToIcon.insert(QStringLiteral("columns-2"), Icons::columns_2);
+    maps.iconToString.insert(Icons::columns_3, QStringLiteral("columns-3"));
+    maps.stringToIcon.insert(QStringLiteral("columns-3"), Icons::columns_3);
+    maps.iconToString.insert(Icons::columns_3_cog, QStringLiteral("columns-3-cog"));
+    maps.stringToIcon.insert(QStringLiteral("columns-3-cog"), Icons::columns_3_cog);
+    maps.iconToString.insert(Icons::columns_4, QStringLiteral("columns-4"));
+    maps.stringToIcon.insert(QStringLiteral("columns-4"), Icons::columns_4);
+    maps.iconToString.insert(Icons::combine, QStringLiteral("combine"));
+    maps.stringToIcon.insert(QStringLiteral("combine"), Icons::combine);
+    maps.iconToString.insert(Icons::command, QStringLiteral("command"));
+    maps.stringToIcon.insert(QStringLiteral("command"), Icons::command);
+    maps.iconToString.insert(Icons::compass, QStringLiteral("compass"));
+    maps.stringToIcon.insert(QStringLiteral("compass"), Icons::compass);
+    maps.iconToString.insert(Icons::component, QStringLiteral("component"));
+    maps.stringToIcon.insert(QStringLiteral("component"), Icons::component);
+    maps.iconToString.insert(Icons::computer, QStringLiteral("computer"));
+    maps.stringToIcon.insert(QStringLiteral("computer"), Icons::computer);
+    maps.iconToString.insert(Icons::concierge_bell, QStringLiteral("concierge-bell"));
+    maps.stringToIcon.insert(QStringLiteral("concierge-bell"), Icons::concierge_bell);
+    maps.iconToString.insert(Icons::cone, QStringLiteral("cone"));
+    maps.stringToIcon.insert(QStringLiteral("cone"), Icons::cone);
+    maps.iconToString.insert(Icons::construction, QStringLiteral("construction"));
+    maps.stringToIcon.insert(QStringLiteral("construction"), Icons::construction);
+    maps.iconToString.insert(Icons::contact, QStringLiteral("contact"));
+    maps.stringToIcon.insert(QStringLiteral("contact"), Icons::contact);
+    maps.iconToString.insert(Icons::contact_round, QStringLiteral("contact-round"));
+    maps.stringToIcon.insert(QStringLiteral("contact-round"), Icons::contact_round);
+    maps.iconToString.insert(Icons::container, QStringLiteral("container"));
+    maps.stringToIcon.insert(QStringLiteral("container"), Icons::container);
+    maps.iconToString.insert(Icons::contrast, QStringLiteral("contrast"));
+    maps.stringToIcon.insert(QStringLiteral("contrast"), Icons::contrast);
+    maps.iconToString.insert(Icons::cookie, QStringLiteral("cookie"));
+    maps.stringToIcon.insert(QStringLiteral("cookie"), Icons::cookie);
+    maps.iconToString.insert(Icons::cooking_pot, QStringLiteral("cooking-pot"));
+    maps.stringToIcon.insert(QStringLiteral("cooking-pot"), Icons::cooking_pot);
+    maps.iconToString.insert(Icons::copy, QStringLiteral("copy"));
+    maps.stringToIcon.insert(QStringLiteral("copy"), Icons::copy);
+    maps.iconToString.insert(Icons::copy_check, QStringLiteral("copy-check"));
+    maps.stringToIcon.insert(QStringLiteral("copy-check"), Icons::copy_check);
+    maps.iconToString.insert(Icons::copy_minus, QStringLiteral("copy-minus"));
+    maps.stringToIcon.insert(QStringLiteral("copy-minus"), Icons::copy_minus);
+    maps.iconToString.insert(Icons::copy_plus, QStringLiteral("copy-plus"));
+    maps.stringToIcon.insert(QStringLiteral("copy-plus"), Icons::copy_plus);
+    maps.iconToString.insert(Icons::copy_slash, QStringLiteral("copy-slash"));
+    maps.stringToIcon.insert(QStringLiteral("copy-slash"), Icons::copy_slash);
+    maps.iconToString.insert(Icons::copy_x, QStringLiteral("copy-x"));
+    maps.stringToIcon.insert(QStringLiteral("copy-x"), Icons::copy_x);
+    maps.iconToString.insert(Icons::copyleft, QStringLiteral("copyleft"));
+    maps.stringToIcon.insert(QStringLiteral("copyleft"), Icons::copyleft);
+    maps.iconToString.insert(Icons::copyright, QStringLiteral("copyright"));
+    maps.stringToIcon.insert(QStringLiteral("copyright"), Icons::copyright);
+    maps.iconToString.insert(Icons::corner_down_left, QStringLiteral("corner-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("corner-down-left"), Icons::corner_down_left);
+    maps.iconToString.insert(Icons::corner_down_right, QStringLiteral("corner-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("corner-down-right"), Icons::corner_down_right);
+    maps.iconToString.insert(Icons::corner_left_down, QStringLiteral("corner-left-down"));
+    maps.stringToIcon.insert(QStringLiteral("corner-left-down"), Icons::corner_left_down);
+    maps.iconToString.insert(Icons::corner_left_up, QStringLiteral("corner-left-up"));
+    maps.stringToIcon.insert(QStringLiteral("corner-left-up"), Icons::corner_left_up);
+    maps.iconToString.insert(Icons::corner_right_down, QStringLiteral("corner-right-down"));
+    maps.stringToIcon.insert(QStringLiteral("corner-right-down"), Icons::corner_right_down);
+    maps.iconToString.insert(Icons::corner_right_up, QStringLiteral("corner-right-up"));
+    maps.stringToIcon.insert(QStringLiteral("corner-right-up"), Icons::corner_right_up);
+    maps.iconToString.insert(Icons::corner_up_left, QStringLiteral("corner-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("corner-up-left"), Icons::corner_up_left);
+    maps.iconToString.insert(Icons::corner_up_right, QStringLiteral("corner-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("corner-up-right"), Icons::corner_up_right);
+    maps.iconToString.insert(Icons::cpu, QStringLiteral("cpu"));
+    maps.stringToIcon.insert(QStringLiteral("cpu"), Icons::cpu);
+    maps.iconToString.insert(Icons::creative_commons, QStringLiteral("creative-commons"));
+    maps.stringToIcon.insert(QStringLiteral("creative-commons"), Icons::creative_commons);
+    maps.iconToString.insert(Icons::credit_card, QStringLiteral("credit-card"));
+    maps.stringToIcon.insert(QStringLiteral("credit-card"), Icons::credit_card);
+    maps.iconToString.insert(Icons::croissant, QStringLiteral("croissant"));
+    maps.stringToIcon.insert(QStringLiteral("croissant"), Icons::croissant);
+    maps.iconToString.insert(Icons::crop, QStringLiteral("crop"));
+    maps.stringToIcon.insert(QStringLiteral("crop"), Icons::crop);
+    maps.iconToString.insert(Icons::cross, QStringLiteral("cross"));
+    maps.stringToIcon.insert(QStringLiteral("cross"), Icons::cross);
+    maps.iconToString.insert(Icons::crosshair, QStringLiteral("crosshair"));
+    maps.stringToIcon.insert(QStringLiteral("crosshair"), Icons::crosshair);
+    maps.iconToString.insert(Icons::crown, QStringLiteral("crown"));
+    maps.stringToIcon.insert(QStringLiteral("crown"), Icons::crown);
+    maps.iconToString.insert(Icons::cuboid, QStringLiteral("cuboid"));
+    maps.stringToIcon.insert(QStringLiteral("cuboid"), Icons::cuboid);
+    maps.iconToString.insert(Icons::cup_soda, QStringLiteral("cup-soda"));
+    maps.stringToIcon.insert(QStringLiteral("cup-soda"), Icons::cup_soda);
+    maps.iconToString.insert(Icons::currency, QStringLiteral("currency"));
+    maps.stringToIcon.insert(QStringLiteral("currency"), Icons::currency);
+    maps.iconToString.insert(Icons::cylinder, QStringLiteral("cylinder"));
+    maps.stringToIcon.insert(QStringLiteral("cylinder"), Icons::cylinder);
+    maps.iconToString.insert(Icons::dam, QStringLiteral("dam"));
+    maps.stringToIcon.insert(QStringLiteral("dam"), Icons::dam);
+    maps.iconToString.insert(Icons::database, QStringLiteral("database"));
+    maps.stringToIcon.insert(QStringLiteral("database"), Icons::database);
+    maps.iconToString.insert(Icons::database_backup, QStringLiteral("database-backup"));
+    maps.stringToIcon.insert(QStringLiteral("database-backup"), Icons::database_backup);
+    maps.iconToString.insert(Icons::database_zap, QStringLiteral("database-zap"));
+    maps.stringToIcon.insert(QStringLiteral("database-zap"), Icons::database_zap);
+    maps.iconToString.insert(Icons::decimals_arrow_left, QStringLiteral("decimals-arrow-left"));
+    maps.stringToIcon.insert(QStringLiteral("decimals-arrow-left"), Icons::decimals_arrow_left);
+    maps.iconToString.insert(Icons::decimals_arrow_right, QStringLiteral("decimals-arrow-right"));
+    maps.stringToIcon.insert(QStringLiteral("decimals-arrow-right"), Icons::decimals_arrow_right);
+    maps.iconToString.insert(Icons::icon_delete, QStringLiteral("delete"));
+    maps.stringToIcon.insert(QStringLiteral("delete"), Icons::icon_delete);
+    maps.iconToString.insert(Icons::dessert, QStringLiteral("dessert"));
+    maps.stringToIcon.insert(QStringLiteral("dessert"), Icons::dessert);
+    maps.iconToString.insert(Icons::diameter, QStringLiteral("diameter"));
+    maps.stringToIcon.insert(QStringLiteral("diameter"), Icons::diameter);
+    maps.iconToString.insert(Icons::diamond, QStringLiteral("diamond"));
+    maps.stringToIcon.insert(QStringLiteral("diamond"), Icons::diamond);
+    maps.iconToString.insert(Icons::diamond_minus, QStringLiteral("diamond-minus"));
+    maps.stringToIcon.insert(QStringLiteral("diamond-minus"), Icons::diamond_minus);
+    maps.iconToString.insert(Icons::diamond_percent, QStringLiteral("diamond-percent"));
+    maps.stringToIcon.insert(QStringLiteral("diamond-percent"), Icons::diamond_percent);
+    maps.iconToString.insert(Icons::diamond_plus, QStringLiteral("diamond-plus"));
+    maps.stringToIcon.insert(QStringLiteral("diamond-plus"), Icons::diamond_plus);
+    maps.iconToString.insert(Icons::dice_1, QStringLiteral("dice-1"));
+    maps.stringToIcon.insert(QStringLiteral("dice-1"), Icons::dice_1);
+    maps.iconToString.insert(Icons::dice_2, QStringLiteral("dice-2"));
+    maps.stringToIcon.insert(QStringLiteral("dice-2"), Icons::dice_2);
+    maps.iconToString.insert(Icons::dice_3, QStringLiteral("dice-3"));
+    maps.stringToIcon.insert(QStringLiteral("dice-3"), Icons::dice_3);
+    maps.iconToString.insert(Icons::dice_4, QStringLiteral("dice-4"));
+    maps.stringToIcon.insert(QStringLiteral("dice-4"), Icons::dice_4);
+    maps.iconToString.insert(Icons::dice_5, QStringLiteral("dice-5"));
+    maps.stringToIcon.insert(QStringLiteral("dice-5"), Icons::dice_5);
+    maps.iconToString.insert(Icons::dice_6, QStringLiteral("dice-6"));
+    maps.stringToIcon.insert(QStringLiteral("dice-6"), Icons::dice_6);
+    maps.iconToString.insert(Icons::dices, QStringLiteral("dices"));
+    maps.stringToIcon.insert(QStringLiteral("dices"), Icons::dices);
+    maps.iconToString.insert(Icons::diff, QStringLiteral("diff"));
+    maps.stringToIcon.insert(QStringLiteral("diff"), Icons::diff);
+    maps.iconToString.insert(Icons::disc, QStringLiteral("disc"));
+    maps.stringToIcon.insert(QStringLiteral("disc"), Icons::disc);
+    maps.iconToString.insert(Icons::disc_2, QStringLiteral("disc-2"));
+    maps.stringToIcon.insert(QStringLiteral("disc-2"), Icons::disc_2);
+    maps.iconToString.insert(Icons::disc_3, QStringLiteral("disc-3"));
+    maps.stringToIcon.insert(QStringLiteral("disc-3"), Icons::disc_3);
+    maps.iconToString.insert(Icons::disc_album, QStringLiteral("disc-album"));
+    maps.stringToIcon.insert(QStringLiteral("disc-album"), Icons::disc_album);
+    maps.iconToString.insert(Icons::divide, QStringLiteral("divide"));
+    maps.stringToIcon.insert(QStringLiteral("divide"), Icons::divide);
+    maps.iconToString.insert(Icons::dna, QStringLiteral("dna"));
+    maps.stringToIcon.insert(QStringLiteral("dna"), Icons::dna);
+    maps.iconToString.insert(Icons::dna_off, QStringLiteral("dna-off"));
+    maps.stringToIcon.insert(QStringLiteral("dna-off"), Icons::dna_off);
+    maps.iconToString.insert(Icons::dock, QStringLiteral("dock"));
+    maps.stringToIcon.insert(QStringLiteral("dock"), Icons::dock);
+    maps.iconToString.insert(Icons::dog, QStringLiteral("dog"));
+    maps.stringToIcon.insert(QStringLiteral("dog"), Icons::dog);
+    maps.iconToString.insert(Icons::dollar_sign, QStringLiteral("dollar-sign"));
+    maps.stringToIcon.insert(QStringLiteral("dollar-sign"), Icons::dollar_sign);
+    maps.iconToString.insert(Icons::donut, QStringLiteral("donut"));
+    maps.stringToIcon.insert(QStringLiteral("donut"), Icons::donut);
+    maps.iconToString.insert(Icons::door_closed, QStringLiteral("door-closed"));
+    maps.stringToIcon.insert(QStringLiteral("door-closed"), Icons::door_closed);
+    maps.iconToString.insert(Icons::door_closed_locked, QStringLiteral("door-closed-locked"));
+    maps.stringToIcon.insert(QStringLiteral("door-closed-locked"), Icons::door_closed_locked);
+    maps.iconToString.insert(Icons::door_open, QStringLiteral("door-open"));
+    maps.stringToIcon.insert(QStringLiteral("door-open"), Icons::door_open);
+    maps.iconToString.insert(Icons::dot, QStringLiteral("dot"));
+    maps.stringToIcon.insert(QStringLiteral("dot"), Icons::dot);
+    maps.iconToString.insert(Icons::download, QStringLiteral("download"));
+    maps.stringToIcon.insert(QStringLiteral("download"), Icons::download);
+    maps.iconToString.insert(Icons::drafting_compass, QStringLiteral("drafting-compass"));
+    maps.stringToIcon.insert(QStringLiteral("drafting-compass"), Icons::drafting_compass);
+    maps.iconToString.insert(Icons::drama, QStringLiteral("drama"));
+    maps.stringToIcon.insert(QStringLiteral("drama"), Icons::drama);
+    maps.iconToString.insert(Icons::dribbble, QStringLiteral("dribbble"));
+    maps.stringToIcon.insert(QStringLiteral("dribbble"), Icons::dribbble);
+    maps.iconToString.insert(Icons::drill, QStringLiteral("drill"));
+    maps.stringToIcon.insert(QStringLiteral("drill"), Icons::drill);
+    maps.iconToString.insert(Icons::drone, QStringLiteral("drone"));
+    maps.stringToIcon.insert(QStringLiteral("drone"), Icons::drone);
+    maps.iconToString.insert(Icons::droplet, QStringLiteral("droplet"));
+    maps.stringToIcon.insert(QStringLiteral("droplet"), Icons::droplet);
+    maps.iconToString.insert(Icons::droplet_off, QStringLiteral("droplet-off"));
+    maps.stringToIcon.insert(QStringLiteral("droplet-off"), Icons::droplet_off);
+    maps.iconToString.insert(Icons::droplets, QStringLiteral("droplets"));
+    maps.stringToIcon.insert(QStringLiteral("droplets"), Icons::droplets);
+    maps.iconToString.insert(Icons::drum, QStringLiteral("drum"));
+    maps.stringToIcon.insert(QStringLiteral("drum"), Icons::drum);
+    maps.iconToString.insert(Icons::drumstick, QStringLiteral("drumstick"));
+    maps.stringToIcon.insert(QStringLiteral("drumstick"), Icons::drumstick);
+    maps.iconToString.insert(Icons::dumbbell, QStringLiteral("dumbbell"));
+    maps.stringToIcon.insert(QStringLiteral("dumbbell"), Icons::dumbbell);
+    maps.iconToString.insert(Icons::ear, QStringLiteral("ear"));
+    maps.stringToIcon.insert(QStringLiteral("ear"), Icons::ear);
+    maps.iconToString.insert(Icons::ear_off, QStringLiteral("ear-off"));
+    maps.stringToIcon.insert(QStringLiteral("ear-off"), Icons::ear_off);
+    maps.iconToString.insert(Icons::earth, QStringLiteral("earth"));
+    maps.stringToIcon.insert(QStringLiteral("earth"), Icons::earth);
+    maps.iconToString.insert(Icons::earth_lock, QStringLiteral("earth-lock"));
+    maps.stringToIcon.insert(QStringLiteral("earth-lock"), Icons::earth_lock);
+    maps.iconToString.insert(Icons::eclipse, QStringLiteral("eclipse"));
+    maps.stringToIcon.insert(QStringLiteral("eclipse"), Icons::eclipse);
+    maps.iconToString.insert(Icons::egg, QStringLiteral("egg"));
+    maps.stringToIcon.insert(QStringLiteral("egg"), Icons::egg);
+    maps.iconToString.insert(Icons::egg_fried, QStringLiteral("egg-fried"));
+    maps.stringToIcon.insert(QStringLiteral("egg-fried"), Icons::egg_fried);
+    maps.iconToString.insert(Icons::egg_off, QStringLiteral("egg-off"));
+    maps.stringToIcon.insert(QStringLiteral("egg-off"), Icons::egg_off);
+    maps.iconToString.insert(Icons::ellipsis, QStringLiteral("ellipsis"));
+    maps.stringToIcon.insert(QStringLiteral("ellipsis"), Icons::ellipsis);
+    maps.iconToString.insert(Icons::ellipsis_vertical, QStringLiteral("ellipsis-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("ellipsis-vertical"), Icons::ellipsis_vertical);
+    maps.iconToString.insert(Icons::equal, QStringLiteral("equal"));
+    maps.stringToIcon.insert(QStringLiteral("equal"), Icons::equal);
+    maps.iconToString.insert(Icons::equal_approximately, QStringLiteral("equal-approximately"));
+    maps.stringToIcon.insert(QStringLiteral("equal-approximately"), Icons::equal_approximately);
+    maps.iconToString.insert(Icons::equal_not, QStringLiteral("equal-not"));
+    maps.stringToIcon.insert(QStringLiteral("equal-not"), Icons::equal_not);
+    maps.iconToString.insert(Icons::eraser, QStringLiteral("eraser"));
+    maps.stringToIcon.insert(QStringLiteral("eraser"), Icons::eraser);
+    maps.iconToString.insert(Icons::ethernet_port, QStringLiteral("ethernet-port"));
+    maps.stringToIcon.insert(QStringLiteral("ethernet-port"), Icons::ethernet_port);
+    maps.iconToString.insert(Icons::euro, QStringLiteral("euro"));
+    maps.stringToIcon.insert(QStringLiteral("euro"), Icons::euro);
+    maps.iconToString.insert(Icons::expand, QStringLiteral("expand"));
+    maps.stringToIcon.insert(QStringLiteral("expand"), Icons::expand);
+    maps.iconToString.insert(Icons::external_link, QStringLiteral("external-link"));
+    maps.stringToIcon.insert(QStringLiteral("external-link"), Icons::external_link);
+    maps.iconToString.insert(Icons::eye, QStringLiteral("eye"));
+    maps.stringToIcon.insert(QStringLiteral("eye"), Icons::eye);
+    maps.iconToString.insert(Icons::eye_closed, QStringLiteral("eye-closed"));
+    maps.stringToIcon.insert(QStringLiteral("eye-closed"), Icons::eye_closed);
+    maps.iconToString.insert(Icons::eye_off, QStringLiteral("eye-off"));
+    maps.stringToIcon.insert(QStringLiteral("eye-off"), Icons::eye_off);
+    maps.iconToString.insert(Icons::facebook, QStringLiteral("facebook"));
+    maps.stringToIcon.insert(QStringLiteral("facebook"), Icons::facebook);
+    maps.iconToString.insert(Icons::factory, QStringLiteral("factory"));
+    maps.stringToIcon.insert(QStringLiteral("factory"), Icons::factory);
+    maps.iconToString.insert(Icons::fan, QStringLiteral("fan"));
+    maps.stringToIcon.insert(QStringLiteral("fan"), Icons::fan);
+    maps.iconToString.insert(Icons::fast_forward, QStringLiteral("fast-forward"));
+    maps.stringToIcon.insert(QStringLiteral("fast-forward"), Icons::fast_forward);
+    maps.iconToString.insert(Icons::feather, QStringLiteral("feather"));
+    maps.stringToIcon.insert(QStringLiteral("feather"), Icons::feather);
+    maps.iconToString.insert(Icons::fence, QStringLiteral("fence"));
+    maps.stringToIcon.insert(QStringLiteral("fence"), Icons::fence);
+    maps.iconToString.insert(Icons::ferris_wheel, QStringLiteral("ferris-wheel"));
+    maps.stringToIcon.insert(QStringLiteral("ferris-wheel"), Icons::ferris_wheel);
+    maps.iconToString.insert(Icons::figma, QStringLiteral("figma"));
+    maps.stringToIcon.insert(QStringLiteral("figma"), Icons::figma);
+    maps.iconToString.insert(Icons::file, QStringLiteral("file"));
+    maps.stringToIcon.insert(QStringLiteral("file"), Icons::file);
+    maps.iconToString.insert(Icons::file_archive, QStringLiteral("file-archive"));
+    maps.stringToIcon.insert(QStringLiteral("file-archive"), Icons::file_archive);
+    maps.iconToString.insert(Icons::file_audio, QStringLiteral("file-audio"));
+    maps.stringToIcon.insert(QStringLiteral("file-audio"), Icons::file_audio);
+    maps.iconToString.insert(Icons::file_audio_2, QStringLiteral("file-audio-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-audio-2"), Icons::file_audio_2);
+    maps.iconToString.insert(Icons::file_axis_3d, QStringLiteral("file-axis-3d"));
+    maps.stringToIcon.insert(QStringLiteral("file-axis-3d"), Icons::file_axis_3d);
+    maps.iconToString.insert(Icons::file_badge, QStringLiteral("file-badge"));
+    maps.stringToIcon.insert(QStringLiteral("file-badge"), Icons::file_badge);
+    maps.iconToString.insert(Icons::file_badge_2, QStringLiteral("file-badge-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-badge-2"), Icons::file_badge_2);
+    maps.iconToString.insert(Icons::file_box, QStringLiteral("file-box"));
+    maps.stringToIcon.insert(QStringLiteral("file-box"), Icons::file_box);
+    maps.iconToString.insert(Icons::file_chart_column, QStringLiteral("file-chart-column"));
+    maps.stringToIcon.insert(QStringLiteral("file-chart-column"), Icons::file_chart_column);
+    maps.iconToString.insert(Icons::file_chart_column_increasing,
+                             QStringLiteral("file-chart-column-increasing"));
+    maps.stringToIcon.insert(QStringLiteral("file-chart-column-increasing"),
+                             Icons::file_chart_column_increasing);
+    maps.iconToString.insert(Icons::file_chart_line, QStringLiteral("file-chart-line"));
+    maps.stringToIcon.insert(QStringLiteral("file-chart-line"), Icons::file_chart_line);
+    maps.iconToString.insert(Icons::file_chart_pie, QStringLiteral("file-chart-pie"));
+    maps.stringToIcon.insert(QStringLiteral("file-chart-pie"), Icons::file_chart_pie);
+    maps.iconToString.insert(Icons::file_check, QStringLiteral("file-check"));
+    maps.stringToIcon.insert(QStringLiteral("file-check"), Icons::file_check);
+    maps.iconToString.insert(Icons::file_check_2, QStringLiteral("file-check-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-check-2"), Icons::file_check_2);
+    maps.iconToString.insert(Icons::file_clock, QStringLiteral("file-clock"));
+    maps.stringToIcon.insert(QStringLiteral("file-clock"), Icons::file_clock);
+    maps.iconToString.insert(Icons::file_code, QStringLiteral("file-code"));
+    maps.stringToIcon.insert(QStringLiteral("file-code"), Icons::file_code);
+    maps.iconToString.insert(Icons::file_code_2, QStringLiteral("file-code-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-code-2"), Icons::file_code_2);
+    maps.iconToString.insert(Icons::file_cog, QStringLiteral("file-cog"));
+    maps.stringToIcon.insert(QStringLiteral("file-cog"), Icons::file_cog);
+    maps.iconToString.insert(Icons::file_diff, QStringLiteral("file-diff"));
+    maps.stringToIcon.insert(QStringLiteral("file-diff"), Icons::file_diff);
+    maps.iconToString.insert(Icons::file_digit, QStringLiteral("file-digit"));
+    maps.stringToIcon.insert(QStringLiteral("file-digit"), Icons::file_digit);
+    maps.iconToString.insert(Icons::file_down, QStringLiteral("file-down"));
+    maps.stringToIcon.insert(QStringLiteral("file-down"), Icons::file_down);
+    maps.iconToString.insert(Icons::file_heart, QStringLiteral("file-heart"));
+    maps.stringToIcon.insert(QStringLiteral("file-heart"), Icons::file_heart);
+    maps.iconToString.insert(Icons::file_image, QStringLiteral("file-image"));
+    maps.stringToIcon.insert(QStringLiteral("file-image"), Icons::file_image);
+    maps.iconToString.insert(Icons::file_input, QStringLiteral("file-input"));
+    maps.stringToIcon.insert(QStringLiteral("file-input"), Icons::file_input);
+    maps.iconToString.insert(Icons::file_json, QStringLiteral("file-json"));
+    maps.stringToIcon.insert(QStringLiteral("file-json"), Icons::file_json);
+    maps.iconToString.insert(Icons::file_json_2, QStringLiteral("file-json-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-json-2"), Icons::file_json_2);
+    maps.iconToString.insert(Icons::file_key, QStringLiteral("file-key"));
+    maps.stringToIcon.insert(QStringLiteral("file-key"), Icons::file_key);
+    maps.iconToString.insert(Icons::file_key_2, QStringLiteral("file-key-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-key-2"), Icons::file_key_2);
+    maps.iconToString.insert(Icons::file_lock, QStringLiteral("file-lock"));
+    maps.stringToIcon.insert(QStringLiteral("file-lock"), Icons::file_lock);
+    maps.iconToString.insert(Icons::file_lock_2, QStringLiteral("file-lock-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-lock-2"), Icons::file_lock_2);
+    maps.iconToString.insert(Icons::file_minus, QStringLiteral("file-minus"));
+    maps.stringToIcon.insert(QStringLiteral("file-minus"), Icons::file_minus);
+    maps.iconToString.insert(Icons::file_minus_2, QStringLiteral("file-minus-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-minus-2"), Icons::file_minus_2);
+    maps.iconToString.insert(Icons::file_music, QStringLiteral("file-music"));
+    maps.stringToIcon.insert(QStringLiteral("file-music"), Icons::file_music);
+    maps.iconToString.insert(Icons::file_output, QStringLiteral("file-output"));
+    maps.stringToIcon.insert(QStringLiteral("file-output"), Icons::file_output);
+    maps.iconToString.insert(Icons::file_pen, QStringLiteral("file-pen"));
+    maps.stringToIcon.insert(QStringLiteral("file-pen"), Icons::file_pen);
+    maps.iconToString.insert(Icons::file_pen_line, QStringLiteral("file-pen-line"));
+    maps.stringToIcon.insert(QStringLiteral("file-pen-line"), Icons::file_pen_line);
+    maps.iconToString.insert(Icons::file_play, QStringLiteral("file-play"));
+    maps.stringToIcon.insert(QStringLiteral("file-play"), Icons::file_play);
+    maps.iconToString.insert(Icons::file_plus, QStringLiteral("file-plus"));
+    maps.stringToIcon.insert(QStringLiteral("file-plus"), Icons::file_plus);
+    maps.iconToString.insert(Icons::file_plus_2, QStringLiteral("file-plus-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-plus-2"), Icons::file_plus_2);
+    maps.iconToString.insert(Icons::file_question_mark, QStringLiteral("file-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("file-question-mark"), Icons::file_question_mark);
+    maps.iconToString.insert(Icons::file_scan, QStringLiteral("file-scan"));
+    maps.stringToIcon.insert(QStringLiteral("file-scan"), Icons::file_scan);
+    maps.iconToString.insert(Icons::file_search, QStringLiteral("file-search"));
+    maps.stringToIcon.insert(QStringLiteral("file-search"), Icons::file_search);
+    maps.iconToString.insert(Icons::file_search_2, QStringLiteral("file-search-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-search-2"), Icons::file_search_2);
+    maps.iconToString.insert(Icons::file_sliders, QStringLiteral("file-sliders"));
+    maps.stringToIcon.insert(QStringLiteral("file-sliders"), Icons::file_sliders);
+    maps.iconToString.insert(Icons::file_spreadsheet, QStringLiteral("file-spreadsheet"));
+    maps.stringToIcon.insert(QStringLiteral("file-spreadsheet"), Icons::file_spreadsheet);
+    maps.iconToString.insert(Icons::file_stack, QStringLiteral("file-stack"));
+    maps.stringToIcon.insert(QStringLiteral("file-stack"), Icons::file_stack);
+    maps.iconToString.insert(Icons::file_symlink, QStringLiteral("file-symlink"));
+    maps.stringToIcon.insert(QStringLiteral("file-symlink"), Icons::file_symlink);
+    maps.iconToString.insert(Icons::file_terminal, QStringLiteral("file-terminal"));
+    maps.stringToIcon.insert(QStringLiteral("file-terminal"), Icons::file_terminal);
+    maps.iconToString.insert(Icons::file_text, QStringLiteral("file-text"));
+    maps.stringToIcon.insert(QStringLiteral("file-text"), Icons::file_text);
+    maps.iconToString.insert(Icons::file_type, QStringLiteral("file-type"));
+    maps.stringToIcon.insert(QStringLiteral("file-type"), Icons::file_type);
+    maps.iconToString.insert(Icons::file_type_2, QStringLiteral("file-type-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-type-2"), Icons::file_type_2);
+    maps.iconToString.insert(Icons::file_up, QStringLiteral("file-up"));
+    maps.stringToIcon.insert(QStringLiteral("file-up"), Icons::file_up);
+    maps.iconToString.insert(Icons::file_user, QStringLiteral("file-user"));
+    maps.stringToIcon.insert(QStringLiteral("file-user"), Icons::file_user);
+    maps.iconToString.insert(Icons::file_video_camera, QStringLiteral("file-video-camera"));
+    maps.stringToIcon.insert(QStringLiteral("file-video-camera"), Icons::file_video_camera);
+    maps.iconToString.insert(Icons::file_volume, QStringLiteral("file-volume"));
+    maps.stringToIcon.insert(QStringLiteral("file-volume"), Icons::file_volume);
+    maps.iconToString.insert(Icons::file_volume_2, QStringLiteral("file-volume-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-volume-2"), Icons::file_volume_2);
+    maps.iconToString.insert(Icons::file_warning, QStringLiteral("file-warning"));
+    maps.stringToIcon.insert(QStringLiteral("file-warning"), Icons::file_warning);
+    maps.iconToString.insert(Icons::file_x, QStringLiteral("file-x"));
+    maps.stringToIcon.insert(QStringLiteral("file-x"), Icons::file_x);
+    maps.iconToString.insert(Icons::file_x_2, QStringLiteral("file-x-2"));
+    maps.stringToIcon.insert(QStringLiteral("file-x-2"), Icons::file_x_2);
+    maps.iconToString.insert(Icons::files, QStringLiteral("files"));
+    maps.stringToIcon.insert(QStringLiteral("files"), Icons::files);
+    maps.iconToString.insert(Icons::film, QStringLiteral("film"));
+    maps.stringToIcon.insert(QStringLiteral("film"), Icons::film);
+    maps.iconToString.insert(Icons::fingerprint, QStringLiteral("fingerprint"));
+    maps.stringToIcon.insert(QStringLiteral("fingerprint"), Icons::fingerprint);
+    maps.iconToString.insert(Icons::fire_extinguisher, QStringLiteral("fire-extinguisher"));
+    maps.stringToIcon.insert(QStringLiteral("fire-extinguisher"), Icons::fire_extinguisher);
+    maps.iconToString.insert(Icons::fish, QStringLiteral("fish"));
+    maps.stringToIcon.insert(QStringLiteral("fish"), Icons::fish);
+    maps.iconToString.insert(Icons::fish_off, QStringLiteral("fish-off"));
+    maps.stringToIcon.insert(QStringLiteral("fish-off"), Icons::fish_off);
+    maps.iconToString.insert(Icons::fish_symbol, QStringLiteral("fish-symbol"));
+    maps.stringToIcon.insert(QStringLiteral("fish-symbol"), Icons::fish_symbol);
+    maps.iconToString.insert(Icons::flag, QStringLiteral("flag"));
+    maps.stringToIcon.insert(QStringLiteral("flag"), Icons::flag);
+    maps.iconToString.insert(Icons::flag_off, QStringLiteral("flag-off"));
+    maps.stringToIcon.insert(QStringLiteral("flag-off"), Icons::flag_off);
+    maps.iconToString.insert(Icons::flag_triangle_left, QStringLiteral("flag-triangle-left"));
+    maps.stringToIcon.insert(QStringLiteral("flag-triangle-left"), Icons::flag_triangle_left);
+    maps.iconToString.insert(Icons::flag_triangle_right, QStringLiteral("flag-triangle-right"));
+    maps.stringToIcon.insert(QStringLiteral("flag-triangle-right"), Icons::flag_triangle_right);
+    maps.iconToString.insert(Icons::flame, QStringLiteral("flame"));
+    maps.stringToIcon.insert(QStringLiteral("flame"), Icons::flame);
+    maps.iconToString.insert(Icons::flame_kindling, QStringLiteral("flame-kindling"));
+    maps.stringToIcon.insert(QStringLiteral("flame-kindling"), Icons::flame_kindling);
+    maps.iconToString.insert(Icons::flashlight, QStringLiteral("flashlight"));
+    maps.stringToIcon.insert(QStringLiteral("flashlight"), Icons::flashlight);
+    maps.iconToString.insert(Icons::flashlight_off, QStringLiteral("flashlight-off"));
+    maps.stringToIcon.insert(QStringLiteral("flashlight-off"), Icons::flashlight_off);
+    maps.iconToString.insert(Icons::flask_conical, QStringLiteral("flask-conical"));
+    maps.stringToIcon.insert(QStringLiteral("flask-conical"), Icons::flask_conical);
+    maps.iconToString.insert(Icons::flask_conical_off, QStringLiteral("flask-conical-off"));
+    maps.stringToIcon.insert(QStringLiteral("flask-conical-off"), Icons::flask_conical_off);
+    maps.iconToString.insert(Icons::flask_round, QStringLiteral("flask-round"));
+    maps.stringToIcon.insert(QStringLiteral("flask-round"), Icons::flask_round);
+    maps.iconToString.insert(Icons::flip_horizontal, QStringLiteral("flip-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("flip-horizontal"), Icons::flip_horizontal);
+    maps.iconToString.insert(Icons::flip_horizontal_2, QStringLiteral("flip-horizontal-2"));
+    maps.stringToIcon.insert(QStringLiteral("flip-horizontal-2"), Icons::flip_horizontal_2);
+    maps.iconToString.insert(Icons::flip_vertical, QStringLiteral("flip-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("flip-vertical"), Icons::flip_vertical);
+    maps.iconToString.insert(Icons::flip_vertical_2, QStringLiteral("flip-vertical-2"));
+    maps.stringToIcon.insert(QStringLiteral("flip-vertical-2"), Icons::flip_vertical_2);
+    maps.iconToString.insert(Icons::flower, QStringLiteral("flower"));
+    maps.stringToIcon.insert(QStringLiteral("flower"), Icons::flower);
+    maps.iconToString.insert(Icons::flower_2, QStringLiteral("flower-2"));
+    maps.stringToIcon.insert(QStringLiteral("flower-2"), Icons::flower_2);
+    maps.iconToString.insert(Icons::focus, QStringLiteral("focus"));
+    maps.stringToIcon.insert(QStringLiteral("focus"), Icons::focus);
+    maps.iconToString.insert(Icons::fold_horizontal, QStringLiteral("fold-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("fold-horizontal"), Icons::fold_horizontal);
+    maps.iconToString.insert(Icons::fold_vertical, QStringLiteral("fold-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("fold-vertical"), Icons::fold_vertical);
+    maps.iconToString.insert(Icons::folder, QStringLiteral("folder"));
+    maps.stringToIcon.insert(QStringLiteral("folder"), Icons::folder);
+    maps.iconToString.insert(Icons::folder_archive, QStringLiteral("folder-archive"));
+    maps.stringToIcon.insert(QStringLiteral("folder-archive"), Icons::folder_archive);
+    maps.iconToString.insert(Icons::folder_check, QStringLiteral("folder-check"));
+    maps.stringToIcon.insert(QStringLiteral("folder-check"), Icons::folder_check);
+    maps.iconToString.insert(Icons::folder_clock, QStringLiteral("folder-clock"));
+    maps.stringToIcon.insert(QStringLiteral("folder-clock"), Icons::folder_clock);
+    maps.iconToString.insert(Icons::folder_closed, QStringLiteral("folder-closed"));
+    maps.stringToIcon.insert(QStringLiteral("folder-closed"), Icons::folder_closed);
+    maps.iconToString.insert(Icons::folder_code, QStringLiteral("folder-code"));
+    maps.stringToIcon.insert(QStringLiteral("folder-code"), Icons::folder_code);
+    maps.iconToString.insert(Icons::folder_cog, QStringLiteral("folder-cog"));
+    maps.stringToIcon.insert(QStringLiteral("folder-cog"), Icons::folder_cog);
+    maps.iconToString.insert(Icons::folder_dot, QStringLiteral("folder-dot"));
+    maps.stringToIcon.insert(QStringLiteral("folder-dot"), Icons::folder_dot);
+    maps.iconToString.insert(Icons::folder_down, QStringLiteral("folder-down"));
+    maps.stringToIcon.insert(QStringLiteral("folder-down"), Icons::folder_down);
+    maps.iconToString.insert(Icons::folder_git, QStringLiteral("folder-git"));
+    maps.stringToIcon.insert(QStringLiteral("folder-git"), Icons::folder_git);
+    maps.iconToString.insert(Icons::folder_git_2, QStringLiteral("folder-git-2"));
+    maps.stringToIcon.insert(QStringLiteral("folder-git-2"), Icons::folder_git_2);
+    maps.iconToString.insert(Icons::folder_heart, QStringLiteral("folder-heart"));
+    maps.stringToIcon.insert(QStringLiteral("folder-heart"), Icons::folder_heart);
+    maps.iconToString.insert(Icons::folder_input, QStringLiteral("folder-input"));
+    maps.stringToIcon.insert(QStringLiteral("folder-input"), Icons::folder_input);
+    maps.iconToString.insert(Icons::folder_kanban, QStringLiteral("folder-kanban"));
+    maps.stringToIcon.insert(QStringLiteral("folder-kanban"), Icons::folder_kanban);
+    maps.iconToString.insert(Icons::folder_key, QStringLiteral("folder-key"));
+    maps.stringToIcon.insert(QStringLiteral("folder-key"), Icons::folder_key);
+    maps.iconToString.insert(Icons::folder_lock, QStringLiteral("folder-lock"));
+    maps.stringToIcon.insert(QStringLiteral("folder-lock"), Icons::folder_lock);
+    maps.iconToString.insert(Icons::folder_minus, QStringLiteral("folder-minus"));
+    maps.stringToIcon.insert(QStringLiteral("folder-minus"), Icons::folder_minus);
+    maps.iconToString.insert(Icons::folder_open, QStringLiteral("folder-open"));
+    maps.stringToIcon.insert(QStringLiteral("folder-open"), Icons::folder_open);
+    maps.iconToString.insert(Icons::folder_open_dot, QStringLiteral("folder-open-dot"));
+    maps.stringToIcon.insert(QStringLiteral("folder-open-dot"), Icons::folder_open_dot);
+    maps.iconToString.insert(Icons::folder_output, QStringLiteral("folder-output"));
+    maps.stringToIcon.insert(QStringLiteral("folder-output"), Icons::folder_output);
+    maps.iconToString.insert(Icons::folder_pen, QStringLiteral("folder-pen"));
+    maps.stringToIcon.insert(QStringLiteral("folder-pen"), Icons::folder_pen);
+    maps.iconToString.insert(Icons::folder_plus, QStringLiteral("folder-plus"));
+    maps.stringToIcon.insert(QStringLiteral("folder-plus"), Icons::folder_plus);
+    maps.iconToString.insert(Icons::folder_root, QStringLiteral("folder-root"));
+    maps.stringToIcon.insert(QStringLiteral("folder-root"), Icons::folder_root);
+    maps.iconToString.insert(Icons::folder_search, QStringLiteral("folder-search"));
+    maps.stringToIcon.insert(QStringLiteral("folder-search"), Icons::folder_search);
+    maps.iconToString.insert(Icons::folder_search_2, QStringLiteral("folder-search-2"));
+    maps.stringToIcon.insert(QStringLiteral("folder-search-2"), Icons::folder_search_2);
+    maps.iconToString.insert(Icons::folder_symlink, QStringLiteral("folder-symlink"));
+    maps.stringToIcon.insert(QStringLiteral("folder-symlink"), Icons::folder_symlink);
+    maps.iconToString.insert(Icons::folder_sync, QStringLiteral("folder-sync"));
+    maps.stringToIcon.insert(QStringLiteral("folder-sync"), Icons::folder_sync);
+    maps.iconToString.insert(Icons::folder_tree, QStringLiteral("folder-tree"));
+    maps.stringToIcon.insert(QStringLiteral("folder-tree"), Icons::folder_tree);
+    maps.iconToString.insert(Icons::folder_up, QStringLiteral("folder-up"));
+    maps.stringToIcon.insert(QStringLiteral("folder-up"), Icons::folder_up);
+    maps.iconToString.insert(Icons::folder_x, QStringLiteral("folder-x"));
+    maps.stringToIcon.insert(QStringLiteral("folder-x"), Icons::folder_x);
+    maps.iconToString.insert(Icons::folders, QStringLiteral("folders"));
+    maps.stringToIcon.insert(QStringLiteral("folders"), Icons::folders);
+    maps.iconToString.insert(Icons::footprints, QStringLiteral("footprints"));
+    maps.stringToIcon.insert(QStringLiteral("footprints"), Icons::footprints);
+    maps.iconToString.insert(Icons::forklift, QStringLiteral("forklift"));
+    maps.stringToIcon.insert(QStringLiteral("forklift"), Icons::forklift);
+    maps.iconToString.insert(Icons::forward, QStringLiteral("forward"));
+    maps.stringToIcon.insert(QStringLiteral("forward"), Icons::forward);
+    maps.iconToString.insert(Icons::frame, QStringLiteral("frame"));
+    maps.stringToIcon.insert(QStringLiteral("frame"), Icons::frame);
+    maps.iconToString.insert(Icons::framer, QStringLiteral("framer"));
+    maps.stringToIcon.insert(QStringLiteral("framer"), Icons::framer);
+    maps.iconToString.insert(Icons::frown, QStringLiteral("frown"));
+    maps.stringToIcon.insert(QStringLiteral("frown"), Icons::frown);
+    maps.iconToString.insert(Icons::fuel, QStringLiteral("fuel"));
+    maps.stringToIcon.insert(QStringLiteral("fuel"), Icons::fuel);
+    maps.iconToString.insert(Icons::fullscreen, QStringLiteral("fullscreen"));
+    maps.stringToIcon.insert(QStringLiteral("fullscreen"), Icons::fullscreen);
+    maps.iconToString.insert(Icons::funnel, QStringLiteral("funnel"));
+    maps.stringToIcon.insert(QStringLiteral("funnel"), Icons::funnel);
+    maps.iconToString.insert(Icons::funnel_plus, QStringLiteral("funnel-plus"));
+    maps.stringToIcon.insert(QStringLiteral("funnel-plus"), Icons::funnel_plus);
+    maps.iconToString.insert(Icons::funnel_x, QStringLiteral("funnel-x"));
+    maps.stringToIcon.insert(QStringLiteral("funnel-x"), Icons::funnel_x);
+    maps.iconToString.insert(Icons::gallery_horizontal, QStringLiteral("gallery-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("gallery-horizontal"), Icons::gallery_horizontal);
+    maps.iconToString.insert(Icons::gallery_horizontal_end,
+                             QStringLiteral("gallery-horizontal-end"));
+    maps.stringToIcon.insert(QStringLiteral("gallery-horizontal-end"),
+                             Icons::gallery_horizontal_end);
+    maps.iconToString.insert(Icons::gallery_thumbnails, QStringLiteral("gallery-thumbnails"));
+    maps.stringToIcon.insert(QStringLiteral("gallery-thumbnails"), Icons::gallery_thumbnails);
+    maps.iconToString.insert(Icons::gallery_vertical, QStringLiteral("gallery-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("gallery-vertical"), Icons::gallery_vertical);
+    maps.iconToString.insert(Icons::gallery_vertical_end, QStringLiteral("gallery-vertical-end"));
+    maps.stringToIcon.insert(QStringLiteral("gallery-vertical-end"), Icons::gallery_vertical_end);
+    maps.iconToString.insert(Icons::gamepad, QStringLiteral("gamepad"));
+    maps.stringToIcon.insert(QStringLiteral("gamepad"), Icons::gamepad);
+    maps.iconToString.insert(Icons::gamepad_2, QStringLiteral("gamepad-2"));
+    maps.stringToIcon.insert(QStringLiteral("gamepad-2"), Icons::gamepad_2);
+    maps.iconToString.insert(Icons::gauge, QStringLiteral("gauge"));
+    maps.stringToIcon.insert(QStringLiteral("gauge"), Icons::gauge);
+    maps.iconToString.insert(Icons::gavel, QStringLiteral("gavel"));
+    maps.stringToIcon.insert(QStringLiteral("gavel"), Icons::gavel);
+    maps.iconToString.insert(Icons::gem, QStringLiteral("gem"));
+    maps.stringToIcon.insert(QStringLiteral("gem"), Icons::gem);
+    maps.iconToString.insert(Icons::georgian_lari, QStringLiteral("georgian-lari"));
+    maps.stringToIcon.insert(QStringLiteral("georgian-lari"), Icons::georgian_lari);
+    maps.iconToString.insert(Icons::ghost, QStringLiteral("ghost"));
+    maps.stringToIcon.insert(QStringLiteral("ghost"), Icons::ghost);
+    maps.iconToString.insert(Icons::gift, QStringLiteral("gift"));
+    maps.stringToIcon.insert(QStringLiteral("gift"), Icons::gift);
+    maps.iconToString.insert(Icons::git_branch, QStringLiteral("git-branch"));
+    maps.stringToIcon.insert(QStringLiteral("git-branch"), Icons::git_branch);
+    maps.iconToString.insert(Icons::git_branch_plus, QStringLiteral("git-branch-plus"));
+    maps.stringToIcon.insert(QStringLiteral("git-branch-plus"), Icons::git_branch_plus);
+    maps.iconToString.insert(Icons::git_commit_horizontal, QStringLiteral("git-commit-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("git-commit-horizontal"), Icons::git_commit_horizontal);
+    maps.iconToString.insert(Icons::git_commit_vertical, QStringLiteral("git-commit-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("git-commit-vertical"), Icons::git_commit_vertical);
+    maps.iconToString.insert(Icons::git_compare, QStringLiteral("git-compare"));
+    maps.stringToIcon.insert(QStringLiteral("git-compare"), Icons::git_compare);
+    maps.iconToString.insert(Icons::git_compare_arrows, QStringLiteral("git-compare-arrows"));
+    maps.stringToIcon.insert(QStringLiteral("git-compare-arrows"), Icons::git_compare_arrows);
+    maps.iconToString.insert(Icons::git_fork, QStringLiteral("git-fork"));
+    maps.stringToIcon.insert(QStringLiteral("git-fork"), Icons::git_fork);
+    maps.iconToString.insert(Icons::git_graph, QStringLiteral("git-graph"));
+    maps.stringToIcon.insert(QStringLiteral("git-graph"), Icons::git_graph);
+    maps.iconToString.insert(Icons::git_merge, QStringLiteral("git-merge"));
+    maps.stringToIcon.insert(QStringLiteral("git-merge"), Icons::git_merge);
+    maps.iconToString.insert(Icons::git_pull_request, QStringLiteral("git-pull-request"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request"), Icons::git_pull_request);
+    maps.iconToString.insert(Icons::git_pull_request_arrow,
+                             QStringLiteral("git-pull-request-arrow"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request-arrow"),
+                             Icons::git_pull_request_arrow);
+    maps.iconToString.insert(Icons::git_pull_request_closed,
+                             QStringLiteral("git-pull-request-closed"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request-closed"),
+                             Icons::git_pull_request_closed);
+    maps.iconToString.insert(Icons::git_pull_request_create,
+                             QStringLiteral("git-pull-request-create"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request-create"),
+                             Icons::git_pull_request_create);
+    maps.iconToString.insert(Icons::git_pull_request_create_arrow,
+                             QStringLiteral("git-pull-request-create-arrow"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request-create-arrow"),
+                             Icons::git_pull_request_create_arrow);
+    maps.iconToString.insert(Icons::git_pull_request_draft,
+                             QStringLiteral("git-pull-request-draft"));
+    maps.stringToIcon.insert(QStringLiteral("git-pull-request-draft"),
+                             Icons::git_pull_request_draft);
+    maps.iconToString.insert(Icons::github, QStringLiteral("github"));
+    maps.stringToIcon.insert(QStringLiteral("github"), Icons::github);
+    maps.iconToString.insert(Icons::gitlab, QStringLiteral("gitlab"));
+    maps.stringToIcon.insert(QStringLiteral("gitlab"), Icons::gitlab);
+    maps.iconToString.insert(Icons::glass_water, QStringLiteral("glass-water"));
+    maps.stringToIcon.insert(QStringLiteral("glass-water"), Icons::glass_water);
+    maps.iconToString.insert(Icons::glasses, QStringLiteral("glasses"));
+    maps.stringToIcon.insert(QStringLiteral("glasses"), Icons::glasses);
+    maps.iconToString.insert(Icons::globe, QStringLiteral("globe"));
+    maps.stringToIcon.insert(QStringLiteral("globe"), Icons::globe);
+    maps.iconToString.insert(Icons::globe_lock, QStringLiteral("globe-lock"));
+    maps.stringToIcon.insert(QStringLiteral("globe-lock"), Icons::globe_lock);
+    maps.iconToString.insert(Icons::goal, QStringLiteral("goal"));
+    maps.stringToIcon.insert(QStringLiteral("goal"), Icons::goal);
+    maps.iconToString.insert(Icons::gpu, QStringLiteral("gpu"));
+    maps.stringToIcon.insert(QStringLiteral("gpu"), Icons::gpu);
+    maps.iconToString.insert(Icons::graduation_cap, QStringLiteral("graduation-cap"));
+    maps.stringToIcon.insert(QStringLiteral("graduation-cap"), Icons::graduation_cap);
+    maps.iconToString.insert(Icons::grape, QStringLiteral("grape"));
+    maps.stringToIcon.insert(QStringLiteral("grape"), Icons::grape);
+    maps.iconToString.insert(Icons::grid_2x2, QStringLiteral("grid-2x2"));
+    maps.stringToIcon.insert(QStringLiteral("grid-2x2"), Icons::grid_2x2);
+    maps.iconToString.insert(Icons::grid_2x2_check, QStringLiteral("grid-2x2-check"));
+    maps.stringToIcon.insert(QStringLiteral("grid-2x2-check"), Icons::grid_2x2_check);
+    maps.iconToString.insert(Icons::grid_2x2_plus, QStringLiteral("grid-2x2-plus"));
+    maps.stringToIcon.insert(QStringLiteral("grid-2x2-plus"), Icons::grid_2x2_plus);
+    maps.iconToString.insert(Icons::grid_2x2_x, QStringLiteral("grid-2x2-x"));
+    maps.stringToIcon.insert(QStringLiteral("grid-2x2-x"), Icons::grid_2x2_x);
+    maps.iconToString.insert(Icons::grid_3x2, QStringLiteral("grid-3x2"));
+    maps.stringToIcon.insert(QStringLiteral("grid-3x2"), Icons::grid_3x2);
+    maps.iconToString.insert(Icons::grid_3x3, QStringLiteral("grid-3x3"));
+    maps.stringToIcon.insert(QStringLiteral("grid-3x3"), Icons::grid_3x3);
+    maps.iconToString.insert(Icons::grip, QStringLiteral("grip"));
+    maps.stringToIcon.insert(QStringLiteral("grip"), Icons::grip);
+    maps.iconToString.insert(Icons::grip_horizontal, QStringLiteral("grip-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("grip-horizontal"), Icons::grip_horizontal);
+    maps.iconToString.insert(Icons::grip_vertical, QStringLiteral("grip-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("grip-vertical"), Icons::grip_vertical);
+    maps.iconToString.insert(Icons::group, QStringLiteral("group"));
+    maps.stringToIcon.insert(QStringLiteral("group"), Icons::group);
+    maps.iconToString.insert(Icons::guitar, QStringLiteral("guitar"));
+    maps.stringToIcon.insert(QStringLiteral("guitar"), Icons::guitar);
+    maps.iconToString.insert(Icons::ham, QStringLiteral("ham"));
+    maps.stringToIcon.insert(QStringLiteral("ham"), Icons::ham);
+    maps.iconToString.insert(Icons::hamburger, QStringLiteral("hamburger"));
+    maps.stringToIcon.insert(QStringLiteral("hamburger"), Icons::hamburger);
+    maps.iconToString.insert(Icons::hammer, QStringLiteral("hammer"));
+    maps.stringToIcon.insert(QStringLiteral("hammer"), Icons::hammer);
+    maps.iconToString.insert(Icons::hand, QStringLiteral("hand"));
+    maps.stringToIcon.insert(QStringLiteral("hand"), Icons::hand);
+    maps.iconToString.insert(Icons::hand_coins, QStringLiteral("hand-coins"));
+    maps.stringToIcon.insert(QStringLiteral("hand-coins"), Icons::hand_coins);
+    maps.iconToString.insert(Icons::hand_fist, QStringLiteral("hand-fist"));
+    maps.stringToIcon.insert(QStringLiteral("hand-fist"), Icons::hand_fist);
+    maps.iconToString.insert(Icons::hand_grab, QStringLiteral("hand-grab"));
+    maps.stringToIcon.insert(QStringLiteral("hand-grab"), Icons::hand_grab);
+    maps.iconToString.insert(Icons::hand_heart, QStringLiteral("hand-heart"));
+    maps.stringToIcon.insert(QStringLiteral("hand-heart"), Icons::hand_heart);
+    maps.iconToString.insert(Icons::hand_helping, QStringLiteral("hand-helping"));
+    maps.stringToIcon.insert(QStringLiteral("hand-helping"), Icons::hand_helping);
+    maps.iconToString.insert(Icons::hand_metal, QStringLiteral("hand-metal"));
+    maps.stringToIcon.insert(QStringLiteral("hand-metal"), Icons::hand_metal);
+    maps.iconToString.insert(Icons::hand_platter, QStringLiteral("hand-platter"));
+    maps.stringToIcon.insert(QStringLiteral("hand-platter"), Icons::hand_platter);
+    maps.iconToString.insert(Icons::handbag, QStringLiteral("handbag"));
+    maps.stringToIcon.insert(QStringLiteral("handbag"), Icons::handbag);
+    maps.iconToString.insert(Icons::handshake, QStringLiteral("handshake"));
+    maps.stringToIcon.insert(QStringLiteral("handshake"), Icons::handshake);
+    maps.iconToString.insert(Icons::hard_drive, QStringLiteral("hard-drive"));
+    maps.stringToIcon.insert(QStringLiteral("hard-drive"), Icons::hard_drive);
+    maps.iconToString.insert(Icons::hard_drive_download, QStringLiteral("hard-drive-download"));
+    maps.stringToIcon.insert(QStringLiteral("hard-drive-download"), Icons::hard_drive_download);
+    maps.iconToString.insert(Icons::hard_drive_upload, QStringLiteral("hard-drive-upload"));
+    maps.stringToIcon.insert(QStringLiteral("hard-drive-upload"), Icons::hard_drive_upload);
+    maps.iconToString.insert(Icons::hard_hat, QStringLiteral("hard-hat"));
+    maps.stringToIcon.insert(QStringLiteral("hard-hat"), Icons::hard_hat);
+    maps.iconToString.insert(Icons::hash, QStringLiteral("hash"));
+    maps.stringToIcon.insert(QStringLiteral("hash"), Icons::hash);
+    maps.iconToString.insert(Icons::hat_glasses, QStringLiteral("hat-glasses"));
+    maps.stringToIcon.insert(QStringLiteral("hat-glasses"), Icons::hat_glasses);
+    maps.iconToString.insert(Icons::haze, QStringLiteral("haze"));
+    maps.stringToIcon.insert(QStringLiteral("haze"), Icons::haze);
+    maps.iconToString.insert(Icons::hdmi_port, QStringLiteral("hdmi-port"));
+    maps.stringToIcon.insert(QStringLiteral("hdmi-port"), Icons::hdmi_port);
+    maps.iconToString.insert(Icons::heading, QStringLiteral("heading"));
+    maps.stringToIcon.insert(QStringLiteral("heading"), Icons::heading);
+    maps.iconToString.insert(Icons::heading_1, QStringLiteral("heading-1"));
+    maps.stringToIcon.insert(QStringLiteral("heading-1"), Icons::heading_1);
+    maps.iconToString.insert(Icons::heading_2, QStringLiteral("heading-2"));
+    maps.stringToIcon.insert(QStringLiteral("heading-2"), Icons::heading_2);
+    maps.iconToString.insert(Icons::heading_3, QStringLiteral("heading-3"));
+    maps.stringToIcon.insert(QStringLiteral("heading-3"), Icons::heading_3);
+    maps.iconToString.insert(Icons::heading_4, QStringLiteral("heading-4"));
+    maps.stringToIcon.insert(QStringLiteral("heading-4"), Icons::heading_4);
+    maps.iconToString.insert(Icons::heading_5, QStringLiteral("heading-5"));
+    maps.stringToIcon.insert(QStringLiteral("heading-5"), Icons::heading_5);
+    maps.iconToString.insert(Icons::heading_6, QStringLiteral("heading-6"));
+    maps.stringToIcon.insert(QStringLiteral("heading-6"), Icons::heading_6);
+    maps.iconToString.insert(Icons::headphone_off, QStringLiteral("headphone-off"));
+    maps.stringToIcon.insert(QStringLiteral("headphone-off"), Icons::headphone_off);
+    maps.iconToString.insert(Icons::headphones, QStringLiteral("headphones"));
+    maps.stringToIcon.insert(QStringLiteral("headphones"), Icons::headphones);
+    maps.iconToString.insert(Icons::headset, QStringLiteral("headset"));
+    maps.stringToIcon.insert(QStringLiteral("headset"), Icons::headset);
+    maps.iconToString.insert(Icons::heart, QStringLiteral("heart"));
+    maps.stringToIcon.insert(QStringLiteral("heart"), Icons::heart);
+    maps.iconToString.insert(Icons::heart_crack, QStringLiteral("heart-crack"));
+    maps.stringToIcon.insert(QStringLiteral("heart-crack"), Icons::heart_crack);
+    maps.iconToString.insert(Icons::heart_handshake, QStringLiteral("heart-handshake"));
+    maps.stringToIcon.insert(QStringLiteral("heart-handshake"), Icons::heart_handshake);
+    maps.iconToString.insert(Icons::heart_minus, QStringLiteral("heart-minus"));
+    maps.stringToIcon.insert(QStringLiteral("heart-minus"), Icons::heart_minus);
+    maps.iconToString.insert(Icons::heart_off, QStringLiteral("heart-off"));
+    maps.stringToIcon.insert(QStringLiteral("heart-off"), Icons::heart_off);
+    maps.iconToString.insert(Icons::heart_plus, QStringLiteral("heart-plus"));
+    maps.stringToIcon.insert(QStringLiteral("heart-plus"), Icons::heart_plus);
+    maps.iconToString.insert(Icons::heart_pulse, QStringLiteral("heart-pulse"));
+    maps.stringToIcon.insert(QStringLiteral("heart-pulse"), Icons::heart_pulse);
+    maps.iconToString.insert(Icons::heater, QStringLiteral("heater"));
+    maps.stringToIcon.insert(QStringLiteral("heater"), Icons::heater);
+    maps.iconToString.insert(Icons::hexagon, QStringLiteral("hexagon"));
+    maps.stringToIcon.insert(QStringLiteral("hexagon"), Icons::hexagon);
+    maps.iconToString.insert(Icons::highlighter, QStringLiteral("highlighter"));
+    maps.stringToIcon.insert(QStringLiteral("highlighter"), Icons::highlighter);
+    maps.iconToString.insert(Icons::history, QStringLiteral("history"));
+    maps.stringToIcon.insert(QStringLiteral("history"), Icons::history);
+    maps.iconToString.insert(Icons::hop, QStringLiteral("hop"));
+    maps.stringToIcon.insert(QStringLiteral("hop"), Icons::hop);
+    maps.iconToString.insert(Icons::hop_off, QStringLiteral("hop-off"));
+    maps.stringToIcon.insert(QStringLiteral("hop-off"), Icons::hop_off);
+    maps.iconToString.insert(Icons::hospital, QStringLiteral("hospital"));
+    maps.stringToIcon.insert(QStringLiteral("hospital"), Icons::hospital);
+    maps.iconToString.insert(Icons::hotel, QStringLiteral("hotel"));
+    maps.stringToIcon.insert(QStringLiteral("hotel"), Icons::hotel);
+    maps.iconToString.insert(Icons::hourglass, QStringLiteral("hourglass"));
+    maps.stringToIcon.insert(QStringLiteral("hourglass"), Icons::hourglass);
+    maps.iconToString.insert(Icons::house, QStringLiteral("house"));
+    maps.stringToIcon.insert(QStringLiteral("house"), Icons::house);
+    maps.iconToString.insert(Icons::house_plug, QStringLiteral("house-plug"));
+    maps.stringToIcon.insert(QStringLiteral("house-plug"), Icons::house_plug);
+    maps.iconToString.insert(Icons::house_plus, QStringLiteral("house-plus"));
+    maps.stringToIcon.insert(QStringLiteral("house-plus"), Icons::house_plus);
+    maps.iconToString.insert(Icons::house_wifi, QStringLiteral("house-wifi"));
+    maps.stringToIcon.insert(QStringLiteral("house-wifi"), Icons::house_wifi);
+    maps.iconToString.insert(Icons::ice_cream_bowl, QStringLiteral("ice-cream-bowl"));
+    maps.stringToIcon.insert(QStringLiteral("ice-cream-bowl"), Icons::ice_cream_bowl);
+    maps.iconToString.insert(Icons::ice_cream_cone, QStringLiteral("ice-cream-cone"));
+    maps.stringToIcon.insert(QStringLiteral("ice-cream-cone"), Icons::ice_cream_cone);
+    maps.iconToString.insert(Icons::id_card, QStringLiteral("id-card"));
+    maps.stringToIcon.insert(QStringLiteral("id-card"), Icons::id_card);
+    maps.iconToString.insert(Icons::id_card_lanyard, QStringLiteral("id-card-lanyard"));
+    maps.stringToIcon.insert(QStringLiteral("id-card-lanyard"), Icons::id_card_lanyard);
+    maps.iconToString.insert(Icons::image, QStringLiteral("image"));
+    maps.stringToIcon.insert(QStringLiteral("image"), Icons::image);
+    maps.iconToString.insert(Icons::image_down, QStringLiteral("image-down"));
+    maps.stringToIcon.insert(QStringLiteral("image-down"), Icons::image_down);
+    maps.iconToString.insert(Icons::image_minus, QStringLiteral("image-minus"));
+    maps.stringToIcon.insert(QStringLiteral("image-minus"), Icons::image_minus);
+    maps.iconToString.insert(Icons::image_off, QStringLiteral("image-off"));
+    maps.stringToIcon.insert(QStringLiteral("image-off"), Icons::image_off);
+    maps.iconToString.insert(Icons::image_play, QStringLiteral("image-play"));
+    maps.stringToIcon.insert(QStringLiteral("image-play"), Icons::image_play);
+    maps.iconToString.insert(Icons::image_plus, QStringLiteral("image-plus"));
+    maps.stringToIcon.insert(QStringLiteral("image-plus"), Icons::image_plus);
+    maps.iconToString.insert(Icons::image_up, QStringLiteral("image-up"));
+    maps.stringToIcon.insert(QStringLiteral("image-up"), Icons::image_up);
+    maps.iconToString.insert(Icons::image_upscale, QStringLiteral("image-upscale"));
+    maps.stringToIcon.insert(QStringLiteral("image-upscale"), Icons::image_upscale);
+    maps.iconToString.insert(Icons::images, QStringLiteral("images"));
+    maps.stringToIcon.insert(QStringLiteral("images"), Icons::images);
+    maps.iconToString.insert(Icons::import, QStringLiteral("import"));
+    maps.stringToIcon.insert(QStringLiteral("import"), Icons::import);
+    maps.iconToString.insert(Icons::inbox, QStringLiteral("inbox"));
+    maps.stringToIcon.insert(QStringLiteral("inbox"), Icons::inbox);
+    maps.iconToString.insert(Icons::indian_rupee, QStringLiteral("indian-rupee"));
+    maps.stringToIcon.insert(QStringLiteral("indian-rupee"), Icons::indian_rupee);
+    maps.iconToString.insert(Icons::infinity, QStringLiteral("infinity"));
+    maps.stringToIcon.insert(QStringLiteral("infinity"), Icons::infinity);
+    maps.iconToString.insert(Icons::info, QStringLiteral("info"));
+    maps.stringToIcon.insert(QStringLiteral("info"), Icons::info);
+    maps.iconToString.insert(Icons::inspection_panel, QStringLiteral("inspection-panel"));
+    maps.stringToIcon.insert(QStringLiteral("inspection-panel"), Icons::inspection_panel);
+    maps.iconToString.insert(Icons::instagram, QStringLiteral("instagram"));
+    maps.stringToIcon.insert(QStringLiteral("instagram"), Icons::instagram);
+    maps.iconToString.insert(Icons::italic, QStringLiteral("italic"));
+    maps.stringToIcon.insert(QStringLiteral("italic"), Icons::italic);
+    maps.iconToString.insert(Icons::iteration_ccw, QStringLiteral("iteration-ccw"));
+    maps.stringToIcon.insert(QStringLiteral("iteration-ccw"), Icons::iteration_ccw);
+    maps.iconToString.insert(Icons::iteration_cw, QStringLiteral("iteration-cw"));
+    maps.stringToIcon.insert(QStringLiteral("iteration-cw"), Icons::iteration_cw);
+    maps.iconToString.insert(Icons::japanese_yen, QStringLiteral("japanese-yen"));
+    maps.stringToIcon.insert(QStringLiteral("japanese-yen"), Icons::japanese_yen);
+    maps.iconToString.insert(Icons::joystick, QStringLiteral("joystick"));
+    maps.stringToIcon.insert(QStringLiteral("joystick"), Icons::joystick);
+    maps.iconToString.insert(Icons::kanban, QStringLiteral("kanban"));
+    maps.stringToIcon.insert(QStringLiteral("kanban"), Icons::kanban);
+    maps.iconToString.insert(Icons::kayak, QStringLiteral("kayak"));
+    maps.stringToIcon.insert(QStringLiteral("kayak"), Icons::kayak);
+    maps.iconToString.insert(Icons::key, QStringLiteral("key"));
+    maps.stringToIcon.insert(QStringLiteral("key"), Icons::key);
+    maps.iconToString.insert(Icons::key_round, QStringLiteral("key-round"));
+    maps.stringToIcon.insert(QStringLiteral("key-round"), Icons::key_round);
+    maps.iconToString.insert(Icons::key_square, QStringLiteral("key-square"));
+    maps.stringToIcon.insert(QStringLiteral("key-square"), Icons::key_square);
+    maps.iconToString.insert(Icons::keyboard, QStringLiteral("keyboard"));
+    maps.stringToIcon.insert(QStringLiteral("keyboard"), Icons::keyboard);
+    maps.iconToString.insert(Icons::keyboard_music, QStringLiteral("keyboard-music"));
+    maps.stringToIcon.insert(QStringLiteral("keyboard-music"), Icons::keyboard_music);
+    maps.iconToString.insert(Icons::keyboard_off, QStringLiteral("keyboard-off"));
+    maps.stringToIcon.insert(QStringLiteral("keyboard-off"), Icons::keyboard_off);
+    maps.iconToString.insert(Icons::lamp, QStringLiteral("lamp"));
+    maps.stringToIcon.insert(QStringLiteral("lamp"), Icons::lamp);
+    maps.iconToString.insert(Icons::lamp_ceiling, QStringLiteral("lamp-ceiling"));
+    maps.stringToIcon.insert(QStringLiteral("lamp-ceiling"), Icons::lamp_ceiling);
+    maps.iconToString.insert(Icons::lamp_desk, QStringLiteral("lamp-desk"));
+    maps.stringToIcon.insert(QStringLiteral("lamp-desk"), Icons::lamp_desk);
+    maps.iconToString.insert(Icons::lamp_floor, QStringLiteral("lamp-floor"));
+    maps.stringToIcon.insert(QStringLiteral("lamp-floor"), Icons::lamp_floor);
+    maps.iconToString.insert(Icons::lamp_wall_down, QStringLiteral("lamp-wall-down"));
+    maps.stringToIcon.insert(QStringLiteral("lamp-wall-down"), Icons::lamp_wall_down);
+    maps.iconToString.insert(Icons::lamp_wall_up, QStringLiteral("lamp-wall-up"));
+    maps.stringToIcon.insert(QStringLiteral("lamp-wall-up"), Icons::lamp_wall_up);
+    maps.iconToString.insert(Icons::land_plot, QStringLiteral("land-plot"));
+    maps.stringToIcon.insert(QStringLiteral("land-plot"), Icons::land_plot);
+    maps.iconToString.insert(Icons::landmark, QStringLiteral("landmark"));
+    maps.stringToIcon.insert(QStringLiteral("landmark"), Icons::landmark);
+    maps.iconToString.insert(Icons::languages, QStringLiteral("languages"));
+    maps.stringToIcon.insert(QStringLiteral("languages"), Icons::languages);
+    maps.iconToString.insert(Icons::laptop, QStringLiteral("laptop"));
+    maps.stringToIcon.insert(QStringLiteral("laptop"), Icons::laptop);
+    maps.iconToString.insert(Icons::laptop_minimal, QStringLiteral("laptop-minimal"));
+    maps.stringToIcon.insert(QStringLiteral("laptop-minimal"), Icons::laptop_minimal);
+    maps.iconToString.insert(Icons::laptop_minimal_check, QStringLiteral("laptop-minimal-check"));
+    maps.stringToIcon.insert(QStringLiteral("laptop-minimal-check"), Icons::laptop_minimal_check);
+    maps.iconToString.insert(Icons::lasso, QStringLiteral("lasso"));
+    maps.stringToIcon.insert(QStringLiteral("lasso"), Icons::lasso);
+    maps.iconToString.insert(Icons::lasso_select, QStringLiteral("lasso-select"));
+    maps.stringToIcon.insert(QStringLiteral("lasso-select"), Icons::lasso_select);
+    maps.iconToString.insert(Icons::laugh, QStringLiteral("laugh"));
+    maps.stringToIcon.insert(QStringLiteral("laugh"), Icons::laugh);
+    maps.iconToString.insert(Icons::layers, QStringLiteral("layers"));
+    maps.stringToIcon.insert(QStringLiteral("layers"), Icons::layers);
+    maps.iconToString.insert(Icons::layers_2, QStringLiteral("layers-2"));
+    maps.stringToIcon.insert(QStringLiteral("layers-2"), Icons::layers_2);
+    maps.iconToString.insert(Icons::layout_dashboard, QStringLiteral("layout-dashboard"));
+    maps.stringToIcon.insert(QStringLiteral("layout-dashboard"), Icons::layout_dashboard);
+    maps.iconToString.insert(Icons::layout_grid, QStringLiteral("layout-grid"));
+    maps.stringToIcon.insert(QStringLiteral("layout-grid"), Icons::layout_grid);
+    maps.iconToString.insert(Icons::layout_list, QStringLiteral("layout-list"));
+    maps.stringToIcon.insert(QStringLiteral("layout-list"), Icons::layout_list);
+    maps.iconToString.insert(Icons::layout_panel_left, QStringLiteral("layout-panel-left"));
+    maps.stringToIcon.insert(QStringLiteral("layout-panel-left"), Icons::layout_panel_left);
+    maps.iconToString.insert(Icons::layout_panel_top, QStringLiteral("layout-panel-top"));
+    maps.stringToIcon.insert(QStringLiteral("layout-panel-top"), Icons::layout_panel_top);
+    maps.iconToString.insert(Icons::layout_template, QStringLiteral("layout-template"));
+    maps.stringToIcon.insert(QStringLiteral("layout-template"), Icons::layout_template);
+    maps.iconToString.insert(Icons::leaf, QStringLiteral("leaf"));
+    maps.stringToIcon.insert(QStringLiteral("leaf"), Icons::leaf);
+    maps.iconToString.insert(Icons::leafy_green, QStringLiteral("leafy-green"));
+    maps.stringToIcon.insert(QStringLiteral("leafy-green"), Icons::leafy_green);
+    maps.iconToString.insert(Icons::lectern, QStringLiteral("lectern"));
+    maps.stringToIcon.insert(QStringLiteral("lectern"), Icons::lectern);
+    maps.iconToString.insert(Icons::library, QStringLiteral("library"));
+    maps.stringToIcon.insert(QStringLiteral("library"), Icons::library);
+    maps.iconToString.insert(Icons::library_big, QStringLiteral("library-big"));
+    maps.stringToIcon.insert(QStringLiteral("library-big"), Icons::library_big);
+    maps.iconToString.insert(Icons::life_buoy, QStringLiteral("life-buoy"));
+    maps.stringToIcon.insert(QStringLiteral("life-buoy"), Icons::life_buoy);
+    maps.iconToString.insert(Icons::ligature, QStringLiteral("ligature"));
+    maps.stringToIcon.insert(QStringLiteral("ligature"), Icons::ligature);
+    maps.iconToString.insert(Icons::lightbulb, QStringLiteral("lightbulb"));
+    maps.stringToIcon.insert(QStringLiteral("lightbulb"), Icons::lightbulb);
+    maps.iconToString.insert(Icons::lightbulb_off, QStringLiteral("lightbulb-off"));
+    maps.stringToIcon.insert(QStringLiteral("lightbulb-off"), Icons::lightbulb_off);
+    maps.iconToString.insert(Icons::line_squiggle, QStringLiteral("line-squiggle"));
+    maps.stringToIcon.insert(QStringLiteral("line-squiggle"), Icons::line_squiggle);
+    maps.iconToString.insert(Icons::link, QStringLiteral("link"));
+    maps.stringToIcon.insert(QStringLiteral("link"), Icons::link);
+    maps.iconToString.insert(Icons::link_2, QStringLiteral("link-2"));
+    maps.stringToIcon.insert(QStringLiteral("link-2"), Icons::link_2);
+    maps.iconToString.insert(Icons::link_2_off, QStringLiteral("link-2-off"));
+    maps.stringToIcon.insert(QStringLiteral("link-2-off"), Icons::link_2_off);
+    maps.iconToString.insert(Icons::linkedin, QStringLiteral("linkedin"));
+    maps.stringToIcon.insert(QStringLiteral("linkedin"), Icons::linkedin);
+    maps.iconToString.insert(Icons::list, QStringLiteral("list"));
+    maps.stringToIcon.insert(QStringLiteral("list"), Icons::list);
+    maps.iconToString.insert(Icons::list_check, QStringLiteral("list-check"));
+    maps.stringToIcon.insert(QStringLiteral("list-check"), Icons::list_check);
+    maps.iconToString.insert(Icons::list_checks, QStringLiteral("list-checks"));
+    maps.stringToIcon.insert(QStringLiteral("list-checks"), Icons::list_checks);
+    maps.iconToString.insert(Icons::list_chevrons_down_up, QStringLiteral("list-chevrons-down-up"));
+    maps.stringToIcon.insert(QStringLiteral("list-chevrons-down-up"), Icons::list_chevrons_down_up);
+    maps.iconToString.insert(Icons::list_chevrons_up_down, QStringLiteral("list-chevrons-up-down"));
+    maps.stringToIcon.insert(QStringLiteral("list-chevrons-up-down"), Icons::list_chevrons_up_down);
+    maps.iconToString.insert(Icons::list_collapse, QStringLiteral("list-collapse"));
+    maps.stringToIcon.insert(QStringLiteral("list-collapse"), Icons::list_collapse);
+    maps.iconToString.insert(Icons::list_end, QStringLiteral("list-end"));
+    maps.stringToIcon.insert(QStringLiteral("list-end"), Icons::list_end);
+    maps.iconToString.insert(Icons::list_filter, QStringLiteral("list-filter"));
+    maps.stringToIcon.insert(QStringLiteral("list-filter"), Icons::list_filter);
+    maps.iconToString.insert(Icons::list_filter_plus, QStringLiteral("list-filter-plus"));
+    maps.stringToIcon.insert(QStringLiteral("list-filter-plus"), Icons::list_filter_plus);
+    maps.iconToString.insert(Icons::list_indent_decrease, QStringLiteral("list-indent-decrease"));
+    maps.stringToIcon.insert(QStringLiteral("list-indent-decrease"), Icons::list_indent_decrease);
+    maps.iconToString.insert(Icons::list_indent_increase, QStringLiteral("list-indent-increase"));
+    maps.stringToIcon.insert(QStringLiteral("list-indent-increase"), Icons::list_indent_increase);
+    maps.iconToString.insert(Icons::list_minus, QStringLiteral("list-minus"));
+    maps.stringToIcon.insert(QStringLiteral("list-minus"), Icons::list_minus);
+    maps.iconToString.insert(Icons::list_music, QStringLiteral("list-music"));
+    maps.stringToIcon.insert(QStringLiteral("list-music"), Icons::list_music);
+    maps.iconToString.insert(Icons::list_ordered, QStringLiteral("list-ordered"));
+    maps.stringToIcon.insert(QStringLiteral("list-ordered"), Icons::list_ordered);
+    maps.iconToString.insert(Icons::list_plus, QStringLiteral("list-plus"));
+    maps.stringToIcon.insert(QStringLiteral("list-plus"), Icons::list_plus);
+    maps.iconToString.insert(Icons::list_restart, QStringLiteral("list-restart"));
+    maps.stringToIcon.insert(QStringLiteral("list-restart"), Icons::list_restart);
+    maps.iconToString.insert(Icons::list_start, QStringLiteral("list-start"));
+    maps.stringToIcon.insert(QStringLiteral("list-start"), Icons::list_start);
+    maps.iconToString.insert(Icons::list_todo, QStringLiteral("list-todo"));
+    maps.stringToIcon.insert(QStringLiteral("list-todo"), Icons::list_todo);
+    maps.iconToString.insert(Icons::list_tree, QStringLiteral("list-tree"));
+    maps.stringToIcon.insert(QStringLiteral("list-tree"), Icons::list_tree);
+    maps.iconToString.insert(Icons::list_video, QStringLiteral("list-video"));
+    maps.stringToIcon.insert(QStringLiteral("list-video"), Icons::list_video);
+    maps.iconToString.insert(Icons::list_x, QStringLiteral("list-x"));
+    maps.stringToIcon.insert(QStringLiteral("list-x"), Icons::list_x);
+    maps.iconToString.insert(Icons::loader, QStringLiteral("loader"));
+    maps.stringToIcon.insert(QStringLiteral("loader"), Icons::loader);
+    maps.iconToString.insert(Icons::loader_circle, QStringLiteral("loader-circle"));
+    maps.stringToIcon.insert(QStringLiteral("loader-circle"), Icons::loader_circle);
+    maps.iconToString.insert(Icons::loader_pinwheel, QStringLiteral("loader-pinwheel"));
+    maps.stringToIcon.insert(QStringLiteral("loader-pinwheel"), Icons::loader_pinwheel);
+    maps.iconToString.insert(Icons::locate, QStringLiteral("locate"));
+    maps.stringToIcon.insert(QStringLiteral("locate"), Icons::locate);
+    maps.iconToString.insert(Icons::locate_fixed, QStringLiteral("locate-fixed"));
+    maps.stringToIcon.insert(QStringLiteral("locate-fixed"), Icons::locate_fixed);
+    maps.iconToString.insert(Icons::locate_off, QStringLiteral("locate-off"));
+    maps.stringToIcon.insert(QStringLiteral("locate-off"), Icons::locate_off);
+    maps.iconToString.insert(Icons::lock, QStringLiteral("lock"));
+    maps.stringToIcon.insert(QStringLiteral("lock"), Icons::lock);
+    maps.iconToString.insert(Icons::lock_keyhole, QStringLiteral("lock-keyhole"));
+    maps.stringToIcon.insert(QStringLiteral("lock-keyhole"), Icons::lock_keyhole);
+    maps.iconToString.insert(Icons::lock_keyhole_open, QStringLiteral("lock-keyhole-open"));
+    maps.stringToIcon.insert(QStringLiteral("lock-keyhole-open"), Icons::lock_keyhole_open);
+    maps.iconToString.insert(Icons::lock_open, QStringLiteral("lock-open"));
+    maps.stringToIcon.insert(QStringLiteral("lock-open"), Icons::lock_open);
+    maps.iconToString.insert(Icons::log_in, QStringLiteral("log-in"));
+    maps.stringToIcon.insert(QStringLiteral("log-in"), Icons::log_in);
+    maps.iconToString.insert(Icons::log_out, QStringLiteral("log-out"));
+    maps.stringToIcon.insert(QStringLiteral("log-out"), Icons::log_out);
+    maps.iconToString.insert(Icons::logs, QStringLiteral("logs"));
+    maps.stringToIcon.insert(QStringLiteral("logs"), Icons::logs);
+    maps.iconToString.insert(Icons::lollipop, QStringLiteral("lollipop"));
+    maps.stringToIcon.insert(QStringLiteral("lollipop"), Icons::lollipop);
+    maps.iconToString.insert(Icons::luggage, QStringLiteral("luggage"));
+    maps.stringToIcon.insert(QStringLiteral("luggage"), Icons::luggage);
+    maps.iconToString.insert(Icons::magnet, QStringLiteral("magnet"));
+    maps.stringToIcon.insert(QStringLiteral("magnet"), Icons::magnet);
+    maps.iconToString.insert(Icons::mail, QStringLiteral("mail"));
+    maps.stringToIcon.insert(QStringLiteral("mail"), Icons::mail);
+    maps.iconToString.insert(Icons::mail_check, QStringLiteral("mail-check"));
+    maps.stringToIcon.insert(QStringLiteral("mail-check"), Icons::mail_check);
+    maps.iconToString.insert(Icons::mail_minus, QStringLiteral("mail-minus"));
+    maps.stringToIcon.insert(QStringLiteral("mail-minus"), Icons::mail_minus);
+    maps.iconToString.insert(Icons::mail_open, QStringLiteral("mail-open"));
+    maps.stringToIcon.insert(QStringLiteral("mail-open"), Icons::mail_open);
+    maps.iconToString.insert(Icons::mail_plus, QStringLiteral("mail-plus"));
+    maps.stringToIcon.insert(QStringLiteral("mail-plus"), Icons::mail_plus);
+    maps.iconToString.insert(Icons::mail_question_mark, QStringLiteral("mail-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("mail-question-mark"), Icons::mail_question_mark);
+    maps.iconToString.insert(Icons::mail_search, QStringLiteral("mail-search"));
+    maps.stringToIcon.insert(QStringLiteral("mail-search"), Icons::mail_search);
+    maps.iconToString.insert(Icons::mail_warning, QStringLiteral("mail-warning"));
+    maps.stringToIcon.insert(QStringLiteral("mail-warning"), Icons::mail_warning);
+    maps.iconToString.insert(Icons::mail_x, QStringLiteral("mail-x"));
+    maps.stringToIcon.insert(QStringLiteral("mail-x"), Icons::mail_x);
+    maps.iconToString.insert(Icons::mailbox, QStringLiteral("mailbox"));
+    maps.stringToIcon.insert(QStringLiteral("mailbox"), Icons::mailbox);
+    maps.iconToString.insert(Icons::mails, QStringLiteral("mails"));
+    maps.stringToIcon.insert(QStringLiteral("mails"), Icons::mails);
+    maps.iconToString.insert(Icons::map, QStringLiteral("map"));
+    maps.stringToIcon.insert(QStringLiteral("map"), Icons::map);
+    maps.iconToString.insert(Icons::map_minus, QStringLiteral("map-minus"));
+    maps.stringToIcon.insert(QStringLiteral("map-minus"), Icons::map_minus);
+    maps.iconToString.insert(Icons::map_pin, QStringLiteral("map-pin"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin"), Icons::map_pin);
+    maps.iconToString.insert(Icons::map_pin_check, QStringLiteral("map-pin-check"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-check"), Icons::map_pin_check);
+    maps.iconToString.insert(Icons::map_pin_check_inside, QStringLiteral("map-pin-check-inside"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-check-inside"), Icons::map_pin_check_inside);
+    maps.iconToString.insert(Icons::map_pin_house, QStringLiteral("map-pin-house"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-house"), Icons::map_pin_house);
+    maps.iconToString.insert(Icons::map_pin_minus, QStringLiteral("map-pin-minus"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-minus"), Icons::map_pin_minus);
+    maps.iconToString.insert(Icons::map_pin_minus_inside, QStringLiteral("map-pin-minus-inside"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-minus-inside"), Icons::map_pin_minus_inside);
+    maps.iconToString.insert(Icons::map_pin_off, QStringLiteral("map-pin-off"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-off"), Icons::map_pin_off);
+    maps.iconToString.insert(Icons::map_pin_pen, QStringLiteral("map-pin-pen"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-pen"), Icons::map_pin_pen);
+    maps.iconToString.insert(Icons::map_pin_plus, QStringLiteral("map-pin-plus"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-plus"), Icons::map_pin_plus);
+    maps.iconToString.insert(Icons::map_pin_plus_inside, QStringLiteral("map-pin-plus-inside"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-plus-inside"), Icons::map_pin_plus_inside);
+    maps.iconToString.insert(Icons::map_pin_x, QStringLiteral("map-pin-x"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-x"), Icons::map_pin_x);
+    maps.iconToString.insert(Icons::map_pin_x_inside, QStringLiteral("map-pin-x-inside"));
+    maps.stringToIcon.insert(QStringLiteral("map-pin-x-inside"), Icons::map_pin_x_inside);
+    maps.iconToString.insert(Icons::map_pinned, QStringLiteral("map-pinned"));
+    maps.stringToIcon.insert(QStringLiteral("map-pinned"), Icons::map_pinned);
+    maps.iconToString.insert(Icons::map_plus, QStringLiteral("map-plus"));
+    maps.stringToIcon.insert(QStringLiteral("map-plus"), Icons::map_plus);
+    maps.iconToString.insert(Icons::mars, QStringLiteral("mars"));
+    maps.stringToIcon.insert(QStringLiteral("mars"), Icons::mars);
+    maps.iconToString.insert(Icons::mars_stroke, QStringLiteral("mars-stroke"));
+    maps.stringToIcon.insert(QStringLiteral("mars-stroke"), Icons::mars_stroke);
+    maps.iconToString.insert(Icons::martini, QStringLiteral("martini"));
+    maps.stringToIcon.insert(QStringLiteral("martini"), Icons::martini);
+    maps.iconToString.insert(Icons::maximize, QStringLiteral("maximize"));
+    maps.stringToIcon.insert(QStringLiteral("maximize"), Icons::maximize);
+    maps.iconToString.insert(Icons::maximize_2, QStringLiteral("maximize-2"));
+    maps.stringToIcon.insert(QStringLiteral("maximize-2"), Icons::maximize_2);
+    maps.iconToString.insert(Icons::medal, QStringLiteral("medal"));
+    maps.stringToIcon.insert(QStringLiteral("medal"), Icons::medal);
+    maps.iconToString.insert(Icons::megaphone, QStringLiteral("megaphone"));
+    maps.stringToIcon.insert(QStringLiteral("megaphone"), Icons::megaphone);
+    maps.iconToString.insert(Icons::megaphone_off, QStringLiteral("megaphone-off"));
+    maps.stringToIcon.insert(QStringLiteral("megaphone-off"), Icons::megaphone_off);
+    maps.iconToString.insert(Icons::meh, QStringLiteral("meh"));
+    maps.stringToIcon.insert(QStringLiteral("meh"), Icons::meh);
+    maps.iconToString.insert(Icons::memory_stick, QStringLiteral("memory-stick"));
+    maps.stringToIcon.insert(QStringLiteral("memory-stick"), Icons::memory_stick);
+    maps.iconToString.insert(Icons::menu, QStringLiteral("menu"));
+    maps.stringToIcon.insert(QStringLiteral("menu"), Icons::menu);
+    maps.iconToString.insert(Icons::merge, QStringLiteral("merge"));
+    maps.stringToIcon.insert(QStringLiteral("merge"), Icons::merge);
+    maps.iconToString.insert(Icons::message_circle, QStringLiteral("message-circle"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle"), Icons::message_circle);
+    maps.iconToString.insert(Icons::message_circle_code, QStringLiteral("message-circle-code"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-code"), Icons::message_circle_code);
+    maps.iconToString.insert(Icons::message_circle_dashed, QStringLiteral("message-circle-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-dashed"), Icons::message_circle_dashed);
+    maps.iconToString.insert(Icons::message_circle_heart, QStringLiteral("message-circle-heart"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-heart"), Icons::message_circle_heart);
+    maps.iconToString.insert(Icons::message_circle_more, QStringLiteral("message-circle-more"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-more"), Icons::message_circle_more);
+    maps.iconToString.insert(Icons::message_circle_off, QStringLiteral("message-circle-off"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-off"), Icons::message_circle_off);
+    maps.iconToString.insert(Icons::message_circle_plus, QStringLiteral("message-circle-plus"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-plus"), Icons::message_circle_plus);
+    maps.iconToString.insert(Icons::message_circle_question_mark,
+                             QStringLiteral("message-circle-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-question-mark"),
+                             Icons::message_circle_question_mark);
+    maps.iconToString.insert(Icons::message_circle_reply, QStringLiteral("message-circle-reply"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-reply"), Icons::message_circle_reply);
+    maps.iconToString.insert(Icons::message_circle_warning,
+                             QStringLiteral("message-circle-warning"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-warning"),
+                             Icons::message_circle_warning);
+    maps.iconToString.insert(Icons::message_circle_x, QStringLiteral("message-circle-x"));
+    maps.stringToIcon.insert(QStringLiteral("message-circle-x"), Icons::message_circle_x);
+    maps.iconToString.insert(Icons::message_square, QStringLiteral("message-square"));
+    maps.stringToIcon.insert(QStringLiteral("message-square"), Icons::message_square);
+    maps.iconToString.insert(Icons::message_square_code, QStringLiteral("message-square-code"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-code"), Icons::message_square_code);
+    maps.iconToString.insert(Icons::message_square_dashed, QStringLiteral("message-square-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-dashed"), Icons::message_square_dashed);
+    maps.iconToString.insert(Icons::message_square_diff, QStringLiteral("message-square-diff"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-diff"), Icons::message_square_diff);
+    maps.iconToString.insert(Icons::message_square_dot, QStringLiteral("message-square-dot"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-dot"), Icons::message_square_dot);
+    maps.iconToString.insert(Icons::message_square_heart, QStringLiteral("message-square-heart"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-heart"), Icons::message_square_heart);
+    maps.iconToString.insert(Icons::message_square_lock, QStringLiteral("message-square-lock"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-lock"), Icons::message_square_lock);
+    maps.iconToString.insert(Icons::message_square_more, QStringLiteral("message-square-more"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-more"), Icons::message_square_more);
+    maps.iconToString.insert(Icons::message_square_off, QStringLiteral("message-square-off"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-off"), Icons::message_square_off);
+    maps.iconToString.insert(Icons::message_square_plus, QStringLiteral("message-square-plus"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-plus"), Icons::message_square_plus);
+    maps.iconToString.insert(Icons::message_square_quote, QStringLiteral("message-square-quote"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-quote"), Icons::message_square_quote);
+    maps.iconToString.insert(Icons::message_square_reply, QStringLiteral("message-square-reply"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-reply"), Icons::message_square_reply);
+    maps.iconToString.insert(Icons::message_square_share, QStringLiteral("message-square-share"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-share"), Icons::message_square_share);
+    maps.iconToString.insert(Icons::message_square_text, QStringLiteral("message-square-text"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-text"), Icons::message_square_text);
+    maps.iconToString.insert(Icons::message_square_warning,
+                             QStringLiteral("message-square-warning"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-warning"),
+                             Icons::message_square_warning);
+    maps.iconToString.insert(Icons::message_square_x, QStringLiteral("message-square-x"));
+    maps.stringToIcon.insert(QStringLiteral("message-square-x"), Icons::message_square_x);
+    maps.iconToString.insert(Icons::messages_square, QStringLiteral("messages-square"));
+    maps.stringToIcon.insert(QStringLiteral("messages-square"), Icons::messages_square);
+    maps.iconToString.insert(Icons::mic, QStringLiteral("mic"));
+    maps.stringToIcon.insert(QStringLiteral("mic"), Icons::mic);
+    maps.iconToString.insert(Icons::mic_off, QStringLiteral("mic-off"));
+    maps.stringToIcon.insert(QStringLiteral("mic-off"), Icons::mic_off);
+    maps.iconToString.insert(Icons::mic_vocal, QStringLiteral("mic-vocal"));
+    maps.stringToIcon.insert(QStringLiteral("mic-vocal"), Icons::mic_vocal);
+    maps.iconToString.insert(Icons::microchip, QStringLiteral("microchip"));
+    maps.stringToIcon.insert(QStringLiteral("microchip"), Icons::microchip);
+    maps.iconToString.insert(Icons::microscope, QStringLiteral("microscope"));
+    maps.stringToIcon.insert(QStringLiteral("microscope"), Icons::microscope);
+    maps.iconToString.insert(Icons::microwave, QStringLiteral("microwave"));
+    maps.stringToIcon.insert(QStringLiteral("microwave"), Icons::microwave);
+    maps.iconToString.insert(Icons::milestone, QStringLiteral("milestone"));
+    maps.stringToIcon.insert(QStringLiteral("milestone"), Icons::milestone);
+    maps.iconToString.insert(Icons::milk, QStringLiteral("milk"));
+    maps.stringToIcon.insert(QStringLiteral("milk"), Icons::milk);
+    maps.iconToString.insert(Icons::milk_off, QStringLiteral("milk-off"));
+    maps.stringToIcon.insert(QStringLiteral("milk-off"), Icons::milk_off);
+    maps.iconToString.insert(Icons::minimize, QStringLiteral("minimize"));
+    maps.stringToIcon.insert(QStringLiteral("minimize"), Icons::minimize);
+    maps.iconToString.insert(Icons::minimize_2, QStringLiteral("minimize-2"));
+    maps.stringToIcon.insert(QStringLiteral("minimize-2"), Icons::minimize_2);
+    maps.iconToString.insert(Icons::minus, QStringLiteral("minus"));
+    maps.stringToIcon.insert(QStringLiteral("minus"), Icons::minus);
+    maps.iconToString.insert(Icons::monitor, QStringLiteral("monitor"));
+    maps.stringToIcon.insert(QStringLiteral("monitor"), Icons::monitor);
+    maps.iconToString.insert(Icons::monitor_check, QStringLiteral("monitor-check"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-check"), Icons::monitor_check);
+    maps.iconToString.insert(Icons::monitor_cog, QStringLiteral("monitor-cog"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-cog"), Icons::monitor_cog);
+    maps.iconToString.insert(Icons::monitor_dot, QStringLiteral("monitor-dot"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-dot"), Icons::monitor_dot);
+    maps.iconToString.insert(Icons::monitor_down, QStringLiteral("monitor-down"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-down"), Icons::monitor_down);
+    maps.iconToString.insert(Icons::monitor_off, QStringLiteral("monitor-off"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-off"), Icons::monitor_off);
+    maps.iconToString.insert(Icons::monitor_pause, QStringLiteral("monitor-pause"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-pause"), Icons::monitor_pause);
+    maps.iconToString.insert(Icons::monitor_play, QStringLiteral("monitor-play"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-play"), Icons::monitor_play);
+    maps.iconToString.insert(Icons::monitor_smartphone, QStringLiteral("monitor-smartphone"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-smartphone"), Icons::monitor_smartphone);
+    maps.iconToString.insert(Icons::monitor_speaker, QStringLiteral("monitor-speaker"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-speaker"), Icons::monitor_speaker);
+    maps.iconToString.insert(Icons::monitor_stop, QStringLiteral("monitor-stop"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-stop"), Icons::monitor_stop);
+    maps.iconToString.insert(Icons::monitor_up, QStringLiteral("monitor-up"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-up"), Icons::monitor_up);
+    maps.iconToString.insert(Icons::monitor_x, QStringLiteral("monitor-x"));
+    maps.stringToIcon.insert(QStringLiteral("monitor-x"), Icons::monitor_x);
+    maps.iconToString.insert(Icons::moon, QStringLiteral("moon"));
+    maps.stringToIcon.insert(QStringLiteral("moon"), Icons::moon);
+    maps.iconToString.insert(Icons::moon_star, QStringLiteral("moon-star"));
+    maps.stringToIcon.insert(QStringLiteral("moon-star"), Icons::moon_star);
+    maps.iconToString.insert(Icons::mountain, QStringLiteral("mountain"));
+    maps.stringToIcon.insert(QStringLiteral("mountain"), Icons::mountain);
+    maps.iconToString.insert(Icons::mountain_snow, QStringLiteral("mountain-snow"));
+    maps.stringToIcon.insert(QStringLiteral("mountain-snow"), Icons::mountain_snow);
+    maps.iconToString.insert(Icons::mouse, QStringLiteral("mouse"));
+    maps.stringToIcon.insert(QStringLiteral("mouse"), Icons::mouse);
+    maps.iconToString.insert(Icons::mouse_off, QStringLiteral("mouse-off"));
+    maps.stringToIcon.insert(QStringLiteral("mouse-off"), Icons::mouse_off);
+    maps.iconToString.insert(Icons::mouse_pointer, QStringLiteral("mouse-pointer"));
+    maps.stringToIcon.insert(QStringLiteral("mouse-pointer"), Icons::mouse_pointer);
+    maps.iconToString.insert(Icons::mouse_pointer_2, QStringLiteral("mouse-pointer-2"));
+    maps.stringToIcon.insert(QStringLiteral("mouse-pointer-2"), Icons::mouse_pointer_2);
+    maps.iconToString.insert(Icons::mouse_pointer_ban, QStringLiteral("mouse-pointer-ban"));
+    maps.stringToIcon.insert(QStringLiteral("mouse-pointer-ban"), Icons::mouse_pointer_ban);
+    maps.iconToString.insert(Icons::mouse_pointer_click, QStringLiteral("mouse-pointer-click"));
+    maps.stringToIcon.insert(QStringLiteral("mouse-pointer-click"), Icons::mouse_pointer_click);
+    maps.iconToString.insert(Icons::move, QStringLiteral("move"));
+    maps.stringToIcon.insert(QStringLiteral("move"), Icons::move);
+    maps.iconToString.insert(Icons::move_3d, QStringLiteral("move-3d"));
+    maps.stringToIcon.insert(QStringLiteral("move-3d"), Icons::move_3d);
+    maps.iconToString.insert(Icons::move_diagonal, QStringLiteral("move-diagonal"));
+    maps.stringToIcon.insert(QStringLiteral("move-diagonal"), Icons::move_diagonal);
+    maps.iconToString.insert(Icons::move_diagonal_2, QStringLiteral("move-diagonal-2"));
+    maps.stringToIcon.insert(QStringLiteral("move-diagonal-2"), Icons::move_diagonal_2);
+    maps.iconToString.insert(Icons::move_down, QStringLiteral("move-down"));
+    maps.stringToIcon.insert(QStringLiteral("move-down"), Icons::move_down);
+    maps.iconToString.insert(Icons::move_down_left, QStringLiteral("move-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("move-down-left"), Icons::move_down_left);
+    maps.iconToString.insert(Icons::move_down_right, QStringLiteral("move-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("move-down-right"), Icons::move_down_right);
+    maps.iconToString.insert(Icons::move_horizontal, QStringLiteral("move-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("move-horizontal"), Icons::move_horizontal);
+    maps.iconToString.insert(Icons::move_left, QStringLiteral("move-left"));
+    maps.stringToIcon.insert(QStringLiteral("move-left"), Icons::move_left);
+    maps.iconToString.insert(Icons::move_right, QStringLiteral("move-right"));
+    maps.stringToIcon.insert(QStringLiteral("move-right"), Icons::move_right);
+    maps.iconToString.insert(Icons::move_up, QStringLiteral("move-up"));
+    maps.stringToIcon.insert(QStringLiteral("move-up"), Icons::move_up);
+    maps.iconToString.insert(Icons::move_up_left, QStringLiteral("move-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("move-up-left"), Icons::move_up_left);
+    maps.iconToString.insert(Icons::move_up_right, QStringLiteral("move-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("move-up-right"), Icons::move_up_right);
+    maps.iconToString.insert(Icons::move_vertical, QStringLiteral("move-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("move-vertical"), Icons::move_vertical);
+    maps.iconToString.insert(Icons::music, QStringLiteral("music"));
+    maps.stringToIcon.insert(QStringLiteral("music"), Icons::music);
+    maps.iconToString.insert(Icons::music_2, QStringLiteral("music-2"));
+    maps.stringToIcon.insert(QStringLiteral("music-2"), Icons::music_2);
+    maps.iconToString.insert(Icons::music_3, QStringLiteral("music-3"));
+    maps.stringToIcon.insert(QStringLiteral("music-3"), Icons::music_3);
+    maps.iconToString.insert(Icons::music_4, QStringLiteral("music-4"));
+    maps.stringToIcon.insert(QStringLiteral("music-4"), Icons::music_4);
+    maps.iconToString.insert(Icons::navigation, QStringLiteral("navigation"));
+    maps.stringToIcon.insert(QStringLiteral("navigation"), Icons::navigation);
+    maps.iconToString.insert(Icons::navigation_2, QStringLiteral("navigation-2"));
+    maps.stringToIcon.insert(QStringLiteral("navigation-2"), Icons::navigation_2);
+    maps.iconToString.insert(Icons::navigation_2_off, QStringLiteral("navigation-2-off"));
+    maps.stringToIcon.insert(QStringLiteral("navigation-2-off"), Icons::navigation_2_off);
+    maps.iconToString.insert(Icons::navigation_off, QStringLiteral("navigation-off"));
+    maps.stringToIcon.insert(QStringLiteral("navigation-off"), Icons::navigation_off);
+    maps.iconToString.insert(Icons::network, QStringLiteral("network"));
+    maps.stringToIcon.insert(QStringLiteral("network"), Icons::network);
+    maps.iconToString.insert(Icons::newspaper, QStringLiteral("newspaper"));
+    maps.stringToIcon.insert(QStringLiteral("newspaper"), Icons::newspaper);
+    maps.iconToString.insert(Icons::nfc, QStringLiteral("nfc"));
+    maps.stringToIcon.insert(QStringLiteral("nfc"), Icons::nfc);
+    maps.iconToString.insert(Icons::non_binary, QStringLiteral("non-binary"));
+    maps.stringToIcon.insert(QStringLiteral("non-binary"), Icons::non_binary);
+    maps.iconToString.insert(Icons::notebook, QStringLiteral("notebook"));
+    maps.stringToIcon.insert(QStringLiteral("notebook"), Icons::notebook);
+    maps.iconToString.insert(Icons::notebook_pen, QStringLiteral("notebook-pen"));
+    maps.stringToIcon.insert(QStringLiteral("notebook-pen"), Icons::notebook_pen);
+    maps.iconToString.insert(Icons::notebook_tabs, QStringLiteral("notebook-tabs"));
+    maps.stringToIcon.insert(QStringLiteral("notebook-tabs"), Icons::notebook_tabs);
+    maps.iconToString.insert(Icons::notebook_text, QStringLiteral("notebook-text"));
+    maps.stringToIcon.insert(QStringLiteral("notebook-text"), Icons::notebook_text);
+    maps.iconToString.insert(Icons::notepad_text, QStringLiteral("notepad-text"));
+    maps.stringToIcon.insert(QStringLiteral("notepad-text"), Icons::notepad_text);
+    maps.iconToString.insert(Icons::notepad_text_dashed, QStringLiteral("notepad-text-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("notepad-text-dashed"), Icons::notepad_text_dashed);
+    maps.iconToString.insert(Icons::nut, QStringLiteral("nut"));
+    maps.stringToIcon.insert(QStringLiteral("nut"), Icons::nut);
+    maps.iconToString.insert(Icons::nut_off, QStringLiteral("nut-off"));
+    maps.stringToIcon.insert(QStringLiteral("nut-off"), Icons::nut_off);
+    maps.iconToString.insert(Icons::octagon, QStringLiteral("octagon"));
+    maps.stringToIcon.insert(QStringLiteral("octagon"), Icons::octagon);
+    maps.iconToString.insert(Icons::octagon_alert, QStringLiteral("octagon-alert"));
+    maps.stringToIcon.insert(QStringLiteral("octagon-alert"), Icons::octagon_alert);
+    maps.iconToString.insert(Icons::octagon_minus, QStringLiteral("octagon-minus"));
+    maps.stringToIcon.insert(QStringLiteral("octagon-minus"), Icons::octagon_minus);
+    maps.iconToString.insert(Icons::octagon_pause, QStringLiteral("octagon-pause"));
+    maps.stringToIcon.insert(QStringLiteral("octagon-pause"), Icons::octagon_pause);
+    maps.iconToString.insert(Icons::octagon_x, QStringLiteral("octagon-x"));
+    maps.stringToIcon.insert(QStringLiteral("octagon-x"), Icons::octagon_x);
+    maps.iconToString.insert(Icons::omega, QStringLiteral("omega"));
+    maps.stringToIcon.insert(QStringLiteral("omega"), Icons::omega);
+    maps.iconToString.insert(Icons::option, QStringLiteral("option"));
+    maps.stringToIcon.insert(QStringLiteral("option"), Icons::option);
+    maps.iconToString.insert(Icons::orbit, QStringLiteral("orbit"));
+    maps.stringToIcon.insert(QStringLiteral("orbit"), Icons::orbit);
+    maps.iconToString.insert(Icons::origami, QStringLiteral("origami"));
+    maps.stringToIcon.insert(QStringLiteral("origami"), Icons::origami);
+    maps.iconToString.insert(Icons::package, QStringLiteral("package"));
+    maps.stringToIcon.insert(QStringLiteral("package"), Icons::package);
+    maps.iconToString.insert(Icons::package_2, QStringLiteral("package-2"));
+    maps.stringToIcon.insert(QStringLiteral("package-2"), Icons::package_2);
+    maps.iconToString.insert(Icons::package_check, QStringLiteral("package-check"));
+    maps.stringToIcon.insert(QStringLiteral("package-check"), Icons::package_check);
+    maps.iconToString.insert(Icons::package_minus, QStringLiteral("package-minus"));
+    maps.stringToIcon.insert(QStringLiteral("package-minus"), Icons::package_minus);
+    maps.iconToString.insert(Icons::package_open, QStringLiteral("package-open"));
+    maps.stringToIcon.insert(QStringLiteral("package-open"), Icons::package_open);
+    maps.iconToString.insert(Icons::package_plus, QStringLiteral("package-plus"));
+    maps.stringToIcon.insert(QStringLiteral("package-plus"), Icons::package_plus);
+    maps.iconToString.insert(Icons::package_search, QStringLiteral("package-search"));
+    maps.stringToIcon.insert(QStringLiteral("package-search"), Icons::package_search);
+    maps.iconToString.insert(Icons::package_x, QStringLiteral("package-x"));
+    maps.stringToIcon.insert(QStringLiteral("package-x"), Icons::package_x);
+    maps.iconToString.insert(Icons::paint_bucket, QStringLiteral("paint-bucket"));
+    maps.stringToIcon.insert(QStringLiteral("paint-bucket"), Icons::paint_bucket);
+    maps.iconToString.insert(Icons::paint_roller, QStringLiteral("paint-roller"));
+    maps.stringToIcon.insert(QStringLiteral("paint-roller"), Icons::paint_roller);
+    maps.iconToString.insert(Icons::paintbrush, QStringLiteral("paintbrush"));
+    maps.stringToIcon.insert(QStringLiteral("paintbrush"), Icons::paintbrush);
+    maps.iconToString.insert(Icons::paintbrush_vertical, QStringLiteral("paintbrush-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("paintbrush-vertical"), Icons::paintbrush_vertical);
+    maps.iconToString.insert(Icons::palette, QStringLiteral("palette"));
+    maps.stringToIcon.insert(QStringLiteral("palette"), Icons::palette);
+    maps.iconToString.insert(Icons::panda, QStringLiteral("panda"));
+    maps.stringToIcon.insert(QStringLiteral("panda"), Icons::panda);
+    maps.iconToString.insert(Icons::panel_bottom, QStringLiteral("panel-bottom"));
+    maps.stringToIcon.insert(QStringLiteral("panel-bottom"), Icons::panel_bottom);
+    maps.iconToString.insert(Icons::panel_bottom_close, QStringLiteral("panel-bottom-close"));
+    maps.stringToIcon.insert(QStringLiteral("panel-bottom-close"), Icons::panel_bottom_close);
+    maps.iconToString.insert(Icons::panel_bottom_dashed, QStringLiteral("panel-bottom-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-bottom-dashed"), Icons::panel_bottom_dashed);
+    maps.iconToString.insert(Icons::panel_bottom_open, QStringLiteral("panel-bottom-open"));
+    maps.stringToIcon.insert(QStringLiteral("panel-bottom-open"), Icons::panel_bottom_open);
+    maps.iconToString.insert(Icons::panel_left, QStringLiteral("panel-left"));
+    maps.stringToIcon.insert(QStringLiteral("panel-left"), Icons::panel_left);
+    maps.iconToString.insert(Icons::panel_left_close, QStringLiteral("panel-left-close"));
+    maps.stringToIcon.insert(QStringLiteral("panel-left-close"), Icons::panel_left_close);
+    maps.iconToString.insert(Icons::panel_left_dashed, QStringLiteral("panel-left-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-left-dashed"), Icons::panel_left_dashed);
+    maps.iconToString.insert(Icons::panel_left_open, QStringLiteral("panel-left-open"));
+    maps.stringToIcon.insert(QStringLiteral("panel-left-open"), Icons::panel_left_open);
+    maps.iconToString.insert(Icons::panel_left_right_dashed,
+                             QStringLiteral("panel-left-right-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-left-right-dashed"),
+                             Icons::panel_left_right_dashed);
+    maps.iconToString.insert(Icons::panel_right, QStringLiteral("panel-right"));
+    maps.stringToIcon.insert(QStringLiteral("panel-right"), Icons::panel_right);
+    maps.iconToString.insert(Icons::panel_right_close, QStringLiteral("panel-right-close"));
+    maps.stringToIcon.insert(QStringLiteral("panel-right-close"), Icons::panel_right_close);
+    maps.iconToString.insert(Icons::panel_right_dashed, QStringLiteral("panel-right-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-right-dashed"), Icons::panel_right_dashed);
+    maps.iconToString.insert(Icons::panel_right_open, QStringLiteral("panel-right-open"));
+    maps.stringToIcon.insert(QStringLiteral("panel-right-open"), Icons::panel_right_open);
+    maps.iconToString.insert(Icons::panel_top, QStringLiteral("panel-top"));
+    maps.stringToIcon.insert(QStringLiteral("panel-top"), Icons::panel_top);
+    maps.iconToString.insert(Icons::panel_top_bottom_dashed,
+                             QStringLiteral("panel-top-bottom-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-top-bottom-dashed"),
+                             Icons::panel_top_bottom_dashed);
+    maps.iconToString.insert(Icons::panel_top_close, QStringLiteral("panel-top-close"));
+    maps.stringToIcon.insert(QStringLiteral("panel-top-close"), Icons::panel_top_close);
+    maps.iconToString.insert(Icons::panel_top_dashed, QStringLiteral("panel-top-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("panel-top-dashed"), Icons::panel_top_dashed);
+    maps.iconToString.insert(Icons::panel_top_open, QStringLiteral("panel-top-open"));
+    maps.stringToIcon.insert(QStringLiteral("panel-top-open"), Icons::panel_top_open);
+    maps.iconToString.insert(Icons::panels_left_bottom, QStringLiteral("panels-left-bottom"));
+    maps.stringToIcon.insert(QStringLiteral("panels-left-bottom"), Icons::panels_left_bottom);
+    maps.iconToString.insert(Icons::panels_right_bottom, QStringLiteral("panels-right-bottom"));
+    maps.stringToIcon.insert(QStringLiteral("panels-right-bottom"), Icons::panels_right_bottom);
+    maps.iconToString.insert(Icons::panels_top_left, QStringLiteral("panels-top-left"));
+    maps.stringToIcon.insert(QStringLiteral("panels-top-left"), Icons::panels_top_left);
+    maps.iconToString.insert(Icons::paperclip, QStringLiteral("paperclip"));
+    maps.stringToIcon.insert(QStringLiteral("paperclip"), Icons::paperclip);
+    maps.iconToString.insert(Icons::parentheses, QStringLiteral("parentheses"));
+    maps.stringToIcon.insert(QStringLiteral("parentheses"), Icons::parentheses);
+    maps.iconToString.insert(Icons::parking_meter, QStringLiteral("parking-meter"));
+    maps.stringToIcon.insert(QStringLiteral("parking-meter"), Icons::parking_meter);
+    maps.iconToString.insert(Icons::party_popper, QStringLiteral("party-popper"));
+    maps.stringToIcon.insert(QStringLiteral("party-popper"), Icons::party_popper);
+    maps.iconToString.insert(Icons::pause, QStringLiteral("pause"));
+    maps.stringToIcon.insert(QStringLiteral("pause"), Icons::pause);
+    maps.iconToString.insert(Icons::paw_print, QStringLiteral("paw-print"));
+    maps.stringToIcon.insert(QStringLiteral("paw-print"), Icons::paw_print);
+    maps.iconToString.insert(Icons::pc_case, QStringLiteral("pc-case"));
+    maps.stringToIcon.insert(QStringLiteral("pc-case"), Icons::pc_case);
+    maps.iconToString.insert(Icons::pen, QStringLiteral("pen"));
+    maps.stringToIcon.insert(QStringLiteral("pen"), Icons::pen);
+    maps.iconToString.insert(Icons::pen_line, QStringLiteral("pen-line"));
+    maps.stringToIcon.insert(QStringLiteral("pen-line"), Icons::pen_line);
+    maps.iconToString.insert(Icons::pen_off, QStringLiteral("pen-off"));
+    maps.stringToIcon.insert(QStringLiteral("pen-off"), Icons::pen_off);
+    maps.iconToString.insert(Icons::pen_tool, QStringLiteral("pen-tool"));
+    maps.stringToIcon.insert(QStringLiteral("pen-tool"), Icons::pen_tool);
+    maps.iconToString.insert(Icons::pencil, QStringLiteral("pencil"));
+    maps.stringToIcon.insert(QStringLiteral("pencil"), Icons::pencil);
+    maps.iconToString.insert(Icons::pencil_line, QStringLiteral("pencil-line"));
+    maps.stringToIcon.insert(QStringLiteral("pencil-line"), Icons::pencil_line);
+    maps.iconToString.insert(Icons::pencil_off, QStringLiteral("pencil-off"));
+    maps.stringToIcon.insert(QStringLiteral("pencil-off"), Icons::pencil_off);
+    maps.iconToString.insert(Icons::pencil_ruler, QStringLiteral("pencil-ruler"));
+    maps.stringToIcon.insert(QStringLiteral("pencil-ruler"), Icons::pencil_ruler);
+    maps.iconToString.insert(Icons::pentagon, QStringLiteral("pentagon"));
+    maps.stringToIcon.insert(QStringLiteral("pentagon"), Icons::pentagon);
+    maps.iconToString.insert(Icons::percent, QStringLiteral("percent"));
+    maps.stringToIcon.insert(QStringLiteral("percent"), Icons::percent);
+    maps.iconToString.insert(Icons::person_standing, QStringLiteral("person-standing"));
+    maps.stringToIcon.insert(QStringLiteral("person-standing"), Icons::person_standing);
+    maps.iconToString.insert(Icons::philippine_peso, QStringLiteral("philippine-peso"));
+    maps.stringToIcon.insert(QStringLiteral("philippine-peso"), Icons::philippine_peso);
+    maps.iconToString.insert(Icons::phone, QStringLiteral("phone"));
+    maps.stringToIcon.insert(QStringLiteral("phone"), Icons::phone);
+    maps.iconToString.insert(Icons::phone_call, QStringLiteral("phone-call"));
+    maps.stringToIcon.insert(QStringLiteral("phone-call"), Icons::phone_call);
+    maps.iconToString.insert(Icons::phone_forwarded, QStringLiteral("phone-forwarded"));
+    maps.stringToIcon.insert(QStringLiteral("phone-forwarded"), Icons::phone_forwarded);
+    maps.iconToString.insert(Icons::phone_incoming, QStringLiteral("phone-incoming"));
+    maps.stringToIcon.insert(QStringLiteral("phone-incoming"), Icons::phone_incoming);
+    maps.iconToString.insert(Icons::phone_missed, QStringLiteral("phone-missed"));
+    maps.stringToIcon.insert(QStringLiteral("phone-missed"), Icons::phone_missed);
+    maps.iconToString.insert(Icons::phone_off, QStringLiteral("phone-off"));
+    maps.stringToIcon.insert(QStringLiteral("phone-off"), Icons::phone_off);
+    maps.iconToString.insert(Icons::phone_outgoing, QStringLiteral("phone-outgoing"));
+    maps.stringToIcon.insert(QStringLiteral("phone-outgoing"), Icons::phone_outgoing);
+    maps.iconToString.insert(Icons::pi, QStringLiteral("pi"));
+    maps.stringToIcon.insert(QStringLiteral("pi"), Icons::pi);
+    maps.iconToString.insert(Icons::piano, QStringLiteral("piano"));
+    maps.stringToIcon.insert(QStringLiteral("piano"), Icons::piano);
+    maps.iconToString.insert(Icons::pickaxe, QStringLiteral("pickaxe"));
+    maps.stringToIcon.insert(QStringLiteral("pickaxe"), Icons::pickaxe);
+    maps.iconToString.insert(Icons::picture_in_picture, QStringLiteral("picture-in-picture"));
+    maps.stringToIcon.insert(QStringLiteral("picture-in-picture"), Icons::picture_in_picture);
+    maps.iconToString.insert(Icons::picture_in_picture_2, QStringLiteral("picture-in-picture-2"));
+    maps.stringToIcon.insert(QStringLiteral("picture-in-picture-2"), Icons::picture_in_picture_2);
+    maps.iconToString.insert(Icons::piggy_bank, QStringLiteral("piggy-bank"));
+    maps.stringToIcon.insert(QStringLiteral("piggy-bank"), Icons::piggy_bank);
+    maps.iconToString.insert(Icons::pilcrow, QStringLiteral("pilcrow"));
+    maps.stringToIcon.insert(QStringLiteral("pilcrow"), Icons::pilcrow);
+    maps.iconToString.insert(Icons::pilcrow_left, QStringLiteral("pilcrow-left"));
+    maps.stringToIcon.insert(QStringLiteral("pilcrow-left"), Icons::pilcrow_left);
+    maps.iconToString.insert(Icons::pilcrow_right, QStringLiteral("pilcrow-right"));
+    maps.stringToIcon.insert(QStringLiteral("pilcrow-right"), Icons::pilcrow_right);
+    maps.iconToString.insert(Icons::pill, QStringLiteral("pill"));
+    maps.stringToIcon.insert(QStringLiteral("pill"), Icons::pill);
+    maps.iconToString.insert(Icons::pill_bottle, QStringLiteral("pill-bottle"));
+    maps.stringToIcon.insert(QStringLiteral("pill-bottle"), Icons::pill_bottle);
+    maps.iconToString.insert(Icons::pin, QStringLiteral("pin"));
+    maps.stringToIcon.insert(QStringLiteral("pin"), Icons::pin);
+    maps.iconToString.insert(Icons::pin_off, QStringLiteral("pin-off"));
+    maps.stringToIcon.insert(QStringLiteral("pin-off"), Icons::pin_off);
+    maps.iconToString.insert(Icons::pipette, QStringLiteral("pipette"));
+    maps.stringToIcon.insert(QStringLiteral("pipette"), Icons::pipette);
+    maps.iconToString.insert(Icons::pizza, QStringLiteral("pizza"));
+    maps.stringToIcon.insert(QStringLiteral("pizza"), Icons::pizza);
+    maps.iconToString.insert(Icons::plane, QStringLiteral("plane"));
+    maps.stringToIcon.insert(QStringLiteral("plane"), Icons::plane);
+    maps.iconToString.insert(Icons::plane_landing, QStringLiteral("plane-landing"));
+    maps.stringToIcon.insert(QStringLiteral("plane-landing"), Icons::plane_landing);
+    maps.iconToString.insert(Icons::plane_takeoff, QStringLiteral("plane-takeoff"));
+    maps.stringToIcon.insert(QStringLiteral("plane-takeoff"), Icons::plane_takeoff);
+    maps.iconToString.insert(Icons::play, QStringLiteral("play"));
+    maps.stringToIcon.insert(QStringLiteral("play"), Icons::play);
+    maps.iconToString.insert(Icons::plug, QStringLiteral("plug"));
+    maps.stringToIcon.insert(QStringLiteral("plug"), Icons::plug);
+    maps.iconToString.insert(Icons::plug_2, QStringLiteral("plug-2"));
+    maps.stringToIcon.insert(QStringLiteral("plug-2"), Icons::plug_2);
+    maps.iconToString.insert(Icons::plug_zap, QStringLiteral("plug-zap"));
+    maps.stringToIcon.insert(QStringLiteral("plug-zap"), Icons::plug_zap);
+    maps.iconToString.insert(Icons::plus, QStringLiteral("plus"));
+    maps.stringToIcon.insert(QStringLiteral("plus"), Icons::plus);
+    maps.iconToString.insert(Icons::pocket, QStringLiteral("pocket"));
+    maps.stringToIcon.insert(QStringLiteral("pocket"), Icons::pocket);
+    maps.iconToString.insert(Icons::pocket_knife, QStringLiteral("pocket-knife"));
+    maps.stringToIcon.insert(QStringLiteral("pocket-knife"), Icons::pocket_knife);
+    maps.iconToString.insert(Icons::podcast, QStringLiteral("podcast"));
+    maps.stringToIcon.insert(QStringLiteral("podcast"), Icons::podcast);
+    maps.iconToString.insert(Icons::pointer, QStringLiteral("pointer"));
+    maps.stringToIcon.insert(QStringLiteral("pointer"), Icons::pointer);
+    maps.iconToString.insert(Icons::pointer_off, QStringLiteral("pointer-off"));
+    maps.stringToIcon.insert(QStringLiteral("pointer-off"), Icons::pointer_off);
+    maps.iconToString.insert(Icons::popcorn, QStringLiteral("popcorn"));
+    maps.stringToIcon.insert(QStringLiteral("popcorn"), Icons::popcorn);
+    maps.iconToString.insert(Icons::popsicle, QStringLiteral("popsicle"));
+    maps.stringToIcon.insert(QStringLiteral("popsicle"), Icons::popsicle);
+    maps.iconToString.insert(Icons::pound_sterling, QStringLiteral("pound-sterling"));
+    maps.stringToIcon.insert(QStringLiteral("pound-sterling"), Icons::pound_sterling);
+    maps.iconToString.insert(Icons::power, QStringLiteral("power"));
+    maps.stringToIcon.insert(QStringLiteral("power"), Icons::power);
+    maps.iconToString.insert(Icons::power_off, QStringLiteral("power-off"));
+    maps.stringToIcon.insert(QStringLiteral("power-off"), Icons::power_off);
+    maps.iconToString.insert(Icons::presentation, QStringLiteral("presentation"));
+    maps.stringToIcon.insert(QStringLiteral("presentation"), Icons::presentation);
+    maps.iconToString.insert(Icons::printer, QStringLiteral("printer"));
+    maps.stringToIcon.insert(QStringLiteral("printer"), Icons::printer);
+    maps.iconToString.insert(Icons::printer_check, QStringLiteral("printer-check"));
+    maps.stringToIcon.insert(QStringLiteral("printer-check"), Icons::printer_check);
+    maps.iconToString.insert(Icons::projector, QStringLiteral("projector"));
+    maps.stringToIcon.insert(QStringLiteral("projector"), Icons::projector);
+    maps.iconToString.insert(Icons::proportions, QStringLiteral("proportions"));
+    maps.stringToIcon.insert(QStringLiteral("proportions"), Icons::proportions);
+    maps.iconToString.insert(Icons::puzzle, QStringLiteral("puzzle"));
+    maps.stringToIcon.insert(QStringLiteral("puzzle"), Icons::puzzle);
+    maps.iconToString.insert(Icons::pyramid, QStringLiteral("pyramid"));
+    maps.stringToIcon.insert(QStringLiteral("pyramid"), Icons::pyramid);
+    maps.iconToString.insert(Icons::qr_code, QStringLiteral("qr-code"));
+    maps.stringToIcon.insert(QStringLiteral("qr-code"), Icons::qr_code);
+    maps.iconToString.insert(Icons::quote, QStringLiteral("quote"));
+    maps.stringToIcon.insert(QStringLiteral("quote"), Icons::quote);
+    maps.iconToString.insert(Icons::rabbit, QStringLiteral("rabbit"));
+    maps.stringToIcon.insert(QStringLiteral("rabbit"), Icons::rabbit);
+    maps.iconToString.insert(Icons::radar, QStringLiteral("radar"));
+    maps.stringToIcon.insert(QStringLiteral("radar"), Icons::radar);
+    maps.iconToString.insert(Icons::radiation, QStringLiteral("radiation"));
+    maps.stringToIcon.insert(QStringLiteral("radiation"), Icons::radiation);
+    maps.iconToString.insert(Icons::radical, QStringLiteral("radical"));
+    maps.stringToIcon.insert(QStringLiteral("radical"), Icons::radical);
+    maps.iconToString.insert(Icons::radio, QStringLiteral("radio"));
+    maps.stringToIcon.insert(QStringLiteral("radio"), Icons::radio);
+    maps.iconToString.insert(Icons::radio_receiver, QStringLiteral("radio-receiver"));
+    maps.stringToIcon.insert(QStringLiteral("radio-receiver"), Icons::radio_receiver);
+    maps.iconToString.insert(Icons::radio_tower, QStringLiteral("radio-tower"));
+    maps.stringToIcon.insert(QStringLiteral("radio-tower"), Icons::radio_tower);
+    maps.iconToString.insert(Icons::radius, QStringLiteral("radius"));
+    maps.stringToIcon.insert(QStringLiteral("radius"), Icons::radius);
+    maps.iconToString.insert(Icons::rail_symbol, QStringLiteral("rail-symbol"));
+    maps.stringToIcon.insert(QStringLiteral("rail-symbol"), Icons::rail_symbol);
+    maps.iconToString.insert(Icons::rainbow, QStringLiteral("rainbow"));
+    maps.stringToIcon.insert(QStringLiteral("rainbow"), Icons::rainbow);
+    maps.iconToString.insert(Icons::rat, QStringLiteral("rat"));
+    maps.stringToIcon.insert(QStringLiteral("rat"), Icons::rat);
+    maps.iconToString.insert(Icons::ratio, QStringLiteral("ratio"));
+    maps.stringToIcon.insert(QStringLiteral("ratio"), Icons::ratio);
+    maps.iconToString.insert(Icons::receipt, QStringLiteral("receipt"));
+    maps.stringToIcon.insert(QStringLiteral("receipt"), Icons::receipt);
+    maps.iconToString.insert(Icons::receipt_cent, QStringLiteral("receipt-cent"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-cent"), Icons::receipt_cent);
+    maps.iconToString.insert(Icons::receipt_euro, QStringLiteral("receipt-euro"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-euro"), Icons::receipt_euro);
+    maps.iconToString.insert(Icons::receipt_indian_rupee, QStringLiteral("receipt-indian-rupee"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-indian-rupee"), Icons::receipt_indian_rupee);
+    maps.iconToString.insert(Icons::receipt_japanese_yen, QStringLiteral("receipt-japanese-yen"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-japanese-yen"), Icons::receipt_japanese_yen);
+    maps.iconToString.insert(Icons::receipt_pound_sterling,
+                             QStringLiteral("receipt-pound-sterling"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-pound-sterling"),
+                             Icons::receipt_pound_sterling);
+    maps.iconToString.insert(Icons::receipt_russian_ruble, QStringLiteral("receipt-russian-ruble"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-russian-ruble"), Icons::receipt_russian_ruble);
+    maps.iconToString.insert(Icons::receipt_swiss_franc, QStringLiteral("receipt-swiss-franc"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-swiss-franc"), Icons::receipt_swiss_franc);
+    maps.iconToString.insert(Icons::receipt_text, QStringLiteral("receipt-text"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-text"), Icons::receipt_text);
+    maps.iconToString.insert(Icons::receipt_turkish_lira, QStringLiteral("receipt-turkish-lira"));
+    maps.stringToIcon.insert(QStringLiteral("receipt-turkish-lira"), Icons::receipt_turkish_lira);
+    maps.iconToString.insert(Icons::rectangle_circle, QStringLiteral("rectangle-circle"));
+    maps.stringToIcon.insert(QStringLiteral("rectangle-circle"), Icons::rectangle_circle);
+    maps.iconToString.insert(Icons::rectangle_ellipsis, QStringLiteral("rectangle-ellipsis"));
+    maps.stringToIcon.insert(QStringLiteral("rectangle-ellipsis"), Icons::rectangle_ellipsis);
+    maps.iconToString.insert(Icons::rectangle_goggles, QStringLiteral("rectangle-goggles"));
+    maps.stringToIcon.insert(QStringLiteral("rectangle-goggles"), Icons::rectangle_goggles);
+    maps.iconToString.insert(Icons::rectangle_horizontal, QStringLiteral("rectangle-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("rectangle-horizontal"), Icons::rectangle_horizontal);
+    maps.iconToString.insert(Icons::rectangle_vertical, QStringLiteral("rectangle-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("rectangle-vertical"), Icons::rectangle_vertical);
+    maps.iconToString.insert(Icons::recycle, QStringLiteral("recycle"));
+    maps.stringToIcon.insert(QStringLiteral("recycle"), Icons::recycle);
+    maps.iconToString.insert(Icons::redo, QStringLiteral("redo"));
+    maps.stringToIcon.insert(QStringLiteral("redo"), Icons::redo);
+    maps.iconToString.insert(Icons::redo_2, QStringLiteral("redo-2"));
+    maps.stringToIcon.insert(QStringLiteral("redo-2"), Icons::redo_2);
+    maps.iconToString.insert(Icons::redo_dot, QStringLiteral("redo-dot"));
+    maps.stringToIcon.insert(QStringLiteral("redo-dot"), Icons::redo_dot);
+    maps.iconToString.insert(Icons::refresh_ccw, QStringLiteral("refresh-ccw"));
+    maps.stringToIcon.insert(QStringLiteral("refresh-ccw"), Icons::refresh_ccw);
+    maps.iconToString.insert(Icons::refresh_ccw_dot, QStringLiteral("refresh-ccw-dot"));
+    maps.stringToIcon.insert(QStringLiteral("refresh-ccw-dot"), Icons::refresh_ccw_dot);
+    maps.iconToString.insert(Icons::refresh_cw, QStringLiteral("refresh-cw"));
+    maps.stringToIcon.insert(QStringLiteral("refresh-cw"), Icons::refresh_cw);
+    maps.iconToString.insert(Icons::refresh_cw_off, QStringLiteral("refresh-cw-off"));
+    maps.stringToIcon.insert(QStringLiteral("refresh-cw-off"), Icons::refresh_cw_off);
+    maps.iconToString.insert(Icons::refrigerator, QStringLiteral("refrigerator"));
+    maps.stringToIcon.insert(QStringLiteral("refrigerator"), Icons::refrigerator);
+    maps.iconToString.insert(Icons::regex, QStringLiteral("regex"));
+    maps.stringToIcon.insert(QStringLiteral("regex"), Icons::regex);
+    maps.iconToString.insert(Icons::remove_formatting, QStringLiteral("remove-formatting"));
+    maps.stringToIcon.insert(QStringLiteral("remove-formatting"), Icons::remove_formatting);
+    maps.iconToString.insert(Icons::repeat, QStringLiteral("repeat"));
+    maps.stringToIcon.insert(QStringLiteral("repeat"), Icons::repeat);
+    maps.iconToString.insert(Icons::repeat_1, QStringLiteral("repeat-1"));
+    maps.stringToIcon.insert(QStringLiteral("repeat-1"), Icons::repeat_1);
+    maps.iconToString.insert(Icons::repeat_2, QStringLiteral("repeat-2"));
+    maps.stringToIcon.insert(QStringLiteral("repeat-2"), Icons::repeat_2);
+    maps.iconToString.insert(Icons::replace, QStringLiteral("replace"));
+    maps.stringToIcon.insert(QStringLiteral("replace"), Icons::replace);
+    maps.iconToString.insert(Icons::replace_all, QStringLiteral("replace-all"));
+    maps.stringToIcon.insert(QStringLiteral("replace-all"), Icons::replace_all);
+    maps.iconToString.insert(Icons::reply, QStringLiteral("reply"));
+    maps.stringToIcon.insert(QStringLiteral("reply"), Icons::reply);
+    maps.iconToString.insert(Icons::reply_all, QStringLiteral("reply-all"));
+    maps.stringToIcon.insert(QStringLiteral("reply-all"), Icons::reply_all);
+    maps.iconToString.insert(Icons::rewind, QStringLiteral("rewind"));
+    maps.stringToIcon.insert(QStringLiteral("rewind"), Icons::rewind);
+    maps.iconToString.insert(Icons::ribbon, QStringLiteral("ribbon"));
+    maps.stringToIcon.insert(QStringLiteral("ribbon"), Icons::ribbon);
+    maps.iconToString.insert(Icons::rocket, QStringLiteral("rocket"));
+    maps.stringToIcon.insert(QStringLiteral("rocket"), Icons::rocket);
+    maps.iconToString.insert(Icons::rocking_chair, QStringLiteral("rocking-chair"));
+    maps.stringToIcon.insert(QStringLiteral("rocking-chair"), Icons::rocking_chair);
+    maps.iconToString.insert(Icons::roller_coaster, QStringLiteral("roller-coaster"));
+    maps.stringToIcon.insert(QStringLiteral("roller-coaster"), Icons::roller_coaster);
+    maps.iconToString.insert(Icons::rose, QStringLiteral("rose"));
+    maps.stringToIcon.insert(QStringLiteral("rose"), Icons::rose);
+    maps.iconToString.insert(Icons::rotate_3d, QStringLiteral("rotate-3d"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-3d"), Icons::rotate_3d);
+    maps.iconToString.insert(Icons::rotate_ccw, QStringLiteral("rotate-ccw"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-ccw"), Icons::rotate_ccw);
+    maps.iconToString.insert(Icons::rotate_ccw_key, QStringLiteral("rotate-ccw-key"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-ccw-key"), Icons::rotate_ccw_key);
+    maps.iconToString.insert(Icons::rotate_ccw_square, QStringLiteral("rotate-ccw-square"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-ccw-square"), Icons::rotate_ccw_square);
+    maps.iconToString.insert(Icons::rotate_cw, QStringLiteral("rotate-cw"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-cw"), Icons::rotate_cw);
+    maps.iconToString.insert(Icons::rotate_cw_square, QStringLiteral("rotate-cw-square"));
+    maps.stringToIcon.insert(QStringLiteral("rotate-cw-square"), Icons::rotate_cw_square);
+    maps.iconToString.insert(Icons::route, QStringLiteral("route"));
+    maps.stringToIcon.insert(QStringLiteral("route"), Icons::route);
+    maps.iconToString.insert(Icons::route_off, QStringLiteral("route-off"));
+    maps.stringToIcon.insert(QStringLiteral("route-off"), Icons::route_off);
+    maps.iconToString.insert(Icons::router, QStringLiteral("router"));
+    maps.stringToIcon.insert(QStringLiteral("router"), Icons::router);
+    maps.iconToString.insert(Icons::rows_2, QStringLiteral("rows-2"));
+    maps.stringToIcon.insert(QStringLiteral("rows-2"), Icons::rows_2);
+    maps.iconToString.insert(Icons::rows_3, QStringLiteral("rows-3"));
+    maps.stringToIcon.insert(QStringLiteral("rows-3"), Icons::rows_3);
+    maps.iconToString.insert(Icons::rows_4, QStringLiteral("rows-4"));
+    maps.stringToIcon.insert(QStringLiteral("rows-4"), Icons::rows_4);
+    maps.iconToString.insert(Icons::rss, QStringLiteral("rss"));
+    maps.stringToIcon.insert(QStringLiteral("rss"), Icons::rss);
+    maps.iconToString.insert(Icons::ruler, QStringLiteral("ruler"));
+    maps.stringToIcon.insert(QStringLiteral("ruler"), Icons::ruler);
+    maps.iconToString.insert(Icons::ruler_dimension_line, QStringLiteral("ruler-dimension-line"));
+    maps.stringToIcon.insert(QStringLiteral("ruler-dimension-line"), Icons::ruler_dimension_line);
+    maps.iconToString.insert(Icons::russian_ruble, QStringLiteral("russian-ruble"));
+    maps.stringToIcon.insert(QStringLiteral("russian-ruble"), Icons::russian_ruble);
+    maps.iconToString.insert(Icons::sailboat, QStringLiteral("sailboat"));
+    maps.stringToIcon.insert(QStringLiteral("sailboat"), Icons::sailboat);
+    maps.iconToString.insert(Icons::salad, QStringLiteral("salad"));
+    maps.stringToIcon.insert(QStringLiteral("salad"), Icons::salad);
+    maps.iconToString.insert(Icons::sandwich, QStringLiteral("sandwich"));
+    maps.stringToIcon.insert(QStringLiteral("sandwich"), Icons::sandwich);
+    maps.iconToString.insert(Icons::satellite, QStringLiteral("satellite"));
+    maps.stringToIcon.insert(QStringLiteral("satellite"), Icons::satellite);
+    maps.iconToString.insert(Icons::satellite_dish, QStringLiteral("satellite-dish"));
+    maps.stringToIcon.insert(QStringLiteral("satellite-dish"), Icons::satellite_dish);
+    maps.iconToString.insert(Icons::saudi_riyal, QStringLiteral("saudi-riyal"));
+    maps.stringToIcon.insert(QStringLiteral("saudi-riyal"), Icons::saudi_riyal);
+    maps.iconToString.insert(Icons::save, QStringLiteral("save"));
+    maps.stringToIcon.insert(QStringLiteral("save"), Icons::save);
+    maps.iconToString.insert(Icons::save_all, QStringLiteral("save-all"));
+    maps.stringToIcon.insert(QStringLiteral("save-all"), Icons::save_all);
+    maps.iconToString.insert(Icons::save_off, QStringLiteral("save-off"));
+    maps.stringToIcon.insert(QStringLiteral("save-off"), Icons::save_off);
+    maps.iconToString.insert(Icons::scale, QStringLiteral("scale"));
+    maps.stringToIcon.insert(QStringLiteral("scale"), Icons::scale);
+    maps.iconToString.insert(Icons::scale_3d, QStringLiteral("scale-3d"));
+    maps.stringToIcon.insert(QStringLiteral("scale-3d"), Icons::scale_3d);
+    maps.iconToString.insert(Icons::scaling, QStringLiteral("scaling"));
+    maps.stringToIcon.insert(QStringLiteral("scaling"), Icons::scaling);
+    maps.iconToString.insert(Icons::scan, QStringLiteral("scan"));
+    maps.stringToIcon.insert(QStringLiteral("scan"), Icons::scan);
+    maps.iconToString.insert(Icons::scan_barcode, QStringLiteral("scan-barcode"));
+    maps.stringToIcon.insert(QStringLiteral("scan-barcode"), Icons::scan_barcode);
+    maps.iconToString.insert(Icons::scan_eye, QStringLiteral("scan-eye"));
+    maps.stringToIcon.insert(QStringLiteral("scan-eye"), Icons::scan_eye);
+    maps.iconToString.insert(Icons::scan_face, QStringLiteral("scan-face"));
+    maps.stringToIcon.insert(QStringLiteral("scan-face"), Icons::scan_face);
+    maps.iconToString.insert(Icons::scan_heart, QStringLiteral("scan-heart"));
+    maps.stringToIcon.insert(QStringLiteral("scan-heart"), Icons::scan_heart);
+    maps.iconToString.insert(Icons::scan_line, QStringLiteral("scan-line"));
+    maps.stringToIcon.insert(QStringLiteral("scan-line"), Icons::scan_line);
+    maps.iconToString.insert(Icons::scan_qr_code, QStringLiteral("scan-qr-code"));
+    maps.stringToIcon.insert(QStringLiteral("scan-qr-code"), Icons::scan_qr_code);
+    maps.iconToString.insert(Icons::scan_search, QStringLiteral("scan-search"));
+    maps.stringToIcon.insert(QStringLiteral("scan-search"), Icons::scan_search);
+    maps.iconToString.insert(Icons::scan_text, QStringLiteral("scan-text"));
+    maps.stringToIcon.insert(QStringLiteral("scan-text"), Icons::scan_text);
+    maps.iconToString.insert(Icons::school, QStringLiteral("school"));
+    maps.stringToIcon.insert(QStringLiteral("school"), Icons::school);
+    maps.iconToString.insert(Icons::scissors, QStringLiteral("scissors"));
+    maps.stringToIcon.insert(QStringLiteral("scissors"), Icons::scissors);
+    maps.iconToString.insert(Icons::scissors_line_dashed, QStringLiteral("scissors-line-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("scissors-line-dashed"), Icons::scissors_line_dashed);
+    maps.iconToString.insert(Icons::screen_share, QStringLiteral("screen-share"));
+    maps.stringToIcon.insert(QStringLiteral("screen-share"), Icons::screen_share);
+    maps.iconToString.insert(Icons::screen_share_off, QStringLiteral("screen-share-off"));
+    maps.stringToIcon.insert(QStringLiteral("screen-share-off"), Icons::screen_share_off);
+    maps.iconToString.insert(Icons::scroll, QStringLiteral("scroll"));
+    maps.stringToIcon.insert(QStringLiteral("scroll"), Icons::scroll);
+    maps.iconToString.insert(Icons::scroll_text, QStringLiteral("scroll-text"));
+    maps.stringToIcon.insert(QStringLiteral("scroll-text"), Icons::scroll_text);
+    maps.iconToString.insert(Icons::search, QStringLiteral("search"));
+    maps.stringToIcon.insert(QStringLiteral("search"), Icons::search);
+    maps.iconToString.insert(Icons::search_check, QStringLiteral("search-check"));
+    maps.stringToIcon.insert(QStringLiteral("search-check"), Icons::search_check);
+    maps.iconToString.insert(Icons::search_code, QStringLiteral("search-code"));
+    maps.stringToIcon.insert(QStringLiteral("search-code"), Icons::search_code);
+    maps.iconToString.insert(Icons::search_slash, QStringLiteral("search-slash"));
+    maps.stringToIcon.insert(QStringLiteral("search-slash"), Icons::search_slash);
+    maps.iconToString.insert(Icons::search_x, QStringLiteral("search-x"));
+    maps.stringToIcon.insert(QStringLiteral("search-x"), Icons::search_x);
+    maps.iconToString.insert(Icons::section, QStringLiteral("section"));
+    maps.stringToIcon.insert(QStringLiteral("section"), Icons::section);
+    maps.iconToString.insert(Icons::send, QStringLiteral("send"));
+    maps.stringToIcon.insert(QStringLiteral("send"), Icons::send);
+    maps.iconToString.insert(Icons::send_horizontal, QStringLiteral("send-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("send-horizontal"), Icons::send_horizontal);
+    maps.iconToString.insert(Icons::send_to_back, QStringLiteral("send-to-back"));
+    maps.stringToIcon.insert(QStringLiteral("send-to-back"), Icons::send_to_back);
+    maps.iconToString.insert(Icons::separator_horizontal, QStringLiteral("separator-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("separator-horizontal"), Icons::separator_horizontal);
+    maps.iconToString.insert(Icons::separator_vertical, QStringLiteral("separator-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("separator-vertical"), Icons::separator_vertical);
+    maps.iconToString.insert(Icons::server, QStringLiteral("server"));
+    maps.stringToIcon.insert(QStringLiteral("server"), Icons::server);
+    maps.iconToString.insert(Icons::server_cog, QStringLiteral("server-cog"));
+    maps.stringToIcon.insert(QStringLiteral("server-cog"), Icons::server_cog);
+    maps.iconToString.insert(Icons::server_crash, QStringLiteral("server-crash"));
+    maps.stringToIcon.insert(QStringLiteral("server-crash"), Icons::server_crash);
+    maps.iconToString.insert(Icons::server_off, QStringLiteral("server-off"));
+    maps.stringToIcon.insert(QStringLiteral("server-off"), Icons::server_off);
+    maps.iconToString.insert(Icons::settings, QStringLiteral("settings"));
+    maps.stringToIcon.insert(QStringLiteral("settings"), Icons::settings);
+    maps.iconToString.insert(Icons::settings_2, QStringLiteral("settings-2"));
+    maps.stringToIcon.insert(QStringLiteral("settings-2"), Icons::settings_2);
+    maps.iconToString.insert(Icons::shapes, QStringLiteral("shapes"));
+    maps.stringToIcon.insert(QStringLiteral("shapes"), Icons::shapes);
+    maps.iconToString.insert(Icons::share, QStringLiteral("share"));
+    maps.stringToIcon.insert(QStringLiteral("share"), Icons::share);
+    maps.iconToString.insert(Icons::share_2, QStringLiteral("share-2"));
+    maps.stringToIcon.insert(QStringLiteral("share-2"), Icons::share_2);
+    maps.iconToString.insert(Icons::sheet, QStringLiteral("sheet"));
+    maps.stringToIcon.insert(QStringLiteral("sheet"), Icons::sheet);
+    maps.iconToString.insert(Icons::shell, QStringLiteral("shell"));
+    maps.stringToIcon.insert(QStringLiteral("shell"), Icons::shell);
+    maps.iconToString.insert(Icons::shield, QStringLiteral("shield"));
+    maps.stringToIcon.insert(QStringLiteral("shield"), Icons::shield);
+    maps.iconToString.insert(Icons::shield_alert, QStringLiteral("shield-alert"));
+    maps.stringToIcon.insert(QStringLiteral("shield-alert"), Icons::shield_alert);
+    maps.iconToString.insert(Icons::shield_ban, QStringLiteral("shield-ban"));
+    maps.stringToIcon.insert(QStringLiteral("shield-ban"), Icons::shield_ban);
+    maps.iconToString.insert(Icons::shield_check, QStringLiteral("shield-check"));
+    maps.stringToIcon.insert(QStringLiteral("shield-check"), Icons::shield_check);
+    maps.iconToString.insert(Icons::shield_ellipsis, QStringLiteral("shield-ellipsis"));
+    maps.stringToIcon.insert(QStringLiteral("shield-ellipsis"), Icons::shield_ellipsis);
+    maps.iconToString.insert(Icons::shield_half, QStringLiteral("shield-half"));
+    maps.stringToIcon.insert(QStringLiteral("shield-half"), Icons::shield_half);
+    maps.iconToString.insert(Icons::shield_minus, QStringLiteral("shield-minus"));
+    maps.stringToIcon.insert(QStringLiteral("shield-minus"), Icons::shield_minus);
+    maps.iconToString.insert(Icons::shield_off, QStringLiteral("shield-off"));
+    maps.stringToIcon.insert(QStringLiteral("shield-off"), Icons::shield_off);
+    maps.iconToString.insert(Icons::shield_plus, QStringLiteral("shield-plus"));
+    maps.stringToIcon.insert(QStringLiteral("shield-plus"), Icons::shield_plus);
+    maps.iconToString.insert(Icons::shield_question_mark, QStringLiteral("shield-question-mark"));
+    maps.stringToIcon.insert(QStringLiteral("shield-question-mark"), Icons::shield_question_mark);
+    maps.iconToString.insert(Icons::shield_user, QStringLiteral("shield-user"));
+    maps.stringToIcon.insert(QStringLiteral("shield-user"), Icons::shield_user);
+    maps.iconToString.insert(Icons::shield_x, QStringLiteral("shield-x"));
+    maps.stringToIcon.insert(QStringLiteral("shield-x"), Icons::shield_x);
+    maps.iconToString.insert(Icons::ship, QStringLiteral("ship"));
+    maps.stringToIcon.insert(QStringLiteral("ship"), Icons::ship);
+    maps.iconToString.insert(Icons::ship_wheel, QStringLiteral("ship-wheel"));
+    maps.stringToIcon.insert(QStringLiteral("ship-wheel"), Icons::ship_wheel);
+    maps.iconToString.insert(Icons::shirt, QStringLiteral("shirt"));
+    maps.stringToIcon.insert(QStringLiteral("shirt"), Icons::shirt);
+    maps.iconToString.insert(Icons::shopping_bag, QStringLiteral("shopping-bag"));
+    maps.stringToIcon.insert(QStringLiteral("shopping-bag"), Icons::shopping_bag);
+    maps.iconToString.insert(Icons::shopping_basket, QStringLiteral("shopping-basket"));
+    maps.stringToIcon.insert(QStringLiteral("shopping-basket"), Icons::shopping_basket);
+    maps.iconToString.insert(Icons::shopping_cart, QStringLiteral("shopping-cart"));
+    maps.stringToIcon.insert(QStringLiteral("shopping-cart"), Icons::shopping_cart);
+    maps.iconToString.insert(Icons::shovel, QStringLiteral("shovel"));
+    maps.stringToIcon.insert(QStringLiteral("shovel"), Icons::shovel);
+    maps.iconToString.insert(Icons::shower_head, QStringLiteral("shower-head"));
+    maps.stringToIcon.insert(QStringLiteral("shower-head"), Icons::shower_head);
+    maps.iconToString.insert(Icons::shredder, QStringLiteral("shredder"));
+    maps.stringToIcon.insert(QStringLiteral("shredder"), Icons::shredder);
+    maps.iconToString.insert(Icons::shrimp, QStringLiteral("shrimp"));
+    maps.stringToIcon.insert(QStringLiteral("shrimp"), Icons::shrimp);
+    maps.iconToString.insert(Icons::shrink, QStringLiteral("shrink"));
+    maps.stringToIcon.insert(QStringLiteral("shrink"), Icons::shrink);
+    maps.iconToString.insert(Icons::shrub, QStringLiteral("shrub"));
+    maps.stringToIcon.insert(QStringLiteral("shrub"), Icons::shrub);
+    maps.iconToString.insert(Icons::shuffle, QStringLiteral("shuffle"));
+    maps.stringToIcon.insert(QStringLiteral("shuffle"), Icons::shuffle);
+    maps.iconToString.insert(Icons::sigma, QStringLiteral("sigma"));
+    maps.stringToIcon.insert(QStringLiteral("sigma"), Icons::sigma);
+    maps.iconToString.insert(Icons::signal, QStringLiteral("signal"));
+    maps.stringToIcon.insert(QStringLiteral("signal"), Icons::signal);
+    maps.iconToString.insert(Icons::signal_high, QStringLiteral("signal-high"));
+    maps.stringToIcon.insert(QStringLiteral("signal-high"), Icons::signal_high);
+    maps.iconToString.insert(Icons::signal_low, QStringLiteral("signal-low"));
+    maps.stringToIcon.insert(QStringLiteral("signal-low"), Icons::signal_low);
+    maps.iconToString.insert(Icons::signal_medium, QStringLiteral("signal-medium"));
+    maps.stringToIcon.insert(QStringLiteral("signal-medium"), Icons::signal_medium);
+    maps.iconToString.insert(Icons::signal_zero, QStringLiteral("signal-zero"));
+    maps.stringToIcon.insert(QStringLiteral("signal-zero"), Icons::signal_zero);
+    maps.iconToString.insert(Icons::signature, QStringLiteral("signature"));
+    maps.stringToIcon.insert(QStringLiteral("signature"), Icons::signature);
+    maps.iconToString.insert(Icons::signpost, QStringLiteral("signpost"));
+    maps.stringToIcon.insert(QStringLiteral("signpost"), Icons::signpost);
+    maps.iconToString.insert(Icons::signpost_big, QStringLiteral("signpost-big"));
+    maps.stringToIcon.insert(QStringLiteral("signpost-big"), Icons::signpost_big);
+    maps.iconToString.insert(Icons::siren, QStringLiteral("siren"));
+    maps.stringToIcon.insert(QStringLiteral("siren"), Icons::siren);
+    maps.iconToString.insert(Icons::skip_back, QStringLiteral("skip-back"));
+    maps.stringToIcon.insert(QStringLiteral("skip-back"), Icons::skip_back);
+    maps.iconToString.insert(Icons::skip_forward, QStringLiteral("skip-forward"));
+    maps.stringToIcon.insert(QStringLiteral("skip-forward"), Icons::skip_forward);
+    maps.iconToString.insert(Icons::skull, QStringLiteral("skull"));
+    maps.stringToIcon.insert(QStringLiteral("skull"), Icons::skull);
+    maps.iconToString.insert(Icons::slack, QStringLiteral("slack"));
+    maps.stringToIcon.insert(QStringLiteral("slack"), Icons::slack);
+    maps.iconToString.insert(Icons::slash, QStringLiteral("slash"));
+    maps.stringToIcon.insert(QStringLiteral("slash"), Icons::slash);
+    maps.iconToString.insert(Icons::slice, QStringLiteral("slice"));
+    maps.stringToIcon.insert(QStringLiteral("slice"), Icons::slice);
+    maps.iconToString.insert(Icons::sliders_horizontal, QStringLiteral("sliders-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("sliders-horizontal"), Icons::sliders_horizontal);
+    maps.iconToString.insert(Icons::sliders_vertical, QStringLiteral("sliders-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("sliders-vertical"), Icons::sliders_vertical);
+    maps.iconToString.insert(Icons::smartphone, QStringLiteral("smartphone"));
+    maps.stringToIcon.insert(QStringLiteral("smartphone"), Icons::smartphone);
+    maps.iconToString.insert(Icons::smartphone_charging, QStringLiteral("smartphone-charging"));
+    maps.stringToIcon.insert(QStringLiteral("smartphone-charging"), Icons::smartphone_charging);
+    maps.iconToString.insert(Icons::smartphone_nfc, QStringLiteral("smartphone-nfc"));
+    maps.stringToIcon.insert(QStringLiteral("smartphone-nfc"), Icons::smartphone_nfc);
+    maps.iconToString.insert(Icons::smile, QStringLiteral("smile"));
+    maps.stringToIcon.insert(QStringLiteral("smile"), Icons::smile);
+    maps.iconToString.insert(Icons::smile_plus, QStringLiteral("smile-plus"));
+    maps.stringToIcon.insert(QStringLiteral("smile-plus"), Icons::smile_plus);
+    maps.iconToString.insert(Icons::snail, QStringLiteral("snail"));
+    maps.stringToIcon.insert(QStringLiteral("snail"), Icons::snail);
+    maps.iconToString.insert(Icons::snowflake, QStringLiteral("snowflake"));
+    maps.stringToIcon.insert(QStringLiteral("snowflake"), Icons::snowflake);
+    maps.iconToString.insert(Icons::soap_dispenser_droplet,
+                             QStringLiteral("soap-dispenser-droplet"));
+    maps.stringToIcon.insert(QStringLiteral("soap-dispenser-droplet"),
+                             Icons::soap_dispenser_droplet);
+    maps.iconToString.insert(Icons::sofa, QStringLiteral("sofa"));
+    maps.stringToIcon.insert(QStringLiteral("sofa"), Icons::sofa);
+    maps.iconToString.insert(Icons::soup, QStringLiteral("soup"));
+    maps.stringToIcon.insert(QStringLiteral("soup"), Icons::soup);
+    maps.iconToString.insert(Icons::space, QStringLiteral("space"));
+    maps.stringToIcon.insert(QStringLiteral("space"), Icons::space);
+    maps.iconToString.insert(Icons::spade, QStringLiteral("spade"));
+    maps.stringToIcon.insert(QStringLiteral("spade"), Icons::spade);
+    maps.iconToString.insert(Icons::sparkle, QStringLiteral("sparkle"));
+    maps.stringToIcon.insert(QStringLiteral("sparkle"), Icons::sparkle);
+    maps.iconToString.insert(Icons::sparkles, QStringLiteral("sparkles"));
+    maps.stringToIcon.insert(QStringLiteral("sparkles"), Icons::sparkles);
+    maps.iconToString.insert(Icons::speaker, QStringLiteral("speaker"));
+    maps.stringToIcon.insert(QStringLiteral("speaker"), Icons::speaker);
+    maps.iconToString.insert(Icons::speech, QStringLiteral("speech"));
+    maps.stringToIcon.insert(QStringLiteral("speech"), Icons::speech);
+    maps.iconToString.insert(Icons::spell_check, QStringLiteral("spell-check"));
+    maps.stringToIcon.insert(QStringLiteral("spell-check"), Icons::spell_check);
+    maps.iconToString.insert(Icons::spell_check_2, QStringLiteral("spell-check-2"));
+    maps.stringToIcon.insert(QStringLiteral("spell-check-2"), Icons::spell_check_2);
+    maps.iconToString.insert(Icons::spline, QStringLiteral("spline"));
+    maps.stringToIcon.insert(QStringLiteral("spline"), Icons::spline);
+    maps.iconToString.insert(Icons::spline_pointer, QStringLiteral("spline-pointer"));
+    maps.stringToIcon.insert(QStringLiteral("spline-pointer"), Icons::spline_pointer);
+    maps.iconToString.insert(Icons::split, QStringLiteral("split"));
+    maps.stringToIcon.insert(QStringLiteral("split"), Icons::split);
+    maps.iconToString.insert(Icons::spool, QStringLiteral("spool"));
+    maps.stringToIcon.insert(QStringLiteral("spool"), Icons::spool);
+    maps.iconToString.insert(Icons::spotlight, QStringLiteral("spotlight"));
+    maps.stringToIcon.insert(QStringLiteral("spotlight"), Icons::spotlight);
+    maps.iconToString.insert(Icons::spray_can, QStringLiteral("spray-can"));
+    maps.stringToIcon.insert(QStringLiteral("spray-can"), Icons::spray_can);
+    maps.iconToString.insert(Icons::sprout, QStringLiteral("sprout"));
+    maps.stringToIcon.insert(QStringLiteral("sprout"), Icons::sprout);
+    maps.iconToString.insert(Icons::square, QStringLiteral("square"));
+    maps.stringToIcon.insert(QStringLiteral("square"), Icons::square);
+    maps.iconToString.insert(Icons::square_activity, QStringLiteral("square-activity"));
+    maps.stringToIcon.insert(QStringLiteral("square-activity"), Icons::square_activity);
+    maps.iconToString.insert(Icons::square_arrow_down, QStringLiteral("square-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-down"), Icons::square_arrow_down);
+    maps.iconToString.insert(Icons::square_arrow_down_left,
+                             QStringLiteral("square-arrow-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-down-left"),
+                             Icons::square_arrow_down_left);
+    maps.iconToString.insert(Icons::square_arrow_down_right,
+                             QStringLiteral("square-arrow-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-down-right"),
+                             Icons::square_arrow_down_right);
+    maps.iconToString.insert(Icons::square_arrow_left, QStringLiteral("square-arrow-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-left"), Icons::square_arrow_left);
+    maps.iconToString.insert(Icons::square_arrow_out_down_left,
+                             QStringLiteral("square-arrow-out-down-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-out-down-left"),
+                             Icons::square_arrow_out_down_left);
+    maps.iconToString.insert(Icons::square_arrow_out_down_right,
+                             QStringLiteral("square-arrow-out-down-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-out-down-right"),
+                             Icons::square_arrow_out_down_right);
+    maps.iconToString.insert(Icons::square_arrow_out_up_left,
+                             QStringLiteral("square-arrow-out-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-out-up-left"),
+                             Icons::square_arrow_out_up_left);
+    maps.iconToString.insert(Icons::square_arrow_out_up_right,
+                             QStringLiteral("square-arrow-out-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-out-up-right"),
+                             Icons::square_arrow_out_up_right);
+    maps.iconToString.insert(Icons::square_arrow_right, QStringLiteral("square-arrow-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-right"), Icons::square_arrow_right);
+    maps.iconToString.insert(Icons::square_arrow_up, QStringLiteral("square-arrow-up"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-up"), Icons::square_arrow_up);
+    maps.iconToString.insert(Icons::square_arrow_up_left, QStringLiteral("square-arrow-up-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-up-left"), Icons::square_arrow_up_left);
+    maps.iconToString.insert(Icons::square_arrow_up_right, QStringLiteral("square-arrow-up-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-arrow-up-right"), Icons::square_arrow_up_right);
+    maps.iconToString.insert(Icons::square_asterisk, QStringLiteral("square-asterisk"));
+    maps.stringToIcon.insert(QStringLiteral("square-asterisk"), Icons::square_asterisk);
+    maps.iconToString.insert(Icons::square_bottom_dashed_scissors,
+                             QStringLiteral("square-bottom-dashed-scissors"));
+    maps.stringToIcon.insert(QStringLiteral("square-bottom-dashed-scissors"),
+                             Icons::square_bottom_dashed_scissors);
+    maps.iconToString.insert(Icons::square_chart_gantt, QStringLiteral("square-chart-gantt"));
+    maps.stringToIcon.insert(QStringLiteral("square-chart-gantt"), Icons::square_chart_gantt);
+    maps.iconToString.insert(Icons::square_check, QStringLiteral("square-check"));
+    maps.stringToIcon.insert(QStringLiteral("square-check"), Icons::square_check);
+    maps.iconToString.insert(Icons::square_check_big, QStringLiteral("square-check-big"));
+    maps.stringToIcon.insert(QStringLiteral("square-check-big"), Icons::square_check_big);
+    maps.iconToString.insert(Icons::square_chevron_down, QStringLiteral("square-chevron-down"));
+    maps.stringToIcon.insert(QStringLiteral("square-chevron-down"), Icons::square_chevron_down);
+    maps.iconToString.insert(Icons::square_chevron_left, QStringLiteral("square-chevron-left"));
+    maps.stringToIcon.insert(QStringLiteral("square-chevron-left"), Icons::square_chevron_left);
+    maps.iconToString.insert(Icons::square_chevron_right, QStringLiteral("square-chevron-right"));
+    maps.stringToIcon.insert(QStringLiteral("square-chevron-right"), Icons::square_chevron_right);
+    maps.iconToString.insert(Icons::square_chevron_up, QStringLiteral("square-chevron-up"));
+    maps.stringToIcon.insert(QStringLiteral("square-chevron-up"), Icons::square_chevron_up);
+    maps.iconToString.insert(Icons::square_code, QStringLiteral("square-code"));
+    maps.stringToIcon.insert(QStringLiteral("square-code"), Icons::square_code);
+    maps.iconToString.insert(Icons::square_dashed, QStringLiteral("square-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed"), Icons::square_dashed);
+    maps.iconToString.insert(Icons::square_dashed_bottom, QStringLiteral("square-dashed-bottom"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed-bottom"), Icons::square_dashed_bottom);
+    maps.iconToString.insert(Icons::square_dashed_bottom_code,
+                             QStringLiteral("square-dashed-bottom-code"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed-bottom-code"),
+                             Icons::square_dashed_bottom_code);
+    maps.iconToString.insert(Icons::square_dashed_kanban, QStringLiteral("square-dashed-kanban"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed-kanban"), Icons::square_dashed_kanban);
+    maps.iconToString.insert(Icons::square_dashed_mouse_pointer,
+                             QStringLiteral("square-dashed-mouse-pointer"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed-mouse-pointer"),
+                             Icons::square_dashed_mouse_pointer);
+    maps.iconToString.insert(Icons::square_dashed_top_solid,
+                             QStringLiteral("square-dashed-top-solid"));
+    maps.stringToIcon.insert(QStringLiteral("square-dashed-top-solid"),
+                             Icons::square_dashed_top_solid);
+    maps.iconToString.insert(Icons::square_divide, QStringLiteral("square-divide"));
+    maps.stringToIcon.insert(QStringLiteral("square-divide"), Icons::square_divide);
+    maps.iconToString.insert(Icons::square_dot, QStringLiteral("square-dot"));
+    maps.stringToIcon.insert(QStringLiteral("square-dot"), Icons::square_dot);
+    maps.iconToString.insert(Icons::square_equal, QStringLiteral("square-equal"));
+    maps.stringToIcon.insert(QStringLiteral("square-equal"), Icons::square_equal);
+    maps.iconToString.insert(Icons::square_function, QStringLiteral("square-function"));
+    maps.stringToIcon.insert(QStringLiteral("square-function"), Icons::square_function);
+    maps.iconToString.insert(Icons::square_kanban, QStringLiteral("square-kanban"));
+    maps.stringToIcon.insert(QStringLiteral("square-kanban"), Icons::square_kanban);
+    maps.iconToString.insert(Icons::square_library, QStringLiteral("square-library"));
+    maps.stringToIcon.insert(QStringLiteral("square-library"), Icons::square_library);
+    maps.iconToString.insert(Icons::square_m, QStringLiteral("square-m"));
+    maps.stringToIcon.insert(QStringLiteral("square-m"), Icons::square_m);
+    maps.iconToString.insert(Icons::square_menu, QStringLiteral("square-menu"));
+    maps.stringToIcon.insert(QStringLiteral("square-menu"), Icons::square_menu);
+    maps.iconToString.insert(Icons::square_minus, QStringLiteral("square-minus"));
+    maps.stringToIcon.insert(QStringLiteral("square-minus"), Icons::square_minus);
+    maps.iconToString.insert(Icons::square_mouse_pointer, QStringLiteral("square-mouse-pointer"));
+    maps.stringToIcon.insert(QStringLiteral("square-mouse-pointer"), Icons::square_mouse_pointer);
+    maps.iconToString.insert(Icons::square_parking, QStringLiteral("square-parking"));
+    maps.stringToIcon.insert(QStringLiteral("square-parking"), Icons::square_parking);
+    maps.iconToString.insert(Icons::square_parking_off, QStringLiteral("square-parking-off"));
+    maps.stringToIcon.insert(QStringLiteral("square-parking-off"), Icons::square_parking_off);
+    maps.iconToString.insert(Icons::square_pause, QStringLiteral("square-pause"));
+    maps.stringToIcon.insert(QStringLiteral("square-pause"), Icons::square_pause);
+    maps.iconToString.insert(Icons::square_pen, QStringLiteral("square-pen"));
+    maps.stringToIcon.insert(QStringLiteral("square-pen"), Icons::square_pen);
+    maps.iconToString.insert(Icons::square_percent, QStringLiteral("square-percent"));
+    maps.stringToIcon.insert(QStringLiteral("square-percent"), Icons::square_percent);
+    maps.iconToString.insert(Icons::square_pi, QStringLiteral("square-pi"));
+    maps.stringToIcon.insert(QStringLiteral("square-pi"), Icons::square_pi);
+    maps.iconToString.insert(Icons::square_pilcrow, QStringLiteral("square-pilcrow"));
+    maps.stringToIcon.insert(QStringLiteral("square-pilcrow"), Icons::square_pilcrow);
+    maps.iconToString.insert(Icons::square_play, QStringLiteral("square-play"));
+    maps.stringToIcon.insert(QStringLiteral("square-play"), Icons::square_play);
+    maps.iconToString.insert(Icons::square_plus, QStringLiteral("square-plus"));
+    maps.stringToIcon.insert(QStringLiteral("square-plus"), Icons::square_plus);
+    maps.iconToString.insert(Icons::square_power, QStringLiteral("square-power"));
+    maps.stringToIcon.insert(QStringLiteral("square-power"), Icons::square_power);
+    maps.iconToString.insert(Icons::square_radical, QStringLiteral("square-radical"));
+    maps.stringToIcon.insert(QStringLiteral("square-radical"), Icons::square_radical);
+    maps.iconToString.insert(Icons::square_round_corner, QStringLiteral("square-round-corner"));
+    maps.stringToIcon.insert(QStringLiteral("square-round-corner"), Icons::square_round_corner);
+    maps.iconToString.insert(Icons::square_scissors, QStringLiteral("square-scissors"));
+    maps.stringToIcon.insert(QStringLiteral("square-scissors"), Icons::square_scissors);
+    maps.iconToString.insert(Icons::square_sigma, QStringLiteral("square-sigma"));
+    maps.stringToIcon.insert(QStringLiteral("square-sigma"), Icons::square_sigma);
+    maps.iconToString.insert(Icons::square_slash, QStringLiteral("square-slash"));
+    maps.stringToIcon.insert(QStringLiteral("square-slash"), Icons::square_slash);
+    maps.iconToString.insert(Icons::square_split_horizontal,
+                             QStringLiteral("square-split-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("square-split-horizontal"),
+                             Icons::square_split_horizontal);
+    maps.iconToString.insert(Icons::square_split_vertical, QStringLiteral("square-split-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("square-split-vertical"), Icons::square_split_vertical);
+    maps.iconToString.insert(Icons::square_square, QStringLiteral("square-square"));
+    maps.stringToIcon.insert(QStringLiteral("square-square"), Icons::square_square);
+    maps.iconToString.insert(Icons::square_stack, QStringLiteral("square-stack"));
+    maps.stringToIcon.insert(QStringLiteral("square-stack"), Icons::square_stack);
+    maps.iconToString.insert(Icons::square_star, QStringLiteral("square-star"));
+    maps.stringToIcon.insert(QStringLiteral("square-star"), Icons::square_star);
+    maps.iconToString.insert(Icons::square_stop, QStringLiteral("square-stop"));
+    maps.stringToIcon.insert(QStringLiteral("square-stop"), Icons::square_stop);
+    maps.iconToString.insert(Icons::square_terminal, QStringLiteral("square-terminal"));
+    maps.stringToIcon.insert(QStringLiteral("square-terminal"), Icons::square_terminal);
+    maps.iconToString.insert(Icons::square_user, QStringLiteral("square-user"));
+    maps.stringToIcon.insert(QStringLiteral("square-user"), Icons::square_user);
+    maps.iconToString.insert(Icons::square_user_round, QStringLiteral("square-user-round"));
+    maps.stringToIcon.insert(QStringLiteral("square-user-round"), Icons::square_user_round);
+    maps.iconToString.insert(Icons::square_x, QStringLiteral("square-x"));
+    maps.stringToIcon.insert(QStringLiteral("square-x"), Icons::square_x);
+    maps.iconToString.insert(Icons::squares_exclude, QStringLiteral("squares-exclude"));
+    maps.stringToIcon.insert(QStringLiteral("squares-exclude"), Icons::squares_exclude);
+    maps.iconToString.insert(Icons::squares_intersect, QStringLiteral("squares-intersect"));
+    maps.stringToIcon.insert(QStringLiteral("squares-intersect"), Icons::squares_intersect);
+    maps.iconToString.insert(Icons::squares_subtract, QStringLiteral("squares-subtract"));
+    maps.stringToIcon.insert(QStringLiteral("squares-subtract"), Icons::squares_subtract);
+    maps.iconToString.insert(Icons::squares_unite, QStringLiteral("squares-unite"));
+    maps.stringToIcon.insert(QStringLiteral("squares-unite"), Icons::squares_unite);
+    maps.iconToString.insert(Icons::squircle, QStringLiteral("squircle"));
+    maps.stringToIcon.insert(QStringLiteral("squircle"), Icons::squircle);
+    maps.iconToString.insert(Icons::squircle_dashed, QStringLiteral("squircle-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("squircle-dashed"), Icons::squircle_dashed);
+    maps.iconToString.insert(Icons::squirrel, QStringLiteral("squirrel"));
+    maps.stringToIcon.insert(QStringLiteral("squirrel"), Icons::squirrel);
+    maps.iconToString.insert(Icons::stamp, QStringLiteral("stamp"));
+    maps.stringToIcon.insert(QStringLiteral("stamp"), Icons::stamp);
+    maps.iconToString.insert(Icons::star, QStringLiteral("star"));
+    maps.stringToIcon.insert(QStringLiteral("star"), Icons::star);
+    maps.iconToString.insert(Icons::star_half, QStringLiteral("star-half"));
+    maps.stringToIcon.insert(QStringLiteral("star-half"), Icons::star_half);
+    maps.iconToString.insert(Icons::star_off, QStringLiteral("star-off"));
+    maps.stringToIcon.insert(QStringLiteral("star-off"), Icons::star_off);
+    maps.iconToString.insert(Icons::step_back, QStringLiteral("step-back"));
+    maps.stringToIcon.insert(QStringLiteral("step-back"), Icons::step_back);
+    maps.iconToString.insert(Icons::step_forward, QStringLiteral("step-forward"));
+    maps.stringToIcon.insert(QStringLiteral("step-forward"), Icons::step_forward);
+    maps.iconToString.insert(Icons::stethoscope, QStringLiteral("stethoscope"));
+    maps.stringToIcon.insert(QStringLiteral("stethoscope"), Icons::stethoscope);
+    maps.iconToString.insert(Icons::sticker, QStringLiteral("sticker"));
+    maps.stringToIcon.insert(QStringLiteral("sticker"), Icons::sticker);
+    maps.iconToString.insert(Icons::sticky_note, QStringLiteral("sticky-note"));
+    maps.stringToIcon.insert(QStringLiteral("sticky-note"), Icons::sticky_note);
+    maps.iconToString.insert(Icons::store, QStringLiteral("store"));
+    maps.stringToIcon.insert(QStringLiteral("store"), Icons::store);
+    maps.iconToString.insert(Icons::stretch_horizontal, QStringLiteral("stretch-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("stretch-horizontal"), Icons::stretch_horizontal);
+    maps.iconToString.insert(Icons::stretch_vertical, QStringLiteral("stretch-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("stretch-vertical"), Icons::stretch_vertical);
+    maps.iconToString.insert(Icons::strikethrough, QStringLiteral("strikethrough"));
+    maps.stringToIcon.insert(QStringLiteral("strikethrough"), Icons::strikethrough);
+    maps.iconToString.insert(Icons::subscript, QStringLiteral("subscript"));
+    maps.stringToIcon.insert(QStringLiteral("subscript"), Icons::subscript);
+    maps.iconToString.insert(Icons::sun, QStringLiteral("sun"));
+    maps.stringToIcon.insert(QStringLiteral("sun"), Icons::sun);
+    maps.iconToString.insert(Icons::sun_dim, QStringLiteral("sun-dim"));
+    maps.stringToIcon.insert(QStringLiteral("sun-dim"), Icons::sun_dim);
+    maps.iconToString.insert(Icons::sun_medium, QStringLiteral("sun-medium"));
+    maps.stringToIcon.insert(QStringLiteral("sun-medium"), Icons::sun_medium);
+    maps.iconToString.insert(Icons::sun_moon, QStringLiteral("sun-moon"));
+    maps.stringToIcon.insert(QStringLiteral("sun-moon"), Icons::sun_moon);
+    maps.iconToString.insert(Icons::sun_snow, QStringLiteral("sun-snow"));
+    maps.stringToIcon.insert(QStringLiteral("sun-snow"), Icons::sun_snow);
+    maps.iconToString.insert(Icons::sunrise, QStringLiteral("sunrise"));
+    maps.stringToIcon.insert(QStringLiteral("sunrise"), Icons::sunrise);
+    maps.iconToString.insert(Icons::sunset, QStringLiteral("sunset"));
+    maps.stringToIcon.insert(QStringLiteral("sunset"), Icons::sunset);
+    maps.iconToString.insert(Icons::superscript, QStringLiteral("superscript"));
+    maps.stringToIcon.insert(QStringLiteral("superscript"), Icons::superscript);
+    maps.iconToString.insert(Icons::swatch_book, QStringLiteral("swatch-book"));
+    maps.stringToIcon.insert(QStringLiteral("swatch-book"), Icons::swatch_book);
+    maps.iconToString.insert(Icons::swiss_franc, QStringLiteral("swiss-franc"));
+    maps.stringToIcon.insert(QStringLiteral("swiss-franc"), Icons::swiss_franc);
+    maps.iconToString.insert(Icons::switch_camera, QStringLiteral("switch-camera"));
+    maps.stringToIcon.insert(QStringLiteral("switch-camera"), Icons::switch_camera);
+    maps.iconToString.insert(Icons::sword, QStringLiteral("sword"));
+    maps.stringToIcon.insert(QStringLiteral("sword"), Icons::sword);
+    maps.iconToString.insert(Icons::swords, QStringLiteral("swords"));
+    maps.stringToIcon.insert(QStringLiteral("swords"), Icons::swords);
+    maps.iconToString.insert(Icons::syringe, QStringLiteral("syringe"));
+    maps.stringToIcon.insert(QStringLiteral("syringe"), Icons::syringe);
+    maps.iconToString.insert(Icons::table, QStringLiteral("table"));
+    maps.stringToIcon.insert(QStringLiteral("table"), Icons::table);
+    maps.iconToString.insert(Icons::table_2, QStringLiteral("table-2"));
+    maps.stringToIcon.insert(QStringLiteral("table-2"), Icons::table_2);
+    maps.iconToString.insert(Icons::table_cells_merge, QStringLiteral("table-cells-merge"));
+    maps.stringToIcon.insert(QStringLiteral("table-cells-merge"), Icons::table_cells_merge);
+    maps.iconToString.insert(Icons::table_cells_split, QStringLiteral("table-cells-split"));
+    maps.stringToIcon.insert(QStringLiteral("table-cells-split"), Icons::table_cells_split);
+    maps.iconToString.insert(Icons::table_columns_split, QStringLiteral("table-columns-split"));
+    maps.stringToIcon.insert(QStringLiteral("table-columns-split"), Icons::table_columns_split);
+    maps.iconToString.insert(Icons::table_of_contents, QStringLiteral("table-of-contents"));
+    maps.stringToIcon.insert(QStringLiteral("table-of-contents"), Icons::table_of_contents);
+    maps.iconToString.insert(Icons::table_properties, QStringLiteral("table-properties"));
+    maps.stringToIcon.insert(QStringLiteral("table-properties"), Icons::table_properties);
+    maps.iconToString.insert(Icons::table_rows_split, QStringLiteral("table-rows-split"));
+    maps.stringToIcon.insert(QStringLiteral("table-rows-split"), Icons::table_rows_split);
+    maps.iconToString.insert(Icons::tablet, QStringLiteral("tablet"));
+    maps.stringToIcon.insert(QStringLiteral("tablet"), Icons::tablet);
+    maps.iconToString.insert(Icons::tablet_smartphone, QStringLiteral("tablet-smartphone"));
+    maps.stringToIcon.insert(QStringLiteral("tablet-smartphone"), Icons::tablet_smartphone);
+    maps.iconToString.insert(Icons::tablets, QStringLiteral("tablets"));
+    maps.stringToIcon.insert(QStringLiteral("tablets"), Icons::tablets);
+    maps.iconToString.insert(Icons::tag, QStringLiteral("tag"));
+    maps.stringToIcon.insert(QStringLiteral("tag"), Icons::tag);
+    maps.iconToString.insert(Icons::tags, QStringLiteral("tags"));
+    maps.stringToIcon.insert(QStringLiteral("tags"), Icons::tags);
+    maps.iconToString.insert(Icons::tally_1, QStringLiteral("tally-1"));
+    maps.stringToIcon.insert(QStringLiteral("tally-1"), Icons::tally_1);
+    maps.iconToString.insert(Icons::tally_2, QStringLiteral("tally-2"));
+    maps.stringToIcon.insert(QStringLiteral("tally-2"), Icons::tally_2);
+    maps.iconToString.insert(Icons::tally_3, QStringLiteral("tally-3"));
+    maps.stringToIcon.insert(QStringLiteral("tally-3"), Icons::tally_3);
+    maps.iconToString.insert(Icons::tally_4, QStringLiteral("tally-4"));
+    maps.stringToIcon.insert(QStringLiteral("tally-4"), Icons::tally_4);
+    maps.iconToString.insert(Icons::tally_5, QStringLiteral("tally-5"));
+    maps.stringToIcon.insert(QStringLiteral("tally-5"), Icons::tally_5);
+    maps.iconToString.insert(Icons::tangent, QStringLiteral("tangent"));
+    maps.stringToIcon.insert(QStringLiteral("tangent"), Icons::tangent);
+    maps.iconToString.insert(Icons::target, QStringLiteral("target"));
+    maps.stringToIcon.insert(QStringLiteral("target"), Icons::target);
+    maps.iconToString.insert(Icons::telescope, QStringLiteral("telescope"));
+    maps.stringToIcon.insert(QStringLiteral("telescope"), Icons::telescope);
+    maps.iconToString.insert(Icons::tent, QStringLiteral("tent"));
+    maps.stringToIcon.insert(QStringLiteral("tent"), Icons::tent);
+    maps.iconToString.insert(Icons::tent_tree, QStringLiteral("tent-tree"));
+    maps.stringToIcon.insert(QStringLiteral("tent-tree"), Icons::tent_tree);
+    maps.iconToString.insert(Icons::terminal, QStringLiteral("terminal"));
+    maps.stringToIcon.insert(QStringLiteral("terminal"), Icons::terminal);
+    maps.iconToString.insert(Icons::test_tube, QStringLiteral("test-tube"));
+    maps.stringToIcon.insert(QStringLiteral("test-tube"), Icons::test_tube);
+    maps.iconToString.insert(Icons::test_tube_diagonal, QStringLiteral("test-tube-diagonal"));
+    maps.stringToIcon.insert(QStringLiteral("test-tube-diagonal"), Icons::test_tube_diagonal);
+    maps.iconToString.insert(Icons::test_tubes, QStringLiteral("test-tubes"));
+    maps.stringToIcon.insert(QStringLiteral("test-tubes"), Icons::test_tubes);
+    maps.iconToString.insert(Icons::text_align_center, QStringLiteral("text-align-center"));
+    maps.stringToIcon.insert(QStringLiteral("text-align-center"), Icons::text_align_center);
+    maps.iconToString.insert(Icons::text_align_end, QStringLiteral("text-align-end"));
+    maps.stringToIcon.insert(QStringLiteral("text-align-end"), Icons::text_align_end);
+    maps.iconToString.insert(Icons::text_align_justify, QStringLiteral("text-align-justify"));
+    maps.stringToIcon.insert(QStringLiteral("text-align-justify"), Icons::text_align_justify);
+    maps.iconToString.insert(Icons::text_align_start, QStringLiteral("text-align-start"));
+    maps.stringToIcon.insert(QStringLiteral("text-align-start"), Icons::text_align_start);
+    maps.iconToString.insert(Icons::text_cursor, QStringLiteral("text-cursor"));
+    maps.stringToIcon.insert(QStringLiteral("text-cursor"), Icons::text_cursor);
+    maps.iconToString.insert(Icons::text_cursor_input, QStringLiteral("text-cursor-input"));
+    maps.stringToIcon.insert(QStringLiteral("text-cursor-input"), Icons::text_cursor_input);
+    maps.iconToString.insert(Icons::text_initial, QStringLiteral("text-initial"));
+    maps.stringToIcon.insert(QStringLiteral("text-initial"), Icons::text_initial);
+    maps.iconToString.insert(Icons::text_quote, QStringLiteral("text-quote"));
+    maps.stringToIcon.insert(QStringLiteral("text-quote"), Icons::text_quote);
+    maps.iconToString.insert(Icons::text_search, QStringLiteral("text-search"));
+    maps.stringToIcon.insert(QStringLiteral("text-search"), Icons::text_search);
+    maps.iconToString.insert(Icons::text_select, QStringLiteral("text-select"));
+    maps.stringToIcon.insert(QStringLiteral("text-select"), Icons::text_select);
+    maps.iconToString.insert(Icons::text_wrap, QStringLiteral("text-wrap"));
+    maps.stringToIcon.insert(QStringLiteral("text-wrap"), Icons::text_wrap);
+    maps.iconToString.insert(Icons::theater, QStringLiteral("theater"));
+    maps.stringToIcon.insert(QStringLiteral("theater"), Icons::theater);
+    maps.iconToString.insert(Icons::thermometer, QStringLiteral("thermometer"));
+    maps.stringToIcon.insert(QStringLiteral("thermometer"), Icons::thermometer);
+    maps.iconToString.insert(Icons::thermometer_snowflake, QStringLiteral("thermometer-snowflake"));
+    maps.stringToIcon.insert(QStringLiteral("thermometer-snowflake"), Icons::thermometer_snowflake);
+    maps.iconToString.insert(Icons::thermometer_sun, QStringLiteral("thermometer-sun"));
+    maps.stringToIcon.insert(QStringLiteral("thermometer-sun"), Icons::thermometer_sun);
+    maps.iconToString.insert(Icons::thumbs_down, QStringLiteral("thumbs-down"));
+    maps.stringToIcon.insert(QStringLiteral("thumbs-down"), Icons::thumbs_down);
+    maps.iconToString.insert(Icons::thumbs_up, QStringLiteral("thumbs-up"));
+    maps.stringToIcon.insert(QStringLiteral("thumbs-up"), Icons::thumbs_up);
+    maps.iconToString.insert(Icons::ticket, QStringLiteral("ticket"));
+    maps.stringToIcon.insert(QStringLiteral("ticket"), Icons::ticket);
+    maps.iconToString.insert(Icons::ticket_check, QStringLiteral("ticket-check"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-check"), Icons::ticket_check);
+    maps.iconToString.insert(Icons::ticket_minus, QStringLiteral("ticket-minus"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-minus"), Icons::ticket_minus);
+    maps.iconToString.insert(Icons::ticket_percent, QStringLiteral("ticket-percent"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-percent"), Icons::ticket_percent);
+    maps.iconToString.insert(Icons::ticket_plus, QStringLiteral("ticket-plus"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-plus"), Icons::ticket_plus);
+    maps.iconToString.insert(Icons::ticket_slash, QStringLiteral("ticket-slash"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-slash"), Icons::ticket_slash);
+    maps.iconToString.insert(Icons::ticket_x, QStringLiteral("ticket-x"));
+    maps.stringToIcon.insert(QStringLiteral("ticket-x"), Icons::ticket_x);
+    maps.iconToString.insert(Icons::tickets, QStringLiteral("tickets"));
+    maps.stringToIcon.insert(QStringLiteral("tickets"), Icons::tickets);
+    maps.iconToString.insert(Icons::tickets_plane, QStringLiteral("tickets-plane"));
+    maps.stringToIcon.insert(QStringLiteral("tickets-plane"), Icons::tickets_plane);
+    maps.iconToString.insert(Icons::timer, QStringLiteral("timer"));
+    maps.stringToIcon.insert(QStringLiteral("timer"), Icons::timer);
+    maps.iconToString.insert(Icons::timer_off, QStringLiteral("timer-off"));
+    maps.stringToIcon.insert(QStringLiteral("timer-off"), Icons::timer_off);
+    maps.iconToString.insert(Icons::timer_reset, QStringLiteral("timer-reset"));
+    maps.stringToIcon.insert(QStringLiteral("timer-reset"), Icons::timer_reset);
+    maps.iconToString.insert(Icons::toggle_left, QStringLiteral("toggle-left"));
+    maps.stringToIcon.insert(QStringLiteral("toggle-left"), Icons::toggle_left);
+    maps.iconToString.insert(Icons::toggle_right, QStringLiteral("toggle-right"));
+    maps.stringToIcon.insert(QStringLiteral("toggle-right"), Icons::toggle_right);
+    maps.iconToString.insert(Icons::toilet, QStringLiteral("toilet"));
+    maps.stringToIcon.insert(QStringLiteral("toilet"), Icons::toilet);
+    maps.iconToString.insert(Icons::tool_case, QStringLiteral("tool-case"));
+    maps.stringToIcon.insert(QStringLiteral("tool-case"), Icons::tool_case);
+    maps.iconToString.insert(Icons::tornado, QStringLiteral("tornado"));
+    maps.stringToIcon.insert(QStringLiteral("tornado"), Icons::tornado);
+    maps.iconToString.insert(Icons::torus, QStringLiteral("torus"));
+    maps.stringToIcon.insert(QStringLiteral("torus"), Icons::torus);
+    maps.iconToString.insert(Icons::touchpad, QStringLiteral("touchpad"));
+    maps.stringToIcon.insert(QStringLiteral("touchpad"), Icons::touchpad);
+    maps.iconToString.insert(Icons::touchpad_off, QStringLiteral("touchpad-off"));
+    maps.stringToIcon.insert(QStringLiteral("touchpad-off"), Icons::touchpad_off);
+    maps.iconToString.insert(Icons::tower_control, QStringLiteral("tower-control"));
+    maps.stringToIcon.insert(QStringLiteral("tower-control"), Icons::tower_control);
+    maps.iconToString.insert(Icons::toy_brick, QStringLiteral("toy-brick"));
+    maps.stringToIcon.insert(QStringLiteral("toy-brick"), Icons::toy_brick);
+    maps.iconToString.insert(Icons::tractor, QStringLiteral("tractor"));
+    maps.stringToIcon.insert(QStringLiteral("tractor"), Icons::tractor);
+    maps.iconToString.insert(Icons::traffic_cone, QStringLiteral("traffic-cone"));
+    maps.stringToIcon.insert(QStringLiteral("traffic-cone"), Icons::traffic_cone);
+    maps.iconToString.insert(Icons::train_front, QStringLiteral("train-front"));
+    maps.stringToIcon.insert(QStringLiteral("train-front"), Icons::train_front);
+    maps.iconToString.insert(Icons::train_front_tunnel, QStringLiteral("train-front-tunnel"));
+    maps.stringToIcon.insert(QStringLiteral("train-front-tunnel"), Icons::train_front_tunnel);
+    maps.iconToString.insert(Icons::train_track, QStringLiteral("train-track"));
+    maps.stringToIcon.insert(QStringLiteral("train-track"), Icons::train_track);
+    maps.iconToString.insert(Icons::tram_front, QStringLiteral("tram-front"));
+    maps.stringToIcon.insert(QStringLiteral("tram-front"), Icons::tram_front);
+    maps.iconToString.insert(Icons::transgender, QStringLiteral("transgender"));
+    maps.stringToIcon.insert(QStringLiteral("transgender"), Icons::transgender);
+    maps.iconToString.insert(Icons::trash, QStringLiteral("trash"));
+    maps.stringToIcon.insert(QStringLiteral("trash"), Icons::trash);
+    maps.iconToString.insert(Icons::trash_2, QStringLiteral("trash-2"));
+    maps.stringToIcon.insert(QStringLiteral("trash-2"), Icons::trash_2);
+    maps.iconToString.insert(Icons::tree_deciduous, QStringLiteral("tree-deciduous"));
+    maps.stringToIcon.insert(QStringLiteral("tree-deciduous"), Icons::tree_deciduous);
+    maps.iconToString.insert(Icons::tree_palm, QStringLiteral("tree-palm"));
+    maps.stringToIcon.insert(QStringLiteral("tree-palm"), Icons::tree_palm);
+    maps.iconToString.insert(Icons::tree_pine, QStringLiteral("tree-pine"));
+    maps.stringToIcon.insert(QStringLiteral("tree-pine"), Icons::tree_pine);
+    maps.iconToString.insert(Icons::trees, QStringLiteral("trees"));
+    maps.stringToIcon.insert(QStringLiteral("trees"), Icons::trees);
+    maps.iconToString.insert(Icons::trello, QStringLiteral("trello"));
+    maps.stringToIcon.insert(QStringLiteral("trello"), Icons::trello);
+    maps.iconToString.insert(Icons::trending_down, QStringLiteral("trending-down"));
+    maps.stringToIcon.insert(QStringLiteral("trending-down"), Icons::trending_down);
+    maps.iconToString.insert(Icons::trending_up, QStringLiteral("trending-up"));
+    maps.stringToIcon.insert(QStringLiteral("trending-up"), Icons::trending_up);
+    maps.iconToString.insert(Icons::trending_up_down, QStringLiteral("trending-up-down"));
+    maps.stringToIcon.insert(QStringLiteral("trending-up-down"), Icons::trending_up_down);
+    maps.iconToString.insert(Icons::triangle, QStringLiteral("triangle"));
+    maps.stringToIcon.insert(QStringLiteral("triangle"), Icons::triangle);
+    maps.iconToString.insert(Icons::triangle_alert, QStringLiteral("triangle-alert"));
+    maps.stringToIcon.insert(QStringLiteral("triangle-alert"), Icons::triangle_alert);
+    maps.iconToString.insert(Icons::triangle_dashed, QStringLiteral("triangle-dashed"));
+    maps.stringToIcon.insert(QStringLiteral("triangle-dashed"), Icons::triangle_dashed);
+    maps.iconToString.insert(Icons::triangle_right, QStringLiteral("triangle-right"));
+    maps.stringToIcon.insert(QStringLiteral("triangle-right"), Icons::triangle_right);
+    maps.iconToString.insert(Icons::trophy, QStringLiteral("trophy"));
+    maps.stringToIcon.insert(QStringLiteral("trophy"), Icons::trophy);
+    maps.iconToString.insert(Icons::truck, QStringLiteral("truck"));
+    maps.stringToIcon.insert(QStringLiteral("truck"), Icons::truck);
+    maps.iconToString.insert(Icons::truck_electric, QStringLiteral("truck-electric"));
+    maps.stringToIcon.insert(QStringLiteral("truck-electric"), Icons::truck_electric);
+    maps.iconToString.insert(Icons::turkish_lira, QStringLiteral("turkish-lira"));
+    maps.stringToIcon.insert(QStringLiteral("turkish-lira"), Icons::turkish_lira);
+    maps.iconToString.insert(Icons::turntable, QStringLiteral("turntable"));
+    maps.stringToIcon.insert(QStringLiteral("turntable"), Icons::turntable);
+    maps.iconToString.insert(Icons::turtle, QStringLiteral("turtle"));
+    maps.stringToIcon.insert(QStringLiteral("turtle"), Icons::turtle);
+    maps.iconToString.insert(Icons::tv, QStringLiteral("tv"));
+    maps.stringToIcon.insert(QStringLiteral("tv"), Icons::tv);
+    maps.iconToString.insert(Icons::tv_minimal, QStringLiteral("tv-minimal"));
+    maps.stringToIcon.insert(QStringLiteral("tv-minimal"), Icons::tv_minimal);
+    maps.iconToString.insert(Icons::tv_minimal_play, QStringLiteral("tv-minimal-play"));
+    maps.stringToIcon.insert(QStringLiteral("tv-minimal-play"), Icons::tv_minimal_play);
+    maps.iconToString.insert(Icons::twitch, QStringLiteral("twitch"));
+    maps.stringToIcon.insert(QStringLiteral("twitch"), Icons::twitch);
+    maps.iconToString.insert(Icons::twitter, QStringLiteral("twitter"));
+    maps.stringToIcon.insert(QStringLiteral("twitter"), Icons::twitter);
+    maps.iconToString.insert(Icons::type, QStringLiteral("type"));
+    maps.stringToIcon.insert(QStringLiteral("type"), Icons::type);
+    maps.iconToString.insert(Icons::type_outline, QStringLiteral("type-outline"));
+    maps.stringToIcon.insert(QStringLiteral("type-outline"), Icons::type_outline);
+    maps.iconToString.insert(Icons::umbrella, QStringLiteral("umbrella"));
+    maps.stringToIcon.insert(QStringLiteral("umbrella"), Icons::umbrella);
+    maps.iconToString.insert(Icons::umbrella_off, QStringLiteral("umbrella-off"));
+    maps.stringToIcon.insert(QStringLiteral("umbrella-off"), Icons::umbrella_off);
+    maps.iconToString.insert(Icons::underline, QStringLiteral("underline"));
+    maps.stringToIcon.insert(QStringLiteral("underline"), Icons::underline);
+    maps.iconToString.insert(Icons::undo, QStringLiteral("undo"));
+    maps.stringToIcon.insert(QStringLiteral("undo"), Icons::undo);
+    maps.iconToString.insert(Icons::undo_2, QStringLiteral("undo-2"));
+    maps.stringToIcon.insert(QStringLiteral("undo-2"), Icons::undo_2);
+    maps.iconToString.insert(Icons::undo_dot, QStringLiteral("undo-dot"));
+    maps.stringToIcon.insert(QStringLiteral("undo-dot"), Icons::undo_dot);
+    maps.iconToString.insert(Icons::unfold_horizontal, QStringLiteral("unfold-horizontal"));
+    maps.stringToIcon.insert(QStringLiteral("unfold-horizontal"), Icons::unfold_horizontal);
+    maps.iconToString.insert(Icons::unfold_vertical, QStringLiteral("unfold-vertical"));
+    maps.stringToIcon.insert(QStringLiteral("unfold-vertical"), Icons::unfold_vertical);
+    maps.iconToString.insert(Icons::ungroup, QStringLiteral("ungroup"));
+    maps.stringToIcon.insert(QStringLiteral("ungroup"), Icons::ungroup);
+    maps.iconToString.insert(Icons::university, QStringLiteral("university"));
+    maps.stringToIcon.insert(QStringLiteral("university"), Icons::university);
+    maps.iconToString.insert(Icons::unlink, QStringLiteral("unlink"));
+    maps.stringToIcon.insert(QStringLiteral("unlink"), Icons::unlink);
+    maps.iconToString.insert(Icons::unlink_2, QStringLiteral("unlink-2"));
+    maps.stringToIcon.insert(QStringLiteral("unlink-2"), Icons::unlink_2);
+    maps.iconToString.insert(Icons::unplug, QStringLiteral("unplug"));
+    maps.stringToIcon.insert(QStringLiteral("unplug"), Icons::unplug);
+    maps.iconToString.insert(Icons::upload, QStringLiteral("upload"));
+    maps.stringToIcon.insert(QStringLiteral("upload"), Icons::upload);
+    maps.iconToString.insert(Icons::usb, QStringLiteral("usb"));
+    maps.stringToIcon.insert(QStringLiteral("usb"), Icons::usb);
+    maps.iconToString.insert(Icons::user, QStringLiteral("user"));
+    maps.stringToIcon.insert(QStringLiteral("user"), Icons::user);
+    maps.iconToString.insert(Icons::user_check, QStringLiteral("user-check"));
+    maps.stringToIcon.insert(QStringLiteral("user-check"), Icons::user_check);
+    maps.iconToString.insert(Icons::user_cog, QStringLiteral("user-cog"));
+    maps.stringToIcon.insert(QStringLiteral("user-cog"), Icons::user_cog);
+    maps.iconToString.insert(Icons::user_lock, QStringLiteral("user-lock"));
+    maps.stringToIcon.insert(QStringLiteral("user-lock"), Icons::user_lock);
+    maps.iconToString.insert(Icons::user_minus, QStringLiteral("user-minus"));
+    maps.stringToIcon.insert(QStringLiteral("user-minus"), Icons::user_minus);
+    maps.iconToString.insert(Icons::user_pen, QStringLiteral("user-pen"));
+    maps.stringToIcon.insert(QStringLiteral("user-pen"), Icons::user_pen);
+    maps.iconToString.insert(Icons::user_plus, QStringLiteral("user-plus"));
+    maps.stringToIcon.insert(QStringLiteral("user-plus"), Icons::user_plus);
+    maps.iconToString.insert(Icons::user_round, QStringLiteral("user-round"));
+    maps.stringToIcon.insert(QStringLiteral("user-round"), Icons::user_round);
+    maps.iconToString.insert(Icons::user_round_check, QStringLiteral("user-round-check"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-check"), Icons::user_round_check);
+    maps.iconToString.insert(Icons::user_round_cog, QStringLiteral("user-round-cog"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-cog"), Icons::user_round_cog);
+    maps.iconToString.insert(Icons::user_round_minus, QStringLiteral("user-round-minus"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-minus"), Icons::user_round_minus);
+    maps.iconToString.insert(Icons::user_round_pen, QStringLiteral("user-round-pen"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-pen"), Icons::user_round_pen);
+    maps.iconToString.insert(Icons::user_round_plus, QStringLiteral("user-round-plus"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-plus"), Icons::user_round_plus);
+    maps.iconToString.insert(Icons::user_round_search, QStringLiteral("user-round-search"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-search"), Icons::user_round_search);
+    maps.iconToString.insert(Icons::user_round_x, QStringLiteral("user-round-x"));
+    maps.stringToIcon.insert(QStringLiteral("user-round-x"), Icons::user_round_x);
+    maps.iconToString.insert(Icons::user_search, QStringLiteral("user-search"));
+    maps.stringToIcon.insert(QStringLiteral("user-search"), Icons::user_search);
+    maps.iconToString.insert(Icons::user_star, QStringLiteral("user-star"));
+    maps.stringToIcon.insert(QStringLiteral("user-star"), Icons::user_star);
+    maps.iconToString.insert(Icons::user_x, QStringLiteral("user-x"));
+    maps.stringToIcon.insert(QStringLiteral("user-x"), Icons::user_x);
+    maps.iconToString.insert(Icons::users, QStringLiteral("users"));
+    maps.stringToIcon.insert(QStringLiteral("users"), Icons::users);
+    maps.iconToString.insert(Icons::users_round, QStringLiteral("users-round"));
+    maps.stringToIcon.insert(QStringLiteral("users-round"), Icons::users_round);
+    maps.iconToString.insert(Icons::utensils, QStringLiteral("utensils"));
+    maps.stringToIcon.insert(QStringLiteral("utensils"), Icons::utensils);
+    maps.iconToString.insert(Icons::utensils_crossed, QStringLiteral("utensils-crossed"));
+    maps.stringToIcon.insert(QStringLiteral("utensils-crossed"), Icons::utensils_crossed);
+    maps.iconToString.insert(Icons::utility_pole, QStringLiteral("utility-pole"));
+    maps.stringToIcon.insert(QStringLiteral("utility-pole"), Icons::utility_pole);
+    maps.iconToString.insert(Icons::variable, QStringLiteral("variable"));
+    maps.stringToIcon.insert(QStringLiteral("variable"), Icons::variable);
+    maps.iconToString.insert(Icons::vault, QStringLiteral("vault"));
+    maps.stringToIcon.insert(QStringLiteral("vault"), Icons::vault);
+    maps.iconToString.insert(Icons::vector_square, QStringLiteral("vector-square"));
+    maps.stringToIcon.insert(QStringLiteral("vector-square"), Icons::vector_square);
+    maps.iconToString.insert(Icons::vegan, QStringLiteral("vegan"));
+    maps.stringToIcon.insert(QStringLiteral("vegan"), Icons::vegan);
+    maps.iconToString.insert(Icons::venetian_mask, QStringLiteral("venetian-mask"));
+    maps.stringToIcon.insert(QStringLiteral("venetian-mask"), Icons::venetian_mask);
+    maps.iconToString.insert(Icons::venus, QStringLiteral("venus"));
+    maps.stringToIcon.insert(QStringLiteral("venus"), Icons::venus);
+    maps.iconToString.insert(Icons::venus_and_mars, QStringLiteral("venus-and-mars"));
+    maps.stringToIcon.insert(QStringLiteral("venus-and-mars"), Icons::venus_and_mars);
+    maps.iconToString.insert(Icons::vibrate, QStringLiteral("vibrate"));
+    maps.stringToIcon.insert(QStringLiteral("vibrate"), Icons::vibrate);
+    maps.iconToString.insert(Icons::vibrate_off, QStringLiteral("vibrate-off"));
+    maps.stringToIcon.insert(QStringLiteral("vibrate-off"), Icons::vibrate_off);
+    maps.iconToString.insert(Icons::video, QStringLiteral("video"));
+    maps.stringToIcon.insert(QStringLiteral("video"), Icons::video);
+    maps.iconToString.insert(Icons::video_off, QStringLiteral("video-off"));
+    maps.stringToIcon.insert(QStringLiteral("video-off"), Icons::video_off);
+    maps.iconToString.insert(Icons::videotape, QStringLiteral("videotape"));
+    maps.stringToIcon.insert(QStringLiteral("videotape"), Icons::videotape);
+    maps.iconToString.insert(Icons::view, QStringLiteral("view"));
+    maps.stringToIcon.insert(QStringLiteral("view"), Icons::view);
+    maps.iconToString.insert(Icons::voicemail, QStringLiteral("voicemail"));
+    maps.stringToIcon.insert(QStringLiteral("voicemail"), Icons::voicemail);
+    maps.iconToString.insert(Icons::volleyball, QStringLiteral("volleyball"));
+    maps.stringToIcon.insert(QStringLiteral("volleyball"), Icons::volleyball);
+    maps.iconToString.insert(Icons::volume, QStringLiteral("volume"));
+    maps.stringToIcon.insert(QStringLiteral("volume"), Icons::volume);
+    maps.iconToString.insert(Icons::volume_1, QStringLiteral("volume-1"));
+    maps.stringToIcon.insert(QStringLiteral("volume-1"), Icons::volume_1);
+    maps.iconToString.insert(Icons::volume_2, QStringLiteral("volume-2"));
+    maps.stringToIcon.insert(QStringLiteral("volume-2"), Icons::volume_2);
+    maps.iconToString.insert(Icons::volume_off, QStringLiteral("volume-off"));
+    maps.stringToIcon.insert(QStringLiteral("volume-off"), Icons::volume_off);
+    maps.iconToString.insert(Icons::volume_x, QStringLiteral("volume-x"));
+    maps.stringToIcon.insert(QStringLiteral("volume-x"), Icons::volume_x);
+    maps.iconToString.insert(Icons::vote, QStringLiteral("vote"));
+    maps.stringToIcon.insert(QStringLiteral("vote"), Icons::vote);
+    maps.iconToString.insert(Icons::wallet, QStringLiteral("wallet"));
+    maps.stringToIcon.insert(QStringLiteral("wallet"), Icons::wallet);
+    maps.iconToString.insert(Icons::wallet_cards, QStringLiteral("wallet-cards"));
+    maps.stringToIcon.insert(QStringLiteral("wallet-cards"), Icons::wallet_cards);
+    maps.iconToString.insert(Icons::wallet_minimal, QStringLiteral("wallet-minimal"));
+    maps.stringToIcon.insert(QStringLiteral("wallet-minimal"), Icons::wallet_minimal);
+    maps.iconToString.insert(Icons::wallpaper, QStringLiteral("wallpaper"));
+    maps.stringToIcon.insert(QStringLiteral("wallpaper"), Icons::wallpaper);
+    maps.iconToString.insert(Icons::wand, QStringLiteral("wand"));
+    maps.stringToIcon.insert(QStringLiteral("wand"), Icons::wand);
+    maps.iconToString.insert(Icons::wand_sparkles, QStringLiteral("wand-sparkles"));
+    maps.stringToIcon.insert(QStringLiteral("wand-sparkles"), Icons::wand_sparkles);
+    maps.iconToString.insert(Icons::warehouse, QStringLiteral("warehouse"));
+    maps.stringToIcon.insert(QStringLiteral("warehouse"), Icons::warehouse);
+    maps.iconToString.insert(Icons::washing_machine, QStringLiteral("washing-machine"));
+    maps.stringToIcon.insert(QStringLiteral("washing-machine"), Icons::washing_machine);
+    maps.iconToString.insert(Icons::watch, QStringLiteral("watch"));
+    maps.stringToIcon.insert(QStringLiteral("watch"), Icons::watch);
+    maps.iconToString.insert(Icons::waves, QStringLiteral("waves"));
+    maps.stringToIcon.insert(QStringLiteral("waves"), Icons::waves);
+    maps.iconToString.insert(Icons::waves_ladder, QStringLiteral("waves-ladder"));
+    maps.stringToIcon.insert(QStringLiteral("waves-ladder"), Icons::waves_ladder);
+    maps.iconToString.insert(Icons::waypoints, QStringLiteral("waypoints"));
+    maps.stringToIcon.insert(QStringLiteral("waypoints"), Icons::waypoints);
+    maps.iconToString.insert(Icons::webcam, QStringLiteral("webcam"));
+    maps.stringToIcon.insert(QStringLiteral("webcam"), Icons::webcam);
+    maps.iconToString.insert(Icons::webhook, QStringLiteral("webhook"));
+    maps.stringToIcon.insert(QStringLiteral("webhook"), Icons::webhook);
+    maps.iconToString.insert(Icons::webhook_off, QStringLiteral("webhook-off"));
+    maps.stringToIcon.insert(QStringLiteral("webhook-off"), Icons::webhook_off);
+    maps.iconToString.insert(Icons::weight, QStringLiteral("weight"));
+    maps.stringToIcon.insert(QStringLiteral("weight"), Icons::weight);
+    maps.iconToString.insert(Icons::wheat, QStringLiteral("wheat"));
+    maps.stringToIcon.insert(QStringLiteral("wheat"), Icons::wheat);
+    maps.iconToString.insert(Icons::wheat_off, QStringLiteral("wheat-off"));
+    maps.stringToIcon.insert(QStringLiteral("wheat-off"), Icons::wheat_off);
+    maps.iconToString.insert(Icons::whole_word, QStringLiteral("whole-word"));
+    maps.stringToIcon.insert(QStringLiteral("whole-word"), Icons::whole_word);
+    maps.iconToString.insert(Icons::wifi, QStringLiteral("wifi"));
+    maps.stringToIcon.insert(QStringLiteral("wifi"), Icons::wifi);
+    maps.iconToString.insert(Icons::wifi_cog, QStringLiteral("wifi-cog"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-cog"), Icons::wifi_cog);
+    maps.iconToString.insert(Icons::wifi_high, QStringLiteral("wifi-high"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-high"), Icons::wifi_high);
+    maps.iconToString.insert(Icons::wifi_low, QStringLiteral("wifi-low"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-low"), Icons::wifi_low);
+    maps.iconToString.insert(Icons::wifi_off, QStringLiteral("wifi-off"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-off"), Icons::wifi_off);
+    maps.iconToString.insert(Icons::wifi_pen, QStringLiteral("wifi-pen"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-pen"), Icons::wifi_pen);
+    maps.iconToString.insert(Icons::wifi_sync, QStringLiteral("wifi-sync"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-sync"), Icons::wifi_sync);
+    maps.iconToString.insert(Icons::wifi_zero, QStringLiteral("wifi-zero"));
+    maps.stringToIcon.insert(QStringLiteral("wifi-zero"), Icons::wifi_zero);
+    maps.iconToString.insert(Icons::wind, QStringLiteral("wind"));
+    maps.stringToIcon.insert(QStringLiteral("wind"), Icons::wind);
+    maps.iconToString.insert(Icons::wind_arrow_down, QStringLiteral("wind-arrow-down"));
+    maps.stringToIcon.insert(QStringLiteral("wind-arrow-down"), Icons::wind_arrow_down);
+    maps.iconToString.insert(Icons::wine, QStringLiteral("wine"));
+    maps.stringToIcon.insert(QStringLiteral("wine"), Icons::wine);
+    maps.iconToString.insert(Icons::wine_off, QStringLiteral("wine-off"));
+    maps.stringToIcon.insert(QStringLiteral("wine-off"), Icons::wine_off);
+    maps.iconToString.insert(Icons::workflow, QStringLiteral("workflow"));
+    maps.stringToIcon.insert(QStringLiteral("workflow"), Icons::workflow);
+    maps.iconToString.insert(Icons::worm, QStringLiteral("worm"));
+    maps.stringToIcon.insert(QStringLiteral("worm"), Icons::worm);
+    maps.iconToString.insert(Icons::wrench, QStringLiteral("wrench"));
+    maps.stringToIcon.insert(QStringLiteral("wrench"), Icons::wrench);
+    maps.iconToString.insert(Icons::x, QStringLiteral("x"));
+    maps.stringToIcon.insert(QStringLiteral("x"), Icons::x);
+    maps.iconToString.insert(Icons::youtube, QStringLiteral("youtube"));
+    maps.stringToIcon.insert(QStringLiteral("youtube"), Icons::youtube);
+    maps.iconToString.insert(Icons::zap, QStringLiteral("zap"));
+    maps.stringToIcon.insert(QStringLiteral("zap"), Icons::zap);
+    maps.iconToString.insert(Icons::zap_off, QStringLiteral("zap-off"));
+    maps.stringToIcon.insert(QStringLiteral("zap-off"), Icons::zap_off);
+    maps.iconToString.insert(Icons::zoom_in, QStringLiteral("zoom-in"));
+    maps.stringToIcon.insert(QStringLiteral("zoom-in"), Icons::zoom_in);
+    maps.iconToString.insert(Icons::zoom_out, QStringLiteral("zoom-out"));
+    maps.stringToIcon.insert(QStringLiteral("zoom-out"), Icons::zoom_out);
+    return maps;
+}
+
+static const IconNameMaps ICON_NAME_MAPS = createIconNameMaps();
+
 /**
  * @brief Mapping from icon enum to string name
  */
-static const QHash<Icons, QString> ICON_TO_STRING_MAP = {
-    {Icons::a_arrow_down, "a-arrow-down"},
-    {Icons::a_arrow_up, "a-arrow-up"},
-    {Icons::a_large_small, "a-large-small"},
-    {Icons::accessibility, "accessibility"},
-    {Icons::activity, "activity"},
-    {Icons::air_vent, "air-vent"},
-    {Icons::airplay, "airplay"},
-    {Icons::alarm_clock, "alarm-clock"},
-    {Icons::alarm_clock_check, "alarm-clock-check"},
-    {Icons::alarm_clock_minus, "alarm-clock-minus"},
-    {Icons::alarm_clock_off, "alarm-clock-off"},
-    {Icons::alarm_clock_plus, "alarm-clock-plus"},
-    {Icons::alarm_smoke, "alarm-smoke"},
-    {Icons::album, "album"},
-    {Icons::align_center_horizontal, "align-center-horizontal"},
-    {Icons::align_center_vertical, "align-center-vertical"},
-    {Icons::align_end_horizontal, "align-end-horizontal"},
-    {Icons::align_end_vertical, "align-end-vertical"},
-    {Icons::align_horizontal_distribute_center, "align-horizontal-distribute-center"},
-    {Icons::align_horizontal_distribute_end, "align-horizontal-distribute-end"},
-    {Icons::align_horizontal_distribute_start, "align-horizontal-distribute-start"},
-    {Icons::align_horizontal_justify_center, "align-horizontal-justify-center"},
-    {Icons::align_horizontal_justify_end, "align-horizontal-justify-end"},
-    {Icons::align_horizontal_justify_start, "align-horizontal-justify-start"},
-    {Icons::align_horizontal_space_around, "align-horizontal-space-around"},
-    {Icons::align_horizontal_space_between, "align-horizontal-space-between"},
-    {Icons::align_start_horizontal, "align-start-horizontal"},
-    {Icons::align_start_vertical, "align-start-vertical"},
-    {Icons::align_vertical_distribute_center, "align-vertical-distribute-center"},
-    {Icons::align_vertical_distribute_end, "align-vertical-distribute-end"},
-    {Icons::align_vertical_distribute_start, "align-vertical-distribute-start"},
-    {Icons::align_vertical_justify_center, "align-vertical-justify-center"},
-    {Icons::align_vertical_justify_end, "align-vertical-justify-end"},
-    {Icons::align_vertical_justify_start, "align-vertical-justify-start"},
-    {Icons::align_vertical_space_around, "align-vertical-space-around"},
-    {Icons::align_vertical_space_between, "align-vertical-space-between"},
-    {Icons::ambulance, "ambulance"},
-    {Icons::ampersand, "ampersand"},
-    {Icons::ampersands, "ampersands"},
-    {Icons::amphora, "amphora"},
-    {Icons::anchor, "anchor"},
-    {Icons::angry, "angry"},
-    {Icons::annoyed, "annoyed"},
-    {Icons::antenna, "antenna"},
-    {Icons::anvil, "anvil"},
-    {Icons::aperture, "aperture"},
-    {Icons::app_window, "app-window"},
-    {Icons::app_window_mac, "app-window-mac"},
-    {Icons::apple, "apple"},
-    {Icons::archive, "archive"},
-    {Icons::archive_restore, "archive-restore"},
-    {Icons::archive_x, "archive-x"},
-    {Icons::armchair, "armchair"},
-    {Icons::arrow_big_down, "arrow-big-down"},
-    {Icons::arrow_big_down_dash, "arrow-big-down-dash"},
-    {Icons::arrow_big_left, "arrow-big-left"},
-    {Icons::arrow_big_left_dash, "arrow-big-left-dash"},
-    {Icons::arrow_big_right, "arrow-big-right"},
-    {Icons::arrow_big_right_dash, "arrow-big-right-dash"},
-    {Icons::arrow_big_up, "arrow-big-up"},
-    {Icons::arrow_big_up_dash, "arrow-big-up-dash"},
-    {Icons::arrow_down, "arrow-down"},
-    {Icons::arrow_down_0_1, "arrow-down-0-1"},
-    {Icons::arrow_down_1_0, "arrow-down-1-0"},
-    {Icons::arrow_down_a_z, "arrow-down-a-z"},
-    {Icons::arrow_down_from_line, "arrow-down-from-line"},
-    {Icons::arrow_down_left, "arrow-down-left"},
-    {Icons::arrow_down_narrow_wide, "arrow-down-narrow-wide"},
-    {Icons::arrow_down_right, "arrow-down-right"},
-    {Icons::arrow_down_to_dot, "arrow-down-to-dot"},
-    {Icons::arrow_down_to_line, "arrow-down-to-line"},
-    {Icons::arrow_down_up, "arrow-down-up"},
-    {Icons::arrow_down_wide_narrow, "arrow-down-wide-narrow"},
-    {Icons::arrow_down_z_a, "arrow-down-z-a"},
-    {Icons::arrow_left, "arrow-left"},
-    {Icons::arrow_left_from_line, "arrow-left-from-line"},
-    {Icons::arrow_left_right, "arrow-left-right"},
-    {Icons::arrow_left_to_line, "arrow-left-to-line"},
-    {Icons::arrow_right, "arrow-right"},
-    {Icons::arrow_right_from_line, "arrow-right-from-line"},
-    {Icons::arrow_right_left, "arrow-right-left"},
-    {Icons::arrow_right_to_line, "arrow-right-to-line"},
-    {Icons::arrow_up, "arrow-up"},
-    {Icons::arrow_up_0_1, "arrow-up-0-1"},
-    {Icons::arrow_up_1_0, "arrow-up-1-0"},
-    {Icons::arrow_up_a_z, "arrow-up-a-z"},
-    {Icons::arrow_up_down, "arrow-up-down"},
-    {Icons::arrow_up_from_dot, "arrow-up-from-dot"},
-    {Icons::arrow_up_from_line, "arrow-up-from-line"},
-    {Icons::arrow_up_left, "arrow-up-left"},
-    {Icons::arrow_up_narrow_wide, "arrow-up-narrow-wide"},
-    {Icons::arrow_up_right, "arrow-up-right"},
-    {Icons::arrow_up_to_line, "arrow-up-to-line"},
-    {Icons::arrow_up_wide_narrow, "arrow-up-wide-narrow"},
-    {Icons::arrow_up_z_a, "arrow-up-z-a"},
-    {Icons::arrows_up_from_line, "arrows-up-from-line"},
-    {Icons::asterisk, "asterisk"},
-    {Icons::at_sign, "at-sign"},
-    {Icons::atom, "atom"},
-    {Icons::audio_lines, "audio-lines"},
-    {Icons::audio_waveform, "audio-waveform"},
-    {Icons::award, "award"},
-    {Icons::axe, "axe"},
-    {Icons::axis_3d, "axis-3d"},
-    {Icons::baby, "baby"},
-    {Icons::backpack, "backpack"},
-    {Icons::badge, "badge"},
-    {Icons::badge_alert, "badge-alert"},
-    {Icons::badge_cent, "badge-cent"},
-    {Icons::badge_check, "badge-check"},
-    {Icons::badge_dollar_sign, "badge-dollar-sign"},
-    {Icons::badge_euro, "badge-euro"},
-    {Icons::badge_indian_rupee, "badge-indian-rupee"},
-    {Icons::badge_info, "badge-info"},
-    {Icons::badge_japanese_yen, "badge-japanese-yen"},
-    {Icons::badge_minus, "badge-minus"},
-    {Icons::badge_percent, "badge-percent"},
-    {Icons::badge_plus, "badge-plus"},
-    {Icons::badge_pound_sterling, "badge-pound-sterling"},
-    {Icons::badge_question_mark, "badge-question-mark"},
-    {Icons::badge_russian_ruble, "badge-russian-ruble"},
-    {Icons::badge_swiss_franc, "badge-swiss-franc"},
-    {Icons::badge_turkish_lira, "badge-turkish-lira"},
-    {Icons::badge_x, "badge-x"},
-    {Icons::baggage_claim, "baggage-claim"},
-    {Icons::ban, "ban"},
-    {Icons::banana, "banana"},
-    {Icons::bandage, "bandage"},
-    {Icons::banknote, "banknote"},
-    {Icons::banknote_arrow_down, "banknote-arrow-down"},
-    {Icons::banknote_arrow_up, "banknote-arrow-up"},
-    {Icons::banknote_x, "banknote-x"},
-    {Icons::barcode, "barcode"},
-    {Icons::barrel, "barrel"},
-    {Icons::baseline, "baseline"},
-    {Icons::bath, "bath"},
-    {Icons::battery, "battery"},
-    {Icons::battery_charging, "battery-charging"},
-    {Icons::battery_full, "battery-full"},
-    {Icons::battery_low, "battery-low"},
-    {Icons::battery_medium, "battery-medium"},
-    {Icons::battery_plus, "battery-plus"},
-    {Icons::battery_warning, "battery-warning"},
-    {Icons::beaker, "beaker"},
-    {Icons::bean, "bean"},
-    {Icons::bean_off, "bean-off"},
-    {Icons::bed, "bed"},
-    {Icons::bed_double, "bed-double"},
-    {Icons::bed_single, "bed-single"},
-    {Icons::beef, "beef"},
-    {Icons::beer, "beer"},
-    {Icons::beer_off, "beer-off"},
-    {Icons::bell, "bell"},
-    {Icons::bell_dot, "bell-dot"},
-    {Icons::bell_electric, "bell-electric"},
-    {Icons::bell_minus, "bell-minus"},
-    {Icons::bell_off, "bell-off"},
-    {Icons::bell_plus, "bell-plus"},
-    {Icons::bell_ring, "bell-ring"},
-    {Icons::between_horizontal_end, "between-horizontal-end"},
-    {Icons::between_horizontal_start, "between-horizontal-start"},
-    {Icons::between_vertical_end, "between-vertical-end"},
-    {Icons::between_vertical_start, "between-vertical-start"},
-    {Icons::biceps_flexed, "biceps-flexed"},
-    {Icons::bike, "bike"},
-    {Icons::binary, "binary"},
-    {Icons::binoculars, "binoculars"},
-    {Icons::biohazard, "biohazard"},
-    {Icons::bird, "bird"},
-    {Icons::bitcoin, "bitcoin"},
-    {Icons::blend, "blend"},
-    {Icons::blinds, "blinds"},
-    {Icons::blocks, "blocks"},
-    {Icons::bluetooth, "bluetooth"},
-    {Icons::bluetooth_connected, "bluetooth-connected"},
-    {Icons::bluetooth_off, "bluetooth-off"},
-    {Icons::bluetooth_searching, "bluetooth-searching"},
-    {Icons::bold, "bold"},
-    {Icons::bolt, "bolt"},
-    {Icons::bomb, "bomb"},
-    {Icons::bone, "bone"},
-    {Icons::book, "book"},
-    {Icons::book_a, "book-a"},
-    {Icons::book_alert, "book-alert"},
-    {Icons::book_audio, "book-audio"},
-    {Icons::book_check, "book-check"},
-    {Icons::book_copy, "book-copy"},
-    {Icons::book_dashed, "book-dashed"},
-    {Icons::book_down, "book-down"},
-    {Icons::book_headphones, "book-headphones"},
-    {Icons::book_heart, "book-heart"},
-    {Icons::book_image, "book-image"},
-    {Icons::book_key, "book-key"},
-    {Icons::book_lock, "book-lock"},
-    {Icons::book_marked, "book-marked"},
-    {Icons::book_minus, "book-minus"},
-    {Icons::book_open, "book-open"},
-    {Icons::book_open_check, "book-open-check"},
-    {Icons::book_open_text, "book-open-text"},
-    {Icons::book_plus, "book-plus"},
-    {Icons::book_text, "book-text"},
-    {Icons::book_type, "book-type"},
-    {Icons::book_up, "book-up"},
-    {Icons::book_up_2, "book-up-2"},
-    {Icons::book_user, "book-user"},
-    {Icons::book_x, "book-x"},
-    {Icons::bookmark, "bookmark"},
-    {Icons::bookmark_check, "bookmark-check"},
-    {Icons::bookmark_minus, "bookmark-minus"},
-    {Icons::bookmark_plus, "bookmark-plus"},
-    {Icons::bookmark_x, "bookmark-x"},
-    {Icons::boom_box, "boom-box"},
-    {Icons::bot, "bot"},
-    {Icons::bot_message_square, "bot-message-square"},
-    {Icons::bot_off, "bot-off"},
-    {Icons::bottle_wine, "bottle-wine"},
-    {Icons::bow_arrow, "bow-arrow"},
-    {Icons::box, "box"},
-    {Icons::boxes, "boxes"},
-    {Icons::braces, "braces"},
-    {Icons::brackets, "brackets"},
-    {Icons::brain, "brain"},
-    {Icons::brain_circuit, "brain-circuit"},
-    {Icons::brain_cog, "brain-cog"},
-    {Icons::brick_wall, "brick-wall"},
-    {Icons::brick_wall_fire, "brick-wall-fire"},
-    {Icons::brick_wall_shield, "brick-wall-shield"},
-    {Icons::briefcase, "briefcase"},
-    {Icons::briefcase_business, "briefcase-business"},
-    {Icons::briefcase_conveyor_belt, "briefcase-conveyor-belt"},
-    {Icons::briefcase_medical, "briefcase-medical"},
-    {Icons::bring_to_front, "bring-to-front"},
-    {Icons::brush, "brush"},
-    {Icons::brush_cleaning, "brush-cleaning"},
-    {Icons::bubbles, "bubbles"},
-    {Icons::bug, "bug"},
-    {Icons::bug_off, "bug-off"},
-    {Icons::bug_play, "bug-play"},
-    {Icons::building, "building"},
-    {Icons::building_2, "building-2"},
-    {Icons::bus, "bus"},
-    {Icons::bus_front, "bus-front"},
-    {Icons::cable, "cable"},
-    {Icons::cable_car, "cable-car"},
-    {Icons::cake, "cake"},
-    {Icons::cake_slice, "cake-slice"},
-    {Icons::calculator, "calculator"},
-    {Icons::calendar, "calendar"},
-    {Icons::calendar_1, "calendar-1"},
-    {Icons::calendar_arrow_down, "calendar-arrow-down"},
-    {Icons::calendar_arrow_up, "calendar-arrow-up"},
-    {Icons::calendar_check, "calendar-check"},
-    {Icons::calendar_check_2, "calendar-check-2"},
-    {Icons::calendar_clock, "calendar-clock"},
-    {Icons::calendar_cog, "calendar-cog"},
-    {Icons::calendar_days, "calendar-days"},
-    {Icons::calendar_fold, "calendar-fold"},
-    {Icons::calendar_heart, "calendar-heart"},
-    {Icons::calendar_minus, "calendar-minus"},
-    {Icons::calendar_minus_2, "calendar-minus-2"},
-    {Icons::calendar_off, "calendar-off"},
-    {Icons::calendar_plus, "calendar-plus"},
-    {Icons::calendar_plus_2, "calendar-plus-2"},
-    {Icons::calendar_range, "calendar-range"},
-    {Icons::calendar_search, "calendar-search"},
-    {Icons::calendar_sync, "calendar-sync"},
-    {Icons::calendar_x, "calendar-x"},
-    {Icons::calendar_x_2, "calendar-x-2"},
-    {Icons::camera, "camera"},
-    {Icons::camera_off, "camera-off"},
-    {Icons::candy, "candy"},
-    {Icons::candy_cane, "candy-cane"},
-    {Icons::candy_off, "candy-off"},
-    {Icons::cannabis, "cannabis"},
-    {Icons::captions, "captions"},
-    {Icons::captions_off, "captions-off"},
-    {Icons::car, "car"},
-    {Icons::car_front, "car-front"},
-    {Icons::car_taxi_front, "car-taxi-front"},
-    {Icons::caravan, "caravan"},
-    {Icons::card_sim, "card-sim"},
-    {Icons::carrot, "carrot"},
-    {Icons::case_lower, "case-lower"},
-    {Icons::case_sensitive, "case-sensitive"},
-    {Icons::case_upper, "case-upper"},
-    {Icons::cassette_tape, "cassette-tape"},
-    {Icons::cast, "cast"},
-    {Icons::castle, "castle"},
-    {Icons::cat, "cat"},
-    {Icons::cctv, "cctv"},
-    {Icons::chart_area, "chart-area"},
-    {Icons::chart_bar, "chart-bar"},
-    {Icons::chart_bar_big, "chart-bar-big"},
-    {Icons::chart_bar_decreasing, "chart-bar-decreasing"},
-    {Icons::chart_bar_increasing, "chart-bar-increasing"},
-    {Icons::chart_bar_stacked, "chart-bar-stacked"},
-    {Icons::chart_candlestick, "chart-candlestick"},
-    {Icons::chart_column, "chart-column"},
-    {Icons::chart_column_big, "chart-column-big"},
-    {Icons::chart_column_decreasing, "chart-column-decreasing"},
-    {Icons::chart_column_increasing, "chart-column-increasing"},
-    {Icons::chart_column_stacked, "chart-column-stacked"},
-    {Icons::chart_gantt, "chart-gantt"},
-    {Icons::chart_line, "chart-line"},
-    {Icons::chart_network, "chart-network"},
-    {Icons::chart_no_axes_column, "chart-no-axes-column"},
-    {Icons::chart_no_axes_column_decreasing, "chart-no-axes-column-decreasing"},
-    {Icons::chart_no_axes_column_increasing, "chart-no-axes-column-increasing"},
-    {Icons::chart_no_axes_combined, "chart-no-axes-combined"},
-    {Icons::chart_no_axes_gantt, "chart-no-axes-gantt"},
-    {Icons::chart_pie, "chart-pie"},
-    {Icons::chart_scatter, "chart-scatter"},
-    {Icons::chart_spline, "chart-spline"},
-    {Icons::check, "check"},
-    {Icons::check_check, "check-check"},
-    {Icons::check_line, "check-line"},
-    {Icons::chef_hat, "chef-hat"},
-    {Icons::cherry, "cherry"},
-    {Icons::chevron_down, "chevron-down"},
-    {Icons::chevron_first, "chevron-first"},
-    {Icons::chevron_last, "chevron-last"},
-    {Icons::chevron_left, "chevron-left"},
-    {Icons::chevron_right, "chevron-right"},
-    {Icons::chevron_up, "chevron-up"},
-    {Icons::chevrons_down, "chevrons-down"},
-    {Icons::chevrons_down_up, "chevrons-down-up"},
-    {Icons::chevrons_left, "chevrons-left"},
-    {Icons::chevrons_left_right, "chevrons-left-right"},
-    {Icons::chevrons_left_right_ellipsis, "chevrons-left-right-ellipsis"},
-    {Icons::chevrons_right, "chevrons-right"},
-    {Icons::chevrons_right_left, "chevrons-right-left"},
-    {Icons::chevrons_up, "chevrons-up"},
-    {Icons::chevrons_up_down, "chevrons-up-down"},
-    {Icons::chromium, "chromium"},
-    {Icons::church, "church"},
-    {Icons::cigarette, "cigarette"},
-    {Icons::cigarette_off, "cigarette-off"},
-    {Icons::circle, "circle"},
-    {Icons::circle_alert, "circle-alert"},
-    {Icons::circle_arrow_down, "circle-arrow-down"},
-    {Icons::circle_arrow_left, "circle-arrow-left"},
-    {Icons::circle_arrow_out_down_left, "circle-arrow-out-down-left"},
-    {Icons::circle_arrow_out_down_right, "circle-arrow-out-down-right"},
-    {Icons::circle_arrow_out_up_left, "circle-arrow-out-up-left"},
-    {Icons::circle_arrow_out_up_right, "circle-arrow-out-up-right"},
-    {Icons::circle_arrow_right, "circle-arrow-right"},
-    {Icons::circle_arrow_up, "circle-arrow-up"},
-    {Icons::circle_check, "circle-check"},
-    {Icons::circle_check_big, "circle-check-big"},
-    {Icons::circle_chevron_down, "circle-chevron-down"},
-    {Icons::circle_chevron_left, "circle-chevron-left"},
-    {Icons::circle_chevron_right, "circle-chevron-right"},
-    {Icons::circle_chevron_up, "circle-chevron-up"},
-    {Icons::circle_dashed, "circle-dashed"},
-    {Icons::circle_divide, "circle-divide"},
-    {Icons::circle_dollar_sign, "circle-dollar-sign"},
-    {Icons::circle_dot, "circle-dot"},
-    {Icons::circle_dot_dashed, "circle-dot-dashed"},
-    {Icons::circle_ellipsis, "circle-ellipsis"},
-    {Icons::circle_equal, "circle-equal"},
-    {Icons::circle_fading_arrow_up, "circle-fading-arrow-up"},
-    {Icons::circle_fading_plus, "circle-fading-plus"},
-    {Icons::circle_gauge, "circle-gauge"},
-    {Icons::circle_minus, "circle-minus"},
-    {Icons::circle_off, "circle-off"},
-    {Icons::circle_parking, "circle-parking"},
-    {Icons::circle_parking_off, "circle-parking-off"},
-    {Icons::circle_pause, "circle-pause"},
-    {Icons::circle_percent, "circle-percent"},
-    {Icons::circle_play, "circle-play"},
-    {Icons::circle_plus, "circle-plus"},
-    {Icons::circle_pound_sterling, "circle-pound-sterling"},
-    {Icons::circle_power, "circle-power"},
-    {Icons::circle_question_mark, "circle-question-mark"},
-    {Icons::circle_slash, "circle-slash"},
-    {Icons::circle_slash_2, "circle-slash-2"},
-    {Icons::circle_small, "circle-small"},
-    {Icons::circle_star, "circle-star"},
-    {Icons::circle_stop, "circle-stop"},
-    {Icons::circle_user, "circle-user"},
-    {Icons::circle_user_round, "circle-user-round"},
-    {Icons::circle_x, "circle-x"},
-    {Icons::circuit_board, "circuit-board"},
-    {Icons::citrus, "citrus"},
-    {Icons::clapperboard, "clapperboard"},
-    {Icons::clipboard, "clipboard"},
-    {Icons::clipboard_check, "clipboard-check"},
-    {Icons::clipboard_clock, "clipboard-clock"},
-    {Icons::clipboard_copy, "clipboard-copy"},
-    {Icons::clipboard_list, "clipboard-list"},
-    {Icons::clipboard_minus, "clipboard-minus"},
-    {Icons::clipboard_paste, "clipboard-paste"},
-    {Icons::clipboard_pen, "clipboard-pen"},
-    {Icons::clipboard_pen_line, "clipboard-pen-line"},
-    {Icons::clipboard_plus, "clipboard-plus"},
-    {Icons::clipboard_type, "clipboard-type"},
-    {Icons::clipboard_x, "clipboard-x"},
-    {Icons::clock, "clock"},
-    {Icons::clock_1, "clock-1"},
-    {Icons::clock_10, "clock-10"},
-    {Icons::clock_11, "clock-11"},
-    {Icons::clock_12, "clock-12"},
-    {Icons::clock_2, "clock-2"},
-    {Icons::clock_3, "clock-3"},
-    {Icons::clock_4, "clock-4"},
-    {Icons::clock_5, "clock-5"},
-    {Icons::clock_6, "clock-6"},
-    {Icons::clock_7, "clock-7"},
-    {Icons::clock_8, "clock-8"},
-    {Icons::clock_9, "clock-9"},
-    {Icons::clock_alert, "clock-alert"},
-    {Icons::clock_arrow_down, "clock-arrow-down"},
-    {Icons::clock_arrow_up, "clock-arrow-up"},
-    {Icons::clock_fading, "clock-fading"},
-    {Icons::clock_plus, "clock-plus"},
-    {Icons::closed_caption, "closed-caption"},
-    {Icons::cloud, "cloud"},
-    {Icons::cloud_alert, "cloud-alert"},
-    {Icons::cloud_check, "cloud-check"},
-    {Icons::cloud_cog, "cloud-cog"},
-    {Icons::cloud_download, "cloud-download"},
-    {Icons::cloud_drizzle, "cloud-drizzle"},
-    {Icons::cloud_fog, "cloud-fog"},
-    {Icons::cloud_hail, "cloud-hail"},
-    {Icons::cloud_lightning, "cloud-lightning"},
-    {Icons::cloud_moon, "cloud-moon"},
-    {Icons::cloud_moon_rain, "cloud-moon-rain"},
-    {Icons::cloud_off, "cloud-off"},
-    {Icons::cloud_rain, "cloud-rain"},
-    {Icons::cloud_rain_wind, "cloud-rain-wind"},
-    {Icons::cloud_snow, "cloud-snow"},
-    {Icons::cloud_sun, "cloud-sun"},
-    {Icons::cloud_sun_rain, "cloud-sun-rain"},
-    {Icons::cloud_upload, "cloud-upload"},
-    {Icons::cloudy, "cloudy"},
-    {Icons::clover, "clover"},
-    {Icons::club, "club"},
-    {Icons::code, "code"},
-    {Icons::code_xml, "code-xml"},
-    {Icons::codepen, "codepen"},
-    {Icons::codesandbox, "codesandbox"},
-    {Icons::coffee, "coffee"},
-    {Icons::cog, "cog"},
-    {Icons::coins, "coins"},
-    {Icons::columns_2, "columns-2"},
-    {Icons::columns_3, "columns-3"},
-    {Icons::columns_3_cog, "columns-3-cog"},
-    {Icons::columns_4, "columns-4"},
-    {Icons::combine, "combine"},
-    {Icons::command, "command"},
-    {Icons::compass, "compass"},
-    {Icons::component, "component"},
-    {Icons::computer, "computer"},
-    {Icons::concierge_bell, "concierge-bell"},
-    {Icons::cone, "cone"},
-    {Icons::construction, "construction"},
-    {Icons::contact, "contact"},
-    {Icons::contact_round, "contact-round"},
-    {Icons::container, "container"},
-    {Icons::contrast, "contrast"},
-    {Icons::cookie, "cookie"},
-    {Icons::cooking_pot, "cooking-pot"},
-    {Icons::copy, "copy"},
-    {Icons::copy_check, "copy-check"},
-    {Icons::copy_minus, "copy-minus"},
-    {Icons::copy_plus, "copy-plus"},
-    {Icons::copy_slash, "copy-slash"},
-    {Icons::copy_x, "copy-x"},
-    {Icons::copyleft, "copyleft"},
-    {Icons::copyright, "copyright"},
-    {Icons::corner_down_left, "corner-down-left"},
-    {Icons::corner_down_right, "corner-down-right"},
-    {Icons::corner_left_down, "corner-left-down"},
-    {Icons::corner_left_up, "corner-left-up"},
-    {Icons::corner_right_down, "corner-right-down"},
-    {Icons::corner_right_up, "corner-right-up"},
-    {Icons::corner_up_left, "corner-up-left"},
-    {Icons::corner_up_right, "corner-up-right"},
-    {Icons::cpu, "cpu"},
-    {Icons::creative_commons, "creative-commons"},
-    {Icons::credit_card, "credit-card"},
-    {Icons::croissant, "croissant"},
-    {Icons::crop, "crop"},
-    {Icons::cross, "cross"},
-    {Icons::crosshair, "crosshair"},
-    {Icons::crown, "crown"},
-    {Icons::cuboid, "cuboid"},
-    {Icons::cup_soda, "cup-soda"},
-    {Icons::currency, "currency"},
-    {Icons::cylinder, "cylinder"},
-    {Icons::dam, "dam"},
-    {Icons::database, "database"},
-    {Icons::database_backup, "database-backup"},
-    {Icons::database_zap, "database-zap"},
-    {Icons::decimals_arrow_left, "decimals-arrow-left"},
-    {Icons::decimals_arrow_right, "decimals-arrow-right"},
-    {Icons::icon_delete, "delete"},
-    {Icons::dessert, "dessert"},
-    {Icons::diameter, "diameter"},
-    {Icons::diamond, "diamond"},
-    {Icons::diamond_minus, "diamond-minus"},
-    {Icons::diamond_percent, "diamond-percent"},
-    {Icons::diamond_plus, "diamond-plus"},
-    {Icons::dice_1, "dice-1"},
-    {Icons::dice_2, "dice-2"},
-    {Icons::dice_3, "dice-3"},
-    {Icons::dice_4, "dice-4"},
-    {Icons::dice_5, "dice-5"},
-    {Icons::dice_6, "dice-6"},
-    {Icons::dices, "dices"},
-    {Icons::diff, "diff"},
-    {Icons::disc, "disc"},
-    {Icons::disc_2, "disc-2"},
-    {Icons::disc_3, "disc-3"},
-    {Icons::disc_album, "disc-album"},
-    {Icons::divide, "divide"},
-    {Icons::dna, "dna"},
-    {Icons::dna_off, "dna-off"},
-    {Icons::dock, "dock"},
-    {Icons::dog, "dog"},
-    {Icons::dollar_sign, "dollar-sign"},
-    {Icons::donut, "donut"},
-    {Icons::door_closed, "door-closed"},
-    {Icons::door_closed_locked, "door-closed-locked"},
-    {Icons::door_open, "door-open"},
-    {Icons::dot, "dot"},
-    {Icons::download, "download"},
-    {Icons::drafting_compass, "drafting-compass"},
-    {Icons::drama, "drama"},
-    {Icons::dribbble, "dribbble"},
-    {Icons::drill, "drill"},
-    {Icons::drone, "drone"},
-    {Icons::droplet, "droplet"},
-    {Icons::droplet_off, "droplet-off"},
-    {Icons::droplets, "droplets"},
-    {Icons::drum, "drum"},
-    {Icons::drumstick, "drumstick"},
-    {Icons::dumbbell, "dumbbell"},
-    {Icons::ear, "ear"},
-    {Icons::ear_off, "ear-off"},
-    {Icons::earth, "earth"},
-    {Icons::earth_lock, "earth-lock"},
-    {Icons::eclipse, "eclipse"},
-    {Icons::egg, "egg"},
-    {Icons::egg_fried, "egg-fried"},
-    {Icons::egg_off, "egg-off"},
-    {Icons::ellipsis, "ellipsis"},
-    {Icons::ellipsis_vertical, "ellipsis-vertical"},
-    {Icons::equal, "equal"},
-    {Icons::equal_approximately, "equal-approximately"},
-    {Icons::equal_not, "equal-not"},
-    {Icons::eraser, "eraser"},
-    {Icons::ethernet_port, "ethernet-port"},
-    {Icons::euro, "euro"},
-    {Icons::expand, "expand"},
-    {Icons::external_link, "external-link"},
-    {Icons::eye, "eye"},
-    {Icons::eye_closed, "eye-closed"},
-    {Icons::eye_off, "eye-off"},
-    {Icons::facebook, "facebook"},
-    {Icons::factory, "factory"},
-    {Icons::fan, "fan"},
-    {Icons::fast_forward, "fast-forward"},
-    {Icons::feather, "feather"},
-    {Icons::fence, "fence"},
-    {Icons::ferris_wheel, "ferris-wheel"},
-    {Icons::figma, "figma"},
-    {Icons::file, "file"},
-    {Icons::file_archive, "file-archive"},
-    {Icons::file_audio, "file-audio"},
-    {Icons::file_audio_2, "file-audio-2"},
-    {Icons::file_axis_3d, "file-axis-3d"},
-    {Icons::file_badge, "file-badge"},
-    {Icons::file_badge_2, "file-badge-2"},
-    {Icons::file_box, "file-box"},
-    {Icons::file_chart_column, "file-chart-column"},
-    {Icons::file_chart_column_increasing, "file-chart-column-increasing"},
-    {Icons::file_chart_line, "file-chart-line"},
-    {Icons::file_chart_pie, "file-chart-pie"},
-    {Icons::file_check, "file-check"},
-    {Icons::file_check_2, "file-check-2"},
-    {Icons::file_clock, "file-clock"},
-    {Icons::file_code, "file-code"},
-    {Icons::file_code_2, "file-code-2"},
-    {Icons::file_cog, "file-cog"},
-    {Icons::file_diff, "file-diff"},
-    {Icons::file_digit, "file-digit"},
-    {Icons::file_down, "file-down"},
-    {Icons::file_heart, "file-heart"},
-    {Icons::file_image, "file-image"},
-    {Icons::file_input, "file-input"},
-    {Icons::file_json, "file-json"},
-    {Icons::file_json_2, "file-json-2"},
-    {Icons::file_key, "file-key"},
-    {Icons::file_key_2, "file-key-2"},
-    {Icons::file_lock, "file-lock"},
-    {Icons::file_lock_2, "file-lock-2"},
-    {Icons::file_minus, "file-minus"},
-    {Icons::file_minus_2, "file-minus-2"},
-    {Icons::file_music, "file-music"},
-    {Icons::file_output, "file-output"},
-    {Icons::file_pen, "file-pen"},
-    {Icons::file_pen_line, "file-pen-line"},
-    {Icons::file_play, "file-play"},
-    {Icons::file_plus, "file-plus"},
-    {Icons::file_plus_2, "file-plus-2"},
-    {Icons::file_question_mark, "file-question-mark"},
-    {Icons::file_scan, "file-scan"},
-    {Icons::file_search, "file-search"},
-    {Icons::file_search_2, "file-search-2"},
-    {Icons::file_sliders, "file-sliders"},
-    {Icons::file_spreadsheet, "file-spreadsheet"},
-    {Icons::file_stack, "file-stack"},
-    {Icons::file_symlink, "file-symlink"},
-    {Icons::file_terminal, "file-terminal"},
-    {Icons::file_text, "file-text"},
-    {Icons::file_type, "file-type"},
-    {Icons::file_type_2, "file-type-2"},
-    {Icons::file_up, "file-up"},
-    {Icons::file_user, "file-user"},
-    {Icons::file_video_camera, "file-video-camera"},
-    {Icons::file_volume, "file-volume"},
-    {Icons::file_volume_2, "file-volume-2"},
-    {Icons::file_warning, "file-warning"},
-    {Icons::file_x, "file-x"},
-    {Icons::file_x_2, "file-x-2"},
-    {Icons::files, "files"},
-    {Icons::film, "film"},
-    {Icons::fingerprint, "fingerprint"},
-    {Icons::fire_extinguisher, "fire-extinguisher"},
-    {Icons::fish, "fish"},
-    {Icons::fish_off, "fish-off"},
-    {Icons::fish_symbol, "fish-symbol"},
-    {Icons::flag, "flag"},
-    {Icons::flag_off, "flag-off"},
-    {Icons::flag_triangle_left, "flag-triangle-left"},
-    {Icons::flag_triangle_right, "flag-triangle-right"},
-    {Icons::flame, "flame"},
-    {Icons::flame_kindling, "flame-kindling"},
-    {Icons::flashlight, "flashlight"},
-    {Icons::flashlight_off, "flashlight-off"},
-    {Icons::flask_conical, "flask-conical"},
-    {Icons::flask_conical_off, "flask-conical-off"},
-    {Icons::flask_round, "flask-round"},
-    {Icons::flip_horizontal, "flip-horizontal"},
-    {Icons::flip_horizontal_2, "flip-horizontal-2"},
-    {Icons::flip_vertical, "flip-vertical"},
-    {Icons::flip_vertical_2, "flip-vertical-2"},
-    {Icons::flower, "flower"},
-    {Icons::flower_2, "flower-2"},
-    {Icons::focus, "focus"},
-    {Icons::fold_horizontal, "fold-horizontal"},
-    {Icons::fold_vertical, "fold-vertical"},
-    {Icons::folder, "folder"},
-    {Icons::folder_archive, "folder-archive"},
-    {Icons::folder_check, "folder-check"},
-    {Icons::folder_clock, "folder-clock"},
-    {Icons::folder_closed, "folder-closed"},
-    {Icons::folder_code, "folder-code"},
-    {Icons::folder_cog, "folder-cog"},
-    {Icons::folder_dot, "folder-dot"},
-    {Icons::folder_down, "folder-down"},
-    {Icons::folder_git, "folder-git"},
-    {Icons::folder_git_2, "folder-git-2"},
-    {Icons::folder_heart, "folder-heart"},
-    {Icons::folder_input, "folder-input"},
-    {Icons::folder_kanban, "folder-kanban"},
-    {Icons::folder_key, "folder-key"},
-    {Icons::folder_lock, "folder-lock"},
-    {Icons::folder_minus, "folder-minus"},
-    {Icons::folder_open, "folder-open"},
-    {Icons::folder_open_dot, "folder-open-dot"},
-    {Icons::folder_output, "folder-output"},
-    {Icons::folder_pen, "folder-pen"},
-    {Icons::folder_plus, "folder-plus"},
-    {Icons::folder_root, "folder-root"},
-    {Icons::folder_search, "folder-search"},
-    {Icons::folder_search_2, "folder-search-2"},
-    {Icons::folder_symlink, "folder-symlink"},
-    {Icons::folder_sync, "folder-sync"},
-    {Icons::folder_tree, "folder-tree"},
-    {Icons::folder_up, "folder-up"},
-    {Icons::folder_x, "folder-x"},
-    {Icons::folders, "folders"},
-    {Icons::footprints, "footprints"},
-    {Icons::forklift, "forklift"},
-    {Icons::forward, "forward"},
-    {Icons::frame, "frame"},
-    {Icons::framer, "framer"},
-    {Icons::frown, "frown"},
-    {Icons::fuel, "fuel"},
-    {Icons::fullscreen, "fullscreen"},
-    {Icons::funnel, "funnel"},
-    {Icons::funnel_plus, "funnel-plus"},
-    {Icons::funnel_x, "funnel-x"},
-    {Icons::gallery_horizontal, "gallery-horizontal"},
-    {Icons::gallery_horizontal_end, "gallery-horizontal-end"},
-    {Icons::gallery_thumbnails, "gallery-thumbnails"},
-    {Icons::gallery_vertical, "gallery-vertical"},
-    {Icons::gallery_vertical_end, "gallery-vertical-end"},
-    {Icons::gamepad, "gamepad"},
-    {Icons::gamepad_2, "gamepad-2"},
-    {Icons::gauge, "gauge"},
-    {Icons::gavel, "gavel"},
-    {Icons::gem, "gem"},
-    {Icons::georgian_lari, "georgian-lari"},
-    {Icons::ghost, "ghost"},
-    {Icons::gift, "gift"},
-    {Icons::git_branch, "git-branch"},
-    {Icons::git_branch_plus, "git-branch-plus"},
-    {Icons::git_commit_horizontal, "git-commit-horizontal"},
-    {Icons::git_commit_vertical, "git-commit-vertical"},
-    {Icons::git_compare, "git-compare"},
-    {Icons::git_compare_arrows, "git-compare-arrows"},
-    {Icons::git_fork, "git-fork"},
-    {Icons::git_graph, "git-graph"},
-    {Icons::git_merge, "git-merge"},
-    {Icons::git_pull_request, "git-pull-request"},
-    {Icons::git_pull_request_arrow, "git-pull-request-arrow"},
-    {Icons::git_pull_request_closed, "git-pull-request-closed"},
-    {Icons::git_pull_request_create, "git-pull-request-create"},
-    {Icons::git_pull_request_create_arrow, "git-pull-request-create-arrow"},
-    {Icons::git_pull_request_draft, "git-pull-request-draft"},
-    {Icons::github, "github"},
-    {Icons::gitlab, "gitlab"},
-    {Icons::glass_water, "glass-water"},
-    {Icons::glasses, "glasses"},
-    {Icons::globe, "globe"},
-    {Icons::globe_lock, "globe-lock"},
-    {Icons::goal, "goal"},
-    {Icons::gpu, "gpu"},
-    {Icons::graduation_cap, "graduation-cap"},
-    {Icons::grape, "grape"},
-    {Icons::grid_2x2, "grid-2x2"},
-    {Icons::grid_2x2_check, "grid-2x2-check"},
-    {Icons::grid_2x2_plus, "grid-2x2-plus"},
-    {Icons::grid_2x2_x, "grid-2x2-x"},
-    {Icons::grid_3x2, "grid-3x2"},
-    {Icons::grid_3x3, "grid-3x3"},
-    {Icons::grip, "grip"},
-    {Icons::grip_horizontal, "grip-horizontal"},
-    {Icons::grip_vertical, "grip-vertical"},
-    {Icons::group, "group"},
-    {Icons::guitar, "guitar"},
-    {Icons::ham, "ham"},
-    {Icons::hamburger, "hamburger"},
-    {Icons::hammer, "hammer"},
-    {Icons::hand, "hand"},
-    {Icons::hand_coins, "hand-coins"},
-    {Icons::hand_fist, "hand-fist"},
-    {Icons::hand_grab, "hand-grab"},
-    {Icons::hand_heart, "hand-heart"},
-    {Icons::hand_helping, "hand-helping"},
-    {Icons::hand_metal, "hand-metal"},
-    {Icons::hand_platter, "hand-platter"},
-    {Icons::handbag, "handbag"},
-    {Icons::handshake, "handshake"},
-    {Icons::hard_drive, "hard-drive"},
-    {Icons::hard_drive_download, "hard-drive-download"},
-    {Icons::hard_drive_upload, "hard-drive-upload"},
-    {Icons::hard_hat, "hard-hat"},
-    {Icons::hash, "hash"},
-    {Icons::hat_glasses, "hat-glasses"},
-    {Icons::haze, "haze"},
-    {Icons::hdmi_port, "hdmi-port"},
-    {Icons::heading, "heading"},
-    {Icons::heading_1, "heading-1"},
-    {Icons::heading_2, "heading-2"},
-    {Icons::heading_3, "heading-3"},
-    {Icons::heading_4, "heading-4"},
-    {Icons::heading_5, "heading-5"},
-    {Icons::heading_6, "heading-6"},
-    {Icons::headphone_off, "headphone-off"},
-    {Icons::headphones, "headphones"},
-    {Icons::headset, "headset"},
-    {Icons::heart, "heart"},
-    {Icons::heart_crack, "heart-crack"},
-    {Icons::heart_handshake, "heart-handshake"},
-    {Icons::heart_minus, "heart-minus"},
-    {Icons::heart_off, "heart-off"},
-    {Icons::heart_plus, "heart-plus"},
-    {Icons::heart_pulse, "heart-pulse"},
-    {Icons::heater, "heater"},
-    {Icons::hexagon, "hexagon"},
-    {Icons::highlighter, "highlighter"},
-    {Icons::history, "history"},
-    {Icons::hop, "hop"},
-    {Icons::hop_off, "hop-off"},
-    {Icons::hospital, "hospital"},
-    {Icons::hotel, "hotel"},
-    {Icons::hourglass, "hourglass"},
-    {Icons::house, "house"},
-    {Icons::house_plug, "house-plug"},
-    {Icons::house_plus, "house-plus"},
-    {Icons::house_wifi, "house-wifi"},
-    {Icons::ice_cream_bowl, "ice-cream-bowl"},
-    {Icons::ice_cream_cone, "ice-cream-cone"},
-    {Icons::id_card, "id-card"},
-    {Icons::id_card_lanyard, "id-card-lanyard"},
-    {Icons::image, "image"},
-    {Icons::image_down, "image-down"},
-    {Icons::image_minus, "image-minus"},
-    {Icons::image_off, "image-off"},
-    {Icons::image_play, "image-play"},
-    {Icons::image_plus, "image-plus"},
-    {Icons::image_up, "image-up"},
-    {Icons::image_upscale, "image-upscale"},
-    {Icons::images, "images"},
-    {Icons::import, "import"},
-    {Icons::inbox, "inbox"},
-    {Icons::indian_rupee, "indian-rupee"},
-    {Icons::infinity, "infinity"},
-    {Icons::info, "info"},
-    {Icons::inspection_panel, "inspection-panel"},
-    {Icons::instagram, "instagram"},
-    {Icons::italic, "italic"},
-    {Icons::iteration_ccw, "iteration-ccw"},
-    {Icons::iteration_cw, "iteration-cw"},
-    {Icons::japanese_yen, "japanese-yen"},
-    {Icons::joystick, "joystick"},
-    {Icons::kanban, "kanban"},
-    {Icons::kayak, "kayak"},
-    {Icons::key, "key"},
-    {Icons::key_round, "key-round"},
-    {Icons::key_square, "key-square"},
-    {Icons::keyboard, "keyboard"},
-    {Icons::keyboard_music, "keyboard-music"},
-    {Icons::keyboard_off, "keyboard-off"},
-    {Icons::lamp, "lamp"},
-    {Icons::lamp_ceiling, "lamp-ceiling"},
-    {Icons::lamp_desk, "lamp-desk"},
-    {Icons::lamp_floor, "lamp-floor"},
-    {Icons::lamp_wall_down, "lamp-wall-down"},
-    {Icons::lamp_wall_up, "lamp-wall-up"},
-    {Icons::land_plot, "land-plot"},
-    {Icons::landmark, "landmark"},
-    {Icons::languages, "languages"},
-    {Icons::laptop, "laptop"},
-    {Icons::laptop_minimal, "laptop-minimal"},
-    {Icons::laptop_minimal_check, "laptop-minimal-check"},
-    {Icons::lasso, "lasso"},
-    {Icons::lasso_select, "lasso-select"},
-    {Icons::laugh, "laugh"},
-    {Icons::layers, "layers"},
-    {Icons::layers_2, "layers-2"},
-    {Icons::layout_dashboard, "layout-dashboard"},
-    {Icons::layout_grid, "layout-grid"},
-    {Icons::layout_list, "layout-list"},
-    {Icons::layout_panel_left, "layout-panel-left"},
-    {Icons::layout_panel_top, "layout-panel-top"},
-    {Icons::layout_template, "layout-template"},
-    {Icons::leaf, "leaf"},
-    {Icons::leafy_green, "leafy-green"},
-    {Icons::lectern, "lectern"},
-    {Icons::library, "library"},
-    {Icons::library_big, "library-big"},
-    {Icons::life_buoy, "life-buoy"},
-    {Icons::ligature, "ligature"},
-    {Icons::lightbulb, "lightbulb"},
-    {Icons::lightbulb_off, "lightbulb-off"},
-    {Icons::line_squiggle, "line-squiggle"},
-    {Icons::link, "link"},
-    {Icons::link_2, "link-2"},
-    {Icons::link_2_off, "link-2-off"},
-    {Icons::linkedin, "linkedin"},
-    {Icons::list, "list"},
-    {Icons::list_check, "list-check"},
-    {Icons::list_checks, "list-checks"},
-    {Icons::list_chevrons_down_up, "list-chevrons-down-up"},
-    {Icons::list_chevrons_up_down, "list-chevrons-up-down"},
-    {Icons::list_collapse, "list-collapse"},
-    {Icons::list_end, "list-end"},
-    {Icons::list_filter, "list-filter"},
-    {Icons::list_filter_plus, "list-filter-plus"},
-    {Icons::list_indent_decrease, "list-indent-decrease"},
-    {Icons::list_indent_increase, "list-indent-increase"},
-    {Icons::list_minus, "list-minus"},
-    {Icons::list_music, "list-music"},
-    {Icons::list_ordered, "list-ordered"},
-    {Icons::list_plus, "list-plus"},
-    {Icons::list_restart, "list-restart"},
-    {Icons::list_start, "list-start"},
-    {Icons::list_todo, "list-todo"},
-    {Icons::list_tree, "list-tree"},
-    {Icons::list_video, "list-video"},
-    {Icons::list_x, "list-x"},
-    {Icons::loader, "loader"},
-    {Icons::loader_circle, "loader-circle"},
-    {Icons::loader_pinwheel, "loader-pinwheel"},
-    {Icons::locate, "locate"},
-    {Icons::locate_fixed, "locate-fixed"},
-    {Icons::locate_off, "locate-off"},
-    {Icons::lock, "lock"},
-    {Icons::lock_keyhole, "lock-keyhole"},
-    {Icons::lock_keyhole_open, "lock-keyhole-open"},
-    {Icons::lock_open, "lock-open"},
-    {Icons::log_in, "log-in"},
-    {Icons::log_out, "log-out"},
-    {Icons::logs, "logs"},
-    {Icons::lollipop, "lollipop"},
-    {Icons::luggage, "luggage"},
-    {Icons::magnet, "magnet"},
-    {Icons::mail, "mail"},
-    {Icons::mail_check, "mail-check"},
-    {Icons::mail_minus, "mail-minus"},
-    {Icons::mail_open, "mail-open"},
-    {Icons::mail_plus, "mail-plus"},
-    {Icons::mail_question_mark, "mail-question-mark"},
-    {Icons::mail_search, "mail-search"},
-    {Icons::mail_warning, "mail-warning"},
-    {Icons::mail_x, "mail-x"},
-    {Icons::mailbox, "mailbox"},
-    {Icons::mails, "mails"},
-    {Icons::map, "map"},
-    {Icons::map_minus, "map-minus"},
-    {Icons::map_pin, "map-pin"},
-    {Icons::map_pin_check, "map-pin-check"},
-    {Icons::map_pin_check_inside, "map-pin-check-inside"},
-    {Icons::map_pin_house, "map-pin-house"},
-    {Icons::map_pin_minus, "map-pin-minus"},
-    {Icons::map_pin_minus_inside, "map-pin-minus-inside"},
-    {Icons::map_pin_off, "map-pin-off"},
-    {Icons::map_pin_pen, "map-pin-pen"},
-    {Icons::map_pin_plus, "map-pin-plus"},
-    {Icons::map_pin_plus_inside, "map-pin-plus-inside"},
-    {Icons::map_pin_x, "map-pin-x"},
-    {Icons::map_pin_x_inside, "map-pin-x-inside"},
-    {Icons::map_pinned, "map-pinned"},
-    {Icons::map_plus, "map-plus"},
-    {Icons::mars, "mars"},
-    {Icons::mars_stroke, "mars-stroke"},
-    {Icons::martini, "martini"},
-    {Icons::maximize, "maximize"},
-    {Icons::maximize_2, "maximize-2"},
-    {Icons::medal, "medal"},
-    {Icons::megaphone, "megaphone"},
-    {Icons::megaphone_off, "megaphone-off"},
-    {Icons::meh, "meh"},
-    {Icons::memory_stick, "memory-stick"},
-    {Icons::menu, "menu"},
-    {Icons::merge, "merge"},
-    {Icons::message_circle, "message-circle"},
-    {Icons::message_circle_code, "message-circle-code"},
-    {Icons::message_circle_dashed, "message-circle-dashed"},
-    {Icons::message_circle_heart, "message-circle-heart"},
-    {Icons::message_circle_more, "message-circle-more"},
-    {Icons::message_circle_off, "message-circle-off"},
-    {Icons::message_circle_plus, "message-circle-plus"},
-    {Icons::message_circle_question_mark, "message-circle-question-mark"},
-    {Icons::message_circle_reply, "message-circle-reply"},
-    {Icons::message_circle_warning, "message-circle-warning"},
-    {Icons::message_circle_x, "message-circle-x"},
-    {Icons::message_square, "message-square"},
-    {Icons::message_square_code, "message-square-code"},
-    {Icons::message_square_dashed, "message-square-dashed"},
-    {Icons::message_square_diff, "message-square-diff"},
-    {Icons::message_square_dot, "message-square-dot"},
-    {Icons::message_square_heart, "message-square-heart"},
-    {Icons::message_square_lock, "message-square-lock"},
-    {Icons::message_square_more, "message-square-more"},
-    {Icons::message_square_off, "message-square-off"},
-    {Icons::message_square_plus, "message-square-plus"},
-    {Icons::message_square_quote, "message-square-quote"},
-    {Icons::message_square_reply, "message-square-reply"},
-    {Icons::message_square_share, "message-square-share"},
-    {Icons::message_square_text, "message-square-text"},
-    {Icons::message_square_warning, "message-square-warning"},
-    {Icons::message_square_x, "message-square-x"},
-    {Icons::messages_square, "messages-square"},
-    {Icons::mic, "mic"},
-    {Icons::mic_off, "mic-off"},
-    {Icons::mic_vocal, "mic-vocal"},
-    {Icons::microchip, "microchip"},
-    {Icons::microscope, "microscope"},
-    {Icons::microwave, "microwave"},
-    {Icons::milestone, "milestone"},
-    {Icons::milk, "milk"},
-    {Icons::milk_off, "milk-off"},
-    {Icons::minimize, "minimize"},
-    {Icons::minimize_2, "minimize-2"},
-    {Icons::minus, "minus"},
-    {Icons::monitor, "monitor"},
-    {Icons::monitor_check, "monitor-check"},
-    {Icons::monitor_cog, "monitor-cog"},
-    {Icons::monitor_dot, "monitor-dot"},
-    {Icons::monitor_down, "monitor-down"},
-    {Icons::monitor_off, "monitor-off"},
-    {Icons::monitor_pause, "monitor-pause"},
-    {Icons::monitor_play, "monitor-play"},
-    {Icons::monitor_smartphone, "monitor-smartphone"},
-    {Icons::monitor_speaker, "monitor-speaker"},
-    {Icons::monitor_stop, "monitor-stop"},
-    {Icons::monitor_up, "monitor-up"},
-    {Icons::monitor_x, "monitor-x"},
-    {Icons::moon, "moon"},
-    {Icons::moon_star, "moon-star"},
-    {Icons::mountain, "mountain"},
-    {Icons::mountain_snow, "mountain-snow"},
-    {Icons::mouse, "mouse"},
-    {Icons::mouse_off, "mouse-off"},
-    {Icons::mouse_pointer, "mouse-pointer"},
-    {Icons::mouse_pointer_2, "mouse-pointer-2"},
-    {Icons::mouse_pointer_ban, "mouse-pointer-ban"},
-    {Icons::mouse_pointer_click, "mouse-pointer-click"},
-    {Icons::move, "move"},
-    {Icons::move_3d, "move-3d"},
-    {Icons::move_diagonal, "move-diagonal"},
-    {Icons::move_diagonal_2, "move-diagonal-2"},
-    {Icons::move_down, "move-down"},
-    {Icons::move_down_left, "move-down-left"},
-    {Icons::move_down_right, "move-down-right"},
-    {Icons::move_horizontal, "move-horizontal"},
-    {Icons::move_left, "move-left"},
-    {Icons::move_right, "move-right"},
-    {Icons::move_up, "move-up"},
-    {Icons::move_up_left, "move-up-left"},
-    {Icons::move_up_right, "move-up-right"},
-    {Icons::move_vertical, "move-vertical"},
-    {Icons::music, "music"},
-    {Icons::music_2, "music-2"},
-    {Icons::music_3, "music-3"},
-    {Icons::music_4, "music-4"},
-    {Icons::navigation, "navigation"},
-    {Icons::navigation_2, "navigation-2"},
-    {Icons::navigation_2_off, "navigation-2-off"},
-    {Icons::navigation_off, "navigation-off"},
-    {Icons::network, "network"},
-    {Icons::newspaper, "newspaper"},
-    {Icons::nfc, "nfc"},
-    {Icons::non_binary, "non-binary"},
-    {Icons::notebook, "notebook"},
-    {Icons::notebook_pen, "notebook-pen"},
-    {Icons::notebook_tabs, "notebook-tabs"},
-    {Icons::notebook_text, "notebook-text"},
-    {Icons::notepad_text, "notepad-text"},
-    {Icons::notepad_text_dashed, "notepad-text-dashed"},
-    {Icons::nut, "nut"},
-    {Icons::nut_off, "nut-off"},
-    {Icons::octagon, "octagon"},
-    {Icons::octagon_alert, "octagon-alert"},
-    {Icons::octagon_minus, "octagon-minus"},
-    {Icons::octagon_pause, "octagon-pause"},
-    {Icons::octagon_x, "octagon-x"},
-    {Icons::omega, "omega"},
-    {Icons::option, "option"},
-    {Icons::orbit, "orbit"},
-    {Icons::origami, "origami"},
-    {Icons::package, "package"},
-    {Icons::package_2, "package-2"},
-    {Icons::package_check, "package-check"},
-    {Icons::package_minus, "package-minus"},
-    {Icons::package_open, "package-open"},
-    {Icons::package_plus, "package-plus"},
-    {Icons::package_search, "package-search"},
-    {Icons::package_x, "package-x"},
-    {Icons::paint_bucket, "paint-bucket"},
-    {Icons::paint_roller, "paint-roller"},
-    {Icons::paintbrush, "paintbrush"},
-    {Icons::paintbrush_vertical, "paintbrush-vertical"},
-    {Icons::palette, "palette"},
-    {Icons::panda, "panda"},
-    {Icons::panel_bottom, "panel-bottom"},
-    {Icons::panel_bottom_close, "panel-bottom-close"},
-    {Icons::panel_bottom_dashed, "panel-bottom-dashed"},
-    {Icons::panel_bottom_open, "panel-bottom-open"},
-    {Icons::panel_left, "panel-left"},
-    {Icons::panel_left_close, "panel-left-close"},
-    {Icons::panel_left_dashed, "panel-left-dashed"},
-    {Icons::panel_left_open, "panel-left-open"},
-    {Icons::panel_left_right_dashed, "panel-left-right-dashed"},
-    {Icons::panel_right, "panel-right"},
-    {Icons::panel_right_close, "panel-right-close"},
-    {Icons::panel_right_dashed, "panel-right-dashed"},
-    {Icons::panel_right_open, "panel-right-open"},
-    {Icons::panel_top, "panel-top"},
-    {Icons::panel_top_bottom_dashed, "panel-top-bottom-dashed"},
-    {Icons::panel_top_close, "panel-top-close"},
-    {Icons::panel_top_dashed, "panel-top-dashed"},
-    {Icons::panel_top_open, "panel-top-open"},
-    {Icons::panels_left_bottom, "panels-left-bottom"},
-    {Icons::panels_right_bottom, "panels-right-bottom"},
-    {Icons::panels_top_left, "panels-top-left"},
-    {Icons::paperclip, "paperclip"},
-    {Icons::parentheses, "parentheses"},
-    {Icons::parking_meter, "parking-meter"},
-    {Icons::party_popper, "party-popper"},
-    {Icons::pause, "pause"},
-    {Icons::paw_print, "paw-print"},
-    {Icons::pc_case, "pc-case"},
-    {Icons::pen, "pen"},
-    {Icons::pen_line, "pen-line"},
-    {Icons::pen_off, "pen-off"},
-    {Icons::pen_tool, "pen-tool"},
-    {Icons::pencil, "pencil"},
-    {Icons::pencil_line, "pencil-line"},
-    {Icons::pencil_off, "pencil-off"},
-    {Icons::pencil_ruler, "pencil-ruler"},
-    {Icons::pentagon, "pentagon"},
-    {Icons::percent, "percent"},
-    {Icons::person_standing, "person-standing"},
-    {Icons::philippine_peso, "philippine-peso"},
-    {Icons::phone, "phone"},
-    {Icons::phone_call, "phone-call"},
-    {Icons::phone_forwarded, "phone-forwarded"},
-    {Icons::phone_incoming, "phone-incoming"},
-    {Icons::phone_missed, "phone-missed"},
-    {Icons::phone_off, "phone-off"},
-    {Icons::phone_outgoing, "phone-outgoing"},
-    {Icons::pi, "pi"},
-    {Icons::piano, "piano"},
-    {Icons::pickaxe, "pickaxe"},
-    {Icons::picture_in_picture, "picture-in-picture"},
-    {Icons::picture_in_picture_2, "picture-in-picture-2"},
-    {Icons::piggy_bank, "piggy-bank"},
-    {Icons::pilcrow, "pilcrow"},
-    {Icons::pilcrow_left, "pilcrow-left"},
-    {Icons::pilcrow_right, "pilcrow-right"},
-    {Icons::pill, "pill"},
-    {Icons::pill_bottle, "pill-bottle"},
-    {Icons::pin, "pin"},
-    {Icons::pin_off, "pin-off"},
-    {Icons::pipette, "pipette"},
-    {Icons::pizza, "pizza"},
-    {Icons::plane, "plane"},
-    {Icons::plane_landing, "plane-landing"},
-    {Icons::plane_takeoff, "plane-takeoff"},
-    {Icons::play, "play"},
-    {Icons::plug, "plug"},
-    {Icons::plug_2, "plug-2"},
-    {Icons::plug_zap, "plug-zap"},
-    {Icons::plus, "plus"},
-    {Icons::pocket, "pocket"},
-    {Icons::pocket_knife, "pocket-knife"},
-    {Icons::podcast, "podcast"},
-    {Icons::pointer, "pointer"},
-    {Icons::pointer_off, "pointer-off"},
-    {Icons::popcorn, "popcorn"},
-    {Icons::popsicle, "popsicle"},
-    {Icons::pound_sterling, "pound-sterling"},
-    {Icons::power, "power"},
-    {Icons::power_off, "power-off"},
-    {Icons::presentation, "presentation"},
-    {Icons::printer, "printer"},
-    {Icons::printer_check, "printer-check"},
-    {Icons::projector, "projector"},
-    {Icons::proportions, "proportions"},
-    {Icons::puzzle, "puzzle"},
-    {Icons::pyramid, "pyramid"},
-    {Icons::qr_code, "qr-code"},
-    {Icons::quote, "quote"},
-    {Icons::rabbit, "rabbit"},
-    {Icons::radar, "radar"},
-    {Icons::radiation, "radiation"},
-    {Icons::radical, "radical"},
-    {Icons::radio, "radio"},
-    {Icons::radio_receiver, "radio-receiver"},
-    {Icons::radio_tower, "radio-tower"},
-    {Icons::radius, "radius"},
-    {Icons::rail_symbol, "rail-symbol"},
-    {Icons::rainbow, "rainbow"},
-    {Icons::rat, "rat"},
-    {Icons::ratio, "ratio"},
-    {Icons::receipt, "receipt"},
-    {Icons::receipt_cent, "receipt-cent"},
-    {Icons::receipt_euro, "receipt-euro"},
-    {Icons::receipt_indian_rupee, "receipt-indian-rupee"},
-    {Icons::receipt_japanese_yen, "receipt-japanese-yen"},
-    {Icons::receipt_pound_sterling, "receipt-pound-sterling"},
-    {Icons::receipt_russian_ruble, "receipt-russian-ruble"},
-    {Icons::receipt_swiss_franc, "receipt-swiss-franc"},
-    {Icons::receipt_text, "receipt-text"},
-    {Icons::receipt_turkish_lira, "receipt-turkish-lira"},
-    {Icons::rectangle_circle, "rectangle-circle"},
-    {Icons::rectangle_ellipsis, "rectangle-ellipsis"},
-    {Icons::rectangle_goggles, "rectangle-goggles"},
-    {Icons::rectangle_horizontal, "rectangle-horizontal"},
-    {Icons::rectangle_vertical, "rectangle-vertical"},
-    {Icons::recycle, "recycle"},
-    {Icons::redo, "redo"},
-    {Icons::redo_2, "redo-2"},
-    {Icons::redo_dot, "redo-dot"},
-    {Icons::refresh_ccw, "refresh-ccw"},
-    {Icons::refresh_ccw_dot, "refresh-ccw-dot"},
-    {Icons::refresh_cw, "refresh-cw"},
-    {Icons::refresh_cw_off, "refresh-cw-off"},
-    {Icons::refrigerator, "refrigerator"},
-    {Icons::regex, "regex"},
-    {Icons::remove_formatting, "remove-formatting"},
-    {Icons::repeat, "repeat"},
-    {Icons::repeat_1, "repeat-1"},
-    {Icons::repeat_2, "repeat-2"},
-    {Icons::replace, "replace"},
-    {Icons::replace_all, "replace-all"},
-    {Icons::reply, "reply"},
-    {Icons::reply_all, "reply-all"},
-    {Icons::rewind, "rewind"},
-    {Icons::ribbon, "ribbon"},
-    {Icons::rocket, "rocket"},
-    {Icons::rocking_chair, "rocking-chair"},
-    {Icons::roller_coaster, "roller-coaster"},
-    {Icons::rose, "rose"},
-    {Icons::rotate_3d, "rotate-3d"},
-    {Icons::rotate_ccw, "rotate-ccw"},
-    {Icons::rotate_ccw_key, "rotate-ccw-key"},
-    {Icons::rotate_ccw_square, "rotate-ccw-square"},
-    {Icons::rotate_cw, "rotate-cw"},
-    {Icons::rotate_cw_square, "rotate-cw-square"},
-    {Icons::route, "route"},
-    {Icons::route_off, "route-off"},
-    {Icons::router, "router"},
-    {Icons::rows_2, "rows-2"},
-    {Icons::rows_3, "rows-3"},
-    {Icons::rows_4, "rows-4"},
-    {Icons::rss, "rss"},
-    {Icons::ruler, "ruler"},
-    {Icons::ruler_dimension_line, "ruler-dimension-line"},
-    {Icons::russian_ruble, "russian-ruble"},
-    {Icons::sailboat, "sailboat"},
-    {Icons::salad, "salad"},
-    {Icons::sandwich, "sandwich"},
-    {Icons::satellite, "satellite"},
-    {Icons::satellite_dish, "satellite-dish"},
-    {Icons::saudi_riyal, "saudi-riyal"},
-    {Icons::save, "save"},
-    {Icons::save_all, "save-all"},
-    {Icons::save_off, "save-off"},
-    {Icons::scale, "scale"},
-    {Icons::scale_3d, "scale-3d"},
-    {Icons::scaling, "scaling"},
-    {Icons::scan, "scan"},
-    {Icons::scan_barcode, "scan-barcode"},
-    {Icons::scan_eye, "scan-eye"},
-    {Icons::scan_face, "scan-face"},
-    {Icons::scan_heart, "scan-heart"},
-    {Icons::scan_line, "scan-line"},
-    {Icons::scan_qr_code, "scan-qr-code"},
-    {Icons::scan_search, "scan-search"},
-    {Icons::scan_text, "scan-text"},
-    {Icons::school, "school"},
-    {Icons::scissors, "scissors"},
-    {Icons::scissors_line_dashed, "scissors-line-dashed"},
-    {Icons::screen_share, "screen-share"},
-    {Icons::screen_share_off, "screen-share-off"},
-    {Icons::scroll, "scroll"},
-    {Icons::scroll_text, "scroll-text"},
-    {Icons::search, "search"},
-    {Icons::search_check, "search-check"},
-    {Icons::search_code, "search-code"},
-    {Icons::search_slash, "search-slash"},
-    {Icons::search_x, "search-x"},
-    {Icons::section, "section"},
-    {Icons::send, "send"},
-    {Icons::send_horizontal, "send-horizontal"},
-    {Icons::send_to_back, "send-to-back"},
-    {Icons::separator_horizontal, "separator-horizontal"},
-    {Icons::separator_vertical, "separator-vertical"},
-    {Icons::server, "server"},
-    {Icons::server_cog, "server-cog"},
-    {Icons::server_crash, "server-crash"},
-    {Icons::server_off, "server-off"},
-    {Icons::settings, "settings"},
-    {Icons::settings_2, "settings-2"},
-    {Icons::shapes, "shapes"},
-    {Icons::share, "share"},
-    {Icons::share_2, "share-2"},
-    {Icons::sheet, "sheet"},
-    {Icons::shell, "shell"},
-    {Icons::shield, "shield"},
-    {Icons::shield_alert, "shield-alert"},
-    {Icons::shield_ban, "shield-ban"},
-    {Icons::shield_check, "shield-check"},
-    {Icons::shield_ellipsis, "shield-ellipsis"},
-    {Icons::shield_half, "shield-half"},
-    {Icons::shield_minus, "shield-minus"},
-    {Icons::shield_off, "shield-off"},
-    {Icons::shield_plus, "shield-plus"},
-    {Icons::shield_question_mark, "shield-question-mark"},
-    {Icons::shield_user, "shield-user"},
-    {Icons::shield_x, "shield-x"},
-    {Icons::ship, "ship"},
-    {Icons::ship_wheel, "ship-wheel"},
-    {Icons::shirt, "shirt"},
-    {Icons::shopping_bag, "shopping-bag"},
-    {Icons::shopping_basket, "shopping-basket"},
-    {Icons::shopping_cart, "shopping-cart"},
-    {Icons::shovel, "shovel"},
-    {Icons::shower_head, "shower-head"},
-    {Icons::shredder, "shredder"},
-    {Icons::shrimp, "shrimp"},
-    {Icons::shrink, "shrink"},
-    {Icons::shrub, "shrub"},
-    {Icons::shuffle, "shuffle"},
-    {Icons::sigma, "sigma"},
-    {Icons::signal, "signal"},
-    {Icons::signal_high, "signal-high"},
-    {Icons::signal_low, "signal-low"},
-    {Icons::signal_medium, "signal-medium"},
-    {Icons::signal_zero, "signal-zero"},
-    {Icons::signature, "signature"},
-    {Icons::signpost, "signpost"},
-    {Icons::signpost_big, "signpost-big"},
-    {Icons::siren, "siren"},
-    {Icons::skip_back, "skip-back"},
-    {Icons::skip_forward, "skip-forward"},
-    {Icons::skull, "skull"},
-    {Icons::slack, "slack"},
-    {Icons::slash, "slash"},
-    {Icons::slice, "slice"},
-    {Icons::sliders_horizontal, "sliders-horizontal"},
-    {Icons::sliders_vertical, "sliders-vertical"},
-    {Icons::smartphone, "smartphone"},
-    {Icons::smartphone_charging, "smartphone-charging"},
-    {Icons::smartphone_nfc, "smartphone-nfc"},
-    {Icons::smile, "smile"},
-    {Icons::smile_plus, "smile-plus"},
-    {Icons::snail, "snail"},
-    {Icons::snowflake, "snowflake"},
-    {Icons::soap_dispenser_droplet, "soap-dispenser-droplet"},
-    {Icons::sofa, "sofa"},
-    {Icons::soup, "soup"},
-    {Icons::space, "space"},
-    {Icons::spade, "spade"},
-    {Icons::sparkle, "sparkle"},
-    {Icons::sparkles, "sparkles"},
-    {Icons::speaker, "speaker"},
-    {Icons::speech, "speech"},
-    {Icons::spell_check, "spell-check"},
-    {Icons::spell_check_2, "spell-check-2"},
-    {Icons::spline, "spline"},
-    {Icons::spline_pointer, "spline-pointer"},
-    {Icons::split, "split"},
-    {Icons::spool, "spool"},
-    {Icons::spotlight, "spotlight"},
-    {Icons::spray_can, "spray-can"},
-    {Icons::sprout, "sprout"},
-    {Icons::square, "square"},
-    {Icons::square_activity, "square-activity"},
-    {Icons::square_arrow_down, "square-arrow-down"},
-    {Icons::square_arrow_down_left, "square-arrow-down-left"},
-    {Icons::square_arrow_down_right, "square-arrow-down-right"},
-    {Icons::square_arrow_left, "square-arrow-left"},
-    {Icons::square_arrow_out_down_left, "square-arrow-out-down-left"},
-    {Icons::square_arrow_out_down_right, "square-arrow-out-down-right"},
-    {Icons::square_arrow_out_up_left, "square-arrow-out-up-left"},
-    {Icons::square_arrow_out_up_right, "square-arrow-out-up-right"},
-    {Icons::square_arrow_right, "square-arrow-right"},
-    {Icons::square_arrow_up, "square-arrow-up"},
-    {Icons::square_arrow_up_left, "square-arrow-up-left"},
-    {Icons::square_arrow_up_right, "square-arrow-up-right"},
-    {Icons::square_asterisk, "square-asterisk"},
-    {Icons::square_bottom_dashed_scissors, "square-bottom-dashed-scissors"},
-    {Icons::square_chart_gantt, "square-chart-gantt"},
-    {Icons::square_check, "square-check"},
-    {Icons::square_check_big, "square-check-big"},
-    {Icons::square_chevron_down, "square-chevron-down"},
-    {Icons::square_chevron_left, "square-chevron-left"},
-    {Icons::square_chevron_right, "square-chevron-right"},
-    {Icons::square_chevron_up, "square-chevron-up"},
-    {Icons::square_code, "square-code"},
-    {Icons::square_dashed, "square-dashed"},
-    {Icons::square_dashed_bottom, "square-dashed-bottom"},
-    {Icons::square_dashed_bottom_code, "square-dashed-bottom-code"},
-    {Icons::square_dashed_kanban, "square-dashed-kanban"},
-    {Icons::square_dashed_mouse_pointer, "square-dashed-mouse-pointer"},
-    {Icons::square_dashed_top_solid, "square-dashed-top-solid"},
-    {Icons::square_divide, "square-divide"},
-    {Icons::square_dot, "square-dot"},
-    {Icons::square_equal, "square-equal"},
-    {Icons::square_function, "square-function"},
-    {Icons::square_kanban, "square-kanban"},
-    {Icons::square_library, "square-library"},
-    {Icons::square_m, "square-m"},
-    {Icons::square_menu, "square-menu"},
-    {Icons::square_minus, "square-minus"},
-    {Icons::square_mouse_pointer, "square-mouse-pointer"},
-    {Icons::square_parking, "square-parking"},
-    {Icons::square_parking_off, "square-parking-off"},
-    {Icons::square_pause, "square-pause"},
-    {Icons::square_pen, "square-pen"},
-    {Icons::square_percent, "square-percent"},
-    {Icons::square_pi, "square-pi"},
-    {Icons::square_pilcrow, "square-pilcrow"},
-    {Icons::square_play, "square-play"},
-    {Icons::square_plus, "square-plus"},
-    {Icons::square_power, "square-power"},
-    {Icons::square_radical, "square-radical"},
-    {Icons::square_round_corner, "square-round-corner"},
-    {Icons::square_scissors, "square-scissors"},
-    {Icons::square_sigma, "square-sigma"},
-    {Icons::square_slash, "square-slash"},
-    {Icons::square_split_horizontal, "square-split-horizontal"},
-    {Icons::square_split_vertical, "square-split-vertical"},
-    {Icons::square_square, "square-square"},
-    {Icons::square_stack, "square-stack"},
-    {Icons::square_star, "square-star"},
-    {Icons::square_stop, "square-stop"},
-    {Icons::square_terminal, "square-terminal"},
-    {Icons::square_user, "square-user"},
-    {Icons::square_user_round, "square-user-round"},
-    {Icons::square_x, "square-x"},
-    {Icons::squares_exclude, "squares-exclude"},
-    {Icons::squares_intersect, "squares-intersect"},
-    {Icons::squares_subtract, "squares-subtract"},
-    {Icons::squares_unite, "squares-unite"},
-    {Icons::squircle, "squircle"},
-    {Icons::squircle_dashed, "squircle-dashed"},
-    {Icons::squirrel, "squirrel"},
-    {Icons::stamp, "stamp"},
-    {Icons::star, "star"},
-    {Icons::star_half, "star-half"},
-    {Icons::star_off, "star-off"},
-    {Icons::step_back, "step-back"},
-    {Icons::step_forward, "step-forward"},
-    {Icons::stethoscope, "stethoscope"},
-    {Icons::sticker, "sticker"},
-    {Icons::sticky_note, "sticky-note"},
-    {Icons::store, "store"},
-    {Icons::stretch_horizontal, "stretch-horizontal"},
-    {Icons::stretch_vertical, "stretch-vertical"},
-    {Icons::strikethrough, "strikethrough"},
-    {Icons::subscript, "subscript"},
-    {Icons::sun, "sun"},
-    {Icons::sun_dim, "sun-dim"},
-    {Icons::sun_medium, "sun-medium"},
-    {Icons::sun_moon, "sun-moon"},
-    {Icons::sun_snow, "sun-snow"},
-    {Icons::sunrise, "sunrise"},
-    {Icons::sunset, "sunset"},
-    {Icons::superscript, "superscript"},
-    {Icons::swatch_book, "swatch-book"},
-    {Icons::swiss_franc, "swiss-franc"},
-    {Icons::switch_camera, "switch-camera"},
-    {Icons::sword, "sword"},
-    {Icons::swords, "swords"},
-    {Icons::syringe, "syringe"},
-    {Icons::table, "table"},
-    {Icons::table_2, "table-2"},
-    {Icons::table_cells_merge, "table-cells-merge"},
-    {Icons::table_cells_split, "table-cells-split"},
-    {Icons::table_columns_split, "table-columns-split"},
-    {Icons::table_of_contents, "table-of-contents"},
-    {Icons::table_properties, "table-properties"},
-    {Icons::table_rows_split, "table-rows-split"},
-    {Icons::tablet, "tablet"},
-    {Icons::tablet_smartphone, "tablet-smartphone"},
-    {Icons::tablets, "tablets"},
-    {Icons::tag, "tag"},
-    {Icons::tags, "tags"},
-    {Icons::tally_1, "tally-1"},
-    {Icons::tally_2, "tally-2"},
-    {Icons::tally_3, "tally-3"},
-    {Icons::tally_4, "tally-4"},
-    {Icons::tally_5, "tally-5"},
-    {Icons::tangent, "tangent"},
-    {Icons::target, "target"},
-    {Icons::telescope, "telescope"},
-    {Icons::tent, "tent"},
-    {Icons::tent_tree, "tent-tree"},
-    {Icons::terminal, "terminal"},
-    {Icons::test_tube, "test-tube"},
-    {Icons::test_tube_diagonal, "test-tube-diagonal"},
-    {Icons::test_tubes, "test-tubes"},
-    {Icons::text_align_center, "text-align-center"},
-    {Icons::text_align_end, "text-align-end"},
-    {Icons::text_align_justify, "text-align-justify"},
-    {Icons::text_align_start, "text-align-start"},
-    {Icons::text_cursor, "text-cursor"},
-    {Icons::text_cursor_input, "text-cursor-input"},
-    {Icons::text_initial, "text-initial"},
-    {Icons::text_quote, "text-quote"},
-    {Icons::text_search, "text-search"},
-    {Icons::text_select, "text-select"},
-    {Icons::text_wrap, "text-wrap"},
-    {Icons::theater, "theater"},
-    {Icons::thermometer, "thermometer"},
-    {Icons::thermometer_snowflake, "thermometer-snowflake"},
-    {Icons::thermometer_sun, "thermometer-sun"},
-    {Icons::thumbs_down, "thumbs-down"},
-    {Icons::thumbs_up, "thumbs-up"},
-    {Icons::ticket, "ticket"},
-    {Icons::ticket_check, "ticket-check"},
-    {Icons::ticket_minus, "ticket-minus"},
-    {Icons::ticket_percent, "ticket-percent"},
-    {Icons::ticket_plus, "ticket-plus"},
-    {Icons::ticket_slash, "ticket-slash"},
-    {Icons::ticket_x, "ticket-x"},
-    {Icons::tickets, "tickets"},
-    {Icons::tickets_plane, "tickets-plane"},
-    {Icons::timer, "timer"},
-    {Icons::timer_off, "timer-off"},
-    {Icons::timer_reset, "timer-reset"},
-    {Icons::toggle_left, "toggle-left"},
-    {Icons::toggle_right, "toggle-right"},
-    {Icons::toilet, "toilet"},
-    {Icons::tool_case, "tool-case"},
-    {Icons::tornado, "tornado"},
-    {Icons::torus, "torus"},
-    {Icons::touchpad, "touchpad"},
-    {Icons::touchpad_off, "touchpad-off"},
-    {Icons::tower_control, "tower-control"},
-    {Icons::toy_brick, "toy-brick"},
-    {Icons::tractor, "tractor"},
-    {Icons::traffic_cone, "traffic-cone"},
-    {Icons::train_front, "train-front"},
-    {Icons::train_front_tunnel, "train-front-tunnel"},
-    {Icons::train_track, "train-track"},
-    {Icons::tram_front, "tram-front"},
-    {Icons::transgender, "transgender"},
-    {Icons::trash, "trash"},
-    {Icons::trash_2, "trash-2"},
-    {Icons::tree_deciduous, "tree-deciduous"},
-    {Icons::tree_palm, "tree-palm"},
-    {Icons::tree_pine, "tree-pine"},
-    {Icons::trees, "trees"},
-    {Icons::trello, "trello"},
-    {Icons::trending_down, "trending-down"},
-    {Icons::trending_up, "trending-up"},
-    {Icons::trending_up_down, "trending-up-down"},
-    {Icons::triangle, "triangle"},
-    {Icons::triangle_alert, "triangle-alert"},
-    {Icons::triangle_dashed, "triangle-dashed"},
-    {Icons::triangle_right, "triangle-right"},
-    {Icons::trophy, "trophy"},
-    {Icons::truck, "truck"},
-    {Icons::truck_electric, "truck-electric"},
-    {Icons::turkish_lira, "turkish-lira"},
-    {Icons::turntable, "turntable"},
-    {Icons::turtle, "turtle"},
-    {Icons::tv, "tv"},
-    {Icons::tv_minimal, "tv-minimal"},
-    {Icons::tv_minimal_play, "tv-minimal-play"},
-    {Icons::twitch, "twitch"},
-    {Icons::twitter, "twitter"},
-    {Icons::type, "type"},
-    {Icons::type_outline, "type-outline"},
-    {Icons::umbrella, "umbrella"},
-    {Icons::umbrella_off, "umbrella-off"},
-    {Icons::underline, "underline"},
-    {Icons::undo, "undo"},
-    {Icons::undo_2, "undo-2"},
-    {Icons::undo_dot, "undo-dot"},
-    {Icons::unfold_horizontal, "unfold-horizontal"},
-    {Icons::unfold_vertical, "unfold-vertical"},
-    {Icons::ungroup, "ungroup"},
-    {Icons::university, "university"},
-    {Icons::unlink, "unlink"},
-    {Icons::unlink_2, "unlink-2"},
-    {Icons::unplug, "unplug"},
-    {Icons::upload, "upload"},
-    {Icons::usb, "usb"},
-    {Icons::user, "user"},
-    {Icons::user_check, "user-check"},
-    {Icons::user_cog, "user-cog"},
-    {Icons::user_lock, "user-lock"},
-    {Icons::user_minus, "user-minus"},
-    {Icons::user_pen, "user-pen"},
-    {Icons::user_plus, "user-plus"},
-    {Icons::user_round, "user-round"},
-    {Icons::user_round_check, "user-round-check"},
-    {Icons::user_round_cog, "user-round-cog"},
-    {Icons::user_round_minus, "user-round-minus"},
-    {Icons::user_round_pen, "user-round-pen"},
-    {Icons::user_round_plus, "user-round-plus"},
-    {Icons::user_round_search, "user-round-search"},
-    {Icons::user_round_x, "user-round-x"},
-    {Icons::user_search, "user-search"},
-    {Icons::user_star, "user-star"},
-    {Icons::user_x, "user-x"},
-    {Icons::users, "users"},
-    {Icons::users_round, "users-round"},
-    {Icons::utensils, "utensils"},
-    {Icons::utensils_crossed, "utensils-crossed"},
-    {Icons::utility_pole, "utility-pole"},
-    {Icons::variable, "variable"},
-    {Icons::vault, "vault"},
-    {Icons::vector_square, "vector-square"},
-    {Icons::vegan, "vegan"},
-    {Icons::venetian_mask, "venetian-mask"},
-    {Icons::venus, "venus"},
-    {Icons::venus_and_mars, "venus-and-mars"},
-    {Icons::vibrate, "vibrate"},
-    {Icons::vibrate_off, "vibrate-off"},
-    {Icons::video, "video"},
-    {Icons::video_off, "video-off"},
-    {Icons::videotape, "videotape"},
-    {Icons::view, "view"},
-    {Icons::voicemail, "voicemail"},
-    {Icons::volleyball, "volleyball"},
-    {Icons::volume, "volume"},
-    {Icons::volume_1, "volume-1"},
-    {Icons::volume_2, "volume-2"},
-    {Icons::volume_off, "volume-off"},
-    {Icons::volume_x, "volume-x"},
-    {Icons::vote, "vote"},
-    {Icons::wallet, "wallet"},
-    {Icons::wallet_cards, "wallet-cards"},
-    {Icons::wallet_minimal, "wallet-minimal"},
-    {Icons::wallpaper, "wallpaper"},
-    {Icons::wand, "wand"},
-    {Icons::wand_sparkles, "wand-sparkles"},
-    {Icons::warehouse, "warehouse"},
-    {Icons::washing_machine, "washing-machine"},
-    {Icons::watch, "watch"},
-    {Icons::waves, "waves"},
-    {Icons::waves_ladder, "waves-ladder"},
-    {Icons::waypoints, "waypoints"},
-    {Icons::webcam, "webcam"},
-    {Icons::webhook, "webhook"},
-    {Icons::webhook_off, "webhook-off"},
-    {Icons::weight, "weight"},
-    {Icons::wheat, "wheat"},
-    {Icons::wheat_off, "wheat-off"},
-    {Icons::whole_word, "whole-word"},
-    {Icons::wifi, "wifi"},
-    {Icons::wifi_cog, "wifi-cog"},
-    {Icons::wifi_high, "wifi-high"},
-    {Icons::wifi_low, "wifi-low"},
-    {Icons::wifi_off, "wifi-off"},
-    {Icons::wifi_pen, "wifi-pen"},
-    {Icons::wifi_sync, "wifi-sync"},
-    {Icons::wifi_zero, "wifi-zero"},
-    {Icons::wind, "wind"},
-    {Icons::wind_arrow_down, "wind-arrow-down"},
-    {Icons::wine, "wine"},
-    {Icons::wine_off, "wine-off"},
-    {Icons::workflow, "workflow"},
-    {Icons::worm, "worm"},
-    {Icons::wrench, "wrench"},
-    {Icons::x, "x"},
-    {Icons::youtube, "youtube"},
-    {Icons::zap, "zap"},
-    {Icons::zap_off, "zap-off"},
-    {Icons::zoom_in, "zoom-in"},
-    {Icons::zoom_out, "zoom-out"}};
+static const QHash<Icons, QString>& ICON_TO_STRING_MAP = ICON_NAME_MAPS.iconToString;
 
 /**
  * @brief Mapping from string name to icon enum
  */
-static QHash<QString, Icons> createStringToIconMap() {
-    QHash<QString, Icons> map;
-    for (auto it = ICON_TO_STRING_MAP.begin(); it != ICON_TO_STRING_MAP.end(); ++it) {
-        map[it.value()] = it.key();
-    }
-    return map;
-}
-
-static const QHash<QString, Icons> STRING_TO_ICON_MAP = createStringToIconMap();
+static const QHash<QString, Icons>& STRING_TO_ICON_MAP = ICON_NAME_MAPS.stringToIcon;
 
 } // namespace lucide
 
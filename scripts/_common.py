@@ -0,0 +1,338 @@
+"""
+QtLucide Build Script Helpers
+Shared command, argument and resource helpers for the build scripts
+"""
+
+import collections
+import contextlib
+import fnmatch
+import functools
+import os
+import shlex
+import shutil
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+BUILT_FILE_EXTENSIONS = (".exe", ".dll", ".so", ".dylib", ".a", ".lib")
+
+
+def format_command(cmd):
+    """Quote an argv list the way a shell would need it, for display"""
+    return shlex.join(str(arg) for arg in cmd)
+
+
+def run_command(cmd, cwd=None, check=True):
+    """Run a command, streaming its output directly to the terminal"""
+    print(f"Running: {format_command(cmd)}")
+    try:
+        return subprocess.run(cmd, cwd=cwd, check=check)
+    except subprocess.CalledProcessError as e:
+        print(f"Error running command: {e}")
+        if check:
+            sys.exit(1)
+        return e
+
+
+def run_command_capture(cmd, cwd=None, check=True):
+    """Run a command and capture its output for parsing"""
+    try:
+        return subprocess.run(cmd, cwd=cwd, check=check, capture_output=True, text=True)
+    except subprocess.CalledProcessError as e:
+        print(f"Error running command: {e}")
+        if e.stderr:
+            print(f"Error output: {e.stderr}")
+        if check:
+            sys.exit(1)
+        return e
+
+
+def kill_process_tree(process):
+    """Kill a command started in its own process group, with its children"""
+    if os.name == "nt":
+        subprocess.run(
+            ["taskkill", "/T", "/F", "/PID", str(process.pid)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+    else:
+        with contextlib.suppress(ProcessLookupError):
+            os.killpg(process.pid, signal.SIGKILL)
+
+
+def stream_command(cmd, cwd=None, out=None, tail_lines=512, timeout=None):
+    """Run a command, echoing its output line by line and keeping the tail
+
+    If the command runs longer than timeout seconds it is killed together
+    with its children and subprocess.TimeoutExpired is raised with the
+    output tail.
+    """
+    # Commands that can time out get their own process group, so that the
+    # compilers and probes they start are killed with them
+    group_args = {}
+    if timeout is not None:
+        if os.name == "nt":
+            group_args["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        else:
+            group_args["start_new_session"] = True
+
+    tail = collections.deque(maxlen=tail_lines)
+    expired = threading.Event()
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        errors="replace",
+        bufsize=1,
+        **group_args,
+    ) as process:
+
+        def on_timeout():
+            expired.set()
+            kill_process_tree(process)
+
+        # Reading blocks until the command writes, so a timer enforces the
+        # timeout; once every process holding the pipe is dead the loop ends
+        timer = None
+        if timeout is not None:
+            timer = threading.Timer(timeout, on_timeout)
+            timer.start()
+        try:
+            for line in process.stdout:
+                print(line, end="", file=out)
+                tail.append(line)
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    if expired.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, "".join(tail))
+    return subprocess.CompletedProcess(cmd, process.returncode, "".join(tail), "")
+
+
+class PrefixedOutput:
+    """Text stream that writes each complete line with a label in front
+
+    Builds running side by side can share one terminal this way: every
+    line is written in one call, so lines from different builds don't
+    mix, and only the unfinished line is held in memory.
+    """
+
+    _lock = threading.Lock()
+
+    def __init__(self, prefix, stream=None):
+        self.prefix = prefix
+        # Bound now, so the stream can replace sys.stdout itself
+        self.stream = sys.stdout if stream is None else stream
+        self.pending = ""
+
+    def write(self, text):
+        *lines, self.pending = (self.pending + text).split("\n")
+        if lines:
+            with self._lock:
+                self.stream.write("".join(f"{self.prefix}{line}\n" for line in lines))
+                self.stream.flush()
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        """Write out a final line that has no newline"""
+        if self.pending:
+            self.write("\n")
+
+
+@functools.lru_cache(maxsize=None)
+def memoized_which(name):
+    """Locate an executable on PATH, caching the lookup"""
+    return shutil.which(name)
+
+
+def check_tool(name, display_name=None):
+    """Check that a required tool is on PATH, reporting it if missing"""
+    if memoized_which(name) is None:
+        print(f"ERROR: {display_name or name} is not installed or not in PATH")
+        return False
+    return True
+
+
+def add_common_build_args(parser):
+    """Add the options shared by every build script to a parser"""
+    parser.add_argument(
+        "--examples", action="store_true", default=True, help="Build examples"
+    )
+    parser.add_argument(
+        "--no-examples",
+        dest="examples",
+        action="store_false",
+        help="Don't build examples",
+    )
+    parser.add_argument(
+        "--tests", action="store_true", default=True, help="Build tests"
+    )
+    parser.add_argument(
+        "--no-tests", dest="tests", action="store_false", help="Don't build tests"
+    )
+    parser.add_argument("--clean", action="store_true", help="Clean build first")
+    parser.add_argument("--install", action="store_true", help="Install after building")
+    parser.add_argument("--test", action="store_true", help="Run tests after building")
+    parser.add_argument(
+        "--generate-resources",
+        action="store_true",
+        help="Generate resources before building",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of parallel jobs (default: number of CPUs)",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    parser.add_argument(
+        "--self-test",
+        action="store_true",
+        help="Check that the script loads and parses its options, then exit",
+    )
+
+
+def ignore_root_dirs(root, *patterns):
+    """Make a copytree ignore callable that skips matching directories at root
+
+    shutil.ignore_patterns applies to every name at every depth, so a
+    pattern like build_* would also drop tools/build_resources.py.
+    """
+    root = os.path.abspath(root)
+
+    def ignore(directory, names):
+        if os.path.abspath(directory) != root:
+            return set()
+        return {
+            name
+            for name in names
+            if any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+            and os.path.isdir(os.path.join(directory, name))
+        }
+
+    return ignore
+
+
+def read_cmake_cache(cache_file):
+    """Read CMakeCache.txt entries into a name -> value dictionary"""
+    entries = {}
+    with open(cache_file, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith(("#", "//")):
+                continue
+            key, sep, value = line.rstrip("\n").partition("=")
+            if sep:
+                entries[key.split(":", 1)[0]] = value
+    return entries
+
+
+def cmake_build_generated(build_dir):
+    """Check whether CMake finished generating the build files in build_dir
+
+    CMakeFiles/cmake.check_cache shows that configuring ran, and the build
+    file of the generator recorded in the cache is only written once
+    generation succeeded. Makefile.cmake alone would only cover Makefiles.
+    """
+    try:
+        generator = read_cmake_cache(build_dir / "CMakeCache.txt")["CMAKE_GENERATOR"]
+    except (OSError, KeyError):
+        return False
+    if not (build_dir / "CMakeFiles" / "cmake.check_cache").exists():
+        return False
+
+    if generator.startswith("Ninja"):
+        return (build_dir / "build.ninja").exists()
+    if generator.endswith("Makefiles"):
+        return (build_dir / "Makefile").exists()
+    if generator.startswith("Visual Studio"):
+        return any(build_dir.glob("*.sln"))
+    if generator == "Xcode":
+        return any(build_dir.glob("*.xcodeproj"))
+    # Other generators have no single well-known build file
+    return True
+
+
+def discard_build_dir(build_dir):
+    """Move the build directory aside and delete it in the background"""
+    trash_dir = build_dir.with_name(
+        f"{build_dir.name}.trash-{os.getpid()}-{time.time_ns()}"
+    )
+    try:
+        os.rename(build_dir, trash_dir)
+    except OSError:
+        # Renaming can fail if files are still in use; delete in place instead
+        shutil.rmtree(build_dir)
+        return
+
+    subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            "import shutil, sys; shutil.rmtree(sys.argv[1], ignore_errors=True)",
+            str(trash_dir),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def load_resource_builder(project_dir):
+    """Import the resource builder from the tools directory, if present"""
+    tools_dir = project_dir / "tools"
+    if not (tools_dir / "build_resources.py").exists():
+        return None
+    if str(tools_dir) not in sys.path:
+        sys.path.insert(0, str(tools_dir))
+    from build_resources import QtLucideResourceBuilder
+
+    return QtLucideResourceBuilder
+
+
+def generate_resources(project_dir):
+    """Generate resources by running the resource builder in-process"""
+    print("Generating resources...")
+    builder_class = load_resource_builder(project_dir)
+    if builder_class is None:
+        print("Warning: Resource generation script not found")
+        return False
+    if builder_class(project_dir).build_all():
+        print("Resources generated successfully!")
+        return True
+    print("Warning: Resource generation failed, continuing with build...")
+    return False
+
+
+def collect_built_files(build_dir):
+    """Collect built artifacts by extension in a single directory walk"""
+    found = {ext: [] for ext in BUILT_FILE_EXTENSIONS}
+    pending = [str(build_dir)]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext in found:
+                    found[ext].append(os.path.relpath(entry.path, build_dir))
+    return found
+
+
+def print_built_files(build_dir, limit=10):
+    """Print the artifacts found in a build directory, a few per type"""
+    print(f"\nBuilt files in {build_dir}:")
+    for files in collect_built_files(build_dir).values():
+        for file in files[:limit]:
+            print(f"  {file}")
+        if len(files) > limit:
+            print(f"  ... and {len(files) - limit} more files")
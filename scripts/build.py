@@ -5,51 +5,33 @@ Automatically detects and uses the best available build system
 """
 
 import argparse
-import subprocess
+import importlib
 import sys
 from pathlib import Path
 
+from _common import add_common_build_args, format_command, memoized_which
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        return result
-    except subprocess.CalledProcessError as e:
-        if check:
-            print(f"Error running command: {e}")
-            if e.stderr:
-                print(f"Error output: {e.stderr}")
-            sys.exit(1)
-        return e
-    except FileNotFoundError:
-        return None
+# Priority order: CMake (most common), Meson (fast), XMake (modern)
+BUILD_SYSTEMS = ["cmake", "meson", "xmake"]
 
 
 def check_build_system_available(system):
-    """Check if a build system is available"""
-    commands = {
-        "cmake": ["cmake", "--version"],
-        "meson": ["meson", "--version"],
-        "xmake": ["xmake", "--version"],
-    }
-
-    if system not in commands:
+    """Check if a build system is available on PATH"""
+    if system not in BUILD_SYSTEMS:
         return False
 
-    result = run_command(commands[system], check=False)
-    return result is not None and result.returncode == 0
+    return memoized_which(system) is not None
+
+
+def check_all_build_systems():
+    """Check every build system, keeping priority order"""
+    return {system: check_build_system_available(system) for system in BUILD_SYSTEMS}
 
 
 def detect_best_build_system():
     """Detect the best available build system"""
-    # Priority order: CMake (most common), Meson (fast), XMake (modern)
-    systems = ["cmake", "meson", "xmake"]
-
-    for system in systems:
-        if check_build_system_available(system):
+    for system, available in check_all_build_systems().items():
+        if available:
             return system
 
     return None
@@ -110,7 +92,7 @@ def build_with_system(system, args, script_dir):
         sys.exit(1)
 
     # Build command arguments
-    cmd = ["python3", str(script_path)]
+    cmd = []
 
     # Add build type
     build_type = normalize_build_type(args.buildtype, system)
@@ -156,6 +138,8 @@ def build_with_system(system, args, script_dir):
             cmd.extend(["--builddir", args.builddir])
         if hasattr(args, "debug_executables") and args.debug_executables:
             cmd.append("--debug-executables")
+        if args.jobs:
+            cmd.extend(["--jobs", str(args.jobs)])
     elif system == "xmake":
         if args.jobs:
             cmd.extend(["--jobs", str(args.jobs)])
@@ -163,18 +147,21 @@ def build_with_system(system, args, script_dir):
             cmd.extend(["--target", args.target])
 
     print(f"Building with {system.upper()}...")
-    print(f"Command: {' '.join(cmd)}")
+    print(f"Command: {format_command([script_path.name, *cmd])}")
 
-    # Execute the build script
-    result = subprocess.run(cmd)
-    return result.returncode
+    # Execute the build script in-process instead of spawning a new interpreter
+    if str(script_dir) not in sys.path:
+        sys.path.insert(0, str(script_dir))
+    module = importlib.import_module(script_path.stem)
+    return module.run(module.build_parser().parse_args(cmd))
 
 
-def main():
+def build_parser():
+    """Create the command line parser for the unified build script"""
     parser = argparse.ArgumentParser(description="QtLucide Unified Build Script")
     parser.add_argument(
         "--system",
-        choices=["cmake", "meson", "xmake"],
+        choices=BUILD_SYSTEMS,
         help="Force specific build system",
     )
     parser.add_argument(
@@ -184,31 +171,7 @@ def main():
     )
     parser.add_argument("--builddir", help="Build directory")
     parser.add_argument("--generator", help="CMake generator")
-    parser.add_argument(
-        "--examples", action="store_true", default=True, help="Build examples"
-    )
-    parser.add_argument(
-        "--no-examples",
-        dest="examples",
-        action="store_false",
-        help="Don't build examples",
-    )
-    parser.add_argument(
-        "--tests", action="store_true", default=True, help="Build tests"
-    )
-    parser.add_argument(
-        "--no-tests", dest="tests", action="store_false", help="Don't build tests"
-    )
-    parser.add_argument("--clean", action="store_true", help="Clean build first")
-    parser.add_argument("--install", action="store_true", help="Install after building")
-    parser.add_argument("--test", action="store_true", help="Run tests after building")
-    parser.add_argument(
-        "--generate-resources",
-        action="store_true",
-        help="Generate resources before building",
-    )
-    parser.add_argument("--jobs", "-j", type=int, help="Number of parallel jobs")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
+    add_common_build_args(parser)
     parser.add_argument("--target", help="Specific target to build (XMake)")
     parser.add_argument(
         "--debug-executables",
@@ -219,17 +182,26 @@ def main():
         "--list-systems", action="store_true", help="List available build systems"
     )
 
-    args = parser.parse_args()
+    return parser
+
 
+def run(args):
+    """Run the unified build with already parsed arguments"""
     script_dir = Path(__file__).parent
 
-    # List available systems if requested
-    if args.list_systems:
+    # List available systems if requested; the self-test does the same and
+    # confirms the build scripts it dispatches to can be loaded
+    if args.list_systems or args.self_test:
         print("Available build systems:")
-        for system in ["cmake", "meson", "xmake"]:
-            available = "[+]" if check_build_system_available(system) else "[-]"
-            print(f"  {available} {system.upper()}")
-        return
+        for system, available in check_all_build_systems().items():
+            print(f"  {'[+]' if available else '[-]'} {system.upper()}")
+        if args.self_test:
+            if str(script_dir) not in sys.path:
+                sys.path.insert(0, str(script_dir))
+            for system in BUILD_SYSTEMS:
+                importlib.import_module(f"build_{system}").build_parser()
+            print("OK")
+        return 0
 
     # Determine build system to use
     if args.system:
@@ -250,8 +222,11 @@ def main():
     print()
 
     # Execute build
-    exit_code = build_with_system(build_system, args, script_dir)
-    sys.exit(exit_code)
+    return build_with_system(build_system, args, script_dir)
+
+
+def main():
+    sys.exit(run(build_parser().parse_args()))
 
 
 if __name__ == "__main__":
@@ -5,80 +5,195 @@ Comprehensive build script for CMake build system
 """
 
 import argparse
-import shutil
-import subprocess
+import glob
+import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from _common import (
+    add_common_build_args,
+    check_tool,
+    cmake_build_generated,
+    discard_build_dir,
+    generate_resources,
+    memoized_which,
+    print_built_files,
+    read_cmake_cache,
+    run_command,
+    run_command_capture,
+)
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
+QT6_FINGERPRINT_FILE = ".qtlucide-configcache-fingerprint"
+QT6_DIR_CACHE = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "qtlucide"
+    / "qt6-dir"
+)
+# Qt online installer layouts, by the toolchain their kits are built with
+QT6_KIT_PATTERNS = {
+    "gcc": [
+        "/opt/Qt/*/gcc_64/lib/cmake/Qt6",
+        str(Path.home() / "Qt" / "*" / "gcc_64" / "lib" / "cmake" / "Qt6"),
+    ],
+    "macos": [str(Path.home() / "Qt" / "*" / "macos" / "lib" / "cmake" / "Qt6")],
+    "msvc": ["C:/Qt/*/msvc*/lib/cmake/Qt6"],
+    "mingw": ["C:/Qt/*/mingw*/lib/cmake/Qt6"],
+}
+# Prefixes find_package(Qt6) searches on its own, besides those on PATH
+SYSTEM_PREFIXES = ["/usr", "/usr/local", "/opt/homebrew"]
+
+
+def cmake_version():
+    """Return the installed CMake version for display"""
+    result = run_command_capture(["cmake", "--version"], check=False)
+    if result.returncode != 0:
+        return "unknown"
+    return result.stdout.split()[2]
+
+
+def cmake_cache_matches(cache_file, expected):
+    """Check whether CMakeCache.txt already holds all expected values
+
+    An expected empty value also matches an entry that is not in the cache.
+    """
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
-        if check:
-            sys.exit(1)
-        return e
-
-
-def check_cmake_installed():
-    """Check if CMake is installed"""
+        entries = read_cmake_cache(cache_file)
+    except OSError:
+        return False
+
+    return all(entries.get(name, "") == value for name, value in expected.items())
+
+
+def qt6_fingerprint(build_dir):
+    """Identify the Qt6Config.cmake a build directory was configured with"""
+    try:
+        qt6_dir = read_cmake_cache(build_dir / "CMakeCache.txt").get("Qt6_DIR")
+        if not qt6_dir:
+            return None
+        stat = (Path(qt6_dir) / "Qt6Config.cmake").stat()
+    except OSError:
+        return None
+
+    return f"{qt6_dir}\n{stat.st_mtime_ns}\n{stat.st_size}\n"
+
+
+def qt6_fingerprint_matches(build_dir):
+    """Check that Qt6 was not moved or upgraded since the last configure"""
+    current = qt6_fingerprint(build_dir)
     try:
-        result = run_command(["cmake", "--version"])
-        print(f"CMake version: {result.stdout.split()[2]}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("ERROR: CMake is not installed or not in PATH")
+        stored = (build_dir / QT6_FINGERPRINT_FILE).read_text(encoding="utf-8")
+    except OSError:
         return False
 
+    return current is not None and current == stored
+
+
+def qt6_kit_toolchain(generator=None):
+    """Name the kind of Qt kit the active toolchain can link, if it is clear"""
+    if sys.platform == "darwin":
+        return "macos"
+    if os.name != "nt":
+        return "gcc"
+    if generator and generator.startswith("Visual Studio"):
+        return "msvc"
+    if generator and ("MinGW" in generator or "MSYS" in generator):
+        return "mingw"
+
+    # Otherwise CMake uses whichever compiler it finds, so only a single
+    # compiler on PATH decides it
+    has_msvc = memoized_which("cl") is not None
+    has_mingw = memoized_which("g++") is not None
+    if has_msvc != has_mingw:
+        return "msvc" if has_msvc else "mingw"
+    return None
 
-def check_qt6_available():
-    """Check if Qt6 is available"""
+
+def system_qt6_available():
+    """Check whether find_package(Qt6) would find a Qt6 by itself"""
+    prefixes = [Path(prefix) for prefix in SYSTEM_PREFIXES]
+    for entry in os.environ.get("PATH", "").split(os.pathsep):
+        if entry and Path(entry).name in ("bin", "sbin"):
+            prefixes.append(Path(entry).parent)
+
+    for prefix in prefixes:
+        for lib_dir in ("lib", "lib64", "lib/*"):
+            if glob.glob(str(prefix / lib_dir / "cmake" / "Qt6" / "Qt6Config.cmake")):
+                return True
+    return False
+
+
+def qt6_kit_version(qt6_dir):
+    """Read the Qt version from an installer path like <root>/6.7.2/<kit>/..."""
+    version = Path(qt6_dir).parents[3].name
+    if not re.fullmatch(r"\d+(\.\d+)*", version):
+        return None
+    return tuple(int(part) for part in version.split("."))
+
+
+def resolve_qt6_dir(generator=None):
+    """Locate Qt6's CMake package directory, if there is exactly one choice
+
+    Installer kits are only used when CMake would not find a Qt6 itself,
+    and only kits for the active toolchain count. The newest Qt version
+    wins; if two kits share it, nothing is pinned.
+    """
+    candidates = []
+    if os.environ.get("Qt6_DIR"):
+        candidates.append(Path(os.environ["Qt6_DIR"]))
+    for prefix in os.environ.get("CMAKE_PREFIX_PATH", "").split(os.pathsep):
+        if prefix:
+            candidates.append(Path(prefix) / "lib" / "cmake" / "Qt6")
+    for candidate in candidates:
+        if (candidate / "Qt6Config.cmake").is_file():
+            return str(candidate)
+
+    if system_qt6_available():
+        return None
+    toolchain = qt6_kit_toolchain(generator)
+    if toolchain is None:
+        return None
+
+    kits = sorted(
+        match for pattern in QT6_KIT_PATTERNS[toolchain] for match in glob.glob(pattern)
+    )
+
+    # The cached choice holds as long as the same kits are installed
     try:
-        # Try to find Qt6 using cmake
-        result = run_command(
-            [
-                "cmake",
-                "--find-package",
-                "-DNAME=Qt6",
-                "-DCOMPILER_ID=GNU",
-                "-DLANGUAGE=CXX",
-                "-DMODE=EXIST",
-            ],
-            check=False,
+        cached = json.loads(QT6_DIR_CACHE.read_text(encoding="utf-8"))
+        if cached["toolchain"] == toolchain and cached["kits"] == kits:
+            return cached["qt6_dir"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    versions = {}
+    for kit in kits:
+        version = qt6_kit_version(kit)
+        if version is not None and (Path(kit) / "Qt6Config.cmake").is_file():
+            versions.setdefault(version, []).append(kit)
+    newest = versions[max(versions)] if versions else []
+    qt6_dir = newest[0] if len(newest) == 1 else None
+
+    try:
+        QT6_DIR_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        QT6_DIR_CACHE.write_text(
+            json.dumps({"toolchain": toolchain, "kits": kits, "qt6_dir": qt6_dir}),
+            encoding="utf-8",
         )
-        return result.returncode == 0
-    except Exception:
-        return False
+    except OSError:
+        pass
+    return qt6_dir
 
 
-def generate_resources(project_dir):
-    """Generate resources using Python script"""
-    print("Generating resources...")
-    build_script = project_dir / "tools" / "build_resources.py"
-    if build_script.exists():
-        try:
-            python_cmd = "python3" if shutil.which("python3") else "python"
-            run_command(
-                [python_cmd, str(build_script), str(project_dir)], cwd=project_dir
-            )
-            print("Resources generated successfully!")
-        except subprocess.CalledProcessError:
-            print("Warning: Resource generation failed, continuing with build...")
-    else:
-        print("Warning: Resource generation script not found")
+def find_compiler_launcher():
+    """Find a compiler cache (sccache or ccache) to use as compiler launcher"""
+    return memoized_which("sccache") or memoized_which("ccache")
 
 
-def main():
+def build_parser():
+    """Create the command line parser for this build script"""
     parser = argparse.ArgumentParser(description="Build QtLucide with CMake")
     parser.add_argument("--builddir", default="build_cmake", help="Build directory")
     parser.add_argument(
@@ -88,37 +203,26 @@ def main():
         help="Build type",
     )
     parser.add_argument(
-        "--generator", help='CMake generator (e.g., "Ninja", "Unix Makefiles")'
-    )
-    parser.add_argument(
-        "--examples", action="store_true", default=True, help="Build examples"
+        "--generator",
+        help='CMake generator (e.g., "Ninja", "Unix Makefiles"; '
+        "default: Ninja if available)",
     )
+    add_common_build_args(parser)
     parser.add_argument(
-        "--no-examples",
-        dest="examples",
+        "--no-compiler-cache",
+        dest="compiler_cache",
         action="store_false",
-        help="Don't build examples",
-    )
-    parser.add_argument(
-        "--tests", action="store_true", default=True, help="Build tests"
-    )
-    parser.add_argument(
-        "--no-tests", dest="tests", action="store_false", help="Don't build tests"
-    )
-    parser.add_argument(
-        "--clean", action="store_true", help="Clean build directory first"
+        help="Don't use sccache/ccache even if available",
     )
-    parser.add_argument("--install", action="store_true", help="Install after building")
-    parser.add_argument("--test", action="store_true", help="Run tests after building")
-    parser.add_argument(
-        "--generate-resources",
-        action="store_true",
-        help="Generate resources before building",
-    )
-    parser.add_argument("--jobs", "-j", type=int, help="Number of parallel jobs")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
-    args = parser.parse_args()
+    return parser
+
+
+def run(args):
+    """Run the build with already parsed arguments"""
+    if args.self_test:
+        print("OK")
+        return 0
 
     # Get project root directory
     script_dir = Path(__file__).parent
@@ -129,18 +233,35 @@ def main():
     print(f"Project root: {project_root}")
     print(f"Build directory: {build_dir}")
 
+    # Generate resources in the background while prerequisites are checked;
+    # configure reads the generated QRC file, so it waits for completion
+    resource_job = None
+    if args.generate_resources:
+        executor = ThreadPoolExecutor(max_workers=1)
+        resource_job = executor.submit(generate_resources, project_root)
+        executor.shutdown(wait=False)
+
     # Check prerequisites
-    if not check_cmake_installed():
+    if not check_tool("cmake", "CMake"):
         sys.exit(1)
+    if args.verbose:
+        print(f"CMake version: {cmake_version()}")
+
+    launcher = find_compiler_launcher() if args.compiler_cache else None
 
     # Clean if requested
     if args.clean and build_dir.exists():
         print("Cleaning build directory...")
-        shutil.rmtree(build_dir)
+        discard_build_dir(build_dir)
 
-    # Generate resources if requested
-    if args.generate_resources:
-        generate_resources(project_root)
+    # Prefer Ninja for fresh build directories; an existing cache keeps the
+    # generator it was configured with, since CMake refuses to switch it
+    if (
+        not args.generator
+        and not (build_dir / "CMakeCache.txt").exists()
+        and memoized_which("ninja")
+    ):
+        args.generator = "Ninja"
 
     # Create build directory
     build_dir.mkdir(exist_ok=True)
@@ -157,13 +278,61 @@ def main():
     if args.generator:
         configure_cmd.extend(["-G", args.generator])
 
-    print("Configuring...")
-    run_command(configure_cmd, cwd=build_dir)
+    # Pin Qt6 for build directories that have not located it yet, so CMake
+    # skips its search; a configured cache keeps the Qt6 it already found
+    try:
+        configured_qt6_dir = read_cmake_cache(build_dir / "CMakeCache.txt").get(
+            "Qt6_DIR", ""
+        )
+    except OSError:
+        configured_qt6_dir = ""
+    if not configured_qt6_dir or configured_qt6_dir.endswith("-NOTFOUND"):
+        qt6_dir = resolve_qt6_dir(args.generator)
+        if qt6_dir:
+            configure_cmd.append(f"-DQt6_DIR={qt6_dir}")
+
+    # Without a compiler cache, drop a launcher cached by an earlier run
+    if launcher:
+        configure_cmd.extend(
+            [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+            ]
+        )
+    else:
+        configure_cmd.extend(
+            ["-UCMAKE_C_COMPILER_LAUNCHER", "-UCMAKE_CXX_COMPILER_LAUNCHER"]
+        )
+
+    expected_cache = {
+        "CMAKE_BUILD_TYPE": args.buildtype,
+        "QTLUCIDE_BUILD_EXAMPLES": "ON" if args.examples else "OFF",
+        "QTLUCIDE_BUILD_TESTS": "ON" if args.tests else "OFF",
+    }
+    if args.generator:
+        expected_cache["CMAKE_GENERATOR"] = args.generator
+    expected_cache["CMAKE_C_COMPILER_LAUNCHER"] = launcher or ""
+    expected_cache["CMAKE_CXX_COMPILER_LAUNCHER"] = launcher or ""
+
+    if resource_job is not None:
+        resource_job.result()
+
+    if (
+        cmake_build_generated(build_dir)
+        and cmake_cache_matches(build_dir / "CMakeCache.txt", expected_cache)
+        and qt6_fingerprint_matches(build_dir)
+    ):
+        print("CMake cache is consistent, skipping configure")
+    else:
+        print("Configuring...")
+        run_command(configure_cmd, cwd=build_dir)
+        fingerprint = qt6_fingerprint(build_dir)
+        if fingerprint:
+            (build_dir / QT6_FINGERPRINT_FILE).write_text(fingerprint, encoding="utf-8")
 
     # Build
     build_cmd = ["cmake", "--build", ".", "--config", args.buildtype]
-    if args.jobs:
-        build_cmd.extend(["--parallel", str(args.jobs)])
+    build_cmd.extend(["--parallel", str(args.jobs)])
     if args.verbose:
         build_cmd.append("--verbose")
 
@@ -190,20 +359,20 @@ def main():
     print("\nBuild Summary:")
     print(f"  Build type: {args.buildtype}")
     print(f"  Generator: {args.generator or 'Default'}")
+    print(f"  Compiler cache: {launcher or 'None'}")
     print(f"  Examples: {args.examples}")
     print(f"  Tests: {args.tests}")
     print(f"  Build directory: {build_dir}")
 
     # Show built targets
     if build_dir.exists():
-        print(f"\nBuilt files in {build_dir}:")
-        for pattern in ["*.exe", "*.dll", "*.so", "*.dylib", "*.a", "*.lib"]:
-            files = list(build_dir.rglob(pattern))
-            if files:
-                for file in files[:10]:  # Show first 10 files
-                    print(f"  {file.relative_to(build_dir)}")
-                if len(files) > 10:
-                    print(f"  ... and {len(files) - 10} more files")
+        print_built_files(build_dir)
+
+    return 0
+
+
+def main():
+    sys.exit(run(build_parser().parse_args()))
 
 
 if __name__ == "__main__":
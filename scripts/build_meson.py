@@ -5,31 +5,45 @@ Equivalent to the existing CMake and XMake build scripts
 """
 
 import argparse
-import subprocess
+import json
 import sys
 from pathlib import Path
 
-
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
-        if check:
-            sys.exit(1)
-        return e
+from _common import (
+    add_common_build_args,
+    discard_build_dir,
+    generate_resources,
+    run_command,
+)
 
 
-def main():
+def meson_options_match(build_dir, expected):
+    """Check whether a configured build directory already uses the options"""
+    options_file = build_dir / "meson-info" / "intro-buildoptions.json"
+    try:
+        with open(options_file, "r", encoding="utf-8") as f:
+            current = {option["name"]: option["value"] for option in json.load(f)}
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+    # Normalize booleans and feature states to the strings passed on the CLI
+    aliases = {True: "true", False: "false", "enabled": "true", "disabled": "false"}
+    for name, value in expected.items():
+        # Options the project does not declare (debug_executables is not in
+        # meson_options.txt) never appear here, so they cannot be compared
+        if name not in current:
+            continue
+        option_value = current[name]
+        if isinstance(option_value, (bool, str)):
+            option_value = aliases.get(option_value, option_value)
+        if option_value != value:
+            return False
+
+    return True
+
+
+def build_parser():
+    """Create the command line parser for this build script"""
     parser = argparse.ArgumentParser(description="Build QtLucide with Meson")
     parser.add_argument("--builddir", default="build_meson", help="Build directory")
     parser.add_argument(
@@ -38,31 +52,19 @@ def main():
         default="debug",
         help="Build type",
     )
-    parser.add_argument(
-        "--examples", action="store_true", default=True, help="Build examples"
-    )
-    parser.add_argument(
-        "--no-examples",
-        dest="examples",
-        action="store_false",
-        help="Don't build examples",
-    )
-    parser.add_argument(
-        "--tests", action="store_true", default=True, help="Build tests"
-    )
-    parser.add_argument(
-        "--no-tests", dest="tests", action="store_false", help="Don't build tests"
-    )
+    add_common_build_args(parser)
     parser.add_argument(
         "--debug-executables", action="store_true", help="Build debug executables"
     )
-    parser.add_argument(
-        "--clean", action="store_true", help="Clean build directory first"
-    )
-    parser.add_argument("--install", action="store_true", help="Install after building")
-    parser.add_argument("--test", action="store_true", help="Run tests after building")
 
-    args = parser.parse_args()
+    return parser
+
+
+def run(args):
+    """Run the build with already parsed arguments"""
+    if args.self_test:
+        print("OK")
+        return 0
 
     # Get project root directory
     script_dir = Path(__file__).parent
@@ -76,36 +78,49 @@ def main():
     # Clean if requested
     if args.clean and build_dir.exists():
         print("Cleaning build directory...")
-        import shutil
+        discard_build_dir(build_dir)
 
-        shutil.rmtree(build_dir)
+    # Generate resources if requested
+    if args.generate_resources:
+        generate_resources(project_root)
 
     # Setup build directory
+    options = {
+        "examples": str(args.examples).lower(),
+        "tests": str(args.tests).lower(),
+        "debug_executables": str(args.debug_executables).lower(),
+    }
     setup_cmd = [
         "meson",
         "setup",
         str(build_dir),
         f"--buildtype={args.buildtype}",
-        f"-Dexamples={str(args.examples).lower()}",
-        f"-Dtests={str(args.tests).lower()}",
-        f"-Ddebug_executables={str(args.debug_executables).lower()}",
-    ]
+    ] + [f"-D{name}={value}" for name, value in options.items()]
 
     if not build_dir.exists():
         print("Setting up build directory...")
         run_command(setup_cmd, cwd=project_root)
+    elif meson_options_match(build_dir, {"buildtype": args.buildtype, **options}):
+        print("Build options unchanged, skipping reconfigure")
     else:
         print("Build directory exists, reconfiguring...")
         run_command(["meson", "configure"] + setup_cmd[3:], cwd=build_dir)
 
     # Build
+    compile_cmd = ["meson", "compile", "-j", str(args.jobs)]
+    if args.verbose:
+        compile_cmd.append("-v")
+
     print("Building...")
-    run_command(["meson", "compile"], cwd=build_dir)
+    run_command(compile_cmd, cwd=build_dir)
 
     # Run tests if requested
     if args.test and args.tests:
         print("Running tests...")
-        run_command(["meson", "test"], cwd=build_dir, check=False)
+        test_cmd = ["meson", "test"]
+        if args.verbose:
+            test_cmd.append("--verbose")
+        run_command(test_cmd, cwd=build_dir, check=False)
 
     # Install if requested
     if args.install:
@@ -122,6 +137,12 @@ def main():
     print(f"  Debug executables: {args.debug_executables}")
     print(f"  Build directory: {build_dir}")
 
+    return 0
+
+
+def main():
+    sys.exit(run(build_parser().parse_args()))
+
 
 if __name__ == "__main__":
     main()
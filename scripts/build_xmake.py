@@ -5,75 +5,46 @@ Comprehensive build script for XMake build system
 """
 
 import argparse
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 
+from _common import (
+    add_common_build_args,
+    check_tool,
+    print_built_files,
+    run_command,
+    run_command_capture,
+)
+from _common import generate_resources as generate_resources_in_process
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(result.stdout)
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Error running command: {e}")
-        if e.stderr:
-            print(f"Error output: {e.stderr}")
-        if check:
-            sys.exit(1)
-        return e
-
-
-def check_xmake_installed():
-    """Check if XMake is installed"""
-    try:
-        result = run_command(["xmake", "--version"])
-        print(f"XMake version: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("ERROR: XMake is not installed or not in PATH")
-        return False
-
-
-def check_qt6_available():
-    """Check if Qt6 is available"""
-    try:
-        # Try to find Qt6 using xmake
-        result = run_command(["xmake", "require", "--info", "qt6base"], check=False)
-        return result.returncode == 0
-    except Exception:
-        return False
+
+def xmake_version():
+    """Return the installed XMake version for display"""
+    result = run_command_capture(["xmake", "--version"], check=False)
+    if result.returncode != 0:
+        return "unknown"
+    return result.stdout.strip()
 
 
 def generate_resources(project_dir):
     """Generate resources using XMake task"""
     print("Generating resources...")
-    try:
-        run_command(["xmake", "generate-resources"], cwd=project_dir)
+    result = run_command(["xmake", "generate-resources"], cwd=project_dir, check=False)
+    if result.returncode == 0:
         print("Resources generated successfully!")
-    except subprocess.CalledProcessError:
-        print("Warning: Resource generation failed, trying Python script...")
-        build_script = project_dir / "tools" / "build_resources.py"
-        if build_script.exists():
-            try:
-                python_cmd = "python3" if shutil.which("python3") else "python"
-                run_command(
-                    [python_cmd, str(build_script), str(project_dir)], cwd=project_dir
-                )
-                print("Resources generated successfully using Python script!")
-            except subprocess.CalledProcessError:
-                print("Warning: Resource generation failed, continuing with build...")
-        else:
-            print("Warning: Resource generation script not found")
+        return
+    print("Warning: Resource generation failed, trying Python script...")
+    generate_resources_in_process(project_dir)
 
 
-def main():
+def find_output_dirs(build_root, args):
+    """Find the XMake output directories for the configured mode"""
+    pattern = f"{args.plat or '*'}/{args.arch or '*'}/{args.mode}"
+    return sorted(path for path in build_root.glob(pattern) if path.is_dir())
+
+
+def build_parser():
+    """Create the command line parser for this build script"""
     parser = argparse.ArgumentParser(description="Build QtLucide with XMake")
     parser.add_argument(
         "--mode",
@@ -83,35 +54,18 @@ def main():
     )
     parser.add_argument("--arch", help="Target architecture (e.g., x86_64, x86)")
     parser.add_argument("--plat", help="Target platform (e.g., windows, linux, macosx)")
-    parser.add_argument(
-        "--examples", action="store_true", default=True, help="Build examples"
-    )
-    parser.add_argument(
-        "--no-examples",
-        dest="examples",
-        action="store_false",
-        help="Don't build examples",
-    )
-    parser.add_argument(
-        "--tests", action="store_true", default=True, help="Build tests"
-    )
-    parser.add_argument(
-        "--no-tests", dest="tests", action="store_false", help="Don't build tests"
-    )
-    parser.add_argument("--clean", action="store_true", help="Clean build first")
+    add_common_build_args(parser)
     parser.add_argument("--rebuild", action="store_true", help="Rebuild all targets")
-    parser.add_argument("--install", action="store_true", help="Install after building")
-    parser.add_argument("--test", action="store_true", help="Run tests after building")
-    parser.add_argument(
-        "--generate-resources",
-        action="store_true",
-        help="Generate resources before building",
-    )
-    parser.add_argument("--jobs", "-j", type=int, help="Number of parallel jobs")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
     parser.add_argument("--target", help="Specific target to build")
 
-    args = parser.parse_args()
+    return parser
+
+
+def run(args):
+    """Run the build with already parsed arguments"""
+    if args.self_test:
+        print("OK")
+        return 0
 
     # Get project root directory
     script_dir = Path(__file__).parent
@@ -121,8 +75,10 @@ def main():
     print(f"Project root: {project_root}")
 
     # Check prerequisites
-    if not check_xmake_installed():
+    if not check_tool("xmake", "XMake"):
         sys.exit(1)
+    if args.verbose:
+        print(f"XMake version: {xmake_version()}")
 
     # Check if xmake.lua exists
     xmake_file = project_root / "xmake.lua"
@@ -167,8 +123,7 @@ def main():
     if args.target:
         build_cmd.append(args.target)
 
-    if args.jobs:
-        build_cmd.extend(["-j", str(args.jobs)])
+    build_cmd.extend(["-j", str(args.jobs)])
 
     if args.verbose:
         build_cmd.append("-v")
@@ -179,11 +134,10 @@ def main():
     # Run tests if requested
     if args.test and args.tests:
         print("Running tests...")
-        try:
-            run_command(
-                ["xmake", "run", "QtLucideTests"], cwd=project_root, check=False
-            )
-        except subprocess.CalledProcessError:
+        result = run_command(
+            ["xmake", "run", "QtLucideTests"], cwd=project_root, check=False
+        )
+        if result.returncode != 0:
             print("Tests failed or test target not found")
 
     # Install if requested
@@ -201,17 +155,15 @@ def main():
     print(f"  Examples: {args.examples}")
     print(f"  Tests: {args.tests}")
 
-    # Show built targets
-    build_dir = project_root / "build"
-    if build_dir.exists():
-        print(f"\nBuilt files in {build_dir}:")
-        for pattern in ["*.exe", "*.dll", "*.so", "*.dylib", "*.a", "*.lib"]:
-            files = list(build_dir.rglob(pattern))
-            if files:
-                for file in files[:10]:  # Show first 10 files
-                    print(f"  {file.relative_to(build_dir)}")
-                if len(files) > 10:
-                    print(f"  ... and {len(files) - 10} more files")
+    # Show built targets, only from this run's build/<plat>/<arch>/<mode>
+    for build_dir in find_output_dirs(project_root / "build", args):
+        print_built_files(build_dir)
+
+    return 0
+
+
+def main():
+    sys.exit(run(build_parser().parse_args()))
 
 
 if __name__ == "__main__":
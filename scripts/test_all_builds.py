@@ -3,69 +3,68 @@
 Test script to verify all QtLucide build systems are working
 """
 
-import subprocess
+import importlib.util
+import os
 import sys
-from pathlib import Path
+from dataclasses import dataclass
+from typing import List, Tuple
 
+from _common import memoized_which
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(f"STDOUT: {result.stdout}")
-        if result.stderr:
-            print(f"STDERR: {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed with exit code {e.returncode}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        if check:
-            raise
-        return e
-    except FileNotFoundError:
-        print(f"Command not found: {cmd[0]}")
-        return None
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+SCRIPTS_TO_TEST = [
+    (os.path.join(SCRIPT_DIR, "build_cmake.py"), "CMake"),
+    (os.path.join(SCRIPT_DIR, "build_meson.py"), "Meson"),
+    (os.path.join(SCRIPT_DIR, "build_xmake.py"), "XMake"),
+]
+UNIFIED_SCRIPT = os.path.join(SCRIPT_DIR, "build.py")
 
 
 def check_build_system(system):
-    """Check if a build system is available"""
-    commands = {
-        "cmake": ["cmake", "--version"],
-        "meson": ["meson", "--version"],
-        "xmake": ["xmake", "--version"],
-    }
-
-    if system not in commands:
+    """Check if a build system is available on PATH"""
+    if system not in ("cmake", "meson", "xmake"):
         return False
 
-    result = run_command(commands[system], check=False)
-    return result is not None and result.returncode == 0
+    return memoized_which(system) is not None
+
+
+def load_script(script_path):
+    """Load a build script as a module without running its main()"""
+    name = os.path.splitext(os.path.basename(script_path))[0]
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.spec_from_file_location(name, script_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_self_test(script_path):
+    """Run a build script's --self-test in-process through its own parser"""
+    module = load_script(script_path)
+    try:
+        return module.run(module.build_parser().parse_args(["--self-test"])) == 0
+    except SystemExit as e:
+        # argparse exits on invalid options
+        return e.code in (0, None)
 
 
 def test_build_script(script_path, system_name):
-    """Test a build script with --help option"""
+    """Test a build script with its --self-test option"""
     print(f"\n=== Testing {system_name} Build Script ===")
 
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         print(f"[-] Script not found: {script_path}")
         return False
 
     try:
-        # Test help option
-        result = run_command(["python3", str(script_path), "--help"], check=False)
-        if result is None:
-            result = run_command(["python", str(script_path), "--help"], check=False)
-
-        if result and result.returncode == 0:
-            print(f"[+] {system_name} script help works")
+        if run_self_test(script_path):
+            print(f"[+] {system_name} script self-test works")
             return True
         else:
-            print(f"[-] {system_name} script help failed")
+            print(f"[-] {system_name} script self-test failed")
             return False
     except Exception as e:
         print(f"[-] {system_name} script test failed: {e}")
@@ -76,59 +75,89 @@ def test_unified_script(script_path):
     """Test the unified build script"""
     print("\n=== Testing Unified Build Script ===")
 
-    if not script_path.exists():
+    if not os.path.exists(script_path):
         print(f"[-] Unified script not found: {script_path}")
         return False
 
     try:
-        # Test list systems option
-        result = run_command(
-            ["python3", str(script_path), "--list-systems"], check=False
-        )
-        if result is None:
-            result = run_command(
-                ["python", str(script_path), "--list-systems"], check=False
-            )
-
-        if result and result.returncode == 0:
-            print("[+] Unified script --list-systems works")
-
-            # Test help option
-            result = run_command(["python3", str(script_path), "--help"], check=False)
-            if result is None:
-                result = run_command(
-                    ["python", str(script_path), "--help"], check=False
-                )
-
-            if result and result.returncode == 0:
-                print("[+] Unified script help works")
-                return True
-            else:
-                print("[-] Unified script help failed")
-                return False
+        # The self-test lists the build systems and loads each build script
+        if run_self_test(script_path):
+            print("[+] Unified script self-test works")
+            return True
         else:
-            print("[-] Unified script --list-systems failed")
+            print("[-] Unified script self-test failed")
             return False
     except Exception as e:
         print(f"[-] Unified script test failed: {e}")
         return False
 
 
+@dataclass
+class Summary:
+    """Collected results, rendered as the final report"""
+
+    systems: List[str]
+    scripts: List[Tuple[str, bool]]
+    unified: bool
+    batches: List[Tuple[str, bool]]
+    readme: bool
+
+    @property
+    def passed(self):
+        """Whether every check succeeded"""
+        return bool(
+            self.systems
+            and all(result for _, result in self.scripts)
+            and self.unified
+            and all(result for _, result in self.batches)
+            and self.readme
+        )
+
+    def render(self):
+        """Build the whole summary as one string"""
+
+        def mark(ok):
+            return "[+]" if ok else "[-]"
+
+        lines = ["", "=" * 40, "TEST SUMMARY", "=" * 40]
+        lines.append(f"Available build systems: {len(self.systems)}/3")
+        lines.extend(f"  [+] {system.upper()}" for system in self.systems)
+
+        passed_scripts = sum(1 for _, result in self.scripts if result)
+        lines.append(f"\nBuild scripts: {passed_scripts}/{len(self.scripts)}")
+        lines.extend(f"  {mark(result)} {name}" for name, result in self.scripts)
+
+        lines.append(f"\nUnified script: {mark(self.unified)}")
+
+        passed_batches = sum(1 for _, result in self.batches if result)
+        lines.append(f"\nBatch files: {passed_batches}/{len(self.batches)}")
+        lines.extend(f"  {mark(result)} {name}" for name, result in self.batches)
+
+        lines.append(f"\nDocumentation: {mark(self.readme)} README.md")
+
+        if self.passed:
+            lines.append("\n[SUCCESS] ALL TESTS PASSED!")
+            lines.append("QtLucide build scripts are ready to use.")
+        else:
+            lines.append("\n[FAILED] SOME TESTS FAILED!")
+            lines.append("Please check the issues above.")
+        return "\n".join(lines) + "\n"
+
+
 def main():
     """Main test function"""
     print("QtLucide Build Scripts Test")
     print("=" * 40)
 
-    script_dir = Path(__file__).parent
-    project_root = script_dir.parent
+    print(f"Script directory: {SCRIPT_DIR}")
+    print(f"Project root: {os.path.dirname(SCRIPT_DIR)}")
 
-    print(f"Script directory: {script_dir}")
-    print(f"Project root: {project_root}")
+    systems = ["cmake", "meson", "xmake"]
 
     # Check available build systems
     print("\n=== Checking Build Systems ===")
     available_systems = []
-    for system in ["cmake", "meson", "xmake"]:
+    for system in systems:
         if check_build_system(system):
             print(f"[+] {system.upper()} is available")
             available_systems.append(system)
@@ -141,28 +170,25 @@ def main():
 
     # Test individual build scripts
     print("\n=== Testing Individual Build Scripts ===")
-    scripts_to_test = [
-        (script_dir / "build_cmake.py", "CMake"),
-        (script_dir / "build_meson.py", "Meson"),
-        (script_dir / "build_xmake.py", "XMake"),
-    ]
-
     script_results = []
-    for script_path, system_name in scripts_to_test:
+    for script_path, system_name in SCRIPTS_TO_TEST:
         result = test_build_script(script_path, system_name)
         script_results.append((system_name, result))
 
     # Test unified build script
-    unified_result = test_unified_script(script_dir / "build.py")
+    unified_result = test_unified_script(UNIFIED_SCRIPT)
 
     # Test batch files exist (Windows)
     print("\n=== Checking Batch Files ===")
     batch_files = ["build.bat", "build_cmake.bat", "build_meson.bat", "build_xmake.bat"]
 
+    # List the script directory once instead of checking each file
+    with os.scandir(SCRIPT_DIR) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+
     batch_results = []
     for batch_file in batch_files:
-        batch_path = script_dir / batch_file
-        if batch_path.exists():
+        if batch_file in present:
             print(f"[+] {batch_file} exists")
             batch_results.append(True)
         else:
@@ -170,56 +196,21 @@ def main():
             batch_results.append(False)
 
     # Check README exists
-    readme_path = script_dir / "README.md"
-    readme_exists = readme_path.exists()
+    readme_exists = "README.md" in present
     if readme_exists:
         print("[+] README.md exists")
     else:
         print("[-] README.md missing")
 
-    # Summary
-    print("\n" + "=" * 40)
-    print("TEST SUMMARY")
-    print("=" * 40)
-
-    print(f"Available build systems: {len(available_systems)}/3")
-    for system in available_systems:
-        print(f"  [+] {system.upper()}")
-
-    print(
-        f"\nBuild scripts: {sum(1 for _, result in script_results if result)}/{len(script_results)}"
+    summary = Summary(
+        systems=available_systems,
+        scripts=script_results,
+        unified=unified_result,
+        batches=list(zip(batch_files, batch_results)),
+        readme=readme_exists,
     )
-    for system_name, result in script_results:
-        status = "[+]" if result else "[-]"
-        print(f"  {status} {system_name}")
-
-    print(f"\nUnified script: {'[+]' if unified_result else '[-]'}")
-
-    print(f"\nBatch files: {sum(batch_results)}/{len(batch_results)}")
-    for i, batch_file in enumerate(batch_files):
-        status = "[+]" if batch_results[i] else "[-]"
-        print(f"  {status} {batch_file}")
-
-    print(f"\nDocumentation: {'[+]' if readme_exists else '[-]'} README.md")
-
-    # Overall result
-    all_scripts_ok = all(result for _, result in script_results)
-    all_batch_ok = all(batch_results)
-
-    if (
-        available_systems
-        and all_scripts_ok
-        and unified_result
-        and all_batch_ok
-        and readme_exists
-    ):
-        print("\n[SUCCESS] ALL TESTS PASSED!")
-        print("QtLucide build scripts are ready to use.")
-        return 0
-    else:
-        print("\n[FAILED] SOME TESTS FAILED!")
-        print("Please check the issues above.")
-        return 1
+    sys.stdout.write(summary.render())
+    return 0 if summary.passed else 1
 
 
 if __name__ == "__main__":
@@ -4,40 +4,36 @@ Test script to verify QtLucide submodule integration works correctly.
 This script creates a temporary test project and builds it with QtLucide as a submodule.
 """
 
+import contextlib
+import os
 import shutil
+import string
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+from _common import (
+    PrefixedOutput,
+    format_command,
+    ignore_root_dirs,
+    load_resource_builder,
+    memoized_which,
+    stream_command,
+)
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result."""
-    print(f"Running: {' '.join(cmd)}")
-    try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
-        )
-        if result.stdout:
-            print(f"STDOUT: {result.stdout}")
-        if result.stderr:
-            print(f"STDERR: {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed with return code {e.returncode}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        raise
-
-
-def create_test_cmake_project(test_dir, qtlucide_path):
-    """Create a test CMake project that uses QtLucide as submodule."""
+JOBS = str(os.cpu_count() or 1)
 
-    # Convert path to use forward slashes for CMake
-    qtlucide_cmake_path = str(qtlucide_path).replace("\\", "/")
+# Resource files the build regenerates inside the QtLucide source tree
+GENERATED_FILES = (
+    "include/QtLucide/QtLucideEnums.h",
+    "include/QtLucide/QtLucideStrings.h",
+    "resources/icons/lucide_icons.qrc",
+)
+GENERATED_DIRS = ("resources/icons/metadata",)
 
-    # Create CMakeLists.txt
-    cmake_content = f"""cmake_minimum_required(VERSION 3.16)
+CMAKE_TEMPLATE = string.Template("""cmake_minimum_required(VERSION 3.16)
 project(QtLucideSubmoduleTest VERSION 1.0.0 LANGUAGES CXX)
 
 set(CMAKE_CXX_STANDARD 17)
@@ -50,7 +46,7 @@ find_package(Qt6 REQUIRED COMPONENTS Core Gui Widgets)
 qt6_standard_project_setup()
 
 # Add QtLucide as subdirectory (simulating submodule)
-add_subdirectory("{qtlucide_cmake_path}" QtLucide)
+add_subdirectory("$qtlucide_path" QtLucide)
 
 # Create test executable
 add_executable(SubmoduleTest main.cpp)
@@ -61,63 +57,9 @@ target_link_libraries(SubmoduleTest PRIVATE
     Qt6::Widgets
     QtLucide::QtLucide
 )
-"""
-
-    with open(test_dir / "CMakeLists.txt", "w") as f:
-        f.write(cmake_content)
-
-    # Create main.cpp
-    main_content = """#include <QApplication>
-#include <QMainWindow>
-#include <QLabel>
-#include <QVBoxLayout>
-#include <QWidget>
-#include <QIcon>
-#include <QDebug>
-#include <QtLucide/QtLucide.h>
-
-int main(int argc, char *argv[])
-{
-    QApplication app(argc, argv);
+""")
 
-    QMainWindow window;
-    QWidget *central = new QWidget(&window);
-    QVBoxLayout *layout = new QVBoxLayout(central);
-
-    // Test QtLucide integration
-    QLabel *label = new QLabel("QtLucide Submodule Test", central);
-    layout->addWidget(label);
-
-    // Try to create an icon to verify QtLucide works
-    lucide::QtLucide qtlucide;
-    QIcon icon = qtlucide.icon(lucide::Icons::save);
-    if (!icon.isNull()) {
-        label->setText("QtLucide Submodule Test - SUCCESS!");
-        qDebug() << "QtLucide icon created successfully";
-    } else {
-        label->setText("QtLucide Submodule Test - FAILED!");
-        qDebug() << "Failed to create QtLucide icon";
-        return 1;
-    }
-
-    window.setCentralWidget(central);
-    window.resize(300, 200);
-
-    // Don't show window in test mode, just verify it works
-    qDebug() << "Test completed successfully";
-    return 0;
-}
-"""
-
-    with open(test_dir / "main.cpp", "w") as f:
-        f.write(main_content)
-
-
-def create_test_meson_project(test_dir, qtlucide_path):
-    """Create a test Meson project that uses QtLucide as subproject."""
-
-    # Create meson.build
-    meson_content = """project('QtLucideSubmoduleTest', 'cpp',
+MESON_TEMPLATE = """project('QtLucideSubmoduleTest', 'cpp',
   version: '1.0.0',
   default_options: ['cpp_std=c++17']
 )
@@ -136,28 +78,45 @@ executable('SubmoduleTest',
 )
 """
 
-    with open(test_dir / "meson.build", "w") as f:
-        f.write(meson_content)
-
-    # Create subprojects directory and wrap file
-    subprojects_dir = test_dir / "subprojects"
-    subprojects_dir.mkdir()
-
-    # Create a simple wrap file pointing to QtLucide
-    wrap_content = f"""[wrap-file]
+MESON_WRAP_TEMPLATE = string.Template("""[wrap-file]
 directory = QtLucide
-source_url = file://{qtlucide_path.absolute()}
+source_url = file://$qtlucide_path
 source_filename = QtLucide
-"""
+""")
 
-    with open(subprojects_dir / "QtLucide.wrap", "w") as f:
-        f.write(wrap_content)
+XMAKE_TEMPLATE = string.Template("""-- Test project for QtLucide submodule integration
+set_project("QtLucideSubmoduleTest")
+set_version("1.0.0")
+set_languages("cxx17")
 
-    # Copy QtLucide to subprojects (simulating subproject)
-    shutil.copytree(qtlucide_path, subprojects_dir / "QtLucide")
+-- Reuse objects from earlier runs when ccache is installed
+set_policy("build.ccache", true)
+
+-- Add Qt6 packages
+add_requires("qt6base")
+
+-- Include QtLucide as submodule
+includes("$qtlucide_path")
 
-    # Create main.cpp in test directory
-    main_content = """#include <QApplication>
+-- Test executable
+target("SubmoduleTest")
+    set_kind("binary")
+    add_packages("qt6base")
+    add_rules("qt.application")
+
+    -- Set C++ standard
+    set_languages("cxx17")
+
+    add_files("main.cpp")
+    add_deps("QtLucide")
+
+    -- Set as console application for testing
+    set_kind("binary")
+target_end()
+""")
+
+# Test program shared by all build systems, parametrized by its title
+MAIN_CPP_TEMPLATE = string.Template("""#include <QApplication>
 #include <QMainWindow>
 #include <QLabel>
 #include <QVBoxLayout>
@@ -175,17 +134,17 @@ int main(int argc, char *argv[])
     QVBoxLayout *layout = new QVBoxLayout(central);
 
     // Test QtLucide integration
-    QLabel *label = new QLabel("QtLucide Meson Subproject Test", central);
+    QLabel *label = new QLabel("$title", central);
     layout->addWidget(label);
 
     // Try to create an icon to verify QtLucide works
     lucide::QtLucide qtlucide;
     QIcon icon = qtlucide.icon(lucide::Icons::save);
     if (!icon.isNull()) {
-        label->setText("QtLucide Meson Subproject Test - SUCCESS!");
+        label->setText("$title - SUCCESS!");
         qDebug() << "QtLucide icon created successfully";
     } else {
-        label->setText("QtLucide Meson Subproject Test - FAILED!");
+        label->setText("$title - FAILED!");
         qDebug() << "Failed to create QtLucide icon";
         return 1;
     }
@@ -197,17 +156,99 @@ int main(int argc, char *argv[])
     qDebug() << "Test completed successfully";
     return 0;
 }
-"""
+""")
+
+
+def run_command(cmd, cwd=None, check=True):
+    """Run a command, streaming its output, and return the result."""
+    print(f"Running: {format_command(cmd)}")
+    result = stream_command(cmd, cwd=cwd)
+    if result.returncode != 0:
+        print(f"Command failed with return code {result.returncode}")
+        if check:
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout)
+    return result
+
+
+def scratch_root():
+    """Prefer RAM-backed /dev/shm for scratch builds when it has room."""
+    if os.path.isdir("/dev/shm") and shutil.disk_usage("/dev/shm").free > 1 << 30:
+        return "/dev/shm"
+    return None
+
+
+def link_source_tree(src, dest):
+    """Mirror a source tree without copying the contents of its inputs."""
+    # Build trees and caches only live at the top of the source tree
+    ignore = ignore_root_dirs(
+        src, ".git", "build", "build_*", ".xmake", ".verify-cache*"
+    )
+
+    # The subproject build writes these; they are copied so that nothing it
+    # writes can land in the real checkout through a shared inode
+    src = os.path.abspath(src)
+    generated_files = {os.path.normpath(os.path.join(src, p)) for p in GENERATED_FILES}
+    generated_dirs = {os.path.normpath(os.path.join(src, p)) for p in GENERATED_DIRS}
+
+    def link_input(source, destination):
+        source = os.path.abspath(source)
+        if source in generated_files or os.path.dirname(source) in generated_dirs:
+            return shutil.copy2(source, destination)
+        return os.link(source, destination)
+
+    # Hardlinks can't cross filesystems, and a symlink to the whole tree
+    # would share the generated files too, so otherwise copy everything
+    if os.stat(src).st_dev == os.stat(os.path.dirname(dest)).st_dev:
+        try:
+            shutil.copytree(src, dest, copy_function=link_input, ignore=ignore)
+            return
+        except (OSError, shutil.Error):
+            shutil.rmtree(dest, ignore_errors=True)
+
+    shutil.copytree(src, dest, ignore=ignore)
 
-    with open(test_dir / "main.cpp", "w") as f:
-        f.write(main_content)
 
+def create_test_cmake_project(test_dir, qtlucide_path):
+    """Create a test CMake project that uses QtLucide as submodule."""
+
+    # Convert path to use forward slashes for CMake
+    qtlucide_cmake_path = str(qtlucide_path).replace("\\", "/")
+
+    (test_dir / "CMakeLists.txt").write_text(
+        CMAKE_TEMPLATE.substitute(qtlucide_path=qtlucide_cmake_path)
+    )
+    (test_dir / "main.cpp").write_text(
+        MAIN_CPP_TEMPLATE.substitute(title="QtLucide Submodule Test")
+    )
 
-def test_cmake_build(qtlucide_path):
+
+def create_test_meson_project(test_dir, qtlucide_path):
+    """Create a test Meson project that uses QtLucide as subproject."""
+
+    (test_dir / "meson.build").write_text(MESON_TEMPLATE)
+
+    # Create subprojects directory and wrap file
+    subprojects_dir = test_dir / "subprojects"
+    subprojects_dir.mkdir()
+
+    # Create a simple wrap file pointing to QtLucide
+    (subprojects_dir / "QtLucide.wrap").write_text(
+        MESON_WRAP_TEMPLATE.substitute(qtlucide_path=qtlucide_path.absolute())
+    )
+
+    # Mirror QtLucide into subprojects (simulating subproject)
+    link_source_tree(qtlucide_path, subprojects_dir / "QtLucide")
+
+    (test_dir / "main.cpp").write_text(
+        MAIN_CPP_TEMPLATE.substitute(title="QtLucide Meson Subproject Test")
+    )
+
+
+def test_cmake_build(qtlucide_path, jobs=JOBS):
     """Test CMake submodule build."""
     print("\n=== Testing CMake Submodule Build ===")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=scratch_root()) as temp_dir:
         test_dir = Path(temp_dir) / "cmake_test"
         test_dir.mkdir()
 
@@ -218,19 +259,30 @@ def test_cmake_build(qtlucide_path):
         build_dir.mkdir()
 
         # Configure
-        run_command(["cmake", "..", "-DCMAKE_BUILD_TYPE=Release"], cwd=build_dir)
+        configure_cmd = ["cmake", "..", "-DCMAKE_BUILD_TYPE=Release"]
+        if memoized_which("ninja"):
+            configure_cmd.extend(["-G", "Ninja"])
+        launcher = memoized_which("sccache") or memoized_which("ccache")
+        if launcher:
+            configure_cmd.extend(
+                [
+                    f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                    f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+                ]
+            )
+        run_command(configure_cmd, cwd=build_dir)
 
         # Build
-        run_command(["cmake", "--build", "."], cwd=build_dir)
+        run_command(["cmake", "--build", ".", "--parallel", jobs], cwd=build_dir)
 
         print("CMake submodule build: SUCCESS")
 
 
-def test_meson_build(qtlucide_path):
+def test_meson_build(qtlucide_path, jobs=JOBS):
     """Test Meson subproject build."""
     print("\n=== Testing Meson Subproject Build ===")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=scratch_root()) as temp_dir:
         test_dir = Path(temp_dir) / "meson_test"
         test_dir.mkdir()
 
@@ -241,23 +293,23 @@ def test_meson_build(qtlucide_path):
         run_command(["meson", "setup", str(build_dir)], cwd=test_dir)
 
         # Build
-        run_command(["meson", "compile"], cwd=build_dir)
+        run_command(["meson", "compile", "-j", jobs], cwd=build_dir)
 
         print("Meson subproject build: SUCCESS")
 
 
-def test_xmake_build(qtlucide_path):
+def test_xmake_build(qtlucide_path, jobs=JOBS):
     """Test XMake submodule build."""
     print("\n=== Testing XMake Submodule Build ===")
 
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=scratch_root()) as temp_dir:
         test_dir = Path(temp_dir) / "xmake_test"
         test_dir.mkdir()
 
         create_test_xmake_project(test_dir, qtlucide_path)
 
         # Build
-        run_command(["xmake"], cwd=test_dir)
+        run_command(["xmake", "build", "-j", jobs], cwd=test_dir)
 
         print("XMake submodule build: SUCCESS")
 
@@ -268,83 +320,25 @@ def create_test_xmake_project(test_dir, qtlucide_path):
     # Convert path to use forward slashes for XMake
     qtlucide_xmake_path = str(qtlucide_path).replace("\\", "/")
 
-    # Create xmake.lua
-    xmake_content = f"""-- Test project for QtLucide submodule integration
-set_project("QtLucideSubmoduleTest")
-set_version("1.0.0")
-set_languages("cxx17")
-
--- Add Qt6 packages
-add_requires("qt6base")
-
--- Include QtLucide as submodule
-includes("{qtlucide_xmake_path}")
+    (test_dir / "xmake.lua").write_text(
+        XMAKE_TEMPLATE.substitute(qtlucide_path=qtlucide_xmake_path)
+    )
+    (test_dir / "main.cpp").write_text(
+        MAIN_CPP_TEMPLATE.substitute(title="QtLucide XMake Submodule Test")
+    )
 
--- Test executable
-target("SubmoduleTest")
-    set_kind("binary")
-    add_packages("qt6base")
-    add_rules("qt.application")
 
-    -- Set C++ standard
-    set_languages("cxx17")
-
-    add_files("main.cpp")
-    add_deps("QtLucide")
-
-    -- Set as console application for testing
-    set_kind("binary")
-target_end()
-"""
-
-    with open(test_dir / "xmake.lua", "w") as f:
-        f.write(xmake_content)
-
-    # Create main.cpp
-    main_content = """#include <QApplication>
-#include <QMainWindow>
-#include <QLabel>
-#include <QVBoxLayout>
-#include <QWidget>
-#include <QIcon>
-#include <QDebug>
-#include <QtLucide/QtLucide.h>
-
-int main(int argc, char *argv[])
-{
-    QApplication app(argc, argv);
-
-    QMainWindow window;
-    QWidget *central = new QWidget(&window);
-    QVBoxLayout *layout = new QVBoxLayout(central);
-
-    // Test QtLucide integration
-    QLabel *label = new QLabel("QtLucide XMake Submodule Test", central);
-    layout->addWidget(label);
-
-    // Try to create an icon to verify QtLucide works
-    lucide::QtLucide qtlucide;
-    QIcon icon = qtlucide.icon(lucide::Icons::save);
-    if (!icon.isNull()) {
-        label->setText("QtLucide XMake Submodule Test - SUCCESS!");
-        qDebug() << "QtLucide icon created successfully";
-    } else {
-        label->setText("QtLucide XMake Submodule Test - FAILED!");
-        qDebug() << "Failed to create QtLucide icon";
-        return 1;
-    }
-
-    window.setCentralWidget(central);
-    window.resize(300, 200);
-
-    // Don't show window in test mode, just verify it works
-    qDebug() << "Test completed successfully";
-    return 0;
-}
-"""
-
-    with open(test_dir / "main.cpp", "w") as f:
-        f.write(main_content)
+def run_build_test(name, test_func, qtlucide_path, jobs):
+    """Run one build test in a worker, labelling its output, and return its error."""
+    output = PrefixedOutput(f"[{name}] ")
+    error = None
+    with contextlib.redirect_stdout(output):
+        try:
+            test_func(qtlucide_path, jobs)
+        except Exception as e:
+            error = str(e)
+    output.close()
+    return error
 
 
 def main():
@@ -363,32 +357,50 @@ def main():
 
     print(f"QtLucide path: {qtlucide_path}")
 
-    try:
-        # Test CMake build
-        test_cmake_build(qtlucide_path)
-
-        # Test Meson build (if meson is available)
-        try:
-            run_command(["meson", "--version"], check=True)
-            test_meson_build(qtlucide_path)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("Meson not available, skipping Meson test")
-
-        # Test XMake build (if xmake is available)
-        try:
-            run_command(["xmake", "--version"], check=True)
-            test_xmake_build(qtlucide_path)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print("XMake not available, skipping XMake test")
-
-        print("\n" + "=" * 40)
-        print("All submodule integration tests PASSED!")
-        return 0
+    # Each build regenerates resources in the shared source tree when they
+    # are out of date; generate them once up front, so the parallel builds
+    # find them current instead of rewriting them under each other
+    builder_class = load_resource_builder(qtlucide_path)
+    if builder_class is not None and not builder_class(qtlucide_path).build_all():
+        print("Error: Resource generation failed")
+        return 1
 
-    except Exception as e:
-        print(f"\nTest FAILED: {e}")
+    build_tests = [("CMake", test_cmake_build)]
+    for tool, name, test_func in [
+        ("meson", "Meson", test_meson_build),
+        ("xmake", "XMake", test_xmake_build),
+    ]:
+        if memoized_which(tool):
+            build_tests.append((name, test_func))
+        else:
+            print(f"{name} not available, skipping {name} test")
+
+    # The builds are independent, so run them side by side; each worker
+    # streams its output with every line labelled, and they share the
+    # CPUs instead of each running a job per CPU
+    failures = []
+    build_jobs = str(max(1, int(JOBS) // len(build_tests)))
+    with ProcessPoolExecutor(max_workers=len(build_tests)) as executor:
+        jobs = {
+            executor.submit(
+                run_build_test, name, test_func, qtlucide_path, build_jobs
+            ): name
+            for name, test_func in build_tests
+        }
+        for job in as_completed(jobs):
+            error = job.result()
+            if error is not None:
+                print(f"\n{jobs[job]} test FAILED: {error}")
+                failures.append(jobs[job])
+
+    if failures:
+        print(f"\nTest FAILED: {', '.join(failures)}")
         return 1
 
+    print("\n" + "=" * 40)
+    print("All submodule integration tests PASSED!")
+    return 0
+
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -3,70 +3,126 @@
 Test script to verify XMake build system functionality for QtLucide
 """
 
+import argparse
+import os
 import subprocess
 import sys
 from pathlib import Path
 
+from _common import format_command, memoized_which, stream_command
 
-def run_command(cmd, cwd=None, check=True):
-    """Run a command and return the result"""
-    print(f"Running: {' '.join(cmd)}")
-    try:
+JOBS = str(os.cpu_count() or 1)
+
+
+def run_command(cmd, cwd=None, check=True, quiet=False):
+    """Run a command, streaming its output unless quiet, and return the result"""
+    print(f"Running: {format_command(cmd)}")
+    if quiet:
         result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=True, text=True
+            cmd, cwd=cwd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
         )
-        if result.stdout:
-            print(f"STDOUT: {result.stdout}")
-        if result.stderr:
-            print(f"STDERR: {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed with exit code {e.returncode}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
-        raise
+    else:
+        result = stream_command(cmd, cwd=cwd)
+    if result.returncode != 0:
+        print(f"Command failed with exit code {result.returncode}")
+        if check:
+            raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout)
+    return result
 
 
 def check_xmake_installed():
     """Check if XMake is installed"""
-    try:
-        result = run_command(["xmake", "--version"])
-        print(f"XMake version: {result.stdout.strip()}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if memoized_which("xmake") is None:
         print("ERROR: XMake is not installed or not in PATH")
         return False
+    return True
 
 
 def check_qt6_available():
     """Check if Qt6 is available"""
     try:
-        # Try to find Qt6 using xmake
-        result = run_command(["xmake", "require", "--info", "qt6base"], check=False)
+        # Try to find Qt6 using xmake; only the exit code matters
+        result = run_command(
+            ["xmake", "require", "--info", "qt6base"], check=False, quiet=True
+        )
         return result.returncode == 0
     except Exception:
         return False
 
 
-def test_xmake_build(project_dir):
+def xmake_config_current(project_dir, mode):
+    """Check whether the XMake config cache is newer than xmake.lua"""
+    xmake_lua_mtime = os.path.getmtime(Path(project_dir) / "xmake.lua")
+    for conf in (Path(project_dir) / ".xmake").glob("*/*/xmake.conf"):
+        try:
+            if os.path.getmtime(conf) > xmake_lua_mtime and (
+                f'mode = "{mode}"' in conf.read_text(encoding="utf-8")
+            ):
+                return True
+        except OSError:
+            continue
+    return False
+
+
+def resources_need_regen(project_dir):
+    """Check whether any generated resource is older than its inputs"""
+    project_dir = Path(project_dir)
+    icons_dir = project_dir / "resources" / "icons"
+    outputs = [
+        icons_dir / "lucide_icons.qrc",
+        icons_dir / "metadata" / "icons.json",
+        project_dir / "include" / "QtLucide" / "QtLucideEnums.h",
+        project_dir / "include" / "QtLucide" / "QtLucideStrings.h",
+    ]
+    try:
+        oldest_output = min(os.path.getmtime(path) for path in outputs)
+    except OSError:
+        return True
+
+    # SVG icons and the generator scripts are the inputs
+    for input_dir, suffix in [
+        (icons_dir / "svg", ".svg"),
+        (project_dir / "tools", ".py"),
+    ]:
+        try:
+            with os.scandir(input_dir) as entries:
+                for entry in entries:
+                    if (
+                        entry.name.endswith(suffix)
+                        and entry.stat().st_mtime > oldest_output
+                    ):
+                        return True
+        except OSError:
+            return True
+    return False
+
+
+def test_xmake_build(project_dir, clean=False):
     """Test XMake build process"""
     print("\n=== Testing XMake Build ===")
 
-    # Clean any previous build
-    print("Cleaning previous build...")
-    run_command(["xmake", "clean"], cwd=project_dir, check=False)
+    # Clean any previous build only when asked; otherwise build incrementally
+    if clean:
+        print("Cleaning previous build...")
+        run_command(["xmake", "clean"], cwd=project_dir, check=False)
 
     # Configure project
-    print("Configuring project...")
-    run_command(["xmake", "config", "--mode=release"], cwd=project_dir)
-
-    # Generate resources first
-    print("Generating resources...")
-    run_command(["xmake", "generate-resources"], cwd=project_dir)
+    if not clean and xmake_config_current(project_dir, "release"):
+        print("XMake configuration is up to date, skipping configure")
+    else:
+        print("Configuring project...")
+        run_command(["xmake", "config", "--mode=release"], cwd=project_dir)
+
+    # Generate resources first, unless they are newer than all their inputs
+    if resources_need_regen(project_dir):
+        print("Generating resources...")
+        run_command(["xmake", "generate-resources"], cwd=project_dir)
+    else:
+        print("Resources are up to date, skipping generation")
 
     # Build project
     print("Building project...")
-    run_command(["xmake", "build"], cwd=project_dir)
+    run_command(["xmake", "build", "-j", JOBS], cwd=project_dir)
 
     # Check if library was built
     build_dir = Path(project_dir) / "build"
@@ -92,8 +148,8 @@ def test_examples_build(project_dir):
     run_command(["xmake", "config", "--examples=true"], cwd=project_dir)
 
     # Build examples
-    run_command(["xmake", "build", "QtLucideExample"], cwd=project_dir)
-    run_command(["xmake", "build", "QtLucideGallery"], cwd=project_dir)
+    run_command(["xmake", "build", "-j", JOBS, "QtLucideExample"], cwd=project_dir)
+    run_command(["xmake", "build", "-j", JOBS, "QtLucideGallery"], cwd=project_dir)
 
     return True
 
@@ -106,7 +162,7 @@ def test_tests_build(project_dir):
     run_command(["xmake", "config", "--tests=true"], cwd=project_dir)
 
     # Build tests
-    run_command(["xmake", "build", "QtLucideTests"], cwd=project_dir)
+    run_command(["xmake", "build", "-j", JOBS, "QtLucideTests"], cwd=project_dir)
 
     return True
 
@@ -126,6 +182,12 @@ def test_package_creation(project_dir):
 
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(description="Test the QtLucide XMake build")
+    parser.add_argument(
+        "--clean", action="store_true", help="Clean previous build before testing"
+    )
+    args = parser.parse_args()
+
     print("QtLucide XMake Build System Test")
     print("=" * 40)
 
@@ -137,7 +199,7 @@ def main():
 
     # Check prerequisites
     if not check_xmake_installed():
-        sys.exit(1)
+        return 1
 
     if not check_qt6_available():
         print("WARNING: Qt6 might not be available through XMake package manager")
@@ -147,42 +209,43 @@ def main():
     xmake_file = project_dir / "xmake.lua"
     if not xmake_file.exists():
         print(f"ERROR: {xmake_file} not found")
-        sys.exit(1)
+        return 1
 
+    # Test basic build; the remaining steps can't pass without it
     try:
-        # Test basic build
-        if not test_xmake_build(project_dir):
-            print("ERROR: Basic build test failed")
-            sys.exit(1)
-
-        # Test examples build
-        try:
-            test_examples_build(project_dir)
-            print("✓ Examples build test passed")
-        except subprocess.CalledProcessError:
-            print("✗ Examples build test failed")
+        built = test_xmake_build(project_dir, clean=args.clean)
+    except subprocess.CalledProcessError as e:
+        print(f"ERROR: {e}")
+        built = False
+    if not built:
+        print("ERROR: Basic build test failed")
+        return 1
 
-        # Test tests build
-        try:
-            test_tests_build(project_dir)
-            print("✓ Tests build test passed")
-        except subprocess.CalledProcessError:
-            print("✗ Tests build test failed")
+    # Test examples build
+    try:
+        test_examples_build(project_dir)
+        print("✓ Examples build test passed")
+    except subprocess.CalledProcessError:
+        print("✗ Examples build test failed")
 
-        # Test package creation
-        if test_package_creation(project_dir):
-            print("✓ Package creation test passed")
-        else:
-            print("✗ Package creation test failed")
+    # Test tests build
+    try:
+        test_tests_build(project_dir)
+        print("✓ Tests build test passed")
+    except subprocess.CalledProcessError:
+        print("✗ Tests build test failed")
 
-        print("\n" + "=" * 40)
-        print("✓ XMake build system test completed successfully!")
-        print("The XMake build system is working correctly.")
+    # Test package creation
+    if test_package_creation(project_dir):
+        print("✓ Package creation test passed")
+    else:
+        print("✗ Package creation test failed")
 
-    except Exception as e:
-        print(f"\nERROR: Test failed with exception: {e}")
-        sys.exit(1)
+    print("\n" + "=" * 40)
+    print("✓ XMake build system test completed successfully!")
+    print("The XMake build system is working correctly.")
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -4,60 +4,241 @@ Comprehensive build verification script for QtLucide.
 Tests all build systems and configurations to ensure everything works correctly.
 """
 
+import argparse
+import fnmatch
+import hashlib
+import importlib.util
+import mmap
+import os
 import shutil
 import subprocess
 import sys
-import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
-
-def run_command(cmd, cwd=None, check=True, capture_output=True):
-    """Run a command and return the result."""
-    print(f"Running: {' '.join(cmd)}")
+from _common import (
+    cmake_build_generated,
+    discard_build_dir,
+    format_command,
+    PrefixedOutput,
+    ignore_root_dirs,
+    load_resource_builder,
+    memoized_which,
+    stream_command,
+)
+
+JOBS = str(os.cpu_count() or 1)
+# Resolved once, so every command gets the same absolute paths
+SCRIPT_DIR = Path(__file__).resolve().parent
+QTLUCIDE_PATH = SCRIPT_DIR.parent
+VERIFY_CACHE = ".verify-cache"
+
+# Seconds a step may take before it is treated as hung. Configuring can
+# fetch packages on a first run, so it gets more than a quick probe would
+CONFIGURE_TIMEOUT = 600
+BUILD_TIMEOUT = 1800
+
+# Inputs of the library build, hashed to tell whether a cached build is current.
+# This covers every build description the three builds read (CMakeLists.txt,
+# meson.build, xmake.lua, the CMake package template) and the tools/ scripts
+# the Meson and XMake builds run to generate resources
+SOURCE_DIRS = ("cmake", "include", "resources", "src", "tools")
+SOURCE_FILES = ("CMakeLists.txt", "meson.build", "meson_options.txt", "xmake.lua")
+SOURCE_SUFFIXES = {
+    ".build",
+    ".cmake",
+    ".cpp",
+    ".h",
+    ".hpp",
+    ".in",
+    ".json",
+    ".lua",
+    ".py",
+    ".qrc",
+    ".svg",
+    ".txt",
+}
+SOURCE_HASH_FILE = ".source-hash"
+
+# Top-level directories left out of the XMake project copy; in the copy they
+# hold its build state, so they are never pruned either
+XMAKE_COPY_IGNORED = (".git", "build", "build_*", ".xmake", VERIFY_CACHE + "*")
+
+# Text every generated QRC file contains
+QRC_MARKERS = (b"<RCC>", b'<qresource prefix="/lucide">', b".svg</file>")
+
+
+def run_command(cmd, cwd=None, check=True, out=None, timeout=None):
+    """Run a command, streaming its output as it is produced."""
+    print(f"Running: {format_command(cmd)}", file=out)
+    result = stream_command(cmd, cwd=cwd, out=out, timeout=timeout)
+    if check and result.returncode != 0:
+        print(f"Command failed with return code {result.returncode}", file=out)
+        # Only the tail of the output is kept for the exception
+        raise subprocess.CalledProcessError(result.returncode, cmd, result.stdout)
+    return result
+
+
+def iter_source_files(directory):
+    """Yield the paths of build inputs below a directory, in one scandir walk."""
     try:
-        result = subprocess.run(
-            cmd, cwd=cwd, check=check, capture_output=capture_output, text=True
-        )
-        if result.stdout and capture_output:
-            print(f"STDOUT: {result.stdout}")
-        if result.stderr and capture_output:
-            print(f"STDERR: {result.stderr}")
-        return result
-    except subprocess.CalledProcessError as e:
-        print(f"Command failed with return code {e.returncode}")
-        if capture_output:
-            print(f"STDOUT: {e.stdout}")
-            print(f"STDERR: {e.stderr}")
-        raise
-
-
-def test_cmake_standalone(qtlucide_path):
-    """Test standalone CMake build."""
-    print("\n=== Testing CMake Standalone Build ===")
+        entries = os.scandir(directory)
+    except FileNotFoundError:
+        return
+    with entries:
+        for entry in entries:
+            # Hidden entries are local caches such as the SVG manifest
+            if entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_source_files(entry.path)
+            elif os.path.splitext(entry.name)[1] in SOURCE_SUFFIXES:
+                yield entry.path
+
+
+def compute_source_hash(qtlucide_path):
+    """Hash the contents of every file the library build depends on."""
+    files = [os.path.join(qtlucide_path, name) for name in SOURCE_FILES]
+    for directory in SOURCE_DIRS:
+        files.extend(iter_source_files(os.path.join(qtlucide_path, directory)))
+
+    digest = hashlib.blake2b(digest_size=16)
+    for path in sorted(files):
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            continue
+        name = os.path.relpath(path, qtlucide_path).replace(os.sep, "/")
+        name = name.encode("utf-8")
+        digest.update(b"%d:%s%d:" % (len(name), name, len(data)))
+        digest.update(data)
+    return digest.hexdigest()
+
+
+def build_is_current(build_dir, source_hash):
+    """Check whether build_dir was last built successfully from source_hash."""
+    if source_hash is None:
+        return False
+    try:
+        return (build_dir / SOURCE_HASH_FILE).read_text() == source_hash
+    except OSError:
+        return False
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        build_dir = Path(temp_dir) / "cmake_build"
-        build_dir.mkdir()
 
-        # Configure
-        run_command(
-            ["cmake", str(qtlucide_path), "-DCMAKE_BUILD_TYPE=Release"], cwd=build_dir
-        )
+def mark_build_current(build_dir, source_hash):
+    """Record the source hash of a successful build in build_dir."""
+    if source_hash is not None:
+        (build_dir / SOURCE_HASH_FILE).write_text(source_hash)
 
-        # Build library only (skip examples/tests for speed)
-        run_command(["cmake", "--build", ".", "--target", "QtLucide"], cwd=build_dir)
 
-        print("CMake standalone build: SUCCESS")
+def copy_if_changed(src, dst):
+    """Copy a file unless the destination already has its size and mtime."""
+    try:
+        src_stat, dst_stat = os.stat(src), os.stat(dst)
+        if (src_stat.st_size, src_stat.st_mtime_ns) == (
+            dst_stat.st_size,
+            dst_stat.st_mtime_ns,
+        ):
+            return dst
+    except FileNotFoundError:
+        pass
+    return shutil.copy2(src, dst)
+
+
+def prune_removed(src, dst, keep=lambda name: False):
+    """Delete entries of dst that no longer exist in src, or changed type."""
+    with os.scandir(dst) as entries:
+        for entry in entries:
+            if keep(entry.name):
+                continue
+            src_path = os.path.join(src, entry.name)
+            if entry.is_dir(follow_symlinks=False):
+                if os.path.isdir(src_path):
+                    prune_removed(src_path, entry.path)
+                else:
+                    shutil.rmtree(entry.path)
+            elif not os.path.isfile(src_path):
+                os.unlink(entry.path)
+
+
+def sync_tree(src, dst, ignored):
+    """Make dst mirror src, leaving out the ignored top-level directories.
+
+    Files unchanged since the last sync keep their timestamps, so the build
+    in dst stays incremental; files removed or renamed in src are removed.
+    """
+
+    def keep(name):
+        return name == SOURCE_HASH_FILE or any(
+            fnmatch.fnmatch(name, pattern) for pattern in ignored
+        )
+
+    if os.path.isdir(dst):
+        prune_removed(src, dst, keep)
+    shutil.copytree(
+        src,
+        dst,
+        ignore=ignore_root_dirs(src, *ignored),
+        copy_function=copy_if_changed,
+        dirs_exist_ok=True,
+    )
 
 
-def test_meson_standalone(qtlucide_path):
+def test_cmake_standalone(qtlucide_path, source_hash=None, out=None, jobs=JOBS):
+    """Test standalone CMake build."""
+    print("\n=== Testing CMake Standalone Build ===", file=out)
+
+    build_dir = qtlucide_path / VERIFY_CACHE / "cmake_build"
+    if build_is_current(build_dir, source_hash):
+        print("CMake standalone build: SUCCESS (sources unchanged)", file=out)
+        return
+    build_dir.mkdir(parents=True, exist_ok=True)
+
+    # Configure only once; later runs rebuild incrementally and CMake
+    # re-runs itself if any CMakeLists.txt changed
+    if cmake_build_generated(build_dir):
+        print("Reusing configured CMake build directory", file=out)
+    else:
+        # Compile through a compiler cache when one is installed
+        configure_cmd = ["cmake", str(qtlucide_path), "-DCMAKE_BUILD_TYPE=Release"]
+        launcher = memoized_which("sccache") or memoized_which("ccache")
+        if launcher:
+            configure_cmd.extend(
+                [
+                    f"-DCMAKE_C_COMPILER_LAUNCHER={launcher}",
+                    f"-DCMAKE_CXX_COMPILER_LAUNCHER={launcher}",
+                ]
+            )
+        run_command(configure_cmd, cwd=build_dir, out=out, timeout=CONFIGURE_TIMEOUT)
+
+    # Build library only (skip examples/tests for speed)
+    run_command(
+        ["cmake", "--build", ".", "--target", "QtLucide", "--parallel", jobs],
+        cwd=build_dir,
+        out=out,
+        timeout=BUILD_TIMEOUT,
+    )
+
+    mark_build_current(build_dir, source_hash)
+    print("CMake standalone build: SUCCESS", file=out)
+
+
+def test_meson_standalone(qtlucide_path, source_hash=None, out=None, jobs=JOBS):
     """Test standalone Meson build."""
-    print("\n=== Testing Meson Standalone Build ===")
+    print("\n=== Testing Meson Standalone Build ===", file=out)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        build_dir = Path(temp_dir) / "meson_build"
+    build_dir = qtlucide_path / VERIFY_CACHE / "meson_build"
+    if build_is_current(build_dir, source_hash):
+        print("Meson standalone build: SUCCESS (sources unchanged)", file=out)
+        return
 
-        # Setup
+    # Setup only once; Meson regenerates build.ninja itself when needed
+    if (build_dir / "build.ninja").exists():
+        print("Reusing configured Meson build directory", file=out)
+    else:
+        # A directory without build.ninja is left over from a failed setup
+        shutil.rmtree(build_dir, ignore_errors=True)
         run_command(
             [
                 "meson",
@@ -68,57 +249,92 @@ def test_meson_standalone(qtlucide_path):
                 "-Dtests=disabled",
             ],
             cwd=qtlucide_path,
+            out=out,
+            timeout=CONFIGURE_TIMEOUT,
         )
 
-        # Build library only
-        run_command(["meson", "compile", "QtLucide"], cwd=build_dir)
+    # Build library only
+    run_command(
+        ["meson", "compile", "-j", jobs, "QtLucide"],
+        cwd=build_dir,
+        out=out,
+        timeout=BUILD_TIMEOUT,
+    )
 
-        print("Meson standalone build: SUCCESS")
+    mark_build_current(build_dir, source_hash)
+    print("Meson standalone build: SUCCESS", file=out)
 
 
-def test_xmake_standalone(qtlucide_path):
+def test_xmake_standalone(qtlucide_path, source_hash=None, out=None, jobs=JOBS):
     """Test standalone XMake build."""
-    print("\n=== Testing XMake Standalone Build ===")
-
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Copy project to temp directory to avoid conflicts
-        temp_project = Path(temp_dir) / "qtlucide"
-        shutil.copytree(qtlucide_path, temp_project)
-
-        # Configure to build library only
-        run_command(
-            ["xmake", "config", "--examples=false", "--tests=false"], cwd=temp_project
-        )
-
-        # Build library only
-        run_command(["xmake", "build", "QtLucide"], cwd=temp_project)
-
-        print("XMake standalone build: SUCCESS")
-
-
-def test_submodule_detection():
+    print("\n=== Testing XMake Standalone Build ===", file=out)
+
+    # Build in a synced copy of the project to avoid conflicts
+    project_copy = qtlucide_path / VERIFY_CACHE / "xmake_project"
+    if build_is_current(project_copy, source_hash):
+        print("XMake standalone build: SUCCESS (sources unchanged)", file=out)
+        return
+    sync_tree(qtlucide_path, project_copy, XMAKE_COPY_IGNORED)
+
+    # Configure to build library only; ccache is used if installed
+    run_command(
+        ["xmake", "config", "--examples=false", "--tests=false", "--ccache=y"],
+        cwd=project_copy,
+        out=out,
+        timeout=CONFIGURE_TIMEOUT,
+    )
+
+    # Build library only
+    run_command(
+        ["xmake", "build", "-j", jobs, "QtLucide"],
+        cwd=project_copy,
+        out=out,
+        timeout=BUILD_TIMEOUT,
+    )
+
+    mark_build_current(project_copy, source_hash)
+    print("XMake standalone build: SUCCESS", file=out)
+
+
+def test_submodule_detection(isolated=False):
     """Test that submodule detection works correctly."""
     print("\n=== Testing Submodule Detection ===")
 
     # This is tested by the existing test_submodule_build.py script
-    script_dir = Path(__file__).parent
-    test_script = script_dir / "test_submodule_build.py"
+    test_script = SCRIPT_DIR / "test_submodule_build.py"
 
-    if test_script.exists():
+    if not test_script.exists():
+        print("Submodule test script not found, skipping")
+        return
+
+    if isolated:
         run_command([sys.executable, str(test_script)])
-        print("Submodule detection: SUCCESS")
     else:
-        print("Submodule test script not found, skipping")
+        spec = importlib.util.spec_from_file_location(
+            "test_submodule_build", test_script
+        )
+        module = importlib.util.module_from_spec(spec)
+        # Registered so its process pool workers can unpickle the test functions
+        sys.modules[spec.name] = module
+        spec.loader.exec_module(module)
+        returncode = module.main()
+        if returncode:
+            raise RuntimeError(f"{test_script.name} returned {returncode}")
+
+    print("Submodule detection: SUCCESS")
 
 
 def test_resource_generation(qtlucide_path):
     """Test resource generation."""
     print("\n=== Testing Resource Generation ===")
 
-    # Test resource generation script
-    build_script = qtlucide_path / "tools" / "build_resources.py"
-    if build_script.exists():
-        run_command([sys.executable, str(build_script), str(qtlucide_path)])
+    # Run the resource builder in-process; there is too little work in it
+    # to be worth spreading over processes, so a child interpreter would
+    # only add its own startup time
+    builder_class = load_resource_builder(qtlucide_path)
+    if builder_class is not None:
+        if not builder_class(qtlucide_path).build_all():
+            raise RuntimeError("Resource builder reported a failure")
 
         # Check that required files were generated
         required_files = [
@@ -128,23 +344,67 @@ def test_resource_generation(qtlucide_path):
             qtlucide_path / "include" / "QtLucide" / "QtLucideStrings.h",
         ]
 
+        # One stat per file checks both that it exists and that it is not empty
         for file_path in required_files:
-            if not file_path.exists():
-                raise FileNotFoundError(f"Required file not generated: {file_path}")
+            try:
+                size = file_path.stat().st_size
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"Required file not generated: {file_path}"
+                ) from None
+            if size == 0:
+                raise RuntimeError(f"Required file is empty: {file_path}")
+
+        # The QRC must be a resource file with the icons under /lucide; it is
+        # mapped rather than read, since only a few markers are searched for
+        qrc_file = required_files[0]
+        with open(qrc_file, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as content:
+            for marker in QRC_MARKERS:
+                if content.find(marker) == -1:
+                    preview = content[:200].decode("utf-8", errors="replace")
+                    raise RuntimeError(
+                        f"{qrc_file} has no {marker.decode()!r}, starts with:\n"
+                        f"{preview}"
+                    )
 
         print("Resource generation: SUCCESS")
     else:
         print("Resource generation script not found, skipping")
 
 
+def run_prefixed(name, test_func, qtlucide_path, source_hash, jobs):
+    """Run a build test with its output lines labelled, returning its error."""
+    out = PrefixedOutput(f"[{name}] ")
+    try:
+        test_func(qtlucide_path, source_hash, out=out, jobs=jobs)
+    except Exception as e:
+        return e
+    finally:
+        out.close()
+    return None
+
+
 def main():
     """Main verification function."""
+    parser = argparse.ArgumentParser(description="Verify all QtLucide builds")
+    parser.add_argument(
+        "--clean",
+        action="store_true",
+        help=f"Discard the cached build directories in {VERIFY_CACHE}/ first",
+    )
+    parser.add_argument(
+        "--isolated",
+        action="store_true",
+        help="Run the submodule test in a separate Python process",
+    )
+    args = parser.parse_args()
+
     print("QtLucide Comprehensive Build Verification")
     print("=" * 50)
 
-    # Get QtLucide path
-    script_dir = Path(__file__).parent
-    qtlucide_path = script_dir.parent
+    qtlucide_path = QTLUCIDE_PATH
 
     if not (qtlucide_path / "CMakeLists.txt").exists():
         print("Error: Could not find QtLucide CMakeLists.txt")
@@ -152,6 +412,11 @@ def main():
 
     print(f"QtLucide path: {qtlucide_path}")
 
+    cache_dir = qtlucide_path / VERIFY_CACHE
+    if args.clean and cache_dir.exists():
+        print(f"Cleaning {cache_dir}...")
+        discard_build_dir(cache_dir)
+
     tests_run = 0
     tests_passed = 0
 
@@ -164,61 +429,62 @@ def main():
         print(f"Resource generation test FAILED: {e}")
         tests_run += 1
 
-    # Test CMake standalone build
-    try:
-        test_cmake_standalone(qtlucide_path)
-        tests_run += 1
-        tests_passed += 1
-    except Exception as e:
-        print(f"CMake standalone test FAILED: {e}")
-        tests_run += 1
-
-    # Test Meson standalone build
-    try:
-        run_command(["meson", "--version"], check=True)
-        test_meson_standalone(qtlucide_path)
-        tests_run += 1
-        tests_passed += 1
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("Meson not available, skipping Meson standalone test")
-    except Exception as e:
-        print(f"Meson standalone test FAILED: {e}")
-        tests_run += 1
-
-    # Test XMake standalone build
-    try:
-        run_command(["xmake", "--version"], check=True)
-        test_xmake_standalone(qtlucide_path)
-        tests_run += 1
-        tests_passed += 1
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        print("XMake not available, skipping XMake standalone test")
-    except Exception as e:
-        print(f"XMake standalone test FAILED: {e}")
-        tests_run += 1
+    # Builds whose cached tree was built from these exact sources are skipped
+    source_hash = compute_source_hash(qtlucide_path)
+
+    # The standalone builds use separate sandboxes, so run them concurrently;
+    # their output streams live, each line labelled with its build system
+    build_tests = [("CMake", test_cmake_standalone)]
+    for tool, name, test_func in [
+        ("meson", "Meson", test_meson_standalone),
+        ("xmake", "XMake", test_xmake_standalone),
+    ]:
+        if memoized_which(tool):
+            build_tests.append((name, test_func))
+        else:
+            print(f"{name} not available, skipping {name} standalone test")
+
+    # Share the CPUs between the concurrent builds instead of giving each
+    # one a job per CPU
+    build_jobs = str(max(1, int(JOBS) // len(build_tests)))
+    with ThreadPoolExecutor(max_workers=len(build_tests)) as executor:
+        jobs = {
+            executor.submit(
+                run_prefixed, name, test_func, qtlucide_path, source_hash, build_jobs
+            ): name
+            for name, test_func in build_tests
+        }
+        for job in as_completed(jobs):
+            error = job.result()
+            tests_run += 1
+            if error is None:
+                tests_passed += 1
+            else:
+                print(f"{jobs[job]} standalone test FAILED: {error}")
 
     # Test submodule detection
     try:
-        test_submodule_detection()
+        test_submodule_detection(args.isolated)
         tests_run += 1
         tests_passed += 1
     except Exception as e:
         print(f"Submodule detection test FAILED: {e}")
         tests_run += 1
 
-    # Summary
-    print("\n" + "=" * 50)
-    print("Build Verification Summary:")
-    print(f"Tests run: {tests_run}")
-    print(f"Tests passed: {tests_passed}")
-    print(f"Tests failed: {tests_run - tests_passed}")
-
-    if tests_passed == tests_run:
-        print("All tests PASSED! ✅")
-        return 0
-    else:
-        print("Some tests FAILED! ❌")
-        return 1
+    # Summary, written in one piece
+    all_passed = tests_passed == tests_run
+    lines = [
+        "",
+        "=" * 50,
+        "Build Verification Summary:",
+        f"Tests run: {tests_run}",
+        f"Tests passed: {tests_passed}",
+        f"Tests failed: {tests_run - tests_passed}",
+        "All tests PASSED! ✅" if all_passed else "Some tests FAILED! ❌",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+
+    return 0 if all_passed else 1
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""
+QtLucide Atomic File Writes
+Replaces generated files in one step, so no reader sees a partial file
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+
+def write_text_atomic(path, content):
+    """Write text through a temporary file in the same directory
+
+    The finished file is moved over the old one, which also replaces a
+    hardlink with a new file instead of writing through it.
+    """
+    path = Path(path)
+
+    # Leave unchanged files alone so their timestamps stay put
+    try:
+        if path.read_text(encoding="utf-8") == content:
+            return
+    except OSError:
+        pass
+
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        try:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+            # Temporary files are private; keep the mode of the file replaced
+            try:
+                mode = os.stat(path).st_mode & 0o777
+            except OSError:
+                mode = 0o644
+            os.chmod(f.name, mode)
+        except BaseException:
+            f.close()
+            os.unlink(f.name)
+            raise
+    os.replace(f.name, path)
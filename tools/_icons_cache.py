@@ -0,0 +1,49 @@
+"""
+QtLucide Metadata Cache
+Loads icon metadata JSON, keeping a pickled copy next to it for reuse
+"""
+
+import contextlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional and only speeds up parsing
+    from json import loads as json_loads
+
+
+def load_json_cached(path):
+    """Load a JSON file, reusing its pickled copy while the file is unchanged"""
+    path = Path(path)
+    stat = path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cache_file = path.with_name(f"{path.name}.pkl")
+
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, data = pickle.load(f)
+        if cached_stamp == stamp:
+            return data
+    except (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError):
+        pass
+
+    data = json_loads(path.read_bytes())
+
+    # The cache is only an optimization, so failing to write it is fine
+    temp_name = None
+    try:
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as f:
+            temp_name = f.name
+            pickle.dump((stamp, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_name, cache_file)
+    except OSError:
+        if temp_name:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+
+    return data
@@ -8,21 +8,146 @@ Automatically builds all resources needed for QtLucide library:
 - Generates C++ headers
 """
 
+import argparse
+import hashlib
 import json
-import subprocess
+import os
+import re
 import sys
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Set, Tuple
+
+from _atomic_write import write_text_atomic
+
+try:
+    import ahocorasick
+except ImportError:  # optional, speeds up keyword matching
+    ahocorasick = None
+
+# Stored in the metadata directory; identifies the inputs of the last build
+SVG_FINGERPRINT_FILE = ".svg_fingerprint"
+
+# Generator scripts whose changes also invalidate the generated resources
+GENERATOR_SCRIPTS = ("build_resources.py", "generate_qrc.py", "generate_headers.py")
+
+# Extra tags added when any of the keywords appears in an icon name
+TAG_KEYWORDS = {
+    "navigation": ("arrow", "chevron"),
+    "files": ("file", "folder", "document"),
+    "users": ("user", "person", "people"),
+    "social": ("heart", "star", "like"),
+}
+
+# Categories assigned when any of the keywords appears in an icon name
+CATEGORY_KEYWORDS = {
+    "navigation": ("arrow", "chevron", "menu", "home", "back", "forward"),
+    "files": ("file", "folder", "document", "save", "download", "upload"),
+    "communication": ("mail", "message", "phone", "chat", "send"),
+    "media": ("play", "pause", "stop", "music", "video", "camera"),
+    "social": ("heart", "star", "like", "share", "user", "users"),
+    "system": ("settings", "cog", "gear", "power", "battery", "wifi"),
+    "editing": ("edit", "pen", "pencil", "brush", "cut", "copy", "paste"),
+    "business": ("briefcase", "chart", "graph", "money", "bank", "credit"),
+}
+
+
+# Every keyword with the (kind, label) pairs it adds; kind is "tag" or "category"
+KEYWORD_LABELS: Dict[str, List[Tuple[str, str]]] = {}
+for _kind, _table in (("tag", TAG_KEYWORDS), ("category", CATEGORY_KEYWORDS)):
+    for _label, _keywords in _table.items():
+        for _keyword in _keywords:
+            KEYWORD_LABELS.setdefault(_keyword, []).append((_kind, _label))
+
+
+def _build_keyword_finder():
+    """Build a function returning every keyword contained in a name"""
+    keywords = sorted(KEYWORD_LABELS, key=len, reverse=True)
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda name: {keyword for _, keyword in automaton.iter(name)}
+
+    # The lookahead reports the longest keyword starting at each position;
+    # keywords contained in it occur in the name too, so add those as well
+    pattern = re.compile("(?=(" + "|".join(map(re.escape, keywords)) + "))")
+    implied = {kw: {other for other in keywords if other in kw} for kw in keywords}
+
+    def find_keywords(name):
+        found = set()
+        for keyword in pattern.findall(name):
+            found |= implied[keyword]
+        return found
+
+    return find_keywords
+
+
+_find_keywords = _build_keyword_finder()
+
+
+def _match_labels(name: str) -> Tuple[Set[str], Set[str]]:
+    """Scan a name once, returning the tags and categories it matches"""
+    tags, categories = set(), set()
+    for keyword in _find_keywords(name):
+        for kind, label in KEYWORD_LABELS[keyword]:
+            (tags if kind == "tag" else categories).add(label)
+    return tags, categories
+
+
+def _ordered_categories(categories: Set[str]) -> List[str]:
+    """List matched categories in table order, falling back to general"""
+    return [c for c in CATEGORY_KEYWORDS if c in categories] or ["general"]
+
+
+def generate_tags_from_name(name: str) -> List[str]:
+    """Generate basic tags from icon name"""
+    # Name parts are tags, plus some common categorizations
+    tags, _ = _match_labels(name)
+    return sorted(tags.union(name.replace("-", " ").split()))
+
+
+def categorize_icon(name: str) -> List[str]:
+    """Categorize icon based on name"""
+    _, categories = _match_labels(name)
+    return _ordered_categories(categories)
+
+
+def icon_metadata(svg_name: str) -> Dict:
+    """Build the metadata entry for one icon"""
+    tags, categories = _match_labels(svg_name)
+    return {
+        "name": svg_name,
+        "svg_file": f"svg/{svg_name}.svg",
+        "tags": sorted(tags.union(svg_name.replace("-", " ").split())),
+        "categories": _ordered_categories(categories),
+        "contributors": [],
+    }
+
+
+def write_json(path: Path, data, pretty: bool = False):
+    """Write JSON atomically through a temporary file in the same directory"""
+    if pretty:
+        content = json.dumps(data, indent=2)
+    else:
+        content = json.dumps(data, separators=(",", ":"))
+
+    # End with a newline like the committed files, which end-of-file-fixer checks
+    write_text_atomic(path, content + "\n")
 
 
 class QtLucideResourceBuilder:
-    def __init__(self, project_root: str):
+    def __init__(self, project_root: str, pretty: bool = False):
         self.project_root = Path(project_root)
+        self.pretty = pretty
         self.tools_dir = self.project_root / "tools"
         self.resources_dir = self.project_root / "resources" / "icons"
         self.svg_dir = self.resources_dir / "svg"
         self.metadata_dir = self.resources_dir / "metadata"
         self.include_dir = self.project_root / "include" / "QtLucide"
+        self._svg_names = None
 
         # Ensure directories exist
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
@@ -34,24 +159,66 @@ class QtLucideResourceBuilder:
             print(f"Warning: SVG directory {self.svg_dir} does not exist")
             return []
 
-        svg_files = list(self.svg_dir.glob("*.svg"))
-        print(f"Found {len(svg_files)} SVG files")
-        return [f.stem for f in svg_files]
+        # The directory is only listed once per builder; names are sorted so
+        # the metadata doesn't depend on the filesystem's listing order
+        if self._svg_names is None:
+            with os.scandir(self.svg_dir) as it:
+                self._svg_names = sorted(
+                    entry.name[:-4]
+                    for entry in it
+                    if entry.name.endswith(".svg") and entry.is_file()
+                )
+            print(f"Found {len(self._svg_names)} SVG files")
+        return self._svg_names
+
+    def output_files(self) -> List[Path]:
+        """List every file generated by build_all"""
+        return [
+            self.metadata_dir / "icons.json",
+            self.metadata_dir / "categories.json",
+            self.metadata_dir / "tags.json",
+            self.resources_dir / "lucide_icons.qrc",
+            self.include_dir / "QtLucideEnums.h",
+            self.include_dir / "QtLucideStrings.h",
+        ]
+
+    def svg_fingerprint(self) -> str:
+        """Hash the name, mtime and size of every SVG and generator script"""
+        entries = []
+        if self.svg_dir.exists():
+            with os.scandir(self.svg_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".svg"):
+                        stat = entry.stat()
+                        entries.append((entry.name, stat.st_mtime_ns, stat.st_size))
+        entries.sort()
+
+        for script in GENERATOR_SCRIPTS:
+            try:
+                stat = (self.tools_dir / script).stat()
+            except OSError:
+                continue
+            entries.append((script, stat.st_mtime_ns, stat.st_size))
+
+        digest = hashlib.blake2b(digest_size=16)
+        for name, mtime_ns, size in entries:
+            digest.update(f"{name}\0{mtime_ns}\0{size}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    def is_up_to_date(self, fingerprint: str) -> bool:
+        """Check whether the outputs were generated from the same inputs"""
+        try:
+            stored = (self.metadata_dir / SVG_FINGERPRINT_FILE).read_text("utf-8")
+        except OSError:
+            return False
+        return stored == fingerprint and all(f.exists() for f in self.output_files())
 
     def generate_metadata_from_svg(self):
         """Generate metadata from existing SVG files"""
         svg_names = self.scan_svg_files()
 
         # Create basic metadata structure
-        icons_data = {}
-        for svg_name in svg_names:
-            icons_data[svg_name] = {
-                "name": svg_name,
-                "svg_file": f"svg/{svg_name}.svg",
-                "tags": self._generate_tags_from_name(svg_name),
-                "categories": self._categorize_icon(svg_name),
-                "contributors": [],
-            }
+        icons_data = {svg_name: icon_metadata(svg_name) for svg_name in svg_names}
 
         # Save icons metadata
         icons_metadata = {
@@ -60,9 +227,7 @@ class QtLucideResourceBuilder:
             "version": "1.0.0",
         }
 
-        icons_file = self.metadata_dir / "icons.json"
-        with open(icons_file, "w", encoding="utf-8") as f:
-            json.dump(icons_metadata, f, indent=2)
+        write_json(self.metadata_dir / "icons.json", icons_metadata, self.pretty)
 
         # Generate categories and tags files
         self._generate_categories_and_tags(icons_data)
@@ -70,144 +235,81 @@ class QtLucideResourceBuilder:
         print(f"Generated metadata for {len(icons_data)} icons")
         return icons_data
 
-    def _generate_tags_from_name(self, name: str) -> List[str]:
-        """Generate basic tags from icon name"""
-        tags = []
-        parts = name.replace("-", " ").split()
-
-        # Add parts as tags
-        tags.extend(parts)
-
-        # Add some common categorizations
-        if any(word in name for word in ["arrow", "chevron"]):
-            tags.append("navigation")
-        if any(word in name for word in ["file", "folder", "document"]):
-            tags.append("files")
-        if any(word in name for word in ["user", "person", "people"]):
-            tags.append("users")
-        if any(word in name for word in ["heart", "star", "like"]):
-            tags.append("social")
-
-        return list(set(tags))  # Remove duplicates
-
-    def _categorize_icon(self, name: str) -> List[str]:
-        """Categorize icon based on name"""
-        categories = []
-
-        # Define category mappings
-        category_keywords = {
-            "navigation": ["arrow", "chevron", "menu", "home", "back", "forward"],
-            "files": ["file", "folder", "document", "save", "download", "upload"],
-            "communication": ["mail", "message", "phone", "chat", "send"],
-            "media": ["play", "pause", "stop", "music", "video", "camera"],
-            "social": ["heart", "star", "like", "share", "user", "users"],
-            "system": ["settings", "cog", "gear", "power", "battery", "wifi"],
-            "editing": ["edit", "pen", "pencil", "brush", "cut", "copy", "paste"],
-            "business": ["briefcase", "chart", "graph", "money", "bank", "credit"],
-        }
-
-        for category, keywords in category_keywords.items():
-            if any(keyword in name for keyword in keywords):
-                categories.append(category)
-
-        if not categories:
-            categories.append("general")
-
-        return categories
-
     def _generate_categories_and_tags(self, icons_data: Dict):
         """Generate categories.json and tags.json files"""
-        categories = {}
-        tags = {}
+        categories = defaultdict(list)
+        tags = defaultdict(list)
 
         for icon_name, icon_data in icons_data.items():
-            # Process categories
-            for category in icon_data.get("categories", []):
-                if category not in categories:
-                    categories[category] = []
+            for category in icon_data.get("categories", ()):
                 categories[category].append(icon_name)
-
-            # Process tags
-            for tag in icon_data.get("tags", []):
-                if tag not in tags:
-                    tags[tag] = []
+            for tag in icon_data.get("tags", ()):
                 tags[tag].append(icon_name)
 
-        # Save categories
-        categories_file = self.metadata_dir / "categories.json"
-        with open(categories_file, "w", encoding="utf-8") as f:
-            json.dump(categories, f, indent=2)
+        write_json(self.metadata_dir / "categories.json", categories, self.pretty)
+        write_json(self.metadata_dir / "tags.json", tags, self.pretty)
 
-        # Save tags
-        tags_file = self.metadata_dir / "tags.json"
-        with open(tags_file, "w", encoding="utf-8") as f:
-            json.dump(tags, f, indent=2)
+    def _import_generators(self):
+        """Make the sibling generator scripts importable"""
+        if str(self.tools_dir) not in sys.path:
+            sys.path.insert(0, str(self.tools_dir))
 
-    def generate_qrc_file(self):
+    def generate_qrc_file(self, icons_data: Dict = None):
         """Generate Qt resource file"""
         print("Generating QRC file...")
 
-        qrc_script = self.tools_dir / "generate_qrc.py"
-        qrc_output = self.resources_dir / "lucide_icons.qrc"
-
-        cmd = [
-            sys.executable,
-            str(qrc_script),
-            str(self.metadata_dir),
-            str(self.svg_dir),
-            str(qrc_output),
-        ]
+        self._import_generators()
+        from generate_qrc import generate_qrc
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Error generating QRC: {result.stderr}")
+        qrc_output = self.resources_dir / "lucide_icons.qrc"
+        if not generate_qrc(self.metadata_dir, self.svg_dir, qrc_output, icons_data):
             return False
 
         print("QRC file generated successfully")
         return True
 
-    def generate_headers(self):
+    def generate_headers(self, icons_data: Dict = None):
         """Generate C++ header files"""
         print("Generating C++ headers...")
 
-        headers_script = self.tools_dir / "generate_headers.py"
-
-        cmd = [
-            sys.executable,
-            str(headers_script),
-            str(self.metadata_dir),
-            str(self.include_dir),
-        ]
+        self._import_generators()
+        from generate_headers import generate_headers
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"Error generating headers: {result.stderr}")
+        if not generate_headers(self.metadata_dir, self.include_dir, icons_data):
             return False
 
         print("C++ headers generated successfully")
         return True
 
-    def build_all(self):
-        """Build all resources"""
+    def build_all(self, force: bool = False):
+        """Build all resources, unless the inputs are unchanged"""
         print("=== QtLucide Resource Builder ===")
         print(f"Project root: {self.project_root}")
         print(f"SVG directory: {self.svg_dir}")
-        print(f"Found {len(list(self.svg_dir.glob('*.svg')))} SVG files")
+
+        fingerprint = self.svg_fingerprint()
+        if not force and self.is_up_to_date(fingerprint):
+            print("SVG files unchanged, resources are up to date (cache hit)")
+            return True
+
+        self.scan_svg_files()
 
         # Step 1: Generate metadata from SVG files
         print("\n1. Generating metadata...")
-        self.generate_metadata_from_svg()
+        icons_data = self.generate_metadata_from_svg()
 
         # Step 2: Generate QRC file
         print("\n2. Generating QRC file...")
-        if not self.generate_qrc_file():
+        if not self.generate_qrc_file(icons_data):
             return False
 
         # Step 3: Generate C++ headers
         print("\n3. Generating C++ headers...")
-        if not self.generate_headers():
+        if not self.generate_headers(icons_data):
             return False
 
+        write_text_atomic(self.metadata_dir / SVG_FINGERPRINT_FILE, fingerprint)
+
         print("\n=== Build Complete ===")
         print("All resources have been generated successfully!")
         print("The library will now include all SVG files when compiled.")
@@ -216,15 +318,29 @@ class QtLucideResourceBuilder:
 
 
 def main():
-    if len(sys.argv) > 1:
-        project_root = sys.argv[1]
-    else:
+    parser = argparse.ArgumentParser(description="Build QtLucide resources")
+    parser.add_argument(
+        "project_root",
+        nargs="?",
         # Assume script is run from tools directory
-        project_root = Path(__file__).parent.parent
-
-    builder = QtLucideResourceBuilder(project_root)
-
-    if not builder.build_all():
+        default=Path(__file__).parent.parent,
+        help="Project root directory",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Regenerate even if the SVG files are unchanged",
+    )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the generated JSON metadata for readability",
+    )
+    args = parser.parse_args()
+
+    builder = QtLucideResourceBuilder(args.project_root, pretty=args.pretty)
+
+    if not builder.build_all(force=args.force):
         sys.exit(1)
 
 
@@ -4,10 +4,11 @@ QtLucide Resource Builder for Meson
 Wrapper around build_resources.py that creates a stamp file for Meson
 """
 
-import subprocess
 import sys
 from pathlib import Path
 
+from build_resources import QtLucideResourceBuilder
+
 
 def main():
     if len(sys.argv) < 3:
@@ -17,32 +18,15 @@ def main():
     project_root = sys.argv[1]
     stamp_file = sys.argv[2]
 
-    # Run the original build_resources.py script
-    build_script = Path(__file__).parent / "build_resources.py"
-
-    try:
-        result = subprocess.run(
-            [sys.executable, str(build_script), project_root],
-            check=True,
-            capture_output=True,
-            text=True,
-        )
-        print(result.stdout)
-        if result.stderr:
-            print(result.stderr, file=sys.stderr)
-
-        # Create stamp file to indicate success
-        Path(stamp_file).touch()
-        print(f"Resource generation completed, stamp file created: {stamp_file}")
-
-    except subprocess.CalledProcessError as e:
-        print(f"Error running build_resources.py: {e}")
-        if e.stdout:
-            print(e.stdout)
-        if e.stderr:
-            print(e.stderr, file=sys.stderr)
+    # Run the resource builder in-process, its output goes straight to Meson
+    if not QtLucideResourceBuilder(project_root).build_all():
+        print("Error running build_resources.py", file=sys.stderr)
         sys.exit(1)
 
+    # Create stamp file to indicate success
+    Path(stamp_file).touch()
+    print(f"Resource generation completed, stamp file created: {stamp_file}")
+
 
 if __name__ == "__main__":
     main()
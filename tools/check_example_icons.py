@@ -6,10 +6,45 @@ This script specifically checks icon usage in examples and provides
 compile-time validation with suggestions for fixes.
 """
 
+import bisect
+import contextlib
+import io
+import mmap
+import os
 import re
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from difflib import SequenceMatcher
 from pathlib import Path
-from typing import List, Set, Tuple
+from typing import FrozenSet, List, Set, Tuple
+
+# Icon name entries in the generated QtLucideStrings.h mapping
+ICON_MAPPING_RE = re.compile(rb'insert\(Icons::\w+,\s*QStringLiteral\("([^"]+)"\)\)')
+
+# A sample icon list statement, e.g. m_sampleIcons << "icon1" << "icon2";
+ICON_LIST_STATEMENT_RE = re.compile(rb"sampleIcons[^;]*?<<[^;]*")
+
+# Quoted strings in an icon list that look like icon names
+ICON_LIST_ENTRY_RE = re.compile(rb'<<\s*"([a-z][a-z0-9-]*[a-z0-9])"')
+
+
+@contextlib.contextmanager
+def mapped_file(path: Path):
+    """Map a file read-only, so regexes scan the page cache directly"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        if os.fstat(fd).st_size == 0:
+            # Empty files cannot be mapped
+            yield b""
+            return
+        mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        try:
+            yield mm
+        finally:
+            mm.close()
+    finally:
+        os.close(fd)
 
 
 def load_available_icons(project_root: Path) -> Set[str]:
@@ -21,13 +56,9 @@ def load_available_icons(project_root: Path) -> Set[str]:
         return set()
 
     try:
-        with open(strings_file, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Extract icon names from the mapping
-        pattern = r'\{Icons::\w+,\s*"([^"]+)"\}'
-        matches = re.findall(pattern, content)
-        return set(matches)
+        with mapped_file(strings_file) as content:
+            # Extract icon names from the mapping
+            return {name.decode("utf-8") for name in ICON_MAPPING_RE.findall(content)}
     except Exception as e:
         print(f"Error loading icons: {e}")
         return set()
@@ -38,45 +69,91 @@ def extract_icon_list_from_cpp(file_path: Path) -> List[Tuple[str, int]]:
     icons = []
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-
-        # Look for patterns like: << "icon-name"
-        # This is more specific than the general validator
-        lines = content.split("\n")
-        in_icon_list = False
-
-        for line_num, line in enumerate(lines, 1):
-            # Start of icon list - look for specific patterns
-            if ("m_sampleIcons" in line or "sampleIcons" in line) and "<<" in line:
-                in_icon_list = True
-
-            if in_icon_list:
-                # Extract quoted strings from this line, but only if they look like icon names
-                pattern = r'<<\s*"([a-z][a-z0-9-]*[a-z0-9])"'
-                matches = re.findall(pattern, line)
-                for match in matches:
+        with mapped_file(file_path) as content:
+            # Look for patterns like: << "icon-name", only inside icon list
+            # statements; this is more specific than the general validator
+            line_num, line_start = 1, 0
+            for statement in ICON_LIST_STATEMENT_RE.finditer(content):
+                for entry in ICON_LIST_ENTRY_RE.finditer(
+                    content, statement.start(), statement.end()
+                ):
+                    match = entry.group(1).decode("ascii")
                     # Additional filter: should look like an icon name
-                    if (
-                        len(match) >= 2
-                        and len(match) <= 30
-                        and "-" in match
-                        or len(match) <= 15
-                    ):
+                    if len(match) <= 30 and "-" in match or len(match) <= 15:
+                        line_num += content[line_start : entry.start()].count(b"\n")
+                        line_start = entry.start()
                         icons.append((match, line_num))
 
-                # End of icon list (semicolon without <<)
-                if ";" in line and "<<" not in line:
-                    in_icon_list = False
-
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
 
     return icons
 
 
-def suggest_similar_icons(invalid_icon: str, available_icons: Set[str]) -> List[str]:
+class IconIndex:
+    """Lookup tables for finding icons similar to an unknown name"""
+
+    def __init__(self, available_icons: Set[str]):
+        self.available_icons = available_icons
+        self.names = sorted(available_icons)
+
+        # Each icon's hyphen separated words, and icons by each word
+        self.icon_words = {icon: frozenset(icon.split("-")) for icon in self.names}
+        self.word_index = defaultdict(set)
+        for icon, words in self.icon_words.items():
+            for word in words:
+                self.word_index[word].add(icon)
+
+        # All names joined into one string, so that finding the icons that
+        # contain some text is a str.find scan instead of a Python loop
+        self.blob = "\n".join(self.names)
+        self.offsets = []
+        offset = 0
+        for icon in self.names:
+            self.offsets.append(offset)
+            offset += len(icon) + 1
+
+    def containing(self, text: str) -> Set[str]:
+        """Icons whose name contains text"""
+        found = set()
+        start = self.blob.find(text)
+        while start != -1:
+            i = bisect.bisect_right(self.offsets, start) - 1
+            found.add(self.names[i])
+            start = self.blob.find(text, self.offsets[i] + len(self.names[i]))
+        return found
+
+    def contained_in(self, text: str) -> Set[str]:
+        """Icons whose name is a substring of text"""
+        substrings = {
+            text[i:j] for i in range(len(text)) for j in range(i + 1, len(text) + 1)
+        }
+        return substrings & self.available_icons
+
+    def words_similarity(self, words: FrozenSet[str], icon: str) -> float:
+        """Jaccard similarity between a set of words and an icon's words"""
+        icon_words = self.icon_words[icon]
+        common = len(words & icon_words)
+        return common / (len(words) + len(icon_words) - common)
+
+    def sharing_words(self, text: str) -> Set[str]:
+        """Icons with at least one hyphen separated word in common with text"""
+        return set().union(
+            *(
+                self.word_index[word]
+                for word in text.split("-")
+                if word in self.word_index
+            )
+        )
+
+
+def suggest_similar_icons(
+    invalid_icon: str, available_icons: Set[str], index: IconIndex = None
+) -> List[str]:
     """Suggest similar icon names"""
+    if index is None:
+        index = IconIndex(available_icons)
+
     suggestions = []
 
     # Common mappings first
@@ -99,21 +176,26 @@ def suggest_similar_icons(invalid_icon: str, available_icons: Set[str]) -> List[
         ]
         suggestions.extend(mapped_suggestions)
 
+    def add_ranked(candidates):
+        # Most similar first; only the small candidate set is compared
+        candidates = candidates.difference(suggestions)
+        suggestions.extend(
+            sorted(
+                candidates,
+                key=lambda icon: (
+                    -SequenceMatcher(None, invalid_icon, icon).ratio(),
+                    icon,
+                ),
+            )
+        )
+
     # Exact substring matches
-    for icon in available_icons:
-        if invalid_icon in icon or icon in invalid_icon:
-            if icon not in suggestions:
-                suggestions.append(icon)
+    add_ranked(index.containing(invalid_icon) | index.contained_in(invalid_icon))
 
     # Word-based similarity
-    invalid_words = set(invalid_icon.split("-"))
-    for icon in available_icons:
-        icon_words = set(icon.split("-"))
-        if invalid_words.intersection(icon_words):
-            if icon not in suggestions:
-                suggestions.append(icon)
-
-    # Remove duplicates and limit
+    if len(suggestions) < 5:
+        add_ranked(index.sharing_words(invalid_icon))
+
     return suggestions[:5]
 
 
@@ -128,6 +210,7 @@ def check_examples(project_root: Path) -> bool:
         return False
 
     print(f"Loaded {len(available_icons)} available icons")
+    icon_index = IconIndex(available_icons)
 
     # Check examples
     examples_dir = project_root / "examples"
@@ -143,13 +226,16 @@ def check_examples(project_root: Path) -> bool:
         examples_dir / "basic_usage" / "MainWindow.cpp",
         examples_dir / "gallery" / "main.cpp",
     ]
+    example_files = [file_path for file_path in example_files if file_path.exists()]
 
-    for file_path in example_files:
-        if not file_path.exists():
-            continue
+    # Read the files concurrently; results keep the order of example_files
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(example_files)))) as pool:
+        icon_lists = dict(
+            zip(example_files, pool.map(extract_icon_list_from_cpp, example_files))
+        )
 
+    for file_path, icons in icon_lists.items():
         print(f"\nChecking {file_path.relative_to(project_root)}...")
-        icons = extract_icon_list_from_cpp(file_path)
 
         if not icons:
             print("  No icon lists found")
@@ -166,7 +252,9 @@ def check_examples(project_root: Path) -> bool:
             print(f"  ❌ Found {len(invalid_icons)} invalid icons:")
             for icon_name, line_num in invalid_icons:
                 print(f"    Line {line_num}: '{icon_name}'")
-                suggestions = suggest_similar_icons(icon_name, available_icons)
+                suggestions = suggest_similar_icons(
+                    icon_name, available_icons, icon_index
+                )
                 if suggestions:
                     print(f"      Suggestions: {', '.join(suggestions[:3])}")
         else:
@@ -201,27 +289,36 @@ def generate_icon_fix_suggestions(project_root: Path) -> None:
 
     fix_file = project_root / "ICON_NAME_FIXES.md"
 
-    with open(fix_file, "w", encoding="utf-8") as f:
-        f.write("# QtLucide Icon Name Reference\n\n")
-        f.write("Common icon name mappings for QtLucide (based on Lucide icons):\n\n")
-
-        for expected, actual_options in common_mappings.items():
-            # Filter to only include icons that actually exist
-            existing_options = [
-                icon for icon in actual_options if icon in available_icons
-            ]
-            if existing_options:
-                f.write(f"- `{expected}` → `{existing_options[0]}`")
-                if len(existing_options) > 1:
-                    f.write(f" (alternatives: {', '.join(existing_options[1:])})")
-                f.write("\n")
-
-        f.write(f"\n## All Available Icons ({len(available_icons)} total)\n\n")
-        f.write("```\n")
-        for icon in sorted(available_icons):
-            f.write(f"{icon}\n")
-        f.write("```\n")
+    f = io.StringIO()
+    f.write("# QtLucide Icon Name Reference\n\n")
+    f.write("Common icon name mappings for QtLucide (based on Lucide icons):\n\n")
+
+    for expected, actual_options in common_mappings.items():
+        # Filter to only include icons that actually exist
+        existing_options = [icon for icon in actual_options if icon in available_icons]
+        if existing_options:
+            f.write(f"- `{expected}` → `{existing_options[0]}`")
+            if len(existing_options) > 1:
+                f.write(f" (alternatives: {', '.join(existing_options[1:])})")
+            f.write("\n")
+
+    f.write(f"\n## All Available Icons ({len(available_icons)} total)\n\n")
+    f.write("```\n")
+    for icon in sorted(available_icons):
+        f.write(f"{icon}\n")
+    f.write("```\n")
+
+    # Only rewrite the file when its content changes, keeping its timestamp
+    content = f.getvalue().encode("utf-8")
+    try:
+        unchanged = fix_file.read_bytes() == content
+    except OSError:
+        unchanged = False
+    if unchanged:
+        print(f"Icon reference is up to date: {fix_file}")
+        return
 
+    fix_file.write_bytes(content)
     print(f"Generated icon reference: {fix_file}")
 
 
@@ -4,146 +4,80 @@ Generate C++ header files from Lucide icon metadata.
 Creates enum definitions and string mappings for QtLucide.
 """
 
-import json
+import functools
+import io
 import re
 from pathlib import Path
+from typing import List, Tuple
+
+from _atomic_write import write_text_atomic
+from _icons_cache import load_json_cached
+
+# Characters not allowed in a C++ identifier, and a leading digit
+INVALID_IDENTIFIER_CHARS_RE = re.compile(r"[^a-zA-Z0-9_]")
+LEADING_DIGIT_RE = re.compile(r"^(\d)")
+
+# C++ keywords that cannot be used as enum names
+CPP_KEYWORDS = frozenset(
+    {
+        "delete",
+        "new",
+        "class",
+        "struct",
+        "enum",
+        "union",
+        "typedef",
+        "static",
+        "const",
+        "volatile",
+        "inline",
+        "virtual",
+        "explicit",
+        "operator",
+        "template",
+        "typename",
+        "namespace",
+        "using",
+        "public",
+        "private",
+        "protected",
+        "friend",
+        "extern",
+        "register",
+        "auto",
+        "void",
+        "char",
+        "short",
+        "int",
+        "long",
+        "float",
+        "double",
+        "signed",
+        "unsigned",
+        "bool",
+        "true",
+        "false",
+        "if",
+        "else",
+        "for",
+        "while",
+        "do",
+        "switch",
+        "case",
+        "default",
+        "break",
+        "continue",
+        "return",
+        "goto",
+        "try",
+        "catch",
+        "throw",
+        "sizeof",
+    }
+)
 
-
-class QtLucideHeaderGenerator:
-    def __init__(self, metadata_dir: str, output_dir: str):
-        self.metadata_dir = Path(metadata_dir)
-        self.output_dir = Path(output_dir)
-        self.icons_data = {}
-
-    def load_metadata(self):
-        """Load icon metadata from JSON files"""
-        icons_file = self.metadata_dir / "icons.json"
-        with open(icons_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.icons_data = data["icons"]
-
-        print(f"Loaded metadata for {len(self.icons_data)} icons")
-
-    def generate_headers(self):
-        """Generate all header files"""
-        self.output_dir.mkdir(parents=True, exist_ok=True)
-
-        self.generate_enums_header()
-        self.generate_strings_header()
-
-        print("Header generation complete")
-
-    def generate_enums_header(self):
-        """Generate QtLucideEnums.h with icon enum definitions"""
-        header_content = self._get_enum_header_template()
-
-        # Generate enum values
-        enum_values = []
-        for i, icon_name in enumerate(sorted(self.icons_data.keys())):
-            enum_name = self._name_to_enum(icon_name)
-            enum_values.append(f"    {enum_name} = {i}")
-
-        enum_content = ",\n".join(enum_values)
-        header_content = header_content.replace("{{ENUM_VALUES}}", enum_content)
-        header_content = header_content.replace(
-            "{{ICON_COUNT}}", str(len(self.icons_data))
-        )
-
-        output_file = self.output_dir / "QtLucideEnums.h"
-        output_file.write_text(header_content, encoding="utf-8")
-
-        print(f"Generated {output_file} with {len(self.icons_data)} enum values")
-
-    def generate_strings_header(self):
-        """Generate QtLucideStrings.h with string mappings"""
-        header_content = self._get_strings_header_template()
-
-        # Generate string array
-        string_entries = []
-        for icon_name in sorted(self.icons_data.keys()):
-            enum_name = self._name_to_enum(icon_name)
-            string_entries.append(f'    {{Icons::{enum_name}, "{icon_name}"}}')
-
-        strings_content = ",\n".join(string_entries)
-        header_content = header_content.replace("{{STRING_MAPPINGS}}", strings_content)
-
-        output_file = self.output_dir / "QtLucideStrings.h"
-        output_file.write_text(header_content, encoding="utf-8")
-
-        print(f"Generated {output_file} with {len(self.icons_data)} string mappings")
-
-    def _name_to_enum(self, name: str) -> str:
-        """Convert icon name to enum constant name"""
-        # Replace hyphens with underscores and ensure valid C++ identifier
-        enum_name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        enum_name = re.sub(
-            r"^(\d)", r"Icon_\1", enum_name
-        )  # Prefix if starts with digit
-
-        # Handle C++ reserved keywords
-        cpp_keywords = {
-            "delete",
-            "new",
-            "class",
-            "struct",
-            "enum",
-            "union",
-            "typedef",
-            "static",
-            "const",
-            "volatile",
-            "inline",
-            "virtual",
-            "explicit",
-            "operator",
-            "template",
-            "typename",
-            "namespace",
-            "using",
-            "public",
-            "private",
-            "protected",
-            "friend",
-            "extern",
-            "register",
-            "auto",
-            "void",
-            "char",
-            "short",
-            "int",
-            "long",
-            "float",
-            "double",
-            "signed",
-            "unsigned",
-            "bool",
-            "true",
-            "false",
-            "if",
-            "else",
-            "for",
-            "while",
-            "do",
-            "switch",
-            "case",
-            "default",
-            "break",
-            "continue",
-            "return",
-            "goto",
-            "try",
-            "catch",
-            "throw",
-            "sizeof",
-        }
-
-        if enum_name in cpp_keywords:
-            enum_name = f"icon_{enum_name}"
-
-        return enum_name
-
-    def _get_enum_header_template(self) -> str:
-        return """/**
+# Generated header text around the per-icon entries
+ENUM_HEADER_PROLOGUE = """/**
  * QtLucide - use Lucide icons in your Qt Application
  *
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
@@ -162,20 +96,23 @@ namespace lucide {
  * @brief Enumeration of all available Lucide icons
  */
 enum class Icons {
-{{ENUM_VALUES}}
+"""
+
+# Formatted with the icon count
+ENUM_HEADER_EPILOGUE = """
 };
 
 /**
  * @brief Total number of available icons
  */
-constexpr int ICON_COUNT = {{ICON_COUNT}};
+constexpr int ICON_COUNT = %d;
 
 } // namespace lucide
 
-#endif // QTLUCIDEENUMS_H"""
+#endif // QTLUCIDEENUMS_H
+"""
 
-    def _get_strings_header_template(self) -> str:
-        return """/**
+STRINGS_HEADER_PROLOGUE = """/**
  * QtLucide - use Lucide icons in your Qt Application
  *
  * AUTO-GENERATED FILE - DO NOT EDIT MANUALLY
@@ -195,28 +132,171 @@ constexpr int ICON_COUNT = {{ICON_COUNT}};
 namespace lucide {
 
 /**
- * @brief Mapping from icon enum to string name
+ * @brief Mappings between icon enums and string names, filled together
  */
-static const QHash<Icons, QString> ICON_TO_STRING_MAP = {
-{{STRING_MAPPINGS}}
+struct IconNameMaps {
+    QHash<Icons, QString> iconToString;
+    QHash<QString, Icons> stringToIcon;
 };
 
+static IconNameMaps createIconNameMaps() {
+    IconNameMaps maps;
+    maps.iconToString.reserve(ICON_COUNT);
+    maps.stringToIcon.reserve(ICON_COUNT);
+"""
+
+STRINGS_HEADER_EPILOGUE = """
+    return maps;
+}
+
+static const IconNameMaps ICON_NAME_MAPS = createIconNameMaps();
+
 /**
- * @brief Mapping from string name to icon enum
+ * @brief Mapping from icon enum to string name
  */
-static QHash<QString, Icons> createStringToIconMap() {
-    QHash<QString, Icons> map;
-    for (auto it = ICON_TO_STRING_MAP.begin(); it != ICON_TO_STRING_MAP.end(); ++it) {
-        map[it.value()] = it.key();
-    }
-    return map;
-}
+static const QHash<Icons, QString>& ICON_TO_STRING_MAP = ICON_NAME_MAPS.iconToString;
 
-static const QHash<QString, Icons> STRING_TO_ICON_MAP = createStringToIconMap();
+/**
+ * @brief Mapping from string name to icon enum
+ */
+static const QHash<QString, Icons>& STRING_TO_ICON_MAP = ICON_NAME_MAPS.stringToIcon;
 
 } // namespace lucide
 
-#endif // QTLUCIDESTRINGS_H"""
+#endif // QTLUCIDESTRINGS_H
+"""
+
+
+# ColumnLimit from .clang-format; generated lines are wrapped the way
+# clang-format would, so regenerating leaves the committed headers unchanged
+COLUMN_LIMIT = 100
+
+
+def format_insert(map_name: str, key: str, value: str) -> str:
+    """Format one map insert, aligning a wrapped value after the bracket"""
+    call = f"    maps.{map_name}.insert("
+    line = f"{call}{key}, {value});"
+    if len(line) <= COLUMN_LIMIT:
+        return line
+    return f"{call}{key},\n{' ' * len(call)}{value});"
+
+
+class QtLucideHeaderGenerator:
+    def __init__(self, metadata_dir: str, output_dir: str):
+        self.metadata_dir = Path(metadata_dir)
+        self.output_dir = Path(output_dir)
+        self.icons_data = {}
+
+    def load_metadata(self):
+        """Load icon metadata from JSON files"""
+        icons_file = self.metadata_dir / "icons.json"
+        self.icons_data = load_json_cached(icons_file)["icons"]
+
+        print(f"Loaded metadata for {len(self.icons_data)} icons")
+
+    def generate_headers(self):
+        """Generate all header files"""
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        # Sort and convert the names once for both headers
+        icons = self._sorted_icons()
+        self.generate_enums_header(icons)
+        self.generate_strings_header(icons)
+
+        print("Header generation complete")
+
+    def _sorted_icons(self) -> List[Tuple[str, str]]:
+        """Pair each icon name, in enum order, with its enum name"""
+        return [(name, self._name_to_enum(name)) for name in sorted(self.icons_data)]
+
+    def generate_enums_header(self, icons: List[Tuple[str, str]] = None):
+        """Generate QtLucideEnums.h with icon enum definitions"""
+        if icons is None:
+            icons = self._sorted_icons()
+
+        buf = io.StringIO()
+        buf.write(ENUM_HEADER_PROLOGUE)
+
+        # Generate enum values
+        buf.write(
+            ",\n".join(
+                f"    {enum_name} = {i}" for i, (_, enum_name) in enumerate(icons)
+            )
+        )
+
+        buf.write(ENUM_HEADER_EPILOGUE % len(self.icons_data))
+
+        output_file = self.output_dir / "QtLucideEnums.h"
+        write_text_atomic(output_file, buf.getvalue())
+
+        print(f"Generated {output_file} with {len(self.icons_data)} enum values")
+
+    def generate_strings_header(self, icons: List[Tuple[str, str]] = None):
+        """Generate QtLucideStrings.h with string mappings"""
+        if icons is None:
+            icons = self._sorted_icons()
+
+        buf = io.StringIO()
+        buf.write(STRINGS_HEADER_PROLOGUE)
+
+        # Generate map inserts, with literals so no string is converted at startup;
+        # both directions are filled here rather than inverting one map at runtime
+        buf.write(
+            "\n".join(
+                format_insert(
+                    "iconToString",
+                    f"Icons::{enum_name}",
+                    f'QStringLiteral("{icon_name}")',
+                )
+                + "\n"
+                + format_insert(
+                    "stringToIcon",
+                    f'QStringLiteral("{icon_name}")',
+                    f"Icons::{enum_name}",
+                )
+                for icon_name, enum_name in icons
+            )
+        )
+
+        buf.write(STRINGS_HEADER_EPILOGUE)
+
+        output_file = self.output_dir / "QtLucideStrings.h"
+        write_text_atomic(output_file, buf.getvalue())
+
+        print(f"Generated {output_file} with {len(self.icons_data)} string mappings")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _name_to_enum(name: str) -> str:
+        """Convert icon name to enum constant name"""
+        # Replace hyphens with underscores and ensure valid C++ identifier
+        enum_name = INVALID_IDENTIFIER_CHARS_RE.sub("_", name)
+        # Prefix if starts with digit
+        enum_name = LEADING_DIGIT_RE.sub(r"Icon_\1", enum_name)
+
+        # Handle C++ reserved keywords
+
+        if enum_name in CPP_KEYWORDS:
+            enum_name = f"icon_{enum_name}"
+
+        return enum_name
+
+
+def generate_headers(
+    metadata_dir: str, output_dir: str, icons_data: dict = None
+) -> bool:
+    """Generate the C++ headers, reading icons.json unless icons_data is given"""
+    generator = QtLucideHeaderGenerator(metadata_dir, output_dir)
+    try:
+        if icons_data is None:
+            generator.load_metadata()
+        else:
+            generator.icons_data = icons_data
+        generator.generate_headers()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error generating headers: {e}")
+        return False
+    return True
 
 
 def main():
@@ -226,12 +306,8 @@ def main():
         print("Usage: python generate_headers.py <metadata_dir> <output_dir>")
         sys.exit(1)
 
-    metadata_dir = sys.argv[1]
-    output_dir = sys.argv[2]
-
-    generator = QtLucideHeaderGenerator(metadata_dir, output_dir)
-    generator.load_metadata()
-    generator.generate_headers()
+    if not generate_headers(sys.argv[1], sys.argv[2]):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -3,9 +3,23 @@
 Generate Qt resource file (.qrc) for embedding Lucide SVG icons.
 """
 
-import json
+import io
+import itertools
 from pathlib import Path
 
+from _atomic_write import write_text_atomic
+from _icons_cache import load_json_cached
+
+# Generated resource file text around the file entries
+QRC_PROLOGUE = """<RCC>
+    <qresource prefix="/lucide">
+"""
+
+QRC_EPILOGUE = """
+    </qresource>
+</RCC>
+"""
+
 
 class QrcGenerator:
     def __init__(self, metadata_dir: str, svg_dir: str, output_file: str):
@@ -17,23 +31,17 @@ class QrcGenerator:
     def load_metadata(self):
         """Load icon metadata"""
         icons_file = self.metadata_dir / "icons.json"
-        with open(icons_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            self.icons_data = data["icons"]
+        self.icons_data = load_json_cached(icons_file)["icons"]
 
     def generate_qrc(self):
         """Generate the .qrc file"""
         self.output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        qrc_content = self._get_qrc_template()
-
-        # Generate file entries
-        file_entries = []
-
-        # Add SVG icon files
-        for icon_name in sorted(self.icons_data.keys()):
-            svg_file = f"svg/{icon_name}.svg"
-            file_entries.append(f'        <file alias="{icon_name}">{svg_file}</file>')
+        # SVG icon file entries
+        icon_entries = (
+            f'        <file alias="{icon_name}">svg/{icon_name}.svg</file>'
+            for icon_name in sorted(self.icons_data)
+        )
 
         # Add metadata files
         metadata_files = [
@@ -42,29 +50,44 @@ class QrcGenerator:
             ("metadata/tags.json", "metadata/tags.json"),
         ]
 
+        metadata_entries = []
         print(f"Adding {len(metadata_files)} metadata files...")
         for alias, file_path in metadata_files:
             full_path = self.metadata_dir.parent / file_path
             if full_path.exists():
-                file_entries.append(f'        <file alias="{alias}">{file_path}</file>')
+                metadata_entries.append(
+                    f'        <file alias="{alias}">{file_path}</file>'
+                )
                 print(f"  Added: {alias} -> {file_path}")
             else:
                 print(f"  Warning: File not found: {full_path}")
 
-        files_content = "\n".join(file_entries)
-        qrc_content = qrc_content.replace("{{FILE_ENTRIES}}", files_content)
+        buf = io.StringIO()
+        buf.write(QRC_PROLOGUE)
+        buf.write("\n".join(itertools.chain(icon_entries, metadata_entries)))
+        buf.write(QRC_EPILOGUE)
 
-        self.output_file.write_text(qrc_content, encoding="utf-8")
+        write_text_atomic(self.output_file, buf.getvalue())
         print(
             f"Generated {self.output_file} with {len(self.icons_data)} icon files and metadata"
         )
 
-    def _get_qrc_template(self) -> str:
-        return """<RCC>
-    <qresource prefix="/lucide">
-{{FILE_ENTRIES}}
-    </qresource>
-</RCC>"""
+
+def generate_qrc(
+    metadata_dir: str, svg_dir: str, output_file: str, icons_data: dict = None
+) -> bool:
+    """Generate the .qrc file, reading icons.json unless icons_data is given"""
+    generator = QrcGenerator(metadata_dir, svg_dir, output_file)
+    try:
+        if icons_data is None:
+            generator.load_metadata()
+        else:
+            generator.icons_data = icons_data
+        generator.generate_qrc()
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error generating QRC: {e}")
+        return False
+    return True
 
 
 def main():
@@ -74,13 +97,8 @@ def main():
         print("Usage: python generate_qrc.py <metadata_dir> <svg_dir> <output_qrc>")
         sys.exit(1)
 
-    metadata_dir = sys.argv[1]
-    svg_dir = sys.argv[2]
-    output_file = sys.argv[3]
-
-    generator = QrcGenerator(metadata_dir, svg_dir, output_file)
-    generator.load_metadata()
-    generator.generate_qrc()
+    if not generate_qrc(sys.argv[1], sys.argv[2], sys.argv[3]):
+        sys.exit(1)
 
 
 if __name__ == "__main__":
@@ -4,9 +4,92 @@ Process Lucide icons from the cloned repository.
 Extracts SVG files, processes metadata, and prepares for embedding.
 """
 
+import hashlib
 import json
+import os
 import re
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional, speeds up reading and writing metadata
+    orjson = None
+
+# Patterns stripped or collapsed by optimize_svg; XML declarations and
+# comments share one pattern so they are removed in a single pass
+XML_DECL_OR_COMMENT_RE = re.compile(rb"<\?xml[^>]*\?>|<!--.*?-->", re.DOTALL)
+WS_RE = re.compile(rb"\s+")
+
+# Digests of the SVGs last written, used to skip rewriting unchanged icons
+SVG_MANIFEST_FILE = ".svg_manifest.json"
+
+
+def json_loads(data: bytes):
+    """Parse JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps_pretty(obj) -> bytes:
+    """Serialize JSON indented by two spaces, with orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def optimize_svg(svg_content: bytes) -> bytes:
+    """Optimize raw SVG content for embedding"""
+    # Remove XML declaration if present, and comments
+    svg_content = XML_DECL_OR_COMMENT_RE.sub(b"", svg_content)
+
+    # Remove unnecessary whitespace
+    svg_content = WS_RE.sub(b" ", svg_content)
+    svg_content = svg_content.strip()
+
+    # Ensure consistent attributes
+    if b"xmlns=" not in svg_content:
+        svg_content = svg_content.replace(
+            b"<svg", b'<svg xmlns="http://www.w3.org/2000/svg"', 1
+        )
+
+    return svg_content
+
+
+def load_icon(svg_file: Path) -> Tuple[str, Dict, bytes]:
+    """Read one icon, returning its name, icon data and optimized SVG"""
+    icon_name = svg_file.stem
+    json_file = svg_file.with_suffix(".json")
+
+    # Read SVG content; it is processed as bytes, since SVG markup is
+    # ASCII and only passes through unchanged
+    svg_content = svg_file.read_bytes()
+
+    # Read metadata if available
+    metadata = {}
+    if json_file.exists():
+        metadata = json_loads(json_file.read_bytes())
+
+    icon_data = {
+        "name": icon_name,
+        "svg_file": f"svg/{icon_name}.svg",
+        "tags": metadata.get("tags", []),
+        "categories": metadata.get("categories", []),
+        "contributors": metadata.get("contributors", []),
+    }
+
+    return icon_name, icon_data, optimize_svg(svg_content)
+
+
+def _load_icon_safely(svg_file: Path):
+    """Worker for load_icon that reports failures as an error message"""
+    try:
+        return load_icon(svg_file), None
+    except Exception as e:
+        return None, f"Error processing {svg_file}: {e}"
 
 
 class LucideIconProcessor:
@@ -14,6 +97,21 @@ class LucideIconProcessor:
         self.source_dir = Path(source_dir)
         self.output_dir = Path(output_dir)
         self.icons_data = {}
+        self.manifest_file = self.output_dir / SVG_MANIFEST_FILE
+        self.svg_digests = self._load_manifest()
+
+    def _load_manifest(self) -> Dict[str, str]:
+        """Load the digests of previously written SVGs, if there are any"""
+        try:
+            manifest = json_loads(self.manifest_file.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_manifest(self):
+        """Record the digests of the SVGs written by this run"""
+        digests = {name: self.svg_digests[name] for name in sorted(self.icons_data)}
+        self.manifest_file.write_bytes(json_dumps_pretty(digests))
 
     def process_icons(self):
         """Main processing function"""
@@ -25,74 +123,60 @@ class LucideIconProcessor:
         (self.output_dir / "metadata").mkdir(exist_ok=True)
 
         # Process all icons
-        icon_files = list(self.source_dir.glob("*.svg"))
+        with os.scandir(self.source_dir) as it:
+            icon_files = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.endswith(".svg") and entry.is_file()
+            ]
         print(f"Found {len(icon_files)} SVG files")
 
+        # Icons are read and optimized across all cores; the results come
+        # back in order and are saved here, so icons_data stays ordered
         processed_count = 0
-        for svg_file in icon_files:
-            if self.process_single_icon(svg_file):
-                processed_count += 1
+        with ProcessPoolExecutor() as executor:
+            for icon, error in executor.map(
+                _load_icon_safely, icon_files, chunksize=32
+            ):
+                if error:
+                    print(error)
+                elif self._save_icon(*icon):
+                    processed_count += 1
 
         print(f"Successfully processed {processed_count} icons")
+        self._save_manifest()
 
         # Generate metadata files
         self.generate_metadata()
 
     def process_single_icon(self, svg_file: Path) -> bool:
         """Process a single icon file"""
-        try:
-            icon_name = svg_file.stem
-            json_file = svg_file.with_suffix(".json")
-
-            # Read SVG content
-            svg_content = svg_file.read_text(encoding="utf-8")
-
-            # Read metadata if available
-            metadata = {}
-            if json_file.exists():
-                metadata = json.loads(json_file.read_text(encoding="utf-8"))
-
-            # Optimize SVG content
-            optimized_svg = self.optimize_svg(svg_content)
+        icon, error = _load_icon_safely(svg_file)
+        if error:
+            print(error)
+            return False
+        return self._save_icon(*icon)
 
-            # Save optimized SVG
-            output_svg = self.output_dir / "svg" / f"{icon_name}.svg"
-            output_svg.write_text(optimized_svg, encoding="utf-8")
+    def _save_icon(self, icon_name: str, icon_data: Dict, optimized_svg: bytes) -> bool:
+        """Save an optimized SVG and record its icon data"""
+        output_svg = self.output_dir / "svg" / f"{icon_name}.svg"
+        digest = hashlib.blake2b(optimized_svg, digest_size=16).hexdigest()
 
-            # Store icon data
-            self.icons_data[icon_name] = {
-                "name": icon_name,
-                "svg_file": f"svg/{icon_name}.svg",
-                "tags": metadata.get("tags", []),
-                "categories": metadata.get("categories", []),
-                "contributors": metadata.get("contributors", []),
-            }
+        # Leave unchanged SVGs untouched so rcc does not recompile them
+        if self.svg_digests.get(icon_name) != digest or not output_svg.exists():
+            try:
+                output_svg.write_bytes(optimized_svg)
+            except OSError as e:
+                print(f"Error processing {icon_name}: {e}")
+                return False
 
-            return True
-
-        except Exception as e:
-            print(f"Error processing {svg_file}: {e}")
-            return False
+        self.svg_digests[icon_name] = digest
+        self.icons_data[icon_name] = icon_data
+        return True
 
     def optimize_svg(self, svg_content: str) -> str:
         """Optimize SVG content for embedding"""
-        # Remove XML declaration if present
-        svg_content = re.sub(r"<\?xml[^>]*\?>", "", svg_content)
-
-        # Remove comments
-        svg_content = re.sub(r"<!--.*?-->", "", svg_content, flags=re.DOTALL)
-
-        # Remove unnecessary whitespace
-        svg_content = re.sub(r"\s+", " ", svg_content)
-        svg_content = svg_content.strip()
-
-        # Ensure consistent attributes
-        if "xmlns=" not in svg_content:
-            svg_content = svg_content.replace(
-                "<svg", '<svg xmlns="http://www.w3.org/2000/svg"'
-            )
-
-        return svg_content
+        return optimize_svg(svg_content.encode("utf-8")).decode("utf-8")
 
     def generate_metadata(self):
         """Generate metadata files for code generation"""
@@ -104,29 +188,22 @@ class LucideIconProcessor:
         }
 
         metadata_file = self.output_dir / "metadata" / "icons.json"
-        metadata_file.write_text(json.dumps(icon_list, indent=2), encoding="utf-8")
+        metadata_file.write_bytes(json_dumps_pretty(icon_list))
 
-        # Generate categories mapping
-        categories = {}
+        # Generate categories and tags mappings in a single pass
+        categories = defaultdict(list)
+        tags = defaultdict(list)
         for icon_name, icon_data in self.icons_data.items():
-            for category in icon_data.get("categories", []):
-                if category not in categories:
-                    categories[category] = []
+            for category in icon_data.get("categories", ()):
                 categories[category].append(icon_name)
+            for tag in icon_data.get("tags", ()):
+                tags[tag].append(icon_name)
 
         categories_file = self.output_dir / "metadata" / "categories.json"
-        categories_file.write_text(json.dumps(categories, indent=2), encoding="utf-8")
-
-        # Generate tags mapping
-        tags = {}
-        for icon_name, icon_data in self.icons_data.items():
-            for tag in icon_data.get("tags", []):
-                if tag not in tags:
-                    tags[tag] = []
-                tags[tag].append(icon_name)
+        categories_file.write_bytes(json_dumps_pretty(categories))
 
         tags_file = self.output_dir / "metadata" / "tags.json"
-        tags_file.write_text(json.dumps(tags, indent=2), encoding="utf-8")
+        tags_file.write_bytes(json_dumps_pretty(tags))
 
         print(f"Generated metadata for {len(self.icons_data)} icons")
         print(f"Categories: {len(categories)}")
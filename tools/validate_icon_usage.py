@@ -7,12 +7,163 @@ actually exist in the QtLucide icon set. It provides compile-time
 checking to prevent runtime icon loading failures.
 """
 
-import json
+import bisect
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from _icons_cache import load_json_cached
+from check_example_icons import ICON_MAPPING_RE, IconIndex, mapped_file
+
+NEWLINE_RE = re.compile(rb"\n")
+
+# Icon usage patterns, and whether matches must look like an icon name. None
+# of them match across lines, so a match always belongs to a single line
+ICON_USAGE_PATTERNS = [
+    # Pattern 1: String literals that look like icon names
+    # "icon-name"
+    (re.compile(rb'"([a-z][a-z0-9-]*[a-z0-9])"'), True),
+    # 'icon-name'
+    (re.compile(rb"'([a-z][a-z0-9-]*[a-z0-9])'"), True),
+    # Pattern 2: QtLucide method calls
+    # .icon("name")
+    (re.compile(rb'\.icon[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\']'), False),
+    # .setIcon("name")
+    (re.compile(rb'\.setIcon[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\']'), False),
+    # QtLucide::method("name")
+    (re.compile(rb'QtLucide::\w+[^\S\n]*\([^\S\n]*["\']([^"\'\n]+)["\']'), False),
+]
+
+
+# Strings that look like icon names but are common non-icon words
+NON_ICON_WORDS = frozenset(
+    {
+        # Common programming terms
+        "error",
+        "warning",
+        "info",
+        "debug",
+        "test",
+        "example",
+        "sample",
+        "main",
+        "window",
+        "widget",
+        "button",
+        "label",
+        "layout",
+        "dialog",
+        "application",
+        "version",
+        "author",
+        "license",
+        "copyright",
+        "true",
+        "false",
+        "null",
+        "undefined",
+        "none",
+        "empty",
+        # UI/CSS terms
+        "color",
+        "size",
+        "width",
+        "height",
+        "opacity",
+        "scale-factor",
+        "geometry",
+        "icon",
+        "svg",
+        "png",
+        "ico",
+        "pdf",
+        "icns",
+        "selected",
+        "hovered",
+        "favorite",
+        "name",
+        "format",
+        "mode",
+        "clicked",
+        "about",
+        "value",
+        "count",
+        "icons",
+        "px",
+        "ms",
+        # Theme/appearance terms
+        "theme",
+        "system",
+        "light",
+        "dark",
+        "compact",
+        "grid",
+        "language",
+        "en",
+        "black",
+        "white",
+        # Test-specific terms
+        "non-existent-icon",
+        "test-icon",
+        "invalid-icon",
+        "example-icon",
+        "heart-icon",
+        "icon-heart",
+        "test-null",
+        "not-a-color",
+        "not-a-number",
+        "corrupted-test",
+        "null-painter",
+        "invalid-painter",
+        "exception-painter",
+        "test-painter",
+        "memory-test-painter",
+        "replacement-painter",
+        "lifetime-painter",
+        "non-existent",
+        "invalid",
+        "unknown",
+        "high-contrast",
+        "color-disabled",
+        "test-option",
+        "test-value",
+        "race-painter",
+        "extreme-painter",
+        "memory-painter",
+        "slow-painter",
+        # Data/metadata terms
+        "categories",
+        "contributors",
+        "favorites",
+        "timestamp",
+        "usage",
+        "recent",
+        "criteria",
+        "quotes",
+        "with",
+        "nested",
+        "level1",
+        "level2",
+        "level3",
+        "value1",
+        "value2",
+        "inner",
+        "x64",
+        # Generic terms
+        "arrows",
+        "communication",
+        "media",
+        "cal",
+        "arrow",
+    }
+)
+
+# Lowercase letters, numbers and hyphens
+ICON_NAME_RE = re.compile(r"^[a-z][a-z0-9-]*[a-z0-9]$")
+
 
 class IconUsageValidator:
     def __init__(self, project_root: str):
@@ -20,6 +171,7 @@ class IconUsageValidator:
         self.available_icons: Set[str] = set()
         self.icon_usage: Dict[str, List[Tuple[str, int]]] = {}
         self.invalid_icons: Dict[str, List[Tuple[str, int]]] = {}
+        self._icon_index: Optional[IconIndex] = None
 
     def load_available_icons(self) -> bool:
         """Load the list of available icons from metadata or generated files."""
@@ -46,13 +198,11 @@ class IconUsageValidator:
     def _load_from_strings_header(self, strings_file: Path) -> bool:
         """Load icons from QtLucideStrings.h file."""
         try:
-            with open(strings_file, "r", encoding="utf-8") as f:
-                content = f.read()
-
-            # Extract icon names from the mapping
-            pattern = r'\{Icons::\w+,\s*"([^"]+)"\}'
-            matches = re.findall(pattern, content)
-            self.available_icons = set(matches)
+            # Extract icon names from the mapping, decoding only the names
+            with mapped_file(strings_file) as content:
+                self.available_icons = {
+                    name.decode("utf-8") for name in ICON_MAPPING_RE.findall(content)
+                }
             print(f"Loaded {len(self.available_icons)} icons from {strings_file}")
             return True
         except Exception as e:
@@ -62,8 +212,7 @@ class IconUsageValidator:
     def _load_from_metadata(self, metadata_file: Path) -> bool:
         """Load icons from metadata JSON file."""
         try:
-            with open(metadata_file, "r", encoding="utf-8") as f:
-                metadata = json.load(f)
+            metadata = load_json_cached(metadata_file)
 
             if isinstance(metadata, dict):
                 self.available_icons = set(metadata.keys())
@@ -81,8 +230,12 @@ class IconUsageValidator:
     def _load_from_svg_files(self, svg_dir: Path) -> bool:
         """Load icons from SVG files in directory."""
         try:
-            svg_files = list(svg_dir.glob("*.svg"))
-            self.available_icons = set(f.stem for f in svg_files)
+            with os.scandir(svg_dir) as it:
+                self.available_icons = {
+                    entry.name[:-4]
+                    for entry in it
+                    if entry.name.endswith(".svg") and entry.is_file()
+                }
             print(f"Loaded {len(self.available_icons)} icons from {svg_dir}")
             return True
         except Exception as e:
@@ -91,178 +244,44 @@ class IconUsageValidator:
 
     def scan_file_for_icons(self, file_path: Path) -> List[Tuple[str, int]]:
         """Scan a source file for icon usage patterns."""
-        icon_usages = []
+        found = []
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-
-            for line_num, line in enumerate(lines, 1):
-                # Pattern 1: String literals that look like icon names
-                string_patterns = [
-                    r'"([a-z][a-z0-9-]*[a-z0-9])"',  # "icon-name"
-                    r"'([a-z][a-z0-9-]*[a-z0-9])'",  # 'icon-name'
-                ]
-
-                for pattern in string_patterns:
-                    matches = re.findall(pattern, line)
-                    for match in matches:
+            # Scan the mapped file with bytes patterns, decoding only matches
+            with mapped_file(file_path) as content:
+                # Offsets at which each line starts, to map matches to lines
+                line_starts = [0]
+                line_starts.extend(m.end() for m in NEWLINE_RE.finditer(content))
+
+                # Each pattern scans the whole file once; matches are sorted
+                # back into line, then pattern, then position order
+                for order, (pattern, check_name) in enumerate(ICON_USAGE_PATTERNS):
+                    for match in pattern.finditer(content):
+                        name = match.group(1).decode("utf-8", errors="replace")
                         # Filter out obvious non-icon strings
-                        if self._looks_like_icon_name(match):
-                            icon_usages.append((match, line_num))
-
-                # Pattern 2: QtLucide method calls
-                qtlucide_patterns = [
-                    r'\.icon\s*\(\s*["\']([^"\']+)["\']',  # .icon("name")
-                    r'\.setIcon\s*\(\s*["\']([^"\']+)["\']',  # .setIcon("name")
-                    r'QtLucide::\w+\s*\(\s*["\']([^"\']+)["\']',  # QtLucide::method("name")
-                ]
-
-                for pattern in qtlucide_patterns:
-                    matches = re.findall(pattern, line)
-                    for match in matches:
-                        icon_usages.append((match, line_num))
+                        if check_name and not self._looks_like_icon_name(name):
+                            continue
+                        line_num = bisect.bisect_right(line_starts, match.start())
+                        found.append((line_num, order, match.start(), name))
 
         except Exception as e:
             print(f"Error scanning {file_path}: {e}")
 
-        return icon_usages
+        found.sort()
+        return [(name, line_num) for line_num, _, _, name in found]
 
     def _looks_like_icon_name(self, name: str) -> bool:
         """Check if a string looks like an icon name."""
-        # Basic heuristics for icon names
-        if len(name) < 2 or len(name) > 50:
-            return False
-
-        # Should contain only lowercase letters, numbers, and hyphens
-        if not re.match(r"^[a-z][a-z0-9-]*[a-z0-9]$", name):
+        # Cheap checks first, so the regex only runs on likely candidates
+        if len(name) < 2 or len(name) > 50 or not ("a" <= name[0] <= "z"):
             return False
 
         # Should not be common non-icon strings
-        non_icon_words = {
-            # Common programming terms
-            "error",
-            "warning",
-            "info",
-            "debug",
-            "test",
-            "example",
-            "sample",
-            "main",
-            "window",
-            "widget",
-            "button",
-            "label",
-            "layout",
-            "dialog",
-            "application",
-            "version",
-            "author",
-            "license",
-            "copyright",
-            "true",
-            "false",
-            "null",
-            "undefined",
-            "none",
-            "empty",
-            # UI/CSS terms
-            "color",
-            "size",
-            "width",
-            "height",
-            "opacity",
-            "scale-factor",
-            "geometry",
-            "icon",
-            "svg",
-            "png",
-            "ico",
-            "pdf",
-            "icns",
-            "selected",
-            "hovered",
-            "favorite",
-            "name",
-            "format",
-            "mode",
-            "clicked",
-            "about",
-            "value",
-            "count",
-            "icons",
-            "px",
-            "ms",
-            # Theme/appearance terms
-            "theme",
-            "system",
-            "light",
-            "dark",
-            "compact",
-            "grid",
-            "language",
-            "en",
-            "black",
-            "white",
-            # Test-specific terms
-            "non-existent-icon",
-            "test-icon",
-            "invalid-icon",
-            "example-icon",
-            "heart-icon",
-            "icon-heart",
-            "test-null",
-            "not-a-color",
-            "not-a-number",
-            "corrupted-test",
-            "null-painter",
-            "invalid-painter",
-            "exception-painter",
-            "test-painter",
-            "memory-test-painter",
-            "replacement-painter",
-            "lifetime-painter",
-            "non-existent",
-            "invalid",
-            "unknown",
-            "high-contrast",
-            "color-disabled",
-            "test-option",
-            "test-value",
-            "race-painter",
-            "extreme-painter",
-            "memory-painter",
-            "slow-painter",
-            # Data/metadata terms
-            "categories",
-            "contributors",
-            "favorites",
-            "timestamp",
-            "usage",
-            "recent",
-            "criteria",
-            "quotes",
-            "with",
-            "nested",
-            "level1",
-            "level2",
-            "level3",
-            "value1",
-            "value2",
-            "inner",
-            "x64",
-            # Generic terms
-            "arrows",
-            "communication",
-            "media",
-            "cal",
-            "arrow",
-        }
-
-        if name in non_icon_words:
+        if name in NON_ICON_WORDS:
             return False
 
-        return True
+        # Should contain only lowercase letters, numbers, and hyphens
+        return ICON_NAME_RE.match(name) is not None
 
     def scan_directory(
         self, directory: Path, extensions: Optional[List[str]] = None
@@ -271,16 +290,23 @@ class IconUsageValidator:
         if extensions is None:
             extensions = [".cpp", ".h", ".hpp", ".cc", ".cxx"]
 
-        for ext in extensions:
-            for file_path in directory.rglob(f"*{ext}"):
-                if file_path.is_file():
-                    usages = self.scan_file_for_icons(file_path)
-                    if usages:
-                        rel_path = str(file_path.relative_to(self.project_root))
-                        for icon_name, line_num in usages:
-                            if icon_name not in self.icon_usage:
-                                self.icon_usage[icon_name] = []
-                            self.icon_usage[icon_name].append((rel_path, line_num))
+        file_paths = [
+            file_path
+            for ext in extensions
+            for file_path in directory.rglob(f"*{ext}")
+            if file_path.is_file()
+        ]
+
+        # Overlap the file reads; results are merged in file order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(self.scan_file_for_icons, file_paths)
+            for file_path, usages in zip(file_paths, results):
+                if usages:
+                    rel_path = str(file_path.relative_to(self.project_root))
+                    for icon_name, line_num in usages:
+                        if icon_name not in self.icon_usage:
+                            self.icon_usage[icon_name] = []
+                        self.icon_usage[icon_name].append((rel_path, line_num))
 
     def validate_usage(self) -> bool:
         """Validate that all used icons exist."""
@@ -295,31 +321,30 @@ class IconUsageValidator:
 
     def suggest_corrections(self, invalid_icon: str) -> List[str]:
         """Suggest possible corrections for invalid icon names."""
-        suggestions = []
-
-        # Look for similar names
-        for available in self.available_icons:
-            # Exact substring match
-            if invalid_icon in available or available in invalid_icon:
-                suggestions.append(available)
-            # Similar words (split by hyphens)
-            elif self._words_similarity(invalid_icon, available) > 0.5:
-                suggestions.append(available)
-
-        return suggestions[:5]  # Limit to 5 suggestions
-
-    def _words_similarity(self, name1: str, name2: str) -> float:
-        """Calculate similarity between two icon names based on words."""
-        words1 = set(name1.split("-"))
-        words2 = set(name2.split("-"))
-
-        if not words1 or not words2:
-            return 0.0
-
-        intersection = words1.intersection(words2)
-        union = words1.union(words2)
+        if self._icon_index is None:
+            self._icon_index = IconIndex(self.available_icons)
+        index = self._icon_index
+
+        # Exact substring matches, in either direction
+        candidates = index.containing(invalid_icon) | index.contained_in(invalid_icon)
+
+        # Similar words (split by hyphens); only icons sharing a word with
+        # the invalid name can score above zero, so each is scored once here
+        words = frozenset(invalid_icon.split("-"))
+        scores = {
+            available: index.words_similarity(words, available)
+            for available in index.sharing_words(invalid_icon)
+        }
+        candidates.update(
+            available for available, score in scores.items() if score > 0.5
+        )
 
-        return len(intersection) / len(union)
+        # Most similar first
+        ranked = sorted(
+            candidates,
+            key=lambda available: (-scores.get(available, 0.0), available),
+        )
+        return ranked[:5]  # Limit to 5 suggestions
 
     def print_report(self) -> None:
         """Print validation report."""